@@ -0,0 +1,55 @@
+# 1リクエストあたりのアクセストークン検証（validate_access_token）にかかる時間を、
+# キャッシュなし（毎回 jwt.decode ＋ AccessTokenPayload 作成）とキャッシュありで比較する
+#
+# 実行方法（プロジェクト直下で実行）
+#   PYTHONPATH=src python benchmarks/access_token_validation.py
+#   PYTHONPATH=src python benchmarks/access_token_validation.py --requests 50000
+
+import argparse
+import time
+
+from datetime import timedelta
+
+import helpdesk_app_backend.core.check_token as check_token
+
+from helpdesk_app_backend.core.access_token_cache import AccessTokenCache
+from helpdesk_app_backend.logic.business.security import create_access_token
+from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now_UTC
+from helpdesk_app_backend.models.enum.user import AccountType
+
+
+# 同じトークンで requests 回検証した場合の、1回あたりの平均時間（マイクロ秒）
+def measure(access_token: str, requests: int, cache_size: int) -> float:
+    check_token.access_token_cache = AccessTokenCache(max_size=cache_size)
+
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        check_token.validate_access_token(access_token)
+    return (time.perf_counter() - started_at) / requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000, help="検証するリクエスト数")
+    args = parser.parse_args()
+
+    access_token = create_access_token(
+        {
+            "sub": "benchmark@example.com",
+            "user_id": 1,
+            "account_type": AccountType.STAFF.value,
+            "exp": get_now_UTC() + timedelta(minutes=30),
+        }
+    )
+
+    without_cache = measure(access_token, args.requests, cache_size=0)
+    with_cache = measure(access_token, args.requests, cache_size=1024)
+
+    print(f"requests={args.requests}")
+    print(f"{'mode':<16}{'us/request':>12}")
+    print(f"{'without cache':<16}{without_cache:>12.2f}")
+    print(f"{'with cache':<16}{with_cache:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
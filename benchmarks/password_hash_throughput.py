@@ -0,0 +1,74 @@
+# ログイン（パスワード照合）のスループットが、ハッシュ化用プロセス数に応じてどう伸びるかを計測する
+#
+# 実行方法（プロジェクト直下で実行）
+#   PYTHONPATH=src python benchmarks/password_hash_throughput.py
+#   PYTHONPATH=src BCRYPT_ROUNDS=10 python benchmarks/password_hash_throughput.py --logins 200
+#
+# 比較対象
+#   inline  → 従来どおりリクエスト処理のスレッドで照合した場合（スレッドを増やしてもGILにより並列化されない）
+#   workers → PasswordHashExecutor のプロセス数（1, 2, 4, ... CPUコア数）ごとの結果
+
+import argparse
+import asyncio
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from helpdesk_app_backend.core.auth import BCRYPT_ROUNDS
+from helpdesk_app_backend.core.password_hash_executor import PasswordHashExecutor
+from helpdesk_app_backend.logic.business.security import trans_password_hash, verify_password
+
+PASSWORD = "BenchmarkP@ssw0rd1"
+
+
+# スレッドプール上で照合した場合（FastAPI の同期ハンドラーと同じ条件）
+def measure_inline(hashed_password: str, logins: int, threads: int) -> float:
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: verify_password(PASSWORD, hashed_password), range(logins)))
+    return logins / (time.perf_counter() - started_at)
+
+
+# PasswordHashExecutor で照合した場合
+async def measure_workers(hashed_password: str, logins: int, workers: int) -> float:
+    executor = PasswordHashExecutor(max_workers=workers, max_pending=logins)
+    try:
+        # プロセスの起動時間を含めないよう、事前に全プロセスを起動しておく
+        await asyncio.gather(
+            *(executor.run(verify_password, PASSWORD, hashed_password) for _ in range(workers))
+        )
+
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *(executor.run(verify_password, PASSWORD, hashed_password) for _ in range(logins))
+        )
+        return logins / (time.perf_counter() - started_at)
+    finally:
+        executor.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=100, help="計測するログイン回数")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, *(2**i for i in range(cpu_count.bit_length())), cpu_count})
+    worker_counts = [count for count in worker_counts if count <= cpu_count]
+
+    hashed_password = trans_password_hash(PASSWORD)
+
+    print(f"BCRYPT_ROUNDS={BCRYPT_ROUNDS} logins={args.logins} cpu_count={cpu_count}")
+    print(f"{'mode':<12}{'workers':>8}{'logins/sec':>14}")
+
+    inline_throughput = measure_inline(hashed_password, args.logins, threads=cpu_count)
+    print(f"{'inline':<12}{cpu_count:>8}{inline_throughput:>14.1f}")
+
+    for workers in worker_counts:
+        throughput = asyncio.run(measure_workers(hashed_password, args.logins, workers))
+        print(f"{'workers':<12}{workers:>8}{throughput:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
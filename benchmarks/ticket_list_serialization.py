@@ -0,0 +1,81 @@
+# チケット一覧（GetTicketResponseItem × 10,000件）のレスポンス作成にかかる時間を、
+# 従来の JSONResponse（標準ライブラリの json）と FastJSONResponse（orjson）で比較する
+#
+# 実行方法（プロジェクト直下で実行）
+#   PYTHONPATH=src python benchmarks/ticket_list_serialization.py
+#   PYTHONPATH=src python benchmarks/ticket_list_serialization.py --items 10000 --repeat 20
+#
+# 計測内容
+#   model_dump → レスポンスモデルからJSON用の値への変換（FastAPI が内部で行う処理。両方式で共通）
+#   JSONResponse / FastJSONResponse → JSON文字列（bytes）への変換
+
+import argparse
+import time
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from helpdesk_app_backend.core.json_response import FastJSONResponse
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.models.response.v1.ticket import GetTicketResponseItem
+
+ticket_list_adapter = TypeAdapter(list[GetTicketResponseItem])
+
+
+def create_items(count: int) -> list[GetTicketResponseItem]:
+    statuses = list(TicketStatusType)
+    return [
+        GetTicketResponseItem(
+            id=index,
+            title=f"テストチケット{index}",
+            is_public=index % 2 == 0,
+            status=statuses[index % len(statuses)],
+            staff=f"テスト社員{index % 50}",
+            supporter=f"テストサポート担当者{index % 5}" if index % 3 else None,
+            created_at=datetime(2020, 7, 21, 6, 12, 30) + timedelta(minutes=index),
+        )
+        for index in range(count)
+    ]
+
+
+# 関数を repeat 回実行した場合の、1回あたりの平均時間（ミリ秒）
+def measure(func: Callable[[], object], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started_at) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10000, help="一覧の件数")
+    parser.add_argument("--repeat", type=int, default=20, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    items = create_items(args.items)
+    content = ticket_list_adapter.dump_python(items, mode="json")
+
+    # 変換結果が同じであることを確認してから計測する
+    assert JSONResponse(content).body == FastJSONResponse(content).body
+
+    results = {
+        "model_dump": measure(
+            lambda: ticket_list_adapter.dump_python(items, mode="json"), args.repeat
+        ),
+        "jsonable_encoder": measure(lambda: jsonable_encoder(items), args.repeat),
+        "JSONResponse": measure(lambda: JSONResponse(content), args.repeat),
+        "FastJSONResponse": measure(lambda: FastJSONResponse(content), args.repeat),
+    }
+
+    print(f"items={args.items} repeat={args.repeat}")
+    print(f"{'step':<20}{'ms':>10}")
+    for step, elapsed in results.items():
+        print(f"{step:<20}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
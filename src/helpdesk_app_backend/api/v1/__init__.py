@@ -4,10 +4,19 @@ from helpdesk_app_backend.api.v1.admin import router as admin_router
 from helpdesk_app_backend.api.v1.auth import router as auth_router
 from helpdesk_app_backend.api.v1.healthcheck import router as healthcheck_router
 from helpdesk_app_backend.api.v1.ticket import router as ticket_router
+from helpdesk_app_backend.api.v1.ticket_async import router as ticket_async_router
+from helpdesk_app_backend.api.v1.ticket_event import router as ticket_event_router
+from helpdesk_app_backend.core.database import DB_ASYNC_ENABLED
 
 router = APIRouter()
 
 router.include_router(auth_router, prefix="/auth", tags=["Auth"])
 router.include_router(healthcheck_router, prefix="/healthcheck", tags=["Healthcheck"])
 router.include_router(admin_router, prefix="/admin")
+# /ticket/events は /ticket/{ticket_id} より先に登録する
+router.include_router(ticket_event_router, prefix="/ticket", tags=["Ticket"])
+# DB_ASYNC_ENABLED の場合、チケット参照系APIは非同期ハンドラーで処理する
+# 同じパスの同期ハンドラーより先に登録し、こちらを優先してマッチさせる
+if DB_ASYNC_ENABLED:
+    router.include_router(ticket_async_router, prefix="/ticket", tags=["Ticket"])
 router.include_router(ticket_router, prefix="/ticket", tags=["Ticket"])
@@ -1,7 +1,11 @@
 from fastapi import APIRouter
 
 from helpdesk_app_backend.api.v1.admin.account import router as account_router
+from helpdesk_app_backend.api.v1.admin.diagnostics import router as diagnostics_router
+from helpdesk_app_backend.api.v1.admin.export import router as export_router
 
 router = APIRouter()
 
 router.include_router(account_router, prefix="/account", tags=["Account"])
+router.include_router(diagnostics_router, prefix="/diagnostics", tags=["Diagnostics"])
+router.include_router(export_router, prefix="/export", tags=["Export"])
@@ -1,15 +1,18 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.core.current_account import invalidate_current_account_cache
+from helpdesk_app_backend.core.json_response import FastJSONResponse
 from helpdesk_app_backend.exceptions.business_exception import (
     BusinessException,
 )
 from helpdesk_app_backend.exceptions.forbidden_exception import ForbiddenException
-from helpdesk_app_backend.logic.business.security import trans_password_hash
-from helpdesk_app_backend.models.db.base import get_db
+from helpdesk_app_backend.logic.business.security import trans_password_hash_async
+from helpdesk_app_backend.models.db.base import get_db, get_read_db
 from helpdesk_app_backend.models.db.user import User
 from helpdesk_app_backend.models.enum.user import AccountType
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
@@ -22,7 +25,11 @@ from helpdesk_app_backend.models.response.v1.admin.account import (
     GetAccountResponseItem,
     UpdateAccountResponse,
 )
-from helpdesk_app_backend.repositories.user import get_user_by_email, get_user_by_id, get_users_all
+from helpdesk_app_backend.repositories.user import (
+    get_account_list_rows,
+    get_user_by_email,
+    get_user_by_id,
+)
 
 router = APIRouter()
 
@@ -37,34 +44,43 @@ def check_account(
         raise ForbiddenException("アクセス権限がありません")
 
 
-@router.get("")
+# レスポンスは FastJSONResponse で直接返すため、レスポンスの形式（APIドキュメント用）は response_model で指定する
+@router.get("", response_model=list[GetAccountResponseItem])
 def get_accounts(
     # Depends(関数) → この関数を呼ぶ前に、()内の関数を実行
-    session: Annotated[Session, Depends(get_db)],
+    # 参照のみのため、読み取り専用のレプリカで処理する
+    session: Annotated[Session, Depends(get_read_db)],
     # トークンの確認し、問題なければ get_accounts 実行
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
-) -> list[GetAccountResponseItem]:
+) -> FastJSONResponse:
     account_type = access_token.account_type
 
     check_account(account_type)
 
-    accounts = get_users_all(session)
-
-    return [
-        GetAccountResponseItem(
-            id=account.id,
-            name=account.name,
-            email=account.email,
-            account_type=account.account_type,
-            is_suspended=account.is_suspended,
-        )
-        # accounts の中から、1つずつ順番に account に入れる
-        for account in accounts
-    ]
+    # 一覧に必要な列のみ取得
+    accounts = get_account_list_rows(session)
+
+    # 1件ごとのモデル作成・検証は行わずにJSONへ変換する
+    # キーの並び順は GetAccountResponseItem の定義順と揃える（出力されるJSONを従来と同一にするため）
+    return FastJSONResponse(
+        [
+            {
+                "id": account.id,
+                "name": account.name,
+                "email": account.email,
+                "account_type": account.account_type,
+                "is_suspended": account.is_suspended,
+            }
+            # accounts の中から、1つずつ順番に account に入れる
+            for account in accounts
+        ]
+    )
 
 
+# パスワードのハッシュ化（bcrypt）は専用プロセスで実行し、待っている間も他のリクエストを処理できるよう async def にする
+# 同期のDB処理はイベントループを止めないよう、スレッドプールで実行する
 @router.post("")
-def create_account(
+async def create_account(
     body: CreateAccountRequest,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
@@ -73,7 +89,7 @@ def create_account(
 
     check_account(account_type)
 
-    if get_user_by_email(session, body.email) is not None:
+    if await run_in_threadpool(get_user_by_email, session, body.email) is not None:
         raise BusinessException("すでに存在するメールアドレスです")
 
     if body.account_type == AccountType.ADMIN:
@@ -82,15 +98,15 @@ def create_account(
     new_account = User(
         name=body.name,
         email=body.email,
-        password=trans_password_hash(body.password),
+        password=await trans_password_hash_async(body.password),
         account_type=body.account_type,
     )
     session.add(new_account)
 
     try:
-        session.commit()
+        await run_in_threadpool(session.commit)
     except Exception as error:
-        session.rollback()
+        await run_in_threadpool(session.rollback)
         raise error
 
     return CreateAccountResponse(
@@ -128,6 +144,9 @@ def update_account(
         session.rollback()
         raise error
 
+    # 変更前の利用状態がキャッシュに残らないよう破棄する
+    invalidate_current_account_cache(target_account.id)
+
     return UpdateAccountResponse(
         id=target_account.id,
         name=target_account.name,
@@ -0,0 +1,134 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from helpdesk_app_backend.api.v1.admin.account import check_account
+from helpdesk_app_backend.core.check_token import access_token_cache, validate_access_token
+from helpdesk_app_backend.core.database_pool import WaitTimeRecordingQueuePool
+from helpdesk_app_backend.core.password_hash_executor import password_hash_executor
+from helpdesk_app_backend.core.ticket_event_broker import ticket_event_broker
+from helpdesk_app_backend.models.db import base
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.models.response.v1.admin.diagnostics import (
+    GetAccessTokenCacheStatusResponse,
+    GetPasswordHashStatusResponse,
+    GetPoolStatusResponse,
+    GetReplicaStatusResponse,
+    GetTicketEventStatusResponse,
+    PoolStatusItem,
+    ReplicaStatusItem,
+)
+
+router = APIRouter()
+
+
+# コネクションプールの現在の状態を取得
+def to_pool_status_item(pool: WaitTimeRecordingQueuePool) -> PoolStatusItem:
+    return PoolStatusItem(
+        pool_size=pool.size(),
+        max_overflow=pool._max_overflow,
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        # SQLAlchemy は接続数が pool_size 未満の場合に負の値を返すため、0 未満は 0 とする
+        overflow=max(pool.overflow(), 0),
+        wait_count=pool.wait_stats.count,
+        wait_time_total_seconds=pool.wait_stats.total_seconds,
+        wait_time_max_seconds=pool.wait_stats.max_seconds,
+    )
+
+
+# コネクションプールの状態（使用中の接続数・超過分・接続待ち時間）を返す
+# ワーカー数や DB_POOL_SIZE / DB_MAX_OVERFLOW を DB の接続上限に合わせて調整する際に使用する
+@router.get("/pool")
+def get_pool_status(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> GetPoolStatusResponse:
+    check_account(access_token.account_type)
+
+    return GetPoolStatusResponse(
+        sync_pool=to_pool_status_item(base.engine.pool),
+        async_pool=(
+            to_pool_status_item(base.async_engine.pool) if base.async_engine is not None else None
+        ),
+    )
+
+
+# 読み取り専用のレプリカの状態（振り分け先かどうか・遅延・コネクションプール）を返す
+# available=False のレプリカには振り分けず、プライマリで処理している
+@router.get("/replicas")
+def get_replica_status(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> GetReplicaStatusResponse:
+    check_account(access_token.account_type)
+
+    replica_router = base.replica_router
+
+    return GetReplicaStatusResponse(
+        max_lag_seconds=replica_router.max_lag_seconds,
+        replicas=[
+            ReplicaStatusItem(
+                url=replica.engine.url.render_as_string(hide_password=True),
+                available=replica.available,
+                lag_seconds=replica.lag_seconds,
+                pool=to_pool_status_item(replica.engine.pool),
+            )
+            for replica in replica_router.replicas
+        ],
+    )
+
+
+# パスワードのハッシュ化・照合を行うプロセスの状態（処理待ちの件数・受付上限超過で断った件数）を返す
+# ログイン集中時に queued / rejected が増える場合は PASSWORD_HASH_WORKERS や BCRYPT_ROUNDS を見直す
+@router.get("/password-hash")
+def get_password_hash_status(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> GetPasswordHashStatusResponse:
+    check_account(access_token.account_type)
+
+    stats = password_hash_executor.stats()
+
+    return GetPasswordHashStatusResponse(
+        max_workers=stats.max_workers,
+        max_pending=stats.max_pending,
+        pending=stats.pending,
+        queued=stats.queued,
+        completed=stats.completed,
+        rejected=stats.rejected,
+    )
+
+
+# アクセストークンのキャッシュの状態（保持件数・ヒット数・ミス数）を返す
+@router.get("/access-token-cache")
+def get_access_token_cache_status(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> GetAccessTokenCacheStatusResponse:
+    check_account(access_token.account_type)
+
+    stats = access_token_cache.stats()
+
+    return GetAccessTokenCacheStatusResponse(
+        max_size=stats.max_size,
+        size=stats.size,
+        hits=stats.hits,
+        misses=stats.misses,
+    )
+
+
+# チケットの変更通知（SSE）の状態（接続数・配信数・取りこぼしにより終了させた接続数）を返す
+# overflowed が増える場合は TICKET_EVENT_QUEUE_SIZE を見直す
+@router.get("/ticket-events")
+def get_ticket_event_status(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> GetTicketEventStatusResponse:
+    check_account(access_token.account_type)
+
+    stats = ticket_event_broker.stats()
+
+    return GetTicketEventStatusResponse(
+        max_subscribers=stats.max_subscribers,
+        subscribers=stats.subscribers,
+        published=stats.published,
+        delivered=stats.delivered,
+        overflowed=stats.overflowed,
+        failed=stats.failed,
+    )
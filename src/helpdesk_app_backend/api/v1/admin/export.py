@@ -0,0 +1,104 @@
+# チケット・対応履歴のエクスポート（監査用の全件出力）
+# 全件を一度に読み込まず、サーバー側カーソルで EXPORT_CHUNK_SIZE 件ずつ読み、変換したものから順に送る
+# 件数が増えても、サーバーが使用するメモリは1チャンク分で変わらない
+
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from helpdesk_app_backend.api.v1.admin.account import check_account
+from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.exceptions.business_exception import BusinessException
+from helpdesk_app_backend.logic.business.export_encoder import encode_export_chunks
+from helpdesk_app_backend.models.db import base
+from helpdesk_app_backend.models.enum.ticket import TicketExportFormat, TicketStatusType
+from helpdesk_app_backend.models.internal.ticket_export_filter import TicketExportFilter
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.repositories.ticket_export import (
+    build_ticket_export_queries,
+    build_ticket_history_export_queries,
+    get_export_column_names,
+    stream_export_rows,
+)
+
+router = APIRouter()
+
+# 1回に読み込み・変換する件数
+EXPORT_CHUNK_SIZE = 1000
+
+
+# エクスポートの絞り込み条件（クエリパラメータ）を受け取る
+def get_ticket_export_filter(
+    # 複数指定した場合は、いずれかのステータスに一致するもの（例：?status=resolved&status=closed）
+    status: Annotated[list[TicketStatusType] | None, Query()] = None,
+    # 作成日時が created_from 以上、created_to 未満のもの
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> TicketExportFilter:
+    if created_from is not None and created_to is not None and created_from >= created_to:
+        raise BusinessException("作成日時の範囲が不正です")
+
+    return TicketExportFilter(
+        statuses=status or [], created_from=created_from, created_to=created_to
+    )
+
+
+# SELECT文の結果を、指定した形式に変換しながら順に返す
+# セッションはレスポンスの送信中も使い続けるため、get_db ではなくここで作成する
+# （get_db のセッションは、レスポンスの本文を送り始める前に閉じられる）
+# 送信中に接続が切られた場合も、ジェネレーターの終了時にセッションを閉じ、接続をプールへ返す
+def stream_export(
+    queries: list[Select], export_format: TicketExportFormat, use_gzip: bool
+) -> Iterator[bytes]:
+    with base.session() as session:
+        yield from encode_export_chunks(
+            get_export_column_names(queries),
+            stream_export_rows(session, queries, EXPORT_CHUNK_SIZE),
+            export_format,
+            use_gzip,
+        )
+
+
+# エクスポートのレスポンスを作成（ファイルとしてダウンロードさせる）
+def to_export_response(
+    queries: list[Select], file_name: str, export_format: TicketExportFormat, use_gzip: bool
+) -> StreamingResponse:
+    file_name = f"{file_name}.{export_format.value}" + (".gz" if use_gzip else "")
+    return StreamingResponse(
+        stream_export(queries, export_format, use_gzip),
+        media_type="application/gzip" if use_gzip else export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
+    )
+
+
+# チケットをエクスポート（管理者のみ）
+# gzip=true → gzip 形式に圧縮して返す（ファイル名の末尾に .gz を付ける）
+@router.get("/tickets")
+def export_tickets(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    filters: Annotated[TicketExportFilter, Depends(get_ticket_export_filter)],
+    format: TicketExportFormat = TicketExportFormat.CSV,
+    gzip: bool = False,
+) -> StreamingResponse:
+    check_account(access_token.account_type)
+
+    return to_export_response(build_ticket_export_queries(filters), "tickets", format, gzip)
+
+
+# 対応履歴をエクスポート（管理者のみ）
+@router.get("/ticket-histories")
+def export_ticket_histories(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    filters: Annotated[TicketExportFilter, Depends(get_ticket_export_filter)],
+    format: TicketExportFormat = TicketExportFormat.CSV,
+    gzip: bool = False,
+) -> StreamingResponse:
+    check_account(access_token.account_type)
+
+    return to_export_response(
+        build_ticket_history_export_queries(filters), "ticket_histories", format, gzip
+    )
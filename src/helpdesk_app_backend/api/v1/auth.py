@@ -2,11 +2,15 @@ from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from helpdesk_app_backend.core.auth import ACCESS_TOKEN_EXPIRE_MINUTES
 from helpdesk_app_backend.exceptions.unauthorized_exception import UnauthorizedException
-from helpdesk_app_backend.logic.business.security import create_access_token, verify_password
+from helpdesk_app_backend.logic.business.security import (
+    create_access_token,
+    verify_password_async,
+)
 from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now_UTC
 from helpdesk_app_backend.models.db.base import get_db
 from helpdesk_app_backend.models.db.user import User
@@ -16,8 +20,10 @@ from helpdesk_app_backend.repositories.user import get_user_by_email
 router = APIRouter()
 
 
+# パスワード照合（bcrypt）は専用プロセスで実行し、待っている間も他のリクエストを処理できるよう async def にする
+# 同期のDB処理はイベントループを止めないよう、スレッドプールで実行する
 @router.post("/login")
-def login(
+async def login(
     body: LoginRequest, session: Annotated[Session, Depends(get_db)], response: Response
 ) -> None:
     # リクエスト展開
@@ -25,10 +31,12 @@ def login(
     target_user_pass = body.password
 
     # target userの取得
-    target_user: User = get_user_by_email(session, email=target_user_email)
+    target_user: User = await run_in_threadpool(
+        get_user_by_email, session, email=target_user_email
+    )
 
     # ユーザーの存在、パスワードの確認
-    if not target_user or not verify_password(
+    if not target_user or not await verify_password_async(
         plain_password=target_user_pass, hashed_password=target_user.password
     ):
         raise UnauthorizedException("メールアドレスまたはパスワードが一致しません")
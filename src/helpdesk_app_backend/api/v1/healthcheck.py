@@ -1,14 +1,13 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 
 from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.core.current_account import get_current_account_for_read
 from helpdesk_app_backend.exceptions.unauthorized_exception import UnauthorizedException
-from helpdesk_app_backend.models.db.base import get_db
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
 from helpdesk_app_backend.models.response.v1.healthcheck import HealthcheckAuthResponse
-from helpdesk_app_backend.repositories.user import get_user_by_id
 
 router = APIRouter()
 
@@ -19,15 +18,13 @@ def healthcheck() -> str:
     return "success"
 
 
+# アカウント情報は読み取り専用のレプリカから取得する
 @router.get("/auth")
 def auth_healthcheck(
-    session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_for_read)],
 ) -> HealthcheckAuthResponse:
     account_type = access_token.account_type
-    user_id = access_token.user_id
-
-    target_account = get_user_by_id(session, id=user_id)
 
     # アカウントが停止状態（is_suspended=True）の場合
     if target_account.is_suspended:
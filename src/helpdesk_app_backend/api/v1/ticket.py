@@ -1,41 +1,152 @@
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.core.current_account import (
+    get_current_account,
+    get_current_account_for_read,
+)
+from helpdesk_app_backend.core.json_response import FastJSONResponse
+from helpdesk_app_backend.core.ticket_event_broker import ticket_event_broker
+from helpdesk_app_backend.core.ticket_search_backend import get_ticket_search_backend
+from helpdesk_app_backend.exceptions.bad_request_exception import BadRequestException
 from helpdesk_app_backend.exceptions.business_exception import BusinessException
+from helpdesk_app_backend.exceptions.conflict_exception import ConflictException
 from helpdesk_app_backend.exceptions.forbidden_exception import ForbiddenException
+from helpdesk_app_backend.exceptions.precondition_failed_exception import (
+    PreconditionFailedException,
+)
 from helpdesk_app_backend.exceptions.unauthorized_exception import UnauthorizedException
+from helpdesk_app_backend.logic.business.etag import (
+    is_etag_matched,
+    is_if_match_satisfied,
+    make_etag,
+    make_version_etag,
+    make_versioned_etag,
+)
+from helpdesk_app_backend.logic.business.pagination_cursor import (
+    CursorConditionMismatchError,
+    decode_cursor,
+    encode_cursor,
+)
 from helpdesk_app_backend.logic.business.status_transition_rules import can_status_transition
-from helpdesk_app_backend.models.db.base import get_db
+from helpdesk_app_backend.models.db.base import get_db, get_read_db
 from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_count import UNASSIGNED_SUPPORTER_ID
 from helpdesk_app_backend.models.db.ticket_history import TicketHistory
-from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.models.enum.ticket import (
+    TicketEventType,
+    TicketListSortType,
+    TicketStatusType,
+)
 from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+from helpdesk_app_backend.models.internal.ticket_list_filter import TicketListFilter
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
 from helpdesk_app_backend.models.request.v1.ticket import (
+    BulkTicketRequest,
+    BulkUpdateTicketStatusRequest,
+    BulkUpdateTicketVisibilityRequest,
     CreateTicketCommentRequest,
     CreateTicketRequest,
     UpdateTicketStatusRequest,
     UpdateTicketVisibilityRequest,
 )
 from helpdesk_app_backend.models.response.v1.ticket import (
+    BulkTicketResponse,
+    BulkTicketResultItem,
     CreateTicketCommentResponse,
     CreateTicketResponse,
+    GetTicketChangesResponse,
+    GetTicketCountsResponse,
     GetTicketDetailResponse,
+    GetTicketHistoriesResponse,
     GetTicketHistoryResponseItem,
+    GetTicketListResponse,
     GetTicketResponseItem,
+    GetTicketSearchResponse,
+    GetTicketStatusCountItem,
+    GetTicketSupporterCountItem,
     UpdateTicketResponse,
     UpdateTicketVisibilityResponse,
 )
-from helpdesk_app_backend.repositories.ticket import get_ticket_by_id, get_tickets_all
-from helpdesk_app_backend.repositories.ticket_history import get_ticket_histories_by_ticket_id
-from helpdesk_app_backend.repositories.user import get_user_by_id
+from helpdesk_app_backend.repositories.ticket import (
+    get_ticket_by_id,
+    get_ticket_detail_by_id,
+    get_ticket_list_rows_by_ids,
+    get_ticket_list_version,
+    get_ticket_version,
+    get_tickets_by_ids,
+    get_visible_ticket_list_rows,
+    update_ticket_if_unchanged,
+)
+from helpdesk_app_backend.repositories.ticket_archive import (
+    get_archived_ticket_by_id,
+    get_archived_ticket_detail_by_id,
+    get_archived_ticket_histories_since,
+    get_archived_ticket_version,
+    get_archived_tickets_by_ids,
+    get_recent_archived_ticket_histories,
+    restore_archived_tickets,
+)
+from helpdesk_app_backend.repositories.ticket_change import (
+    get_latest_ticket_change_seq,
+    get_ticket_change_seqs_by_history_ids,
+    get_ticket_changes_since,
+    insert_ticket_changes,
+)
+from helpdesk_app_backend.repositories.ticket_count import (
+    TicketCountKey,
+    add_ticket_counts,
+    get_own_private_ticket_count_rows,
+    get_ticket_count_rows,
+    to_ticket_count_key,
+)
+from helpdesk_app_backend.repositories.ticket_history import (
+    add_ticket_histories,
+    get_recent_ticket_histories,
+    get_ticket_histories_by_ids,
+    get_ticket_histories_since,
+)
+from helpdesk_app_backend.repositories.user import get_latest_user_updated_at
 
 router = APIRouter()
 
 TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE = "指定したチケットは存在しない、もしくは操作権限がありません"
+TICKET_UPDATED_BY_OTHERS_MESSAGE = (
+    "他の操作でチケットが更新されました。最新の内容を取得してから、再度操作してください"
+)
+
+
+# チケット一覧のページネーション設定
+TICKET_LIST_DEFAULT_LIMIT = 50
+TICKET_LIST_MAX_LIMIT = 200
+
+
+# チケット詳細に含める直近の対応履歴の件数
+TICKET_DETAIL_HISTORY_LIMIT = 50
+
+# 対応履歴取得のページネーション設定
+TICKET_HISTORY_DEFAULT_LIMIT = 100
+TICKET_HISTORY_MAX_LIMIT = 500
+
+# チケット検索のページネーション設定（関連度順のため offset で指定する。深いページは取得させない）
+TICKET_SEARCH_DEFAULT_LIMIT = 20
+TICKET_SEARCH_MAX_LIMIT = 100
+TICKET_SEARCH_MAX_OFFSET = 1000
+
+# 変更の差分取得の1回あたりの件数
+TICKET_CHANGE_DEFAULT_LIMIT = 200
+TICKET_CHANGE_MAX_LIMIT = 1000
 
 
 # 社員以外のアカウントタイプの場合
@@ -46,80 +157,145 @@ def check_account(
         raise ForbiddenException("社員でないためチケットの登録はできません")
 
 
-@router.get("")
-def get_tickets(
-    session: Annotated[Session, Depends(get_db)],
-    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
-) -> list[GetTicketResponseItem]:
-    account_type = access_token.account_type
-    user_id = access_token.user_id
-
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
+# アカウントが存在しない または 停止状態（is_suspended=True）の場合
+def check_current_account(target_account: CurrentAccount | None) -> None:
     if target_account is None or target_account.is_suspended:
         raise UnauthorizedException("このアカウント情報は不正です")
 
-    all_tickets = get_tickets_all(session)
 
-    # アカウントタイプが「社員」以外の場合
-    target_tickets = all_tickets
+# チケット一覧の1件分を、レスポンスモデル（GetTicketResponseItem）を作成せずにJSON用の辞書へ変換する
+# 一覧用に列を絞って取得した行は、DBの列の型どおりの値のため、1件ごとのモデル作成・検証は行わない
+# キーの並び順は GetTicketResponseItem の定義順と揃える（出力されるJSONを従来と同一にするため）
+def to_ticket_response_dict(ticket_row: Row) -> dict:
+    return {
+        "id": ticket_row.id,
+        "title": ticket_row.title,
+        "is_public": ticket_row.is_public,
+        "status": ticket_row.status,
+        "staff": ticket_row.staff_name,
+        "supporter": ticket_row.supporter_name,
+        "created_at": ticket_row.created_at,
+    }
+
+
+# 対応履歴1件分のレスポンスを作成
+def to_ticket_history_response_item(ticket_history: TicketHistory) -> GetTicketHistoryResponseItem:
+    return GetTicketHistoryResponseItem(
+        id=ticket_history.id,
+        ticket=ticket_history.ticket_id,
+        action_user=ticket_history.action_user.name if ticket_history.action_user else None,
+        action_description=ticket_history.action_description,
+        created_at=ticket_history.created_at,
+    )
 
-    # アカウントタイプが「社員」の場合
-    if account_type == AccountType.STAFF:
-        # 以下のパターンでも同様に表現することが可能
-        # not_target_tickets = list(
-        #     filter(lambda ticket: not ticket.is_public and ticket.staff_id != user_id, all_tickets)
-        # )
-        # # set = 集合（ベン図）という概念 listからsetに変換して計算してから、setからlistに変換
-        # target_tickets = list(set(all_tickets) - set(not_target_tickets))
-
-        target_tickets = list(
-            filter(lambda ticket: ticket.staff_id == user_id or ticket.is_public, all_tickets)
-        )
 
-    return [
-        GetTicketResponseItem(
-            id=target_ticket.id,
-            title=target_ticket.title,
-            is_public=target_ticket.is_public,
-            status=target_ticket.status,
-            staff=target_ticket.staff.name,
-            supporter=target_ticket.supporter.name if target_ticket.supporter else None,
-            created_at=target_ticket.created_at,
-        )
-        for target_ticket in target_tickets
-    ]
+# 一覧取得用のカーソルを (created_at, id) に戻す（未指定の場合は None）
+# カーソルを作成したときと異なる並び順・絞り込み条件で指定された場合は 400
+def decode_ticket_list_cursor(
+    cursor: str | None, sort: TicketListSortType, filters: TicketListFilter
+) -> tuple[datetime, int] | None:
+    if cursor is None:
+        return None
 
+    try:
+        return decode_cursor(cursor, sort.value, filters.model_dump_json())
+    except CursorConditionMismatchError as err:
+        raise BadRequestException(str(err)) from err
+    except ValueError as err:
+        raise BusinessException("不正なカーソルです") from err
+
+
+# 一覧の絞り込み条件（クエリパラメータ）を受け取る
+# 同期版・非同期版の一覧取得で共通して使用する（Depends で指定する）
+def get_ticket_list_filter(
+    # 複数指定した場合は、いずれかのステータスに一致するチケット（例：?status=start&status=assigned）
+    status: Annotated[list[TicketStatusType] | None, Query()] = None,
+    staff_id: int | None = None,
+    supporter_id: int | None = None,
+    is_public: bool | None = None,
+    # 作成日時が created_from 以上、created_to 未満のチケット
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> TicketListFilter:
+    if created_from is not None and created_to is not None and created_from >= created_to:
+        raise BusinessException("作成日時の範囲が不正です")
+
+    return TicketListFilter(
+        statuses=status or [],
+        staff_id=staff_id,
+        supporter_id=supporter_id,
+        is_public=is_public,
+        created_from=created_from,
+        created_to=created_to,
+    )
 
-@router.get("/{ticket_id}")
-def get_ticket_detail(
-    ticket_id: int,
-    session: Annotated[Session, Depends(get_db)],
-    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
-) -> GetTicketDetailResponse:
-    account_type = access_token.account_type
-    user_id = access_token.user_id
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
+# チケット一覧のレスポンスを作成
+# ticket_rows は次ページの有無を判定するため、limit より1件多く取得したもの
+# 件数が多いため、レスポンスモデルでの再検証を行わずにJSONへ変換して返す（形式は GetTicketListResponse）
+def to_ticket_list_response(
+    ticket_rows: list[Row],
+    limit: int,
+    sort: TicketListSortType,
+    filters: TicketListFilter,
+) -> FastJSONResponse:
+    has_next = len(ticket_rows) > limit
+    page_rows = ticket_rows[:limit]
+
+    return FastJSONResponse(
+        {
+            "items": [to_ticket_response_dict(ticket_row) for ticket_row in page_rows],
+            # 次ページが存在する場合、このページ最後のチケットを起点としたカーソルを返す
+            # （並び替えに使った日時とIDの組。同じ sort・絞り込み条件を指定した場合のみ有効）
+            "next_cursor": (
+                encode_cursor(
+                    getattr(page_rows[-1], sort.column_name),
+                    page_rows[-1].id,
+                    sort.value,
+                    filters.model_dump_json(),
+                )
+                if has_next
+                else None
+            ),
+        }
+    )
 
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
 
-    # チケット情報取得
-    target_ticket = get_ticket_by_id(session, id=ticket_id)
+# チケット一覧のレスポンスを作成（互換用・ページネーションなし。形式は list[GetTicketResponseItem]）
+def to_legacy_ticket_list_response(ticket_rows: list[Row]) -> FastJSONResponse:
+    return FastJSONResponse([to_ticket_response_dict(ticket_row) for ticket_row in ticket_rows])
+
+
+# 一覧取得時の取得件数（互換用の場合は全件。それ以外は次ページの有無を判定するため、1件多く取得する）
+def get_ticket_list_fetch_limit(limit: int, legacy: bool) -> int | None:
+    return None if legacy else limit + 1
 
+
+# 一覧取得のレスポンス（互換用 または ページネーションあり）を作成し、ETag を設定する
+def to_ticket_list_page_response(
+    ticket_rows: list[Row],
+    etag: str,
+    limit: int,
+    legacy: bool,
+    sort: TicketListSortType,
+    filters: TicketListFilter,
+) -> FastJSONResponse:
+    if legacy:
+        response = to_legacy_ticket_list_response(ticket_rows)
+    else:
+        response = to_ticket_list_response(ticket_rows, limit, sort, filters)
+    set_etag_headers(response, etag)
+    return response
+
+
+# チケットを閲覧できるか確認する
+def check_ticket_visible(
+    target_ticket: Ticket | None, account_type: AccountType, user_id: int
+) -> None:
     # 存在しないチケットを取得しようとした場合
     if target_ticket is None:
         raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
 
-    # アカウントタイプがサポート担当者であり、チケットの担当である場合
-    is_own_ticket = bool(
-        account_type == AccountType.SUPPORTER and target_ticket.supporter_id == user_id
-    )
-
     # 社員が他人の非公開チケットを取得しようとした場合
     if (
         account_type == AccountType.STAFF
@@ -128,8 +304,22 @@ def get_ticket_detail(
     ):
         raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
 
-    # 対応情報取得
-    ticket_histories = get_ticket_histories_by_ticket_id(session, id=ticket_id)
+
+# チケット詳細のレスポンスを作成
+# recent_histories はより古い履歴の有無を判定するため、TICKET_DETAIL_HISTORY_LIMIT より1件多く取得したもの
+def to_ticket_detail_response(
+    target_ticket: Ticket,
+    recent_histories: list[TicketHistory],
+    account_type: AccountType,
+    user_id: int,
+) -> GetTicketDetailResponse:
+    # アカウントタイプがサポート担当者であり、チケットの担当である場合
+    is_own_ticket = bool(
+        account_type == AccountType.SUPPORTER and target_ticket.supporter_id == user_id
+    )
+
+    has_more_histories = len(recent_histories) > TICKET_DETAIL_HISTORY_LIMIT
+    ticket_histories = recent_histories[-TICKET_DETAIL_HISTORY_LIMIT:]
 
     return GetTicketDetailResponse(
         id=target_ticket.id,
@@ -141,15 +331,573 @@ def get_ticket_detail(
         created_at=target_ticket.created_at,
         is_own_ticket=is_own_ticket,
         ticket_histories=[
-            GetTicketHistoryResponseItem(
-                id=ticket_history.id,
-                ticket=ticket_history.ticket_id,
-                action_user=ticket_history.action_user.name if ticket_history.action_user else None,
-                action_description=ticket_history.action_description,
-                created_at=ticket_history.created_at,
-            )
-            for ticket_history in ticket_histories
+            to_ticket_history_response_item(ticket_history) for ticket_history in ticket_histories
         ],
+        has_more_histories=has_more_histories,
+        version=target_ticket.version,
+    )
+
+
+# 対応履歴の差分取得のレスポンスを作成
+# ticket_histories は残りの履歴の有無を判定するため、limit より1件多く取得したもの
+def to_ticket_histories_response(
+    ticket_histories: list[TicketHistory], since_id: int, limit: int
+) -> GetTicketHistoriesResponse:
+    has_more = len(ticket_histories) > limit
+    ticket_histories = ticket_histories[:limit]
+
+    return GetTicketHistoriesResponse(
+        items=[
+            to_ticket_history_response_item(ticket_history) for ticket_history in ticket_histories
+        ],
+        # 新しい履歴がない場合は、指定された since_id をそのまま返す
+        latest_id=ticket_histories[-1].id if ticket_histories else since_id,
+        has_more=has_more,
+    )
+
+
+# 検索結果のレスポンスを作成（limit + 1 件取得した結果から、次ページの有無を判定する）
+def to_ticket_search_response(ticket_rows: list[Row], limit: int, offset: int) -> FastJSONResponse:
+    has_next = len(ticket_rows) > limit
+    return FastJSONResponse(
+        {
+            "items": [to_ticket_response_dict(ticket_row) for ticket_row in ticket_rows[:limit]],
+            "next_offset": offset + limit if has_next else None,
+        }
+    )
+
+
+# チケット件数のレスポンスを作成（集計キーごとの件数を、ステータス別・サポート担当者別に合計する）
+def to_ticket_counts_response(count_rows: list[Row]) -> GetTicketCountsResponse:
+    status_counts = dict.fromkeys(TicketStatusType, 0)
+    supporter_counts: dict[int, GetTicketSupporterCountItem] = {}
+    unassigned = 0
+    for count_row in count_rows:
+        status_counts[count_row.status] += count_row.ticket_count
+        if count_row.supporter_id == UNASSIGNED_SUPPORTER_ID:
+            unassigned += count_row.ticket_count
+            continue
+        supporter_count = supporter_counts.setdefault(
+            count_row.supporter_id,
+            GetTicketSupporterCountItem(
+                supporter_id=count_row.supporter_id,
+                supporter=count_row.supporter_name,
+                count=0,
+            ),
+        )
+        supporter_count.count += count_row.ticket_count
+
+    return GetTicketCountsResponse(
+        total=sum(status_counts.values()),
+        unassigned=unassigned,
+        by_status=[
+            GetTicketStatusCountItem(status=status, count=count)
+            for status, count in status_counts.items()
+        ],
+        by_supporter=[supporter_counts[supporter_id] for supporter_id in sorted(supporter_counts)],
+    )
+
+
+# 取得した変更を、内容を返すチケット・対応履歴と、閲覧できなくなったチケットに振り分ける
+# 変更の取得時点でのチケットの起票者・公開設定で判定する（一覧取得と同じ条件）
+# アーカイブへ移したチケット（起票者が NULL）は、一覧から外れたため閲覧できなくなったチケットとして返す
+def split_ticket_changes(
+    change_rows: list[Row], account_type: AccountType, user_id: int
+) -> tuple[list[int], list[int], list[int]]:
+    ticket_ids: dict[int, None] = {}
+    history_ids: list[int] = []
+    removed_ticket_ids: dict[int, None] = {}
+    for change_row in change_rows:
+        if change_row.staff_id is not None and (
+            account_type != AccountType.STAFF
+            or change_row.staff_id == user_id
+            or change_row.is_public
+        ):
+            ticket_ids[change_row.ticket_id] = None
+            if change_row.ticket_history_id is not None:
+                history_ids.append(change_row.ticket_history_id)
+        else:
+            removed_ticket_ids[change_row.ticket_id] = None
+    return list(ticket_ids), history_ids, list(removed_ticket_ids)
+
+
+# 取得した変更を limit 件に切り詰め、残りの変更の有無と、次回の since に指定する seq を返す
+# change_rows は残りの変更の有無を判定するため、limit より1件多く取得したもの
+# 残りがある場合は、返す最後の変更の seq まで進める（それより後の変更は次回に回す）
+def split_ticket_change_page(
+    change_rows: list[Row], limit: int, latest_seq: int
+) -> tuple[list[Row], int, bool]:
+    has_more = len(change_rows) > limit
+    change_rows = change_rows[:limit]
+    if has_more:
+        latest_seq = change_rows[-1].seq
+    return change_rows, latest_seq, has_more
+
+
+def to_ticket_changes_response(
+    ticket_rows: list[Row],
+    ticket_histories: list[TicketHistory],
+    removed_ticket_ids: list[int],
+    latest_seq: int,
+    has_more: bool,
+) -> FastJSONResponse:
+    return FastJSONResponse(
+        {
+            "tickets": [to_ticket_response_dict(ticket_row) for ticket_row in ticket_rows],
+            "ticket_histories": [
+                to_ticket_history_response_item(ticket_history)
+                for ticket_history in ticket_histories
+            ],
+            "removed_ticket_ids": removed_ticket_ids,
+            "latest_seq": latest_seq,
+            "has_more": has_more,
+        }
+    )
+
+
+# チケット一覧の ETag を作成
+# 一覧の版（最新のチケットID・最新の対応履歴ID・最新の変更の seq・アカウントの最終更新日時）に、閲覧範囲とクエリパラメータを組み合わせる
+# 閲覧範囲 → 社員は自分ごと（自分のチケット＋公開チケット）、社員以外は全員同じ（全チケット）
+def to_ticket_list_etag(
+    list_version: Row,
+    account_type: AccountType,
+    user_id: int,
+    limit: int,
+    cursor: str | None,
+    legacy: bool,
+    filters: TicketListFilter,
+    sort: TicketListSortType,
+) -> str:
+    visibility_class = f"staff:{user_id}" if account_type == AccountType.STAFF else "all"
+    return make_etag(
+        "ticket-list",
+        visibility_class,
+        "legacy" if legacy else f"{limit}:{cursor or ''}",
+        filters.model_dump_json(),
+        sort.value,
+        list_version.latest_ticket_id,
+        list_version.latest_history_id,
+        list_version.latest_change_seq,
+        list_version.latest_user_updated_at,
+    )
+
+
+# チケット詳細の ETag を作成
+# チケットの版（更新のたびに進む version）と最新の対応履歴IDに、閲覧者（is_own_ticket が閲覧者によって変わるため）を組み合わせる
+# （更新日時は秒単位のため、同じ秒に2回更新された場合に区別できない）
+# 詳細に含む名前（起票者・サポート担当者・対応者）の変更は、アカウントの最終更新日時で判定する
+# 先頭を版にした強い ETag（"版.ハッシュ値"）のため、受け取った ETag をそのまま更新系APIの If-Match に指定できる
+def to_ticket_detail_etag(
+    ticket_id: int,
+    version: int,
+    latest_history_id: int | None,
+    latest_user_updated_at: datetime | None,
+    account_type: AccountType,
+    user_id: int,
+) -> str:
+    return make_versioned_etag(
+        version,
+        "ticket",
+        ticket_id,
+        latest_history_id,
+        latest_user_updated_at,
+        account_type.value,
+        user_id,
+    )
+
+
+# チケットの版から詳細の ETag を作成し、If-None-Match と一致する場合は 304 のレスポンスを返す（一致しない場合は None）
+# ticket_version → tickets になければアーカイブ済みのチケットから取得した版（閲覧できない場合は 404）
+def to_ticket_detail_not_modified_response(
+    ticket_version: Row | None,
+    ticket_id: int,
+    if_none_match: str,
+    account_type: AccountType,
+    user_id: int,
+) -> Response | None:
+    check_ticket_visible(ticket_version, account_type, user_id)
+
+    etag = to_ticket_detail_etag(
+        ticket_id,
+        ticket_version.version,
+        ticket_version.latest_history_id,
+        ticket_version.latest_user_updated_at,
+        account_type,
+        user_id,
+    )
+    if is_etag_matched(if_none_match, etag):
+        return to_not_modified_response(etag)
+    return None
+
+
+# チケット詳細のレスポンスを作成し、ETag を設定する
+# ETag は取得した内容から作成する（本文と ETag の版を一致させる）
+def to_ticket_detail_response_with_etag(
+    response: Response,
+    target_ticket: Ticket,
+    recent_histories: list[TicketHistory],
+    latest_user_updated_at: datetime | None,
+    account_type: AccountType,
+    user_id: int,
+) -> GetTicketDetailResponse:
+    set_etag_headers(
+        response,
+        to_ticket_detail_etag(
+            target_ticket.id,
+            target_ticket.version,
+            max((ticket_history.id for ticket_history in recent_histories), default=None),
+            latest_user_updated_at,
+            account_type,
+            user_id,
+        ),
+    )
+
+    return to_ticket_detail_response(target_ticket, recent_histories, account_type, user_id)
+
+
+# ETag に関するレスポンスヘッダーを設定
+# Cache-Control: private, no-cache → ブラウザにのみ保存させ、使用前に必ず ETag で更新の有無を確認させる
+def set_etag_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+# 更新がない場合のレスポンス（304・本文なし）
+def to_not_modified_response(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_etag_headers(response, etag)
+    return response
+
+
+# チケット参照系API（一覧・詳細・対応履歴）
+# DB_ASYNC_ENABLED=true の場合は api/v1/ticket_async.py の非同期ハンドラーが優先して使用される
+# 一覧・詳細は読み取り専用のレプリカで処理する（get_read_db。書き込み直後の利用者はプライマリで処理する）
+# レスポンスは FastJSONResponse で直接返すため、レスポンスの形式（APIドキュメント用）は response_model で指定する
+@router.get("", response_model=GetTicketListResponse | list[GetTicketResponseItem])
+def get_tickets(
+    session: Annotated[Session, Depends(get_read_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_for_read)],
+    # 絞り込み条件（ステータス・起票者・サポート担当者・公開設定・作成日時の範囲）
+    filters: Annotated[TicketListFilter, Depends(get_ticket_list_filter)],
+    # 1ページあたりの取得件数
+    limit: Annotated[int, Query(ge=1, le=TICKET_LIST_MAX_LIMIT)] = TICKET_LIST_DEFAULT_LIMIT,
+    # 前回レスポンスの next_cursor（未指定の場合は先頭ページ）
+    cursor: str | None = None,
+    # 互換用フラグ：True の場合、従来どおり全件をページネーションなしの配列で返す
+    # （クライアントの移行完了後に削除予定）
+    legacy: bool = False,
+    # 並び順（既定は作成日時の新しい順）
+    sort: TicketListSortType = TicketListSortType.CREATED_AT_DESC,
+    # 前回レスポンスの ETag（一致する場合は一覧を作成せずに 304 を返す）
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    decoded_cursor = None if legacy else decode_ticket_list_cursor(cursor, sort, filters)
+
+    # 一覧の版は、一覧の取得より先に確認する
+    # （間に更新があった場合、ETag が一覧より古くなり次回は再取得される。逆の順番では更新を見逃す）
+    list_version = get_ticket_list_version(session)
+    etag = to_ticket_list_etag(
+        list_version, account_type, user_id, limit, cursor, legacy, filters, sort
+    )
+    if is_etag_matched(if_none_match, etag):
+        return to_not_modified_response(etag)
+
+    # 閲覧可能なチケットのみ取得（社員の場合は自分のチケット または 公開チケットのみ）
+    ticket_rows = get_visible_ticket_list_rows(
+        session,
+        user_id=user_id,
+        account_type=account_type,
+        limit=get_ticket_list_fetch_limit(limit, legacy),
+        cursor=decoded_cursor,
+        filters=filters,
+        sort=sort,
+    )
+
+    return to_ticket_list_page_response(ticket_rows, etag, limit, legacy, sort, filters)
+
+
+# ダッシュボード用のチケット件数（ステータス別・サポート担当者別）
+# 一覧を取得して数えるのではなく、更新のたびに増減している集計（ticket_counts）から返す
+# 社員の場合は公開チケットの件数に、自分の非公開チケットの件数（チケットから直接集計）を加える
+@router.get("/counts")
+def get_ticket_counts(
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+) -> GetTicketCountsResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    if account_type == AccountType.STAFF:
+        count_rows = get_ticket_count_rows(
+            session, public_only=True
+        ) + get_own_private_ticket_count_rows(session, staff_id=user_id)
+    else:
+        count_rows = get_ticket_count_rows(session, public_only=False)
+
+    return to_ticket_counts_response(count_rows)
+
+
+# タイトル・詳細・対応履歴にキーワードを含むチケットを、関連度の高い順に返す
+# 閲覧可能なチケットのみ（一覧取得と同じ条件）
+@router.get("/search", response_model=GetTicketSearchResponse)
+def search_tickets(
+    session: Annotated[Session, Depends(get_read_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_for_read)],
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=TICKET_SEARCH_MAX_LIMIT)] = TICKET_SEARCH_DEFAULT_LIMIT,
+    offset: Annotated[int, Query(ge=0, le=TICKET_SEARCH_MAX_OFFSET)] = 0,
+) -> FastJSONResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    # 次ページの有無を判定するため、1件多く取得する
+    ticket_rows = get_ticket_search_backend(session).search(
+        session,
+        keyword=q,
+        user_id=user_id,
+        account_type=account_type,
+        limit=limit + 1,
+        offset=offset,
+    )
+
+    return to_ticket_search_response(ticket_rows, limit, offset)
+
+
+# 指定した seq より後の変更のうち、閲覧可能なチケット・対応履歴のみ返す（差分同期）
+# クライアントは手元に保持した一覧に反映し、次回は返された latest_seq を since に指定する
+# 最新の seq を先に確定し、それ以前の変更のみ返す（取得中に追加された変更は次回に回す）
+# 閲覧可能な変更がない場合も latest_seq は進むため、次回は同じ範囲を読み直さない
+@router.get("/changes", response_model=GetTicketChangesResponse)
+def get_ticket_changes(
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=TICKET_CHANGE_MAX_LIMIT)] = TICKET_CHANGE_DEFAULT_LIMIT,
+) -> FastJSONResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    latest_seq = get_latest_ticket_change_seq(session)
+
+    # 残りの変更の有無を判定するため、1件多く取得する
+    change_rows = get_ticket_changes_since(
+        session,
+        user_id=user_id,
+        account_type=account_type,
+        since_seq=since,
+        until_seq=latest_seq,
+        limit=limit + 1,
+    )
+    change_rows, latest_seq, has_more = split_ticket_change_page(change_rows, limit, latest_seq)
+
+    ticket_ids, history_ids, removed_ticket_ids = split_ticket_changes(
+        change_rows, account_type, user_id
+    )
+    ticket_rows = get_ticket_list_rows_by_ids(session, ids=ticket_ids) if ticket_ids else []
+    ticket_histories = get_ticket_histories_by_ids(session, ids=history_ids) if history_ids else []
+
+    return to_ticket_changes_response(
+        ticket_rows, ticket_histories, removed_ticket_ids, latest_seq, has_more
+    )
+
+
+@router.get("/{ticket_id}", response_model=GetTicketDetailResponse)
+def get_ticket_detail(
+    ticket_id: int,
+    session: Annotated[Session, Depends(get_read_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_for_read)],
+    response: Response,
+    # 前回レスポンスの ETag（一致する場合は詳細を作成せずに 304 を返す）
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> GetTicketDetailResponse | Response:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    # ETag が指定された場合、版（チケットの版・最新の対応履歴ID）のみ取得して比較する
+    # tickets にない場合は、アーカイブ済みのチケットの版を取得する
+    if if_none_match is not None:
+        ticket_version = get_ticket_version(session, id=ticket_id)
+        if ticket_version is None:
+            ticket_version = get_archived_ticket_version(session, id=ticket_id)
+
+        not_modified_response = to_ticket_detail_not_modified_response(
+            ticket_version, ticket_id, if_none_match, account_type, user_id
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+    # アカウントの最終更新日時は、詳細の取得より先に確認する
+    # （取得中に名前が変更された場合は、ETag が古くなり、次回の確認で取得し直される）
+    latest_user_updated_at = get_latest_user_updated_at(session)
+
+    # チケット情報取得（サポート担当者も同時に取得）
+    target_ticket = get_ticket_detail_by_id(session, id=ticket_id)
+
+    # tickets にない場合は、アーカイブ済みのチケットから取得する（レスポンスは同じ）
+    is_archived = target_ticket is None
+    if is_archived:
+        target_ticket = get_archived_ticket_detail_by_id(session, id=ticket_id)
+
+    check_ticket_visible(target_ticket, account_type, user_id)
+
+    # 対応情報取得（直近の履歴のみ・対応者も同時に取得）
+    # より古い履歴の有無を判定するため、1件多く取得する
+    recent_histories = (
+        get_recent_archived_ticket_histories if is_archived else get_recent_ticket_histories
+    )(session, ticket_id=ticket_id, limit=TICKET_DETAIL_HISTORY_LIMIT + 1)
+
+    return to_ticket_detail_response_with_etag(
+        response, target_ticket, recent_histories, latest_user_updated_at, account_type, user_id
+    )
+
+
+# 対応履歴の差分取得
+# since_id より後に追加された履歴のみ返すため、画面更新時は前回の latest_id を指定して差分だけ取得できる
+# （since_id=0 の場合は最初の履歴から取得）
+@router.get("/{ticket_id}/histories")
+def get_ticket_histories(
+    ticket_id: int,
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+    since_id: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=TICKET_HISTORY_MAX_LIMIT)] = TICKET_HISTORY_DEFAULT_LIMIT,
+) -> GetTicketHistoriesResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    # チケット情報取得
+    target_ticket = get_ticket_by_id(session, id=ticket_id)
+
+    # tickets にない場合は、アーカイブ済みのチケットから取得する
+    is_archived = target_ticket is None
+    if is_archived:
+        target_ticket = get_archived_ticket_by_id(session, id=ticket_id)
+
+    check_ticket_visible(target_ticket, account_type, user_id)
+
+    # 残りの履歴の有無を判定するため、1件多く取得する
+    ticket_histories = (
+        get_archived_ticket_histories_since if is_archived else get_ticket_histories_since
+    )(session, ticket_id=ticket_id, since_id=since_id, limit=limit + 1)
+
+    return to_ticket_histories_response(ticket_histories, since_id, limit)
+
+
+# チケットの変更を、差分同期用の変更履歴（ticket_changes）に追加
+# 更新内容と同じトランザクションでコミットし、変更の取りこぼし・変更のない seq の採番を防ぐ
+def add_ticket_change(
+    session: Session,
+    change_type: TicketEventType,
+    target_ticket: Ticket,
+    new_ticket_history: TicketHistory,
+) -> TicketChange:
+    ticket_change = TicketChange(
+        ticket_id=target_ticket.id,
+        ticket_history=new_ticket_history,
+        change_type=change_type,
+    )
+    session.add(ticket_change)
+    return ticket_change
+
+
+# チケットの現在の状態の、件数の集計キー
+def get_ticket_count_key(target_ticket: Ticket) -> TicketCountKey:
+    return to_ticket_count_key(
+        target_ticket.status, target_ticket.supporter_id, target_ticket.is_public
+    )
+
+
+# チケットのステータス・サポート担当者・公開設定の変更を、件数の集計（ticket_counts）に反映
+# before → 変更前の集計キー。更新内容と同じトランザクションでコミットする
+def move_ticket_count(session: Session, before: TicketCountKey, target_ticket: Ticket) -> None:
+    after = get_ticket_count_key(target_ticket)
+    if before != after:
+        add_ticket_counts(session, {before: -1, after: 1})
+
+
+# If-Match で指定された版が、チケットの現在の版と一致するか確認する（一致しない場合は 412）
+# 画面に表示中の内容が古い（表示した後に他の操作で更新された）まま、更新しないようにする
+def check_ticket_if_match(if_match: str | None, target_ticket: Ticket) -> None:
+    if not is_if_match_satisfied(if_match, target_ticket.version):
+        raise PreconditionFailedException(TICKET_UPDATED_BY_OTHERS_MESSAGE)
+
+
+# 更新後のチケットの版を ETag ヘッダーに設定する（次の更新の If-Match に指定する）
+def set_ticket_version_header(response: Response, target_ticket: Ticket) -> None:
+    response.headers["ETag"] = make_version_etag(target_ticket.version)
+
+
+# アーカイブ済みのチケットを tickets へ戻す（再オープン時。チケットID → 戻したチケット）
+# 戻したチケットは件数の集計に加え直し、変更履歴に復元を記録する（一覧の版・検索用の索引に反映させるため）
+# 更新内容と同じトランザクションでコミットする
+def restore_tickets_from_archive(session: Session, ticket_ids: list[int]) -> dict[int, Ticket]:
+    restored_ids = restore_archived_tickets(session, ticket_ids) if ticket_ids else []
+    if not restored_ids:
+        return {}
+
+    restored_tickets = {
+        target_ticket.id: target_ticket
+        for target_ticket in get_tickets_by_ids(session, restored_ids)
+    }
+
+    count_deltas: dict[TicketCountKey, int] = {}
+    for target_ticket in restored_tickets.values():
+        count_key = get_ticket_count_key(target_ticket)
+        count_deltas[count_key] = count_deltas.get(count_key, 0) + 1
+    add_ticket_counts(session, count_deltas)
+
+    insert_ticket_changes(
+        session,
+        [
+            {
+                "ticket_id": ticket_id,
+                "ticket_history_id": None,
+                "change_type": TicketEventType.RESTORED,
+            }
+            for ticket_id in restored_ids
+        ],
+    )
+    return restored_tickets
+
+
+# チケットの変更を、SSE で接続中のアカウントへ通知（コミット後に呼び出す）
+# is_public → 配信先の絞り込みに使う公開設定（省略した場合はチケットの現在の設定）
+def publish_ticket_event(
+    ticket_change: TicketChange,
+    target_ticket: Ticket,
+    new_ticket_history: TicketHistory | None = None,
+    is_public: bool | None = None,
+) -> None:
+    ticket_event_broker.publish(
+        TicketEvent(
+            event_type=ticket_change.change_type,
+            change_seq=ticket_change.seq,
+            ticket_id=target_ticket.id,
+            staff_id=target_ticket.staff_id,
+            is_public=target_ticket.is_public if is_public is None else is_public,
+            history_id=new_ticket_history.id if new_ticket_history is not None else None,
+        )
     )
 
 
@@ -158,16 +906,12 @@ def create_ticket(
     body: CreateTicketRequest,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
 ) -> CreateTicketResponse:
     account_type = access_token.account_type
     user_id = access_token.user_id
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
+    check_current_account(target_account)
 
     check_account(account_type)
 
@@ -179,6 +923,12 @@ def create_ticket(
     )
 
     session.add(new_ticket)
+    # チケットIDは登録時に採番されるため、関連（ticket）で紐づける
+    ticket_change = TicketChange(ticket=new_ticket, change_type=TicketEventType.CREATED)
+    session.add(ticket_change)
+    add_ticket_counts(
+        session, {to_ticket_count_key(TicketStatusType.START, None, new_ticket.is_public): 1}
+    )
 
     try:
         session.commit()
@@ -186,6 +936,8 @@ def create_ticket(
         session.rollback()
         raise error
 
+    publish_ticket_event(ticket_change, new_ticket)
+
     return CreateTicketResponse(
         id=new_ticket.id,
         title=new_ticket.title,
@@ -203,16 +955,12 @@ def create_ticket_comment(
     body: CreateTicketCommentRequest,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
 ) -> CreateTicketCommentResponse:
     account_type = access_token.account_type
     user_id = access_token.user_id
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
+    check_current_account(target_account)
 
     # チケット情報取得
     target_ticket = get_ticket_by_id(session, id=ticket_id)
@@ -240,6 +988,9 @@ def create_ticket_comment(
     )
 
     session.add(new_ticket_history)
+    ticket_change = add_ticket_change(
+        session, TicketEventType.COMMENTED, target_ticket, new_ticket_history
+    )
 
     try:
         session.commit()
@@ -247,6 +998,8 @@ def create_ticket_comment(
         session.rollback()
         raise error
 
+    publish_ticket_event(ticket_change, target_ticket, new_ticket_history)
+
     return CreateTicketCommentResponse(
         id=target_ticket.id,
         action_user=target_account.name,
@@ -254,6 +1007,424 @@ def create_ticket_comment(
     )
 
 
+# チケット一括操作の対象（検証を通過し、変更を適用したチケット1件分）
+@dataclass
+class BulkTicketChange:
+    target_ticket: Ticket
+    # 変更前の件数の集計キー
+    count_key: TicketCountKey
+    # 追加する対応履歴の内容
+    action_description: str
+
+
+# チケット一括操作で対象にできなかったチケット（1件分）
+@dataclass
+class BulkTicketFailure:
+    # 単体の操作で返すステータスコードと同じ
+    # （422：操作の条件を満たさない、412：指定された版と異なる、409：更新するまでの間に他の操作で更新された）
+    status_code: int
+    # 失敗した理由
+    message: str
+
+
+# 一括操作の対象チケットを1回のSELECTで取得する（チケットID → チケット。重複したIDは1件にまとめる）
+def get_bulk_target_tickets(session: Session, ticket_ids: list[int]) -> dict[int, Ticket]:
+    return {
+        target_ticket.id: target_ticket
+        for target_ticket in get_tickets_by_ids(session, list(dict.fromkeys(ticket_ids)))
+    }
+
+
+# 一括操作で変更したチケットの対応履歴・変更履歴・件数の集計を追加し、1回でコミットする
+# 対応履歴はまとめて flush し（採番されたIDは追加したオブジェクトから取得する）、変更履歴は1回の executemany で追加する
+# （チケットごとのコミットは行わない）
+# is_public → 通知の配信先の絞り込みに使う公開設定（省略した場合はチケットの現在の設定）
+def commit_bulk_ticket_changes(
+    session: Session,
+    change_type: TicketEventType,
+    action_user_id: int | None,
+    bulk_changes: list[BulkTicketChange],
+    is_public: bool | None = None,
+) -> None:
+    if not bulk_changes:
+        return
+
+    history_ids = add_ticket_histories(
+        session,
+        [
+            {
+                "ticket_id": bulk_change.target_ticket.id,
+                "action_user_id": action_user_id,
+                "action_description": bulk_change.action_description,
+            }
+            for bulk_change in bulk_changes
+        ],
+    )
+    ticket_ids = [bulk_change.target_ticket.id for bulk_change in bulk_changes]
+
+    insert_ticket_changes(
+        session,
+        [
+            {
+                "ticket_id": ticket_id,
+                "ticket_history_id": history_ids[ticket_id],
+                "change_type": change_type,
+            }
+            for ticket_id in ticket_ids
+        ],
+    )
+
+    # 同じ集計キーの増減はまとめてから反映する
+    count_deltas: dict[TicketCountKey, int] = {}
+    for bulk_change in bulk_changes:
+        after = get_ticket_count_key(bulk_change.target_ticket)
+        count_deltas[bulk_change.count_key] = count_deltas.get(bulk_change.count_key, 0) - 1
+        count_deltas[after] = count_deltas.get(after, 0) + 1
+    add_ticket_counts(session, count_deltas)
+
+    try:
+        session.commit()
+    except Exception as error:
+        session.rollback()
+        raise error
+
+    # seq はコミット時に採番するため、コミット後に取得する
+    change_seqs = get_ticket_change_seqs_by_history_ids(session, list(history_ids.values()))
+    for bulk_change in bulk_changes:
+        target_ticket = bulk_change.target_ticket
+        history_id = history_ids[target_ticket.id]
+        ticket_event_broker.publish(
+            TicketEvent(
+                event_type=change_type,
+                change_seq=change_seqs[history_id],
+                ticket_id=target_ticket.id,
+                staff_id=target_ticket.staff_id,
+                is_public=target_ticket.is_public if is_public is None else is_public,
+                history_id=history_id,
+            )
+        )
+
+
+# 一括操作の対象にできるか、チケットごとに確認する（対象にできないチケットID → 理由）
+# 操作ごとの条件（check）を満たす場合、版の指定（expected_versions）があれば、画面に表示したときの版と同じか確認する
+# （チケットごとの If-Match。指定がないチケットは版を確認しない）
+def check_bulk_targets(
+    ticket_ids: list[int],
+    target_tickets: Mapping[int, Ticket],
+    expected_versions: dict[int, int],
+    check: Callable[[Ticket | None], str | None],
+) -> dict[int, BulkTicketFailure]:
+    failures = {}
+    for ticket_id in dict.fromkeys(ticket_ids):
+        target_ticket = target_tickets.get(ticket_id)
+        if (message := check(target_ticket)) is not None:
+            failures[ticket_id] = BulkTicketFailure(422, message)
+        elif (
+            ticket_id in expected_versions and target_ticket.version != expected_versions[ticket_id]
+        ):
+            failures[ticket_id] = BulkTicketFailure(412, TICKET_UPDATED_BY_OTHERS_MESSAGE)
+    return failures
+
+
+# 一括操作のレスポンスを作成（指定されたチケットIDの順。失敗したチケットは理由を返す）
+def to_bulk_ticket_response(
+    ticket_ids: list[int], failures: dict[int, BulkTicketFailure]
+) -> BulkTicketResponse:
+    results = [
+        BulkTicketResultItem(
+            ticket_id=ticket_id,
+            success=failure is None,
+            status_code=200 if failure is None else failure.status_code,
+            message=None if failure is None else failure.message,
+        )
+        for ticket_id in dict.fromkeys(ticket_ids)
+        for failure in [failures.get(ticket_id)]
+    ]
+    return BulkTicketResponse(
+        results=results,
+        succeeded=sum(result.success for result in results),
+        failed=sum(not result.success for result in results),
+    )
+
+
+# 一括担当割り当ての対象にできるか確認する（担当割り当て（/{ticket_id}/assign）と同じ条件）
+# 対象にできない場合はその理由を返す
+def check_bulk_assign(target_ticket: Ticket | None) -> str | None:
+    if target_ticket is None:
+        return TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE
+    if target_ticket.supporter_id:
+        return "すでにサポート担当者が存在します"
+    if target_ticket.status != TicketStatusType.START or not can_status_transition(
+        target_ticket.status, TicketStatusType.ASSIGNED
+    ):
+        return "選択したステータスには変更できません"
+    return None
+
+
+# 一括担当解除の対象にできるか確認する（担当解除（/{ticket_id}/unassign）と同じ条件）
+def check_bulk_unassign(target_ticket: Ticket | None, supporter_id: int) -> str | None:
+    if target_ticket is None:
+        return TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE
+    if target_ticket.supporter_id != supporter_id:
+        return "このチケットの担当解除を行う権限がありません"
+    if not can_status_transition(target_ticket.status, TicketStatusType.START):
+        return "選択したステータスには変更できません"
+    return None
+
+
+# ステータス一括変更の対象にできるか確認する（ステータス変更（/{ticket_id}/status）と同じ条件）
+def check_bulk_update_status(
+    target_ticket: Ticket | None,
+    new_status: TicketStatusType,
+    account_type: AccountType,
+    user_id: int,
+) -> str | None:
+    if target_ticket is None:
+        return TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE
+    if target_ticket.status == TicketStatusType.START:
+        return "現在のステータスからの変更はできません"
+    if target_ticket.supporter_id is None:
+        return "担当者が設定されていません"
+    if not (account_type == AccountType.ADMIN or target_ticket.supporter_id == user_id):
+        return "ステータスを変更する権限がありません"
+    if not can_status_transition(target_ticket.status, new_status):
+        return "選択したステータスには変更できません"
+    return None
+
+
+# 公開設定一括変更の対象にできるか確認する（公開設定変更（/{ticket_id}/visibility）と同じ条件）
+def check_bulk_update_visibility(
+    target_ticket: Ticket | None, is_public: bool, account_type: AccountType, user_id: int
+) -> str | None:
+    if target_ticket is None:
+        return TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE
+    if account_type == AccountType.STAFF and target_ticket.staff_id != user_id:
+        return TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE
+    if target_ticket.is_public == is_public:
+        return "設定は更新済みです"
+    return None
+
+
+# [一括操作]
+# 複数のチケットへの同じ操作を1回のリクエスト・1回のコミットで行う（チケットごとにAPIを呼び出さない）
+# 全チケットを先に検証し、対象にできるチケットのみ変更する（対象にできないチケットは理由を返す）
+# /{ticket_id}/assign などより先に登録する（/bulk がチケットIDとして扱われないようにする）
+@router.put("/bulk/assign")
+def bulk_assign_supporter(
+    body: BulkTicketRequest,
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+) -> BulkTicketResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    # アカウントタイプがサポート担当者でない場合
+    if account_type != AccountType.SUPPORTER:
+        raise ForbiddenException("サポート担当者でないため、チケットの担当にはなれません")
+
+    check_current_account(target_account)
+
+    target_tickets = get_bulk_target_tickets(session, body.ticket_ids)
+    failures = check_bulk_targets(
+        body.ticket_ids, target_tickets, body.expected_versions, check_bulk_assign
+    )
+
+    bulk_changes = []
+    for ticket_id, target_ticket in target_tickets.items():
+        if ticket_id in failures:
+            continue
+        count_key = get_ticket_count_key(target_ticket)
+        # 読み込んだ後に他の操作で更新されていた場合は、このチケットのみ失敗とする（他のチケットは変更する）
+        if not update_ticket_if_unchanged(
+            session, target_ticket, supporter_id=user_id, status=TicketStatusType.ASSIGNED
+        ):
+            failures[ticket_id] = BulkTicketFailure(409, TICKET_UPDATED_BY_OTHERS_MESSAGE)
+            continue
+        bulk_changes.append(
+            BulkTicketChange(
+                target_ticket,
+                count_key,
+                f"担当者 {target_account.name} を担当に割り当てました",
+            )
+        )
+
+    commit_bulk_ticket_changes(session, TicketEventType.ASSIGNED, None, bulk_changes)
+
+    return to_bulk_ticket_response(body.ticket_ids, failures)
+
+
+@router.put("/bulk/unassign")
+def bulk_unassign_supporter(
+    body: BulkTicketRequest,
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+) -> BulkTicketResponse:
+    account_type = access_token.account_type
+
+    # アカウントタイプがサポート担当者でない場合
+    if account_type != AccountType.SUPPORTER:
+        raise ForbiddenException("サポート担当者でないため、チケットの担当解除はできません")
+
+    check_current_account(target_account)
+
+    target_tickets = get_bulk_target_tickets(session, body.ticket_ids)
+    failures = check_bulk_targets(
+        body.ticket_ids,
+        target_tickets,
+        body.expected_versions,
+        lambda target_ticket: check_bulk_unassign(target_ticket, target_account.id),
+    )
+
+    bulk_changes = []
+    for ticket_id, target_ticket in target_tickets.items():
+        if ticket_id in failures:
+            continue
+        count_key = get_ticket_count_key(target_ticket)
+        # 読み込んだ後に他の操作で更新されていた場合は、このチケットのみ失敗とする（他のチケットは変更する）
+        if not update_ticket_if_unchanged(
+            session, target_ticket, supporter_id=None, status=TicketStatusType.START
+        ):
+            failures[ticket_id] = BulkTicketFailure(409, TICKET_UPDATED_BY_OTHERS_MESSAGE)
+            continue
+        bulk_changes.append(
+            BulkTicketChange(
+                target_ticket,
+                count_key,
+                f"担当者 {target_account.name} の担当を解除しました",
+            )
+        )
+
+    commit_bulk_ticket_changes(session, TicketEventType.UNASSIGNED, None, bulk_changes)
+
+    return to_bulk_ticket_response(body.ticket_ids, failures)
+
+
+@router.put("/bulk/status")
+def bulk_update_ticket_status(
+    body: BulkUpdateTicketStatusRequest,
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+) -> BulkTicketResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+    new_status = body.status
+
+    # ステータスを「新規質問」に変更しようとした場合
+    if new_status == TicketStatusType.START:
+        raise BusinessException("「新規質問」には遷移できません")
+
+    # アカウントタイプが社員（サポート担当者または管理者でない場合）の場合
+    if account_type == AccountType.STAFF:
+        raise ForbiddenException("社員のため、ステータスを変更することができません")
+
+    check_current_account(target_account)
+
+    target_tickets = get_bulk_target_tickets(session, body.ticket_ids)
+    # tickets にないチケットは、アーカイブ済みのチケットから取得する（再オープンする場合のみ、確認後に tickets へ戻す）
+    archived_ticket_ids = [
+        ticket_id for ticket_id in dict.fromkeys(body.ticket_ids) if ticket_id not in target_tickets
+    ]
+    archived_tickets = (
+        {
+            archived_ticket.id: archived_ticket
+            for archived_ticket in get_archived_tickets_by_ids(session, archived_ticket_ids)
+        }
+        if archived_ticket_ids
+        else {}
+    )
+    failures = check_bulk_targets(
+        body.ticket_ids,
+        {**archived_tickets, **target_tickets},
+        body.expected_versions,
+        lambda target_ticket: check_bulk_update_status(
+            target_ticket, new_status, account_type, target_account.id
+        ),
+    )
+    target_tickets.update(
+        restore_tickets_from_archive(
+            session,
+            [ticket_id for ticket_id in archived_tickets if ticket_id not in failures],
+        )
+    )
+    # 同時に戻された などで、アーカイブになくなっていた場合
+    for ticket_id in archived_tickets:
+        if ticket_id not in target_tickets:
+            failures.setdefault(
+                ticket_id, BulkTicketFailure(422, TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
+            )
+
+    bulk_changes = []
+    for ticket_id, target_ticket in target_tickets.items():
+        if ticket_id in failures:
+            continue
+        count_key = get_ticket_count_key(target_ticket)
+        # 読み込んだ後に他の操作で更新されていた場合は、このチケットのみ失敗とする（他のチケットは変更する）
+        if not update_ticket_if_unchanged(session, target_ticket, status=new_status):
+            failures[ticket_id] = BulkTicketFailure(409, TICKET_UPDATED_BY_OTHERS_MESSAGE)
+            continue
+        bulk_changes.append(
+            BulkTicketChange(
+                target_ticket,
+                count_key,
+                f"ステータスを「{new_status.label_ja}」に変更しました",
+            )
+        )
+
+    commit_bulk_ticket_changes(session, TicketEventType.STATUS_UPDATED, user_id, bulk_changes)
+
+    return to_bulk_ticket_response(body.ticket_ids, failures)
+
+
+@router.put("/bulk/visibility")
+def bulk_update_ticket_visibility(
+    body: BulkUpdateTicketVisibilityRequest,
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+) -> BulkTicketResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    target_tickets = get_bulk_target_tickets(session, body.ticket_ids)
+    failures = check_bulk_targets(
+        body.ticket_ids,
+        target_tickets,
+        body.expected_versions,
+        lambda target_ticket: check_bulk_update_visibility(
+            target_ticket, body.is_public, account_type, user_id
+        ),
+    )
+
+    bulk_changes = []
+    for ticket_id, target_ticket in target_tickets.items():
+        if ticket_id in failures:
+            continue
+        count_key = get_ticket_count_key(target_ticket)
+        # 読み込んだ後に他の操作で更新されていた場合は、このチケットのみ失敗とする（他のチケットは変更する）
+        if not update_ticket_if_unchanged(session, target_ticket, is_public=body.is_public):
+            failures[ticket_id] = BulkTicketFailure(409, TICKET_UPDATED_BY_OTHERS_MESSAGE)
+            continue
+        bulk_changes.append(
+            BulkTicketChange(
+                target_ticket,
+                count_key,
+                f"公開設定を「{target_ticket.translate_is_public_to_ja()}」に変更しました",
+            )
+        )
+
+    # 公開→非公開に変更した場合も、変更前に閲覧できていた社員へ通知する（公開チケットとして配信する）
+    commit_bulk_ticket_changes(
+        session, TicketEventType.VISIBILITY_UPDATED, user_id, bulk_changes, is_public=True
+    )
+
+    return to_bulk_ticket_response(body.ticket_ids, failures)
+
+
 # [URLのパス設計]
 # 「どのリソースに何をしたいか」がURLで表現されているのが望ましい
 # 動詞を先頭に置いたり、動詞だけのパスは避ける
@@ -263,6 +1434,9 @@ def assign_supporter(
     ticket_id: int,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> UpdateTicketResponse:
     account_type = access_token.account_type
     user_id = access_token.user_id
@@ -271,12 +1445,7 @@ def assign_supporter(
     if account_type != AccountType.SUPPORTER:
         raise ForbiddenException("サポート担当者でないため、チケットの担当にはなれません")
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
+    check_current_account(target_account)
 
     # チケット情報取得
     target_ticket = get_ticket_by_id(session, id=ticket_id)
@@ -285,22 +1454,24 @@ def assign_supporter(
     if target_ticket is None:
         raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
 
+    # 画面に表示した後に、他の操作でチケットが更新されていた場合
+    check_ticket_if_match(if_match, target_ticket)
+
     # すでにチケットのサポート担当者が存在する場合
     if target_ticket.supporter_id:
         raise BusinessException("すでにサポート担当者が存在します")
 
-    # チケットのサポート担当者を更新
-    target_ticket.supporter_id = user_id
-
-    # ステータスが「新規質問」でない場合
-    if target_ticket.status != TicketStatusType.START:
-        raise Exception
-
-    # 遷移不可のステータスに変更しようとした場合
-    if not can_status_transition(target_ticket.status, TicketStatusType.ASSIGNED):
+    # ステータスが「新規質問」でない場合 または 遷移不可のステータスに変更しようとした場合
+    # （チケットを変更する前に確認する）
+    if target_ticket.status != TicketStatusType.START or not can_status_transition(
+        target_ticket.status, TicketStatusType.ASSIGNED
+    ):
         raise BusinessException("選択したステータスには変更できません")
 
-    # ステータスを「新規質問」から「担当者割り当て済み」に変更
+    count_key = get_ticket_count_key(target_ticket)
+
+    # チケットのサポート担当者を更新し、ステータスを「新規質問」から「担当者割り当て済み」に変更
+    target_ticket.supporter_id = user_id
     target_ticket.status = TicketStatusType.ASSIGNED
 
     # 対応履歴の追加
@@ -311,13 +1482,24 @@ def assign_supporter(
     )
 
     session.add(new_ticket_history)
+    ticket_change = add_ticket_change(
+        session, TicketEventType.ASSIGNED, target_ticket, new_ticket_history
+    )
+    move_ticket_count(session, count_key, target_ticket)
 
     try:
         session.commit()
+    # 読み込んだ後に他の操作でチケットが更新されていた場合（版が一致せず、UPDATE の対象の行がない場合）
+    except StaleDataError as error:
+        session.rollback()
+        raise ConflictException(TICKET_UPDATED_BY_OTHERS_MESSAGE) from error
     except Exception as error:
         session.rollback()
         raise error
 
+    publish_ticket_event(ticket_change, target_ticket, new_ticket_history)
+    set_ticket_version_header(response, target_ticket)
+
     # FEを意識した必要最低限のレスポンスにする(以下以外の変更内容はDBを確認)
     return UpdateTicketResponse(
         id=target_ticket.id,
@@ -331,20 +1513,17 @@ def unassign_supporter(
     ticket_id: int,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> UpdateTicketResponse:
     account_type = access_token.account_type
-    user_id = access_token.user_id
 
     # アカウントタイプがサポート担当者でない場合
     if account_type != AccountType.SUPPORTER:
         raise ForbiddenException("サポート担当者でないため、チケットの担当解除はできません")
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
+    check_current_account(target_account)
 
     # チケット情報取得
     target_ticket = get_ticket_by_id(session, id=ticket_id)
@@ -353,6 +1532,9 @@ def unassign_supporter(
     if target_ticket is None:
         raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
 
+    # 画面に表示した後に、他の操作でチケットが更新されていた場合
+    check_ticket_if_match(if_match, target_ticket)
+
     # ログイン中のアカウントがチケットの担当者でない場合
     if target_ticket.supporter_id != target_account.id:
         raise ForbiddenException("このチケットの担当解除を行う権限がありません")
@@ -361,6 +1543,8 @@ def unassign_supporter(
     if not can_status_transition(target_ticket.status, TicketStatusType.START):
         raise BusinessException("選択したステータスには変更できません")
 
+    count_key = get_ticket_count_key(target_ticket)
+
     # チケットのサポート担当者を更新
     target_ticket.supporter_id = None
 
@@ -375,13 +1559,24 @@ def unassign_supporter(
     )
 
     session.add(new_ticket_history)
+    ticket_change = add_ticket_change(
+        session, TicketEventType.UNASSIGNED, target_ticket, new_ticket_history
+    )
+    move_ticket_count(session, count_key, target_ticket)
 
     try:
         session.commit()
+    # 読み込んだ後に他の操作でチケットが更新されていた場合（版が一致せず、UPDATE の対象の行がない場合）
+    except StaleDataError as error:
+        session.rollback()
+        raise ConflictException(TICKET_UPDATED_BY_OTHERS_MESSAGE) from error
     except Exception as error:
         session.rollback()
         raise error
 
+    publish_ticket_event(ticket_change, target_ticket, new_ticket_history)
+    set_ticket_version_header(response, target_ticket)
+
     return UpdateTicketResponse(
         id=target_ticket.id,
         status=target_ticket.status,
@@ -395,6 +1590,9 @@ def update_ticket_status(
     body: UpdateTicketStatusRequest,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> UpdateTicketResponse:
     account_type = access_token.account_type
     user_id = access_token.user_id
@@ -408,20 +1606,23 @@ def update_ticket_status(
     if account_type == AccountType.STAFF:
         raise ForbiddenException("社員のため、ステータスを変更することができません")
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
+    check_current_account(target_account)
 
     # チケット情報取得
     target_ticket = get_ticket_by_id(session, id=ticket_id)
 
+    # tickets にない場合は、アーカイブ済みのチケットを取得する（再オープンする場合のみ、確認後に tickets へ戻す）
+    is_archived = target_ticket is None
+    if is_archived:
+        target_ticket = get_archived_ticket_by_id(session, id=ticket_id)
+
     # 存在しないチケットを取得しようとした場合
     if target_ticket is None:
         raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
 
+    # 画面に表示した後に、他の操作でチケットが更新されていた場合
+    check_ticket_if_match(if_match, target_ticket)
+
     # 現在のステータスが「新規質問」の場合、ステータス変更不可
     if target_ticket.status == TicketStatusType.START:
         raise BusinessException("現在のステータスからの変更はできません")
@@ -440,6 +1641,16 @@ def update_ticket_status(
     if not can_status_transition(target_ticket.status, new_status):
         raise BusinessException("選択したステータスには変更できません")
 
+    # アーカイブ済みのチケット（「クローズ」）を再オープンする場合、tickets へ戻してから変更する
+    if is_archived:
+        target_ticket = restore_tickets_from_archive(session, [ticket_id]).get(ticket_id)
+
+        # 同時に戻された などで、アーカイブになくなっていた場合
+        if target_ticket is None:
+            raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
+
+    count_key = get_ticket_count_key(target_ticket)
+
     # 選択したステータスに変更
     target_ticket.status = new_status
 
@@ -451,13 +1662,24 @@ def update_ticket_status(
     )
 
     session.add(new_ticket_history)
+    ticket_change = add_ticket_change(
+        session, TicketEventType.STATUS_UPDATED, target_ticket, new_ticket_history
+    )
+    move_ticket_count(session, count_key, target_ticket)
 
     try:
         session.commit()
+    # 読み込んだ後に他の操作でチケットが更新されていた場合（版が一致せず、UPDATE の対象の行がない場合）
+    except StaleDataError as error:
+        session.rollback()
+        raise ConflictException(TICKET_UPDATED_BY_OTHERS_MESSAGE) from error
     except Exception as error:
         session.rollback()
         raise error
 
+    publish_ticket_event(ticket_change, target_ticket, new_ticket_history)
+    set_ticket_version_header(response, target_ticket)
+
     return UpdateTicketResponse(
         id=target_ticket.id,
         status=target_ticket.status,
@@ -471,16 +1693,14 @@ def update_ticket_visibility(
     body: UpdateTicketVisibilityRequest,
     session: Annotated[Session, Depends(get_db)],
     access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> UpdateTicketVisibilityResponse:
     account_type = access_token.account_type
     user_id = access_token.user_id
 
-    # アカウント情報取得
-    target_account = get_user_by_id(session, id=user_id)
-
-    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
-    if target_account is None or target_account.is_suspended:
-        raise UnauthorizedException("このアカウント情報は不正です")
+    check_current_account(target_account)
 
     # チケット情報取得
     target_ticket = get_ticket_by_id(session, id=ticket_id)
@@ -493,11 +1713,16 @@ def update_ticket_visibility(
     if account_type == AccountType.STAFF and target_ticket.staff_id != user_id:
         raise BusinessException(TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE)
 
+    # 画面に表示した後に、他の操作でチケットが更新されていた場合
+    check_ticket_if_match(if_match, target_ticket)
+
     # 現在の設定と同じ設定に変更しようとした場合
     # ※ 対応履歴など履歴として更新を残す必要がない場合は、早期リターンが望ましい（エラーは出さない）
     if target_ticket.is_public == body.is_public:
         raise BusinessException("設定は更新済みです")
 
+    count_key = get_ticket_count_key(target_ticket)
+
     # チケットの公開設定を更新
     target_ticket.is_public = body.is_public
 
@@ -512,13 +1737,25 @@ def update_ticket_visibility(
     )
 
     session.add(new_ticket_history)
+    ticket_change = add_ticket_change(
+        session, TicketEventType.VISIBILITY_UPDATED, target_ticket, new_ticket_history
+    )
+    move_ticket_count(session, count_key, target_ticket)
 
     try:
         session.commit()
+    # 読み込んだ後に他の操作でチケットが更新されていた場合（版が一致せず、UPDATE の対象の行がない場合）
+    except StaleDataError as error:
+        session.rollback()
+        raise ConflictException(TICKET_UPDATED_BY_OTHERS_MESSAGE) from error
     except Exception as error:
         session.rollback()
         raise error
 
+    # 公開→非公開に変更した場合も、変更前に閲覧できていた社員へ通知する（公開チケットとして配信する）
+    publish_ticket_event(ticket_change, target_ticket, new_ticket_history, is_public=True)
+    set_ticket_version_header(response, target_ticket)
+
     return UpdateTicketVisibilityResponse(
         id=target_ticket.id,
         action_user=target_account.name,
@@ -0,0 +1,248 @@
+# チケット参照系API（一覧・詳細・対応履歴）の非同期版
+# DB_ASYNC_ENABLED=true の場合のみ、api/v1/ticket.py の同期ハンドラーより先に登録される
+# 処理内容・レスポンスは同期版と同じ（検証・レスポンスの作成は api/v1/ticket.py の関数を使用し、DBの取得のみ非同期で行う）
+# 更新系APIは非同期版を設けない（理由は core/database.py の DB_ASYNC_ENABLED を参照）
+# 一覧・詳細は同期版と同様に、読み取り専用のレプリカで処理する（get_read_async_db）
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from helpdesk_app_backend.api.v1.ticket import (
+    TICKET_CHANGE_DEFAULT_LIMIT,
+    TICKET_CHANGE_MAX_LIMIT,
+    TICKET_DETAIL_HISTORY_LIMIT,
+    TICKET_HISTORY_DEFAULT_LIMIT,
+    TICKET_HISTORY_MAX_LIMIT,
+    TICKET_LIST_DEFAULT_LIMIT,
+    TICKET_LIST_MAX_LIMIT,
+    check_current_account,
+    check_ticket_visible,
+    decode_ticket_list_cursor,
+    get_ticket_list_fetch_limit,
+    get_ticket_list_filter,
+    split_ticket_change_page,
+    split_ticket_changes,
+    to_not_modified_response,
+    to_ticket_changes_response,
+    to_ticket_detail_not_modified_response,
+    to_ticket_detail_response_with_etag,
+    to_ticket_histories_response,
+    to_ticket_list_etag,
+    to_ticket_list_page_response,
+)
+from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.core.current_account import (
+    get_current_account_async,
+    get_current_account_for_read_async,
+)
+from helpdesk_app_backend.core.json_response import FastJSONResponse
+from helpdesk_app_backend.logic.business.etag import is_etag_matched
+from helpdesk_app_backend.models.db.base import get_async_db, get_read_async_db
+from helpdesk_app_backend.models.enum.ticket import TicketListSortType
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.ticket_list_filter import TicketListFilter
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.models.response.v1.ticket import (
+    GetTicketChangesResponse,
+    GetTicketDetailResponse,
+    GetTicketHistoriesResponse,
+    GetTicketListResponse,
+    GetTicketResponseItem,
+)
+from helpdesk_app_backend.repositories.ticket import (
+    get_ticket_by_id_async,
+    get_ticket_detail_by_id_async,
+    get_ticket_list_rows_by_ids_async,
+    get_ticket_list_version_async,
+    get_ticket_version_async,
+    get_visible_ticket_list_rows_async,
+)
+from helpdesk_app_backend.repositories.ticket_archive import (
+    get_archived_ticket_by_id_async,
+    get_archived_ticket_detail_by_id_async,
+    get_archived_ticket_histories_since_async,
+    get_archived_ticket_version_async,
+    get_recent_archived_ticket_histories_async,
+)
+from helpdesk_app_backend.repositories.ticket_change import (
+    get_latest_ticket_change_seq_async,
+    get_ticket_changes_since_async,
+)
+from helpdesk_app_backend.repositories.ticket_history import (
+    get_recent_ticket_histories_async,
+    get_ticket_histories_by_ids_async,
+    get_ticket_histories_since_async,
+)
+from helpdesk_app_backend.repositories.user import get_latest_user_updated_at_async
+
+router = APIRouter()
+
+
+@router.get("", response_model=GetTicketListResponse | list[GetTicketResponseItem])
+async def get_tickets_async(
+    session: Annotated[AsyncSession, Depends(get_read_async_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_for_read_async)],
+    filters: Annotated[TicketListFilter, Depends(get_ticket_list_filter)],
+    limit: Annotated[int, Query(ge=1, le=TICKET_LIST_MAX_LIMIT)] = TICKET_LIST_DEFAULT_LIMIT,
+    cursor: str | None = None,
+    legacy: bool = False,
+    sort: TicketListSortType = TicketListSortType.CREATED_AT_DESC,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    decoded_cursor = None if legacy else decode_ticket_list_cursor(cursor, sort, filters)
+
+    # 一覧の版は、一覧の取得より先に確認する
+    list_version = await get_ticket_list_version_async(session)
+    etag = to_ticket_list_etag(
+        list_version, account_type, user_id, limit, cursor, legacy, filters, sort
+    )
+    if is_etag_matched(if_none_match, etag):
+        return to_not_modified_response(etag)
+
+    ticket_rows = await get_visible_ticket_list_rows_async(
+        session,
+        user_id=user_id,
+        account_type=account_type,
+        limit=get_ticket_list_fetch_limit(limit, legacy),
+        cursor=decoded_cursor,
+        filters=filters,
+        sort=sort,
+    )
+
+    return to_ticket_list_page_response(ticket_rows, etag, limit, legacy, sort, filters)
+
+
+@router.get("/changes", response_model=GetTicketChangesResponse)
+async def get_ticket_changes_async(
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_async)],
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=TICKET_CHANGE_MAX_LIMIT)] = TICKET_CHANGE_DEFAULT_LIMIT,
+) -> FastJSONResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    latest_seq = await get_latest_ticket_change_seq_async(session)
+
+    # 残りの変更の有無を判定するため、1件多く取得する
+    change_rows = await get_ticket_changes_since_async(
+        session,
+        user_id=user_id,
+        account_type=account_type,
+        since_seq=since,
+        until_seq=latest_seq,
+        limit=limit + 1,
+    )
+    change_rows, latest_seq, has_more = split_ticket_change_page(change_rows, limit, latest_seq)
+
+    ticket_ids, history_ids, removed_ticket_ids = split_ticket_changes(
+        change_rows, account_type, user_id
+    )
+    ticket_rows = (
+        await get_ticket_list_rows_by_ids_async(session, ids=ticket_ids) if ticket_ids else []
+    )
+    ticket_histories = (
+        await get_ticket_histories_by_ids_async(session, ids=history_ids) if history_ids else []
+    )
+
+    return to_ticket_changes_response(
+        ticket_rows, ticket_histories, removed_ticket_ids, latest_seq, has_more
+    )
+
+
+# {ticket_id:int} → 数値のパスのみ一致させる（/ticket/search など、非同期版のない同期版のAPIへ処理を回す）
+@router.get("/{ticket_id:int}", response_model=GetTicketDetailResponse)
+async def get_ticket_detail_async(
+    ticket_id: int,
+    session: Annotated[AsyncSession, Depends(get_read_async_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_for_read_async)],
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> GetTicketDetailResponse | Response:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    # ETag が指定された場合、版（チケットの版・最新の対応履歴ID）のみ取得して比較する
+    # tickets にない場合は、アーカイブ済みのチケットの版を取得する
+    if if_none_match is not None:
+        ticket_version = await get_ticket_version_async(session, id=ticket_id)
+        if ticket_version is None:
+            ticket_version = await get_archived_ticket_version_async(session, id=ticket_id)
+
+        not_modified_response = to_ticket_detail_not_modified_response(
+            ticket_version, ticket_id, if_none_match, account_type, user_id
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+    # アカウントの最終更新日時は、詳細の取得より先に確認する
+    latest_user_updated_at = await get_latest_user_updated_at_async(session)
+
+    # チケット情報取得（起票者・サポート担当者も同時に取得）
+    target_ticket = await get_ticket_detail_by_id_async(session, id=ticket_id)
+
+    # tickets にない場合は、アーカイブ済みのチケットから取得する（レスポンスは同じ）
+    is_archived = target_ticket is None
+    if is_archived:
+        target_ticket = await get_archived_ticket_detail_by_id_async(session, id=ticket_id)
+
+    check_ticket_visible(target_ticket, account_type, user_id)
+
+    # より古い履歴の有無を判定するため、1件多く取得する
+    recent_histories = await (
+        get_recent_archived_ticket_histories_async
+        if is_archived
+        else get_recent_ticket_histories_async
+    )(session, ticket_id=ticket_id, limit=TICKET_DETAIL_HISTORY_LIMIT + 1)
+
+    return to_ticket_detail_response_with_etag(
+        response, target_ticket, recent_histories, latest_user_updated_at, account_type, user_id
+    )
+
+
+@router.get("/{ticket_id:int}/histories")
+async def get_ticket_histories_async(
+    ticket_id: int,
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account_async)],
+    since_id: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=TICKET_HISTORY_MAX_LIMIT)] = TICKET_HISTORY_DEFAULT_LIMIT,
+) -> GetTicketHistoriesResponse:
+    account_type = access_token.account_type
+    user_id = access_token.user_id
+
+    check_current_account(target_account)
+
+    # チケット情報取得
+    target_ticket = await get_ticket_by_id_async(session, id=ticket_id)
+
+    # tickets にない場合は、アーカイブ済みのチケットから取得する
+    is_archived = target_ticket is None
+    if is_archived:
+        target_ticket = await get_archived_ticket_by_id_async(session, id=ticket_id)
+
+    check_ticket_visible(target_ticket, account_type, user_id)
+
+    # 残りの履歴の有無を判定するため、1件多く取得する
+    ticket_histories = await (
+        get_archived_ticket_histories_since_async
+        if is_archived
+        else get_ticket_histories_since_async
+    )(session, ticket_id=ticket_id, since_id=since_id, limit=limit + 1)
+
+    return to_ticket_histories_response(ticket_histories, since_id, limit)
@@ -0,0 +1,101 @@
+# チケットの変更通知（Server-Sent Events）
+# クライアントは一覧・詳細を定期的に取得（ポーリング）する代わりに、通知を受け取った場合のみ再取得する
+# GET /ticket/{ticket_id} より先に登録する（/ticket/events がチケットIDとして扱われないようにする）
+
+import asyncio
+
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+import orjson
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.core.current_account import get_current_account
+from helpdesk_app_backend.core.ticket_event import TICKET_EVENT_HEARTBEAT_SECONDS
+from helpdesk_app_backend.core.ticket_event_broker import ticket_event_broker
+from helpdesk_app_backend.exceptions.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
+from helpdesk_app_backend.exceptions.unauthorized_exception import UnauthorizedException
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+
+router = APIRouter()
+
+# 切断時に、クライアント（EventSource）が再接続するまでの待ち時間（ミリ秒）
+TICKET_EVENT_RETRY_MILLISECONDS = 3000
+
+
+# SSE の1メッセージを作成（data は1行のJSON）
+def to_sse_message(event_name: str, data: dict) -> bytes:
+    return b"event: " + event_name.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+# クライアントへ送る通知の内容（配信先の絞り込みに使用した起票者・公開設定は含めない）
+# id → 変更履歴の seq。切断後は最後に受け取った id を GET /ticket/changes?since= に指定し、取りこぼしを取得する
+def to_ticket_event_message(event: TicketEvent) -> bytes:
+    return f"id: {event.change_seq}\n".encode() + to_sse_message(
+        "ticket",
+        {
+            "type": event.event_type.value,
+            "ticket_id": event.ticket_id,
+            "history_id": event.history_id,
+        },
+    )
+
+
+# 通知を待ち、届いたものから順に送る
+# 通知がない間は一定間隔でコメント行を送り、接続が切れていないことを伝える
+async def stream_ticket_events(
+    account_type: AccountType, user_id: int, heartbeat_seconds: float
+) -> AsyncIterator[bytes]:
+    subscription = ticket_event_broker.subscribe(account_type, user_id)
+    try:
+        yield f"retry: {TICKET_EVENT_RETRY_MILLISECONDS}\n\n".encode()
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+            except TimeoutError:
+                yield b": ping\n\n"
+                continue
+
+            # 配信待ちが上限を超えた場合、取りこぼした通知があるため再取得を求めて終了する
+            if event is None:
+                yield to_sse_message("resync", {})
+                return
+
+            yield to_ticket_event_message(event)
+    finally:
+        # 切断された場合（クライアントが閉じた・サーバーが終了した）も必ず購読を終了する
+        ticket_event_broker.unsubscribe(subscription)
+
+
+@router.get("/events")
+async def get_ticket_events(
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+    target_account: Annotated[CurrentAccount | None, Depends(get_current_account)],
+) -> StreamingResponse:
+    # アカウントが存在しない または 停止状態（is_suspended=True）の場合
+    if target_account is None or target_account.is_suspended:
+        raise UnauthorizedException("このアカウント情報は不正です")
+
+    # 同時接続数の上限を超えている場合
+    if ticket_event_broker.is_full():
+        raise ServiceUnavailableException(
+            "接続数が上限に達しています。しばらくしてから再度お試しください",
+            retry_after_seconds=TICKET_EVENT_RETRY_MILLISECONDS // 1000,
+        )
+
+    return StreamingResponse(
+        stream_ticket_events(
+            access_token.account_type, access_token.user_id, TICKET_EVENT_HEARTBEAT_SECONDS
+        ),
+        media_type="text/event-stream",
+        # X-Accel-Buffering: no → nginx 等のプロキシに、通知をためずにすぐ送らせる
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,116 @@
+# クローズ後、一定期間更新のないチケットを、対応履歴とともにアーカイブ（archived_tickets）へ移す
+# 一覧・検索・集計で参照する tickets / ticket_histories を、対応中のチケットの分だけに保つ
+# 移したチケットの詳細は引き続き取得でき、再オープン（「クローズ」→「対応中」）すると tickets へ戻る
+#
+# 実行方法（プロジェクト直下で実行。定期実行を想定）
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.archive_closed_tickets
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.archive_closed_tickets --days 90 --batch-size 200
+#
+# 既定値は環境変数 TICKET_ARCHIVE_AFTER_DAYS / TICKET_ARCHIVE_BATCH_SIZE（core/ticket_archive.py）
+
+import argparse
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.core.ticket_archive import (
+    TICKET_ARCHIVE_AFTER_DAYS,
+    TICKET_ARCHIVE_BATCH_SIZE,
+)
+from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now
+from helpdesk_app_backend.models.db.base import session as create_session
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+from helpdesk_app_backend.repositories.ticket_archive import (
+    archive_tickets,
+    get_archivable_ticket_rows,
+)
+from helpdesk_app_backend.repositories.ticket_change import insert_ticket_changes
+from helpdesk_app_backend.repositories.ticket_count import (
+    TicketCountKey,
+    add_ticket_counts,
+    to_ticket_count_key,
+)
+
+
+# closed_before より前から「クローズ」のまま更新のないチケットを、batch_size 件ずつアーカイブへ移す（移した件数を返す）
+# 1バッチごとにコミットし、ロックの保持時間・1トランザクションの大きさを一定に抑える
+# 移したチケットは件数の集計から除き、変更履歴に記録する（差分同期で一覧から外させ、一覧の版を変えるため）
+def archive_closed_tickets(
+    session: Session,
+    closed_before: datetime,
+    batch_size: int,
+    max_batches: int | None = None,
+) -> int:
+    archived_count = 0
+    batch_count = 0
+    while max_batches is None or batch_count < max_batches:
+        ticket_rows = get_archivable_ticket_rows(session, closed_before, batch_size)
+        if not ticket_rows:
+            session.rollback()
+            break
+
+        ticket_ids = [ticket_row.id for ticket_row in ticket_rows]
+        archive_tickets(session, ticket_ids, archived_at=get_now())
+
+        count_deltas: dict[TicketCountKey, int] = {}
+        for ticket_row in ticket_rows:
+            count_key = to_ticket_count_key(
+                ticket_row.status, ticket_row.supporter_id, ticket_row.is_public
+            )
+            count_deltas[count_key] = count_deltas.get(count_key, 0) - 1
+        add_ticket_counts(session, count_deltas)
+
+        insert_ticket_changes(
+            session,
+            [
+                {
+                    "ticket_id": ticket_id,
+                    "ticket_history_id": None,
+                    "change_type": TicketEventType.ARCHIVED,
+                }
+                for ticket_id in ticket_ids
+            ],
+        )
+        session.commit()
+
+        archived_count += len(ticket_ids)
+        batch_count += 1
+        if len(ticket_ids) < batch_size:
+            break
+
+    return archived_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=TICKET_ARCHIVE_AFTER_DAYS,
+        help="クローズ後、この日数を超えて更新のないチケットを移す",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=TICKET_ARCHIVE_BATCH_SIZE,
+        help="1回のトランザクションで移すチケットの件数",
+    )
+    parser.add_argument(
+        "--max-batches", type=int, help="実行するバッチ数の上限（省略時は対象がなくなるまで）"
+    )
+    args = parser.parse_args()
+
+    # 日時の列はタイムゾーンなし（日本時間）で保存されているため、比較する日時もタイムゾーンを外す
+    closed_before = get_now().replace(tzinfo=None) - timedelta(days=args.days)
+
+    with create_session() as session:
+        archived_count = archive_closed_tickets(
+            session, closed_before, args.batch_size, args.max_batches
+        )
+
+    print(f"{archived_count}件のチケットをアーカイブしました")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# チケット・対応履歴をファイル（または標準出力）へエクスポートする
+# API（GET /api/v1/admin/export/...）と同じく、サーバー側カーソルで1チャンクずつ読み、変換したものから順に書き込む
+#
+# 実行方法（プロジェクト直下で実行）
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.export_tickets tickets --output tickets.csv
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.export_tickets ticket-histories \
+#     --format ndjson --gzip --created-from 2026-09-01 --created-to 2026-10-01 --output histories.ndjson.gz
+#   （--status は複数指定できる。--output を省略した場合は標準出力へ書き込む）
+
+import argparse
+import sys
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import BinaryIO
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.logic.business.export_encoder import encode_export_chunks
+from helpdesk_app_backend.models.db.base import session as create_session
+from helpdesk_app_backend.models.enum.ticket import TicketExportFormat, TicketStatusType
+from helpdesk_app_backend.models.internal.ticket_export_filter import TicketExportFilter
+from helpdesk_app_backend.repositories.ticket_export import (
+    build_ticket_export_queries,
+    build_ticket_history_export_queries,
+    get_export_column_names,
+    stream_export_rows,
+)
+
+# 1回に読み込み・変換する件数
+EXPORT_CHUNK_SIZE = 1000
+
+# エクスポート対象（コマンドの第1引数）→ SELECT文の作成
+EXPORT_QUERY_BUILDERS = {
+    "tickets": build_ticket_export_queries,
+    "ticket-histories": build_ticket_history_export_queries,
+}
+
+
+# SELECT文の結果を、指定した形式に変換しながら output へ書き込む（書き込んだバイト数を返す）
+def export_rows(
+    session: Session,
+    queries: list[Select],
+    output: BinaryIO,
+    export_format: TicketExportFormat,
+    use_gzip: bool,
+) -> int:
+    chunks: Iterable[bytes] = encode_export_chunks(
+        get_export_column_names(queries),
+        stream_export_rows(session, queries, EXPORT_CHUNK_SIZE),
+        export_format,
+        use_gzip,
+    )
+    written = 0
+    for chunk in chunks:
+        output.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target", choices=EXPORT_QUERY_BUILDERS.keys())
+    parser.add_argument(
+        "--format",
+        type=TicketExportFormat,
+        default=TicketExportFormat.CSV,
+        help="csv（既定）または ndjson",
+    )
+    parser.add_argument("--gzip", action="store_true", help="gzip 形式に圧縮する")
+    parser.add_argument(
+        "--status",
+        type=TicketStatusType,
+        action="append",
+        default=[],
+        help="チケットのステータスで絞り込む（複数指定可）",
+    )
+    parser.add_argument("--created-from", type=datetime.fromisoformat, help="作成日時（以上）")
+    parser.add_argument("--created-to", type=datetime.fromisoformat, help="作成日時（未満）")
+    parser.add_argument("--output", help="書き込み先のファイル（省略時は標準出力）")
+    args = parser.parse_args()
+
+    if (
+        args.created_from is not None
+        and args.created_to is not None
+        and args.created_from >= args.created_to
+    ):
+        parser.error("作成日時の範囲が不正です")
+
+    queries = EXPORT_QUERY_BUILDERS[args.target](
+        TicketExportFilter(
+            statuses=args.status, created_from=args.created_from, created_to=args.created_to
+        )
+    )
+
+    with create_session() as session:
+        if args.output is None:
+            export_rows(session, queries, sys.stdout.buffer, args.format, args.gzip)
+        else:
+            with open(args.output, "wb") as output:
+                written = export_rows(session, queries, output, args.format, args.gzip)
+            print(f"{args.output} に {written} バイト書き込みました", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
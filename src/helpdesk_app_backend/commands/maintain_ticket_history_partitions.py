@@ -0,0 +1,117 @@
+# 対応履歴（ticket_histories）の月ごとのパーティションを、先の月の分まで作成し、保持期間を過ぎた月の分を削除する（MySQL のみ）
+# 古い対応履歴の削除は、行単位の DELETE ではなくパーティションごとの削除（メタデータの変更のみ）で行う
+#
+# 実行方法（プロジェクト直下で実行。月に1回以上の定期実行を想定）
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.maintain_ticket_history_partitions
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.maintain_ticket_history_partitions --retention-months 36
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.maintain_ticket_history_partitions --retention-months 36 --exchange
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.maintain_ticket_history_partitions --dry-run
+#
+# 既定値は環境変数 TICKET_HISTORY_PARTITION_MONTHS_AHEAD / TICKET_HISTORY_RETENTION_MONTHS（core/ticket_history_partition.py）
+# --exchange を指定した場合、削除する月の対応履歴を別のテーブル（ticket_histories_p + 年月）へ移してから削除する
+# 削除する月の対応履歴を参照している変更履歴（ticket_changes.ticket_history_id）は、削除の前に NULL にする
+# （変更履歴は残すため、差分同期では対応履歴のない変更として返る）。対応履歴の検索用テーブルからも削除する
+
+import argparse
+
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.core.ticket_history_partition import (
+    TICKET_HISTORY_PARTITION_MONTHS_AHEAD,
+    TICKET_HISTORY_RETENTION_MONTHS,
+)
+from helpdesk_app_backend.logic.business.ticket_history_partition import (
+    TicketHistoryPartitionPlan,
+    plan_ticket_history_partitions,
+    to_partition_name,
+)
+from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now
+from helpdesk_app_backend.models.db.base import session as create_session
+from helpdesk_app_backend.repositories.ticket_history_partition import (
+    add_ticket_history_partitions,
+    detach_ticket_history_partition_references,
+    drop_ticket_history_partitions,
+    exchange_ticket_history_partition,
+    get_ticket_history_partition_names,
+)
+
+
+# 作成済みのパーティションを確認し、計画に沿って作成・削除する（実行した計画を返す）
+# dry_run=True の場合は計画のみ返し、変更しない
+def maintain_ticket_history_partitions(
+    session: Session,
+    today: date,
+    months_ahead: int,
+    retention_months: int,
+    exchange: bool = False,
+    dry_run: bool = False,
+) -> TicketHistoryPartitionPlan:
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name != "mysql":
+        raise ValueError(f"対応履歴のパーティション分割に対応していないDBです: {dialect_name}")
+
+    plan = plan_ticket_history_partitions(
+        get_ticket_history_partition_names(session), today, months_ahead, retention_months
+    )
+    if dry_run:
+        return plan
+
+    if plan.create_months:
+        add_ticket_history_partitions(session, plan.create_months)
+
+    if plan.expired_names:
+        detach_ticket_history_partition_references(session, plan.expired_names)
+        if exchange:
+            for partition_name in plan.expired_names:
+                exchange_ticket_history_partition(session, partition_name)
+        else:
+            drop_ticket_history_partitions(session, plan.expired_names)
+
+    return plan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=TICKET_HISTORY_PARTITION_MONTHS_AHEAD,
+        help="当月から何か月先までパーティションを作成しておくか",
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=TICKET_HISTORY_RETENTION_MONTHS,
+        help="対応履歴を保持する月数（0 → 削除しない）",
+    )
+    parser.add_argument(
+        "--exchange",
+        action="store_true",
+        help="削除する月の対応履歴を、別のテーブルへ移してから削除する",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="計画の確認のみ行い、変更しない")
+    args = parser.parse_args()
+
+    with create_session() as session:
+        plan = maintain_ticket_history_partitions(
+            session,
+            get_now().date(),
+            args.months_ahead,
+            args.retention_months,
+            exchange=args.exchange,
+            dry_run=args.dry_run,
+        )
+
+    suffix = "（--dry-run のため変更していません）" if args.dry_run else ""
+    created_names = [to_partition_name(month) for month in plan.create_months]
+    print(f"作成: {', '.join(created_names) or 'なし'}{suffix}")
+    print(
+        f"{'移動・削除' if args.exchange else '削除'}: {', '.join(plan.expired_names) or 'なし'}"
+        f"{suffix}"
+    )
+
+
+if __name__ == "__main__":
+    main()
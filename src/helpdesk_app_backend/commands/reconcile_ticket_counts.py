@@ -0,0 +1,86 @@
+# チケット件数の集計（ticket_counts）を、チケットから集計し直した件数と比較し、ずれがあれば作り直す
+# 集計は更新のたびに増減しているため通常はずれないが、DBを直接更新した場合などに使用する
+#
+# 実行方法（プロジェクト直下で実行）
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.reconcile_ticket_counts
+#   PYTHONPATH=src python -m helpdesk_app_backend.commands.reconcile_ticket_counts --dry-run
+#
+# 終了コード
+#   0 → ずれなし
+#   1 → ずれあり（--dry-run を指定しない場合は作り直し済み）
+
+import argparse
+import sys
+
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.base import session as create_session
+from helpdesk_app_backend.repositories.ticket_count import (
+    TicketCountKey,
+    get_actual_ticket_counts,
+    get_stored_ticket_counts,
+    replace_ticket_counts,
+)
+
+
+# 集計キー1つ分のずれ
+@dataclass
+class TicketCountDrift:
+    key: TicketCountKey
+    stored: int
+    actual: int
+
+
+# 集計済みの件数と、チケットから集計し直した件数を比較する
+# dry_run=False の場合、ずれがあれば集計し直した件数で作り直してコミットする
+# 集計済みの行をロックしてから集計し直すため、作り直し中の更新は作り直し後の件数に反映される
+def reconcile_ticket_counts(session: Session, dry_run: bool) -> list[TicketCountDrift]:
+    stored_counts = get_stored_ticket_counts(session, for_update=not dry_run)
+    actual_counts = get_actual_ticket_counts(session)
+
+    drifts = [
+        TicketCountDrift(
+            key=key, stored=stored_counts.get(key, 0), actual=actual_counts.get(key, 0)
+        )
+        for key in sorted(
+            stored_counts.keys() | actual_counts.keys(),
+            key=lambda key: (key.status.value, key.supporter_id, key.is_public),
+        )
+        if stored_counts.get(key, 0) != actual_counts.get(key, 0)
+    ]
+
+    if drifts and not dry_run:
+        replace_ticket_counts(session, actual_counts)
+        session.commit()
+    else:
+        session.rollback()
+
+    return drifts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="ずれの確認のみ行い、作り直さない")
+    args = parser.parse_args()
+
+    with create_session() as session:
+        drifts = reconcile_ticket_counts(session, dry_run=args.dry_run)
+
+    if not drifts:
+        print("ずれはありません")
+        return
+
+    print(f"{'status':<14}{'supporter_id':>14}{'is_public':>11}{'stored':>8}{'actual':>8}")
+    for drift in drifts:
+        print(
+            f"{drift.key.status.value:<14}{drift.key.supporter_id:>14}"
+            f"{drift.key.is_public!s:>11}{drift.stored:>8}{drift.actual:>8}"
+        )
+    print(f"{len(drifts)}件のずれを{'検出しました' if args.dry_run else '修正しました'}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
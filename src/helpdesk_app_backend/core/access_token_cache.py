@@ -0,0 +1,78 @@
+# 検証済みアクセストークンのキャッシュ（件数上限付き・最も長く使われていないものから破棄する）
+# キーはトークンそのものではなく SHA-256 のダイジェストとし、トークンをメモリ上に保持しない
+
+import hashlib
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+
+
+# キャッシュの状態
+@dataclass
+class AccessTokenCacheStats:
+    max_size: int
+    size: int
+    hits: int
+    misses: int
+
+
+class AccessTokenCache:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, AccessTokenPayload] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _to_key(access_token: str) -> bytes:
+        return hashlib.sha256(access_token.encode()).digest()
+
+    # 有効期限内の検証済みペイロードを取得（存在しない・期限切れの場合は None）
+    def get(self, access_token: str) -> AccessTokenPayload | None:
+        key = self._to_key(access_token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None and payload.exp <= time.time():
+                # 期限切れは破棄し、通常の検証（有効期限切れエラー）に回す
+                del self._entries[key]
+                payload = None
+
+            if payload is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return payload
+
+    # 検証済みペイロードを登録（上限を超えた場合は最も長く使われていないものを破棄する）
+    def set(self, access_token: str, payload: AccessTokenPayload) -> None:
+        if self.max_size <= 0 or payload.exp <= time.time():
+            return
+
+        key = self._to_key(access_token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> AccessTokenCacheStats:
+        with self._lock:
+            return AccessTokenCacheStats(
+                max_size=self.max_size,
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+            )
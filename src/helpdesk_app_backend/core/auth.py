@@ -8,3 +8,19 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+# ログイン中のアカウント情報（利用状態など）をプロセス内にキャッシュする秒数（0 の場合はキャッシュしない）
+# 管理者が利用状態を変更した場合、変更したプロセスのキャッシュは即時破棄される
+ACCOUNT_CACHE_TTL_SECONDS = int(os.getenv("ACCOUNT_CACHE_TTL_SECONDS", "0"))
+
+# bcrypt のコスト（2のべき乗回ハッシュ計算を繰り返す。1増やすと計算時間が約2倍になる）
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# パスワードのハッシュ化・照合を行うプロセス数（0 の場合はCPUコア数）
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+# ハッシュ化・照合の受付上限（処理中＋待機中の件数）。超えた場合は 503 を返す
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# 検証済みのアクセストークンを保持する件数（0 の場合はキャッシュしない）
+# 同じトークンでの2回目以降のリクエストは、署名検証・デコードを省略する（有効期限を過ぎたものは破棄する）
+ACCESS_TOKEN_CACHE_SIZE = int(os.getenv("ACCESS_TOKEN_CACHE_SIZE", "1024"))
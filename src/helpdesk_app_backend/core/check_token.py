@@ -2,12 +2,18 @@ from fastapi import Cookie
 from jose import JWTError
 from jose.exceptions import ExpiredSignatureError
 
+from helpdesk_app_backend.core.access_token_cache import AccessTokenCache
+from helpdesk_app_backend.core.auth import ACCESS_TOKEN_CACHE_SIZE
 from helpdesk_app_backend.exceptions.unauthorized_exception import UnauthorizedException
 from helpdesk_app_backend.logic.business.security import verify_access_token
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
 
+# 検証済みアクセストークンのキャッシュ（プロセス内で共有する）
+access_token_cache = AccessTokenCache(max_size=ACCESS_TOKEN_CACHE_SIZE)
+
 
 # アクセストークンの検証
+# 検証済みのトークンはキャッシュから返し、署名検証・デコードを省略する
 def validate_access_token(
     access_token: str | None = Cookie(default=None),
 ) -> AccessTokenPayload:
@@ -15,6 +21,10 @@ def validate_access_token(
     if access_token is None:
         raise UnauthorizedException("アクセストークンが存在しません")
 
+    cached_payload = access_token_cache.get(access_token)
+    if cached_payload is not None:
+        return cached_payload
+
     # access_token が None でなければ 暗号解除(decode)を試みる
     try:
         # access_token の user_id が None だったらエラーを返す
@@ -22,13 +32,15 @@ def validate_access_token(
         user_id = access_token_payload.get("user_id")
         if user_id is None:
             raise JWTError
-        # デコードした access_token 返す
-        return AccessTokenPayload(
+        validated_payload = AccessTokenPayload(
             sub=access_token_payload["sub"],
             user_id=access_token_payload["user_id"],
             account_type=access_token_payload["account_type"],
             exp=access_token_payload["exp"],
         )
+        access_token_cache.set(access_token, validated_payload)
+        # デコードした access_token 返す
+        return validated_payload
 
     # 暗号解除(decode)できなかった場合、401エラーを返す
     except ExpiredSignatureError as err:
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.core.auth import ACCOUNT_CACHE_TTL_SECONDS
+from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.models.db.base import (
+    get_async_db,
+    get_db,
+    get_read_async_db,
+    get_read_db,
+)
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.repositories.user import get_user_by_id, get_user_by_id_async
+
+# プロセス内で共有するアカウント情報のキャッシュ（キー：ユーザーID、値：(有効期限, アカウント情報)）
+# ACCOUNT_CACHE_TTL_SECONDS が 0 の場合は使用しない
+_account_cache: dict[int, tuple[float, CurrentAccount]] = {}
+# リクエストは複数スレッドで並行処理されるため、キャッシュの読み書きはロックして行う
+_account_cache_lock = threading.Lock()
+
+
+# キャッシュから有効期限内のアカウント情報を取得（存在しない・期限切れの場合は None）
+def _get_cached_account(user_id: int) -> CurrentAccount | None:
+    with _account_cache_lock:
+        cached = _account_cache.get(user_id)
+        if cached is None:
+            return None
+        expires_at, account = cached
+        if expires_at <= time.monotonic():
+            del _account_cache[user_id]
+            return None
+        return account
+
+
+# アカウント情報をキャッシュに登録
+def _set_cached_account(account: CurrentAccount) -> None:
+    with _account_cache_lock:
+        _account_cache[account.id] = (time.monotonic() + ACCOUNT_CACHE_TTL_SECONDS, account)
+
+
+# キャッシュしているアカウント情報を破棄する（利用状態を変更したときに呼び出す）
+def invalidate_current_account_cache(user_id: int) -> None:
+    with _account_cache_lock:
+        _account_cache.pop(user_id, None)
+
+
+# DBから取得したユーザーをアカウント情報に変換し、キャッシュ有効時はキャッシュに登録する
+def _to_current_account(target_account: User | None) -> CurrentAccount | None:
+    if target_account is None:
+        return None
+
+    current_account = CurrentAccount(
+        id=target_account.id,
+        name=target_account.name,
+        account_type=target_account.account_type,
+        is_suspended=target_account.is_suspended,
+    )
+
+    if ACCOUNT_CACHE_TTL_SECONDS > 0:
+        _set_cached_account(current_account)
+
+    return current_account
+
+
+# ログイン中のアカウント情報を取得する
+# FastAPI は同じリクエスト内の Depends の結果を使い回すため、1リクエストにつき取得は1回のみ
+# ACCOUNT_CACHE_TTL_SECONDS を設定した場合、その秒数の間はDBを参照せずキャッシュから返す
+# アカウントが存在しない場合は None を返す（停止状態も含め、判定は呼び出し側で行う）
+def get_current_account(
+    session: Annotated[Session, Depends(get_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> CurrentAccount | None:
+    user_id = access_token.user_id
+
+    if ACCOUNT_CACHE_TTL_SECONDS > 0:
+        cached_account = _get_cached_account(user_id)
+        if cached_account is not None:
+            return cached_account
+
+    return _to_current_account(get_user_by_id(session, id=user_id))
+
+
+# get_current_account の非同期版（async def のハンドラーで使用する）
+async def get_current_account_async(
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> CurrentAccount | None:
+    user_id = access_token.user_id
+
+    if ACCOUNT_CACHE_TTL_SECONDS > 0:
+        cached_account = _get_cached_account(user_id)
+        if cached_account is not None:
+            return cached_account
+
+    return _to_current_account(await get_user_by_id_async(session, id=user_id))
+
+
+# get_current_account の参照系API用（get_read_db のセッション → 読み取り専用のレプリカから取得する）
+# 停止状態への変更がレプリカへ反映されるまで、最大でレプリカの遅延の許容秒数（DB_REPLICA_MAX_LAG_SECONDS）かかる
+def get_current_account_for_read(
+    session: Annotated[Session, Depends(get_read_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> CurrentAccount | None:
+    return get_current_account(session, access_token)
+
+
+# get_current_account_for_read の非同期版
+async def get_current_account_for_read_async(
+    session: Annotated[AsyncSession, Depends(get_read_async_db)],
+    access_token: Annotated[AccessTokenPayload, Depends(validate_access_token)],
+) -> CurrentAccount | None:
+    return await get_current_account_async(session, access_token)
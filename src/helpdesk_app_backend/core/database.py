@@ -25,3 +25,53 @@ DATABASE_URL = (
     + "/"
     + DB_DATABASE
 )
+
+
+# コネクションプールの設定（同期・非同期のエンジンで共通）
+# DB_POOL_SIZE → 常に保持する接続数
+# DB_MAX_OVERFLOW → 混雑時に DB_POOL_SIZE を超えて一時的に作成できる接続数
+# DB_POOL_TIMEOUT → 空き接続を待つ最大秒数（超えた場合はエラー）
+# DB_POOL_RECYCLE → 接続を作り直すまでの秒数（MySQL の wait_timeout より短くし、切断済みの接続を使わないようにする）
+# DB_POOL_PRE_PING → 接続を取り出すたびに生存確認を行い、切断されていれば再接続する
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# 非同期DB接続の設定
+# DB_ASYNC_ENABLED=true の場合、チケット参照系APIを async def のハンドラー（AsyncSession）で処理する
+# 遅いクエリが重なっても、FastAPI のスレッドプールを使い切らずにリクエストを受け付けられる
+# 更新系API（登録・担当割り当て・ステータス変更など）は対象外とし、同期のハンドラーのまま処理する
+# （短いトランザクションで件数も少ないため、スレッドプールを使い切る原因にならない。
+#   件数の集計・変更履歴の追加など、更新と同じトランザクションで行う処理を同期・非同期で二重に持たないようにする）
+DB_ASYNC_ENABLED = os.getenv("DB_ASYNC_ENABLED", "false").lower() == "true"
+# 非同期用のドライバー（例：mysql+aiomysql）
+ASYNC_DB_CONNECTION = os.getenv("ASYNC_DB_CONNECTION", "mysql+aiomysql")
+
+ASYNC_DATABASE_URL = (
+    ASYNC_DB_CONNECTION
+    + "://"
+    + DB_USERNAME
+    + ":"
+    + DB_PASSWORD
+    + "@"
+    + DB_HOST
+    + ":"
+    + DB_PORT
+    + "/"
+    + DB_DATABASE
+)
+
+# 読み取り専用のレプリカの設定
+# DB_REPLICA_URLS → レプリカの接続先（DATABASE_URL と同じ形式。カンマ区切りで複数指定可。未指定の場合はすべてプライマリで処理する）
+# DB_REPLICA_MAX_LAG_SECONDS → レプリカの遅延の許容秒数（超えたレプリカは使わない）
+#   書き込み後、この秒数の間は同じ利用者の読み取りをプライマリで行う（自分の変更が反映前のデータを返さないようにする）
+# DB_REPLICA_HEALTH_CHECK_SECONDS → レプリカの状態（接続可否・遅延）を確認し直す間隔（秒）
+# DB_REPLICA_CONNECT_TIMEOUT_SECONDS → レプリカへの接続を待つ最大秒数（応答しないレプリカの確認・読み取りで待ち続けないようにする）
+DB_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()
+]
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5"))
+DB_REPLICA_HEALTH_CHECK_SECONDS = float(os.getenv("DB_REPLICA_HEALTH_CHECK_SECONDS", "10"))
+DB_REPLICA_CONNECT_TIMEOUT_SECONDS = int(os.getenv("DB_REPLICA_CONNECT_TIMEOUT_SECONDS", "3"))
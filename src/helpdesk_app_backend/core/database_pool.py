@@ -0,0 +1,44 @@
+# 接続の待ち時間を記録するコネクションプール（管理者向けの診断APIで使用する）
+
+import threading
+import time
+
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+
+# 空き接続を取得するまでの待ち時間の集計
+class PoolWaitStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    # 待ち時間を1回分記録する
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+
+# QueuePool の接続取得処理に待ち時間の計測を追加したもの
+class WaitTimeRecordingQueuePool(QueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started_at)
+
+
+# WaitTimeRecordingQueuePool の非同期エンジン用
+# （AsyncAdaptedQueuePool は QueuePool の待ち行列を asyncio 用に差し替えたもの。計測処理はそのまま使える）
+class WaitTimeRecordingAsyncAdaptedQueuePool(WaitTimeRecordingQueuePool, AsyncAdaptedQueuePool):
+    pass
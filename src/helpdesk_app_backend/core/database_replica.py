@@ -0,0 +1,139 @@
+# 読み取り専用のレプリカの振り分け
+# 参照系APIの読み取りを、接続でき、遅延が許容範囲内のレプリカへ順番に振り分ける
+# 使えるレプリカがない場合は、プライマリで処理する（呼び出し側で判定する）
+
+import itertools
+import logging
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Engine, Result, event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+# レプリカの遅延（秒）を取得する
+# MySQL 以外（SQLite 等）と、レプリケーションの状態を取得できない接続先（読み取り専用のエンドポイント等）は 0 とする
+# レプリケーションが停止している場合は None
+def get_replica_lag_seconds(connection: Connection) -> float | None:
+    if connection.dialect.name != "mysql":
+        return 0.0
+
+    replica_status = connection.execute(text("SHOW REPLICA STATUS")).mappings().first()
+    if replica_status is None:
+        return 0.0
+
+    lag_seconds = replica_status.get("Seconds_Behind_Source")
+    return float(lag_seconds) if lag_seconds is not None else None
+
+
+# レプリカ1台分の状態
+@dataclass
+class ReplicaStatus:
+    engine: Engine
+    # 最後に確認した時点で、接続でき、遅延が許容範囲内だったかどうか
+    available: bool = False
+    # 最後に確認した時点の遅延（秒）。確認できなかった場合は None
+    lag_seconds: float | None = None
+
+
+class ReplicaRouter:
+    def __init__(
+        self, engines: list[Engine], max_lag_seconds: float, check_interval_seconds: float
+    ) -> None:
+        self.replicas = [ReplicaStatus(engine=engine) for engine in engines]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._checked_at: float | None = None
+        self._check_lock = threading.Lock()
+        self._next_index = itertools.count()
+
+        for index, replica in enumerate(self.replicas):
+            self.watch_disconnects(replica.engine, index)
+
+    # エンジンでの処理中に接続が切れた場合は、次回の確認を待たずに index 番目のレプリカを振り分け先から外す
+    # 同じレプリカへ接続する非同期エンジン（の sync_engine）も登録する
+    def watch_disconnects(self, engine: Engine, index: int) -> None:
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                self.replicas[index].available = False
+
+        event.listen(engine, "handle_error", handle_error)
+
+    # 前回の確認から check_interval_seconds 以上経っている場合、すべてのレプリカの状態を確認し直す
+    # 他のスレッドが確認中の場合は待たずに戻り、前回の確認結果で振り分ける
+    def refresh_if_stale(self) -> None:
+        if not self.replicas:
+            return
+        if (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.check_interval_seconds
+        ):
+            return
+        if not self._check_lock.acquire(blocking=False):
+            return
+
+        # 応答しないレプリカがあっても、確認にかかる時間が台数分に延びないよう、並行して確認する
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.replicas)) as executor:
+                list(executor.map(self._check, self.replicas))
+            self._checked_at = time.monotonic()
+        finally:
+            self._check_lock.release()
+
+    def _check(self, replica: ReplicaStatus) -> None:
+        try:
+            with replica.engine.connect() as connection:
+                lag_seconds = get_replica_lag_seconds(connection)
+        except SQLAlchemyError:
+            logger.warning("レプリカに接続できません: %s", replica.engine.url, exc_info=True)
+            replica.available = False
+            replica.lag_seconds = None
+            return
+
+        replica.lag_seconds = lag_seconds
+        replica.available = lag_seconds is not None and lag_seconds <= self.max_lag_seconds
+
+    # 読み取りに使うレプリカの番号を返す（使えるレプリカがない場合は None → プライマリで処理する）
+    # 使えるレプリカが複数ある場合は、順番に振り分ける
+    # refresh=False → 状態を確認せず、前回の確認結果で振り分ける
+    # （非同期のハンドラーでは、確認をスレッドプールで済ませてから呼び出し、イベントループで接続を待たないようにする）
+    def choose(self, refresh: bool = True) -> int | None:
+        if refresh:
+            self.refresh_if_stale()
+
+        available_indexes = [
+            index for index, replica in enumerate(self.replicas) if replica.available
+        ]
+        if not available_indexes:
+            return None
+        return available_indexes[next(self._next_index) % len(available_indexes)]
+
+
+# レプリカのセッションで、接続が切れてエラーになった読み取りを、1回だけプライマリで実行し直す
+# 以降の読み取りも、同じセッションではプライマリで行う（接続が切れたレプリカは、watch_disconnects で振り分け先から外れる）
+# session_factory → レプリカのセッション（sessionmaker または Session のサブクラス）、primary_engine → プライマリのエンジン
+def retry_reads_on_primary(
+    session_factory: sessionmaker | type[Session], primary_engine: Engine
+) -> None:
+    def handle_orm_execute(orm_execute_state: ORMExecuteState) -> Result:
+        primary_bind_arguments = {"bind": primary_engine}
+        if orm_execute_state.session.info.get("use_primary"):
+            return orm_execute_state.invoke_statement(bind_arguments=primary_bind_arguments)
+
+        try:
+            return orm_execute_state.invoke_statement()
+        except DBAPIError as error:
+            if not error.connection_invalidated:
+                raise
+            logger.warning("レプリカとの接続が切れたため、プライマリで読み取ります", exc_info=True)
+            orm_execute_state.session.info["use_primary"] = True
+            return orm_execute_state.invoke_statement(bind_arguments=primary_bind_arguments)
+
+    event.listen(session_factory, "do_orm_execute", handle_orm_execute)
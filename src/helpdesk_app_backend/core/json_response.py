@@ -0,0 +1,22 @@
+# orjson を使ったJSONレスポンス（全APIのデフォルトのレスポンスクラスとして main.py で設定する）
+# 標準ライブラリの json より高速にJSON文字列へ変換できる
+
+from typing import Any
+
+import orjson
+
+from fastapi.responses import ORJSONResponse
+from pydantic_core import to_jsonable_python
+
+
+class FastJSONResponse(ORJSONResponse):
+    # OPT_PASSTHROUGH_DATETIME → datetime は orjson では変換せず default（pydantic と同じ変換）に任せ、
+    #                            レスポンスモデル経由の場合と日時の書式（タイムゾーンの表記など）を揃える
+    # OPT_NON_STR_KEYS → 文字列以外の辞書キーも変換できるようにする
+    # Enum（TicketStatusType など）は orjson が値（"start" など）に変換する
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        return orjson.dumps(
+            content,
+            default=to_jsonable_python,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
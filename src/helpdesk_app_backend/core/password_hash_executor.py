@@ -0,0 +1,97 @@
+# パスワードのハッシュ化・照合（bcrypt）を、リクエスト処理とは別のプロセスで実行するための実行器
+# bcrypt は1回あたり数十ミリ秒CPUを使うため、リクエスト処理のスレッドで実行すると
+# ログインが集中した際に他のAPIまで遅くなる（スレッドではGILにより並列に計算できない）
+
+import asyncio
+import multiprocessing
+import os
+import threading
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from helpdesk_app_backend.core.auth import PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_WORKERS
+from helpdesk_app_backend.exceptions.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
+
+
+# 実行器の状態（管理者向けの診断APIで使用する）
+@dataclass
+class PasswordHashExecutorStats:
+    max_workers: int
+    max_pending: int
+    # 処理中＋待機中の件数
+    pending: int
+    # プロセスの空きを待っている件数（キューの深さ）
+    queued: int
+    completed: int
+    rejected: int
+
+
+class PasswordHashExecutor:
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    # プロセスプールは初回の使用時に作成する（起動時・テスト時に不要なプロセスを作らない）
+    # spawn → スレッドを持つ親プロセスを fork しないよう、新しいプロセスとして起動する
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    # 関数を別プロセスで実行し、結果を返す
+    # 受付上限を超えている場合は待たずに 503 を返す（待機列が伸び続けないようにする）
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise ServiceUnavailableException(
+                    "混雑しているため処理できませんでした。しばらくしてから再度お試しください"
+                )
+            self._pending += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+    def stats(self) -> PasswordHashExecutorStats:
+        with self._lock:
+            return PasswordHashExecutorStats(
+                max_workers=self.max_workers,
+                max_pending=self.max_pending,
+                pending=self._pending,
+                queued=max(self._pending - self.max_workers, 0),
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    # プロセスプールを終了する
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+password_hash_executor = PasswordHashExecutor(
+    max_workers=PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,54 @@
+# 書き込み後の読み取りを、一定時間プライマリへ固定する
+# レプリカは遅延して変更が反映されるため、書き込んだ直後の利用者がレプリカから読むと自分の変更が見えないことがある
+# 書き込み（POST / PUT / PATCH / DELETE）に成功したレスポンスに、固定する期限を Cookie で付与し、
+# 期限内の読み取りはレプリカを使わずプライマリで処理する（Cookie のため、別のワーカーで処理した場合も有効）
+
+import time
+
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# プライマリへ固定する期限（UNIX時間）を保存する Cookie の名前
+PRIMARY_PINNED_COOKIE_NAME = "db_primary_until"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+# Cookie の期限内かどうか（値が不正な場合は固定しない）
+def is_primary_pinned(pinned_until: str | None) -> bool:
+    if pinned_until is None:
+        return False
+    try:
+        return float(pinned_until) > time.time()
+    except ValueError:
+        return False
+
+
+# 書き込みに成功したレスポンスに、pin_seconds 秒後までプライマリへ固定する Cookie を付与するミドルウェア
+# レスポンス本文には触れないため、ストリーミングのレスポンス（SSE 等）もそのまま返す
+class PrimaryPinningMiddleware:
+    def __init__(self, app: ASGIApp, pin_seconds: float) -> None:
+        self.app = app
+        self.pin_seconds = pin_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("set-cookie", self._build_cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+    def _build_cookie(self) -> str:
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[PRIMARY_PINNED_COOKIE_NAME] = str(time.time() + self.pin_seconds)
+        cookie[PRIMARY_PINNED_COOKIE_NAME]["max-age"] = int(self.pin_seconds) + 1
+        cookie[PRIMARY_PINNED_COOKIE_NAME]["path"] = "/"
+        cookie[PRIMARY_PINNED_COOKIE_NAME]["httponly"] = True
+        cookie[PRIMARY_PINNED_COOKIE_NAME]["samesite"] = "lax"
+        return cookie.output(header="").strip()
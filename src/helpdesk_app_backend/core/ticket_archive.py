@@ -0,0 +1,10 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# クローズ後、この日数を超えて更新のないチケットをアーカイブ（archived_tickets）へ移す
+TICKET_ARCHIVE_AFTER_DAYS = int(os.getenv("TICKET_ARCHIVE_AFTER_DAYS", "180"))
+# 1回のトランザクションで移すチケットの件数（対応履歴はチケットごとにすべて移す）
+TICKET_ARCHIVE_BATCH_SIZE = int(os.getenv("TICKET_ARCHIVE_BATCH_SIZE", "500"))
@@ -0,0 +1,17 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# チケットの変更通知（SSE）を複数のワーカー間で共有する方法（local → 同じプロセス内の接続のみに配信）
+TICKET_EVENT_BACKEND = os.getenv("TICKET_EVENT_BACKEND", "local")
+
+# 接続ごとに配信待ちで保持する通知の件数（超えた場合は resync を送って接続を終了する）
+TICKET_EVENT_QUEUE_SIZE = int(os.getenv("TICKET_EVENT_QUEUE_SIZE", "100"))
+
+# 1プロセスあたりの同時接続数の上限（超えた場合は 503 を返す）
+TICKET_EVENT_MAX_SUBSCRIBERS = int(os.getenv("TICKET_EVENT_MAX_SUBSCRIBERS", "10000"))
+
+# 通知がない間に送るコメント行の間隔（秒）。プロキシ等による無通信切断を防ぐ
+TICKET_EVENT_HEARTBEAT_SECONDS = float(os.getenv("TICKET_EVENT_HEARTBEAT_SECONDS", "15"))
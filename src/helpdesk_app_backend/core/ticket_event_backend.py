@@ -0,0 +1,37 @@
+# チケットの変更通知を、ワーカー（プロセス）間で共有するための配信経路
+# 書き込み系APIを処理したワーカーと、SSE で接続しているワーカーが異なる場合でも通知を届けるため、
+# ブローカーは通知を配信経路へ送り、配信経路から受け取った通知を自プロセスの接続へ配る
+# 配信経路を追加する場合は TicketEventBackend を実装し、create_ticket_event_backend に登録する
+
+from collections.abc import Callable
+from typing import Protocol
+
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+
+
+class TicketEventBackend(Protocol):
+    # 受け取った通知を渡す先（ブローカーの配信処理）を登録する
+    def attach(self, deliver: Callable[[TicketEvent], None]) -> None: ...
+
+    # 通知を全ワーカーへ送る（書き込み系APIのスレッドから呼ばれる）
+    def publish(self, event: TicketEvent) -> None: ...
+
+
+# 同じプロセス内にのみ配信する（ワーカーが1つの場合・開発環境・テスト用）
+class LocalTicketEventBackend:
+    def __init__(self) -> None:
+        self._deliver: Callable[[TicketEvent], None] | None = None
+
+    def attach(self, deliver: Callable[[TicketEvent], None]) -> None:
+        self._deliver = deliver
+
+    def publish(self, event: TicketEvent) -> None:
+        if self._deliver is not None:
+            self._deliver(event)
+
+
+# 環境変数 TICKET_EVENT_BACKEND の値から配信経路を作成
+def create_ticket_event_backend(name: str) -> TicketEventBackend:
+    if name == "local":
+        return LocalTicketEventBackend()
+    raise ValueError(f"TICKET_EVENT_BACKEND の値が不正です: {name}")
@@ -0,0 +1,147 @@
+# チケットの変更通知を、SSE で接続中のアカウントへ配信するブローカー
+# 接続ごとに配信待ちのキュー（asyncio.Queue）を1つ持つだけなので、
+# 通知を待っている間の接続はスレッドもDB接続も使わない（数千接続を1つのイベントループで保持できる）
+
+import asyncio
+import logging
+import threading
+
+from dataclasses import dataclass
+
+from helpdesk_app_backend.core.ticket_event import (
+    TICKET_EVENT_BACKEND,
+    TICKET_EVENT_MAX_SUBSCRIBERS,
+    TICKET_EVENT_QUEUE_SIZE,
+)
+from helpdesk_app_backend.core.ticket_event_backend import (
+    TicketEventBackend,
+    create_ticket_event_backend,
+)
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+
+logger = logging.getLogger(__name__)
+
+
+# ブローカーの状態（管理者向けの診断APIで使用する）
+@dataclass
+class TicketEventBrokerStats:
+    max_subscribers: int
+    subscribers: int
+    published: int
+    delivered: int
+    # 配信待ちが上限を超え、resync を送って終了させた接続の数
+    overflowed: int
+    # 配信経路への送信に失敗した通知の数
+    failed: int
+
+
+# SSE の接続1つ分の購読
+class TicketEventSubscription:
+    def __init__(self, account_type: AccountType, user_id: int, queue_size: int) -> None:
+        self.account_type = account_type
+        self.user_id = user_id
+        # None → 配信待ちが上限を超えたため、クライアントに再取得（resync）を求める印
+        # 印を必ず入れられるよう、上限より1件多く保持できるようにする
+        self.queue: asyncio.Queue[TicketEvent | None] = asyncio.Queue(maxsize=queue_size + 1)
+
+    # 閲覧可能なチケットの通知のみ配信する（一覧取得と同じ条件）
+    # 社員の場合は自分のチケット または 公開チケットのみ
+    def can_see(self, event: TicketEvent) -> bool:
+        return (
+            self.account_type != AccountType.STAFF
+            or event.staff_id == self.user_id
+            or event.is_public
+        )
+
+
+class TicketEventBroker:
+    def __init__(self, backend: TicketEventBackend, queue_size: int, max_subscribers: int) -> None:
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._backend = backend
+        self._backend.attach(self.deliver)
+        self._subscriptions: set[TicketEventSubscription] = set()
+        # 購読を受け付けたイベントループ（書き込み系APIのスレッドから、このループへ配信を依頼する）
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._published = 0
+        self._delivered = 0
+        self._overflowed = 0
+        self._failed = 0
+
+    def is_full(self) -> bool:
+        return len(self._subscriptions) >= self.max_subscribers
+
+    # 購読を開始（イベントループ内で呼び出す）
+    def subscribe(self, account_type: AccountType, user_id: int) -> TicketEventSubscription:
+        self._loop = asyncio.get_running_loop()
+        subscription = TicketEventSubscription(account_type, user_id, self.queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    # 購読を終了（接続の切断時に呼び出す）
+    def unsubscribe(self, subscription: TicketEventSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    # 通知を配信経路へ送る（コミット後に呼び出す）
+    # 更新自体は完了しているため、送信に失敗しても例外は投げない
+    def publish(self, event: TicketEvent) -> None:
+        with self._lock:
+            self._published += 1
+        try:
+            self._backend.publish(event)
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            logger.exception("チケットの変更通知を送信できませんでした")
+
+    # 配信経路から受け取った通知を、イベントループへ渡す（どのスレッドから呼ばれてもよい）
+    def deliver(self, event: TicketEvent) -> None:
+        loop = self._loop
+        # まだ誰も接続していない場合は配信先がない
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, event)
+        except RuntimeError:
+            # ループが終了処理中の場合
+            return
+
+    # 接続中の購読へ配信（イベントループ内で実行される）
+    def _dispatch(self, event: TicketEvent) -> None:
+        delivered = 0
+        overflowed = 0
+        for subscription in tuple(self._subscriptions):
+            if not subscription.can_see(event):
+                continue
+            # 読み出しが追いつかない接続は、通知を取りこぼす前に打ち切り、再取得を求める
+            if subscription.queue.qsize() >= self.queue_size:
+                subscription.queue.put_nowait(None)
+                self._subscriptions.discard(subscription)
+                overflowed += 1
+                continue
+            subscription.queue.put_nowait(event)
+            delivered += 1
+
+        with self._lock:
+            self._delivered += delivered
+            self._overflowed += overflowed
+
+    def stats(self) -> TicketEventBrokerStats:
+        with self._lock:
+            return TicketEventBrokerStats(
+                max_subscribers=self.max_subscribers,
+                subscribers=len(self._subscriptions),
+                published=self._published,
+                delivered=self._delivered,
+                overflowed=self._overflowed,
+                failed=self._failed,
+            )
+
+
+ticket_event_broker = TicketEventBroker(
+    backend=create_ticket_event_backend(TICKET_EVENT_BACKEND),
+    queue_size=TICKET_EVENT_QUEUE_SIZE,
+    max_subscribers=TICKET_EVENT_MAX_SUBSCRIBERS,
+)
@@ -0,0 +1,11 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 対応履歴（ticket_histories）の月ごとのパーティションを、当月から何か月先まで作成しておくか
+TICKET_HISTORY_PARTITION_MONTHS_AHEAD = int(os.getenv("TICKET_HISTORY_PARTITION_MONTHS_AHEAD", "3"))
+# 対応履歴を保持する月数（当月を含まない。この月数より前の月のパーティションを削除する）
+# 0 → 削除しない
+TICKET_HISTORY_RETENTION_MONTHS = int(os.getenv("TICKET_HISTORY_RETENTION_MONTHS", "0"))
@@ -0,0 +1,11 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# チケット検索の方法
+# fulltext → MySQL の全文インデックス（タイトル・詳細・対応履歴。対応履歴はパーティション分割していない検索用のテーブルで検索する）
+# inverted_index → プロセス内の索引（全文インデックスを使えない環境向け。対応履歴も検索する）
+# auto → 接続先が MySQL の場合は fulltext、それ以外（SQLite 等）の場合は inverted_index
+TICKET_SEARCH_BACKEND = os.getenv("TICKET_SEARCH_BACKEND", "auto")
@@ -0,0 +1,174 @@
+# チケット検索の実行方法
+# 接続先が MySQL の場合は全文インデックス、それ以外（SQLite 等）の場合はプロセス内の索引で検索する
+# 検索方法を追加する場合は TicketSearchBackend を実装し、TICKET_SEARCH_BACKENDS に登録する
+
+import threading
+
+from typing import Protocol
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.core.ticket_search import TICKET_SEARCH_BACKEND
+from helpdesk_app_backend.core.ticket_search_index import TicketSearchIndex
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.repositories.ticket_change import get_latest_ticket_change_seq
+from helpdesk_app_backend.repositories.ticket_search import (
+    get_ticket_changes_for_search,
+    get_ticket_history_search_documents,
+    get_ticket_search_documents,
+    get_visible_ticket_list_rows_by_ids,
+    search_tickets_fulltext,
+)
+
+# プロセス内の索引で検索する場合に、閲覧可否をDBで確認するチケットIDの1回あたりの最小件数
+TICKET_SEARCH_VISIBILITY_BATCH_SIZE = 100
+
+
+class TicketSearchBackend(Protocol):
+    # キーワードに一致する閲覧可能なチケットを、関連度の高い順に offset 件目から limit 件返す
+    def search(
+        self,
+        session: Session,
+        keyword: str,
+        user_id: int,
+        account_type: AccountType,
+        limit: int,
+        offset: int,
+    ) -> list[Row]: ...
+
+
+# MySQL の全文インデックス（ngram）で、タイトル・詳細・対応履歴を検索する
+# 対応履歴は、追加と同じトランザクションで写した検索用のテーブル（ticket_history_search）で検索する
+class FullTextTicketSearchBackend:
+    def search(
+        self,
+        session: Session,
+        keyword: str,
+        user_id: int,
+        account_type: AccountType,
+        limit: int,
+        offset: int,
+    ) -> list[Row]:
+        return search_tickets_fulltext(session, keyword, user_id, account_type, limit, offset)
+
+
+# プロセス内の索引で検索する（全文インデックスを使えない環境向け）
+# 索引は初回の検索時に全チケットから作成し、以降は変更履歴（ticket_changes）の差分のみ反映する
+# 別のワーカーで行われた更新も、DBの変更履歴から反映される
+# 変更履歴の seq はコミットした順に採番されるため、反映済みの seq より後の変更のみ読めば、取りこぼしはない
+class InvertedIndexTicketSearchBackend:
+    def __init__(self) -> None:
+        self.index = TicketSearchIndex()
+        self._refresh_lock = threading.Lock()
+
+    # 索引を最新の変更まで更新
+    def refresh(self, session: Session) -> None:
+        with self._refresh_lock:
+            latest_seq = get_latest_ticket_change_seq(session)
+
+            if self.index.indexed_seq is None:
+                # 先に seq を確定してから全件を読み込む（読み込み中の変更は次回の差分で反映される）
+                ticket_documents = get_ticket_search_documents(session)
+                history_documents = get_ticket_history_search_documents(session)
+            elif latest_seq > self.index.indexed_seq:
+                change_rows = get_ticket_changes_for_search(
+                    session, since_seq=self.index.indexed_seq, until_seq=latest_seq
+                )
+                # タイトル・詳細はチケット登録時のみ、それ以外の変更は対応履歴の追加のみ反映する
+                # アーカイブから戻したチケットは、索引の作成後にアーカイブされていた場合に備えて対応履歴ごと登録し直す
+                created_ticket_ids = [
+                    change_row.ticket_id
+                    for change_row in change_rows
+                    if change_row.change_type == TicketEventType.CREATED
+                ]
+                restored_ticket_ids = [
+                    change_row.ticket_id
+                    for change_row in change_rows
+                    if change_row.change_type == TicketEventType.RESTORED
+                ]
+                history_ids = [
+                    change_row.ticket_history_id
+                    for change_row in change_rows
+                    if change_row.ticket_history_id is not None
+                ]
+                ticket_documents = (
+                    get_ticket_search_documents(
+                        session, ids=created_ticket_ids + restored_ticket_ids
+                    )
+                    if created_ticket_ids or restored_ticket_ids
+                    else []
+                )
+                history_documents = (
+                    get_ticket_history_search_documents(session, ids=history_ids)
+                    if history_ids
+                    else []
+                )
+                if restored_ticket_ids:
+                    history_documents += get_ticket_history_search_documents(
+                        session, ticket_ids=restored_ticket_ids
+                    )
+            else:
+                return
+
+            for ticket_document in ticket_documents:
+                self.index.set_ticket(
+                    ticket_document.id, ticket_document.title, ticket_document.description
+                )
+            for history_document in history_documents:
+                self.index.add_history(
+                    history_document.id,
+                    history_document.ticket_id,
+                    history_document.action_description,
+                )
+            self.index.indexed_seq = latest_seq
+
+    def search(
+        self,
+        session: Session,
+        keyword: str,
+        user_id: int,
+        account_type: AccountType,
+        limit: int,
+        offset: int,
+    ) -> list[Row]:
+        self.refresh(session)
+
+        ranked_ticket_ids = self.index.search(keyword)
+
+        # 閲覧可否はDBで確認する。関連度の高い順に一定件数ずつ確認し、offset + limit 件そろった時点で終える
+        # （一致した全チケットIDを IN に指定しない。閲覧できないチケットが多い場合は、確認する件数を倍に増やす）
+        ticket_rows: list[Row] = []
+        batch_size = max(offset + limit, TICKET_SEARCH_VISIBILITY_BATCH_SIZE)
+        start = 0
+        while start < len(ranked_ticket_ids) and len(ticket_rows) < offset + limit:
+            batch_ids = ranked_ticket_ids[start : start + batch_size]
+            batch_rows = get_visible_ticket_list_rows_by_ids(
+                session, ids=batch_ids, user_id=user_id, account_type=account_type
+            )
+            # 索引の関連度順に並べ直す
+            rank = {ticket_id: i for i, ticket_id in enumerate(batch_ids)}
+            ticket_rows += sorted(batch_rows, key=lambda ticket_row: rank[ticket_row.id])
+            start += batch_size
+            batch_size *= 2
+        return ticket_rows[offset : offset + limit]
+
+
+# 検索方法の一覧（TICKET_SEARCH_BACKEND に指定する名前 → 検索方法）
+TICKET_SEARCH_BACKENDS: dict[str, TicketSearchBackend] = {
+    "fulltext": FullTextTicketSearchBackend(),
+    "inverted_index": InvertedIndexTicketSearchBackend(),
+}
+
+
+# 環境変数 TICKET_SEARCH_BACKEND の値と、セッションの接続先から検索方法を選ぶ
+def get_ticket_search_backend(session: Session) -> TicketSearchBackend:
+    backend_name = TICKET_SEARCH_BACKEND
+    if backend_name == "auto":
+        is_mysql = session.get_bind().dialect.name == "mysql"
+        backend_name = "fulltext" if is_mysql else "inverted_index"
+
+    if backend_name not in TICKET_SEARCH_BACKENDS:
+        raise ValueError(f"TICKET_SEARCH_BACKEND の値が不正です: {backend_name}")
+    return TICKET_SEARCH_BACKENDS[backend_name]
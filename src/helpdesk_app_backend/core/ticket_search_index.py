@@ -0,0 +1,85 @@
+# チケット検索用のプロセス内の索引（転置インデックス）
+# MySQL の全文インデックス（ngram）と同じく、文字列を2文字ずつに区切った語（bigram）ごとに、
+# その語を含むチケットと出現回数を保持する。検索時は索引のみを参照し、全チケットを読み直さない
+
+import math
+import re
+import threading
+import unicodedata
+
+from collections import Counter
+
+# 語の区切り（空白・記号）。区切りをまたぐ2文字は語として扱わない
+WORD_SEPARATOR_PATTERN = re.compile(r"[\W_]+")
+
+
+# 文字列を2文字ずつの語に分割する（1文字の単語はそのまま1語とする）
+# 全角/半角・大文字/小文字の違いは区別しない
+def to_ngrams(text: str, n: int = 2) -> list[str]:
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    ngrams: list[str] = []
+    for word in WORD_SEPARATOR_PATTERN.split(normalized):
+        if len(word) < n:
+            if word:
+                ngrams.append(word)
+            continue
+        ngrams.extend(word[i : i + n] for i in range(len(word) - n + 1))
+    return ngrams
+
+
+class TicketSearchIndex:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # 語 → {チケットID: 出現回数}
+        self._postings: dict[str, dict[int, int]] = {}
+        # チケットごとのタイトル・詳細の語（更新時に差し替えるため保持する）
+        self._ticket_ngrams: dict[int, Counter[str]] = {}
+        # 索引に追加済みの対応履歴ID（同じ履歴を二重に数えないようにする）
+        self._history_ids: set[int] = set()
+        # 索引に反映済みの変更の seq（未作成の場合は None）
+        self.indexed_seq: int | None = None
+
+    def _update_postings(self, ticket_id: int, ngrams: Counter[str], sign: int) -> None:
+        for ngram, count in ngrams.items():
+            ticket_counts = self._postings.setdefault(ngram, {})
+            new_count = ticket_counts.get(ticket_id, 0) + sign * count
+            if new_count > 0:
+                ticket_counts[ticket_id] = new_count
+            else:
+                ticket_counts.pop(ticket_id, None)
+                if not ticket_counts:
+                    del self._postings[ngram]
+
+    # チケットのタイトル・詳細を索引に追加（追加済みの場合は差し替える）
+    def set_ticket(self, ticket_id: int, title: str, description: str) -> None:
+        ngrams = Counter(to_ngrams(title) + to_ngrams(description))
+        with self._lock:
+            old_ngrams = self._ticket_ngrams.get(ticket_id)
+            if old_ngrams is not None:
+                self._update_postings(ticket_id, old_ngrams, -1)
+            self._ticket_ngrams[ticket_id] = ngrams
+            self._update_postings(ticket_id, ngrams, 1)
+
+    # 対応履歴の内容を、チケットの語として索引に追加
+    def add_history(self, history_id: int, ticket_id: int, action_description: str) -> None:
+        with self._lock:
+            if history_id in self._history_ids:
+                return
+            self._history_ids.add(history_id)
+            self._update_postings(ticket_id, Counter(to_ngrams(action_description)), 1)
+
+    # キーワードを含むチケットIDを、関連度の高い順（同じ場合はIDの大きい順）に返す
+    # 関連度 → キーワードの語ごとに、出現回数（対数）× 語の珍しさ（含むチケットが少ないほど高い）を合計
+    def search(self, keyword: str) -> list[int]:
+        query_ngrams = set(to_ngrams(keyword))
+        scores: dict[int, float] = {}
+        with self._lock:
+            ticket_count = max(len(self._ticket_ngrams), 1)
+            for ngram in query_ngrams:
+                ticket_counts = self._postings.get(ngram)
+                if not ticket_counts:
+                    continue
+                idf = math.log(1 + ticket_count / len(ticket_counts))
+                for ticket_id, count in ticket_counts.items():
+                    scores[ticket_id] = scores.get(ticket_id, 0.0) + (1 + math.log(count)) * idf
+        return sorted(scores, key=lambda ticket_id: (scores[ticket_id], ticket_id), reverse=True)
@@ -0,0 +1,9 @@
+from fastapi import HTTPException
+
+
+# Exceptionの中のBadRequestExceptionというエラー
+# Exception > HTTPException > BadRequestException
+# リクエストの指定内容どうしが矛盾している場合（例：別の条件で作成されたカーソルを指定した）
+class BadRequestException(HTTPException):
+    def __init__(self, message: str) -> None:
+        super().__init__(status_code=400, detail=message)
@@ -0,0 +1,9 @@
+from fastapi import HTTPException
+
+
+# Exceptionの中のConflictExceptionというエラー
+# Exception > HTTPException > ConflictException
+# 読み込んだ後に他の操作でデータが更新されていたため、更新できなかった場合（再度取得してから操作し直す）
+class ConflictException(HTTPException):
+    def __init__(self, message: str) -> None:
+        super().__init__(status_code=409, detail=message)
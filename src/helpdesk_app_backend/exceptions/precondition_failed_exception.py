@@ -0,0 +1,9 @@
+from fastapi import HTTPException
+
+
+# Exceptionの中のPreconditionFailedExceptionというエラー
+# Exception > HTTPException > PreconditionFailedException
+# 更新の前提条件（If-Match で指定された版）が、現在のデータと一致しない場合
+class PreconditionFailedException(HTTPException):
+    def __init__(self, message: str) -> None:
+        super().__init__(status_code=412, detail=message)
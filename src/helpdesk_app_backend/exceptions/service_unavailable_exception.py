@@ -0,0 +1,14 @@
+from fastapi import HTTPException
+
+
+# Exceptionの中のServiceUnavailableExceptionというエラー
+# Exception > HTTPException > ServiceUnavailableException
+# 処理が混雑していて、一時的にリクエストを受け付けられない場合
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, message: str, retry_after_seconds: int = 1) -> None:
+        # Retry-After → クライアントに再試行までの待ち秒数を伝える
+        super().__init__(
+            status_code=503,
+            detail=message,
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
@@ -0,0 +1,61 @@
+import hashlib
+
+
+# レスポンスの版を表す ETag を作成する
+# parts には、レスポンスの内容が変わると必ず変わる値（更新日時・最新の履歴IDなど）と、
+# 同じURLでも内容が変わる条件（閲覧者・クエリパラメータなど）を渡す
+# 内容そのものではなく版から作成するため、本文を作成・JSON変換しなくても比較できる（弱いETag）
+def make_etag(*parts: object) -> str:
+    return 'W/"' + make_etag_digest(parts) + '"'
+
+
+# ETag に使う、parts のハッシュ値を作成する
+def make_etag_digest(parts: tuple[object, ...]) -> str:
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# If-None-Match ヘッダーのいずれかが ETag と一致するか判定する
+# （弱い比較のため、W/ の有無は区別しない。「*」はどの ETag にも一致する）
+def is_etag_matched(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(
+        candidate.strip() == "*" or _opaque(candidate) == _opaque(etag)
+        for candidate in if_none_match.split(",")
+    )
+
+
+# 更新系APIの If-Match で使う、データの版（更新のたびに1つ進む番号）を表す強い ETag を作成する
+def make_version_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+# データの版と、版以外で内容が変わる値（parts）から、強い ETag を作成する（"版.ハッシュ値"）
+# 参照系APIの ETag として If-None-Match で比較できるうえ、そのまま更新系APIの If-Match にも指定できる
+def make_versioned_etag(version: int, *parts: object) -> str:
+    return f'"{version}.{make_etag_digest(parts)}"'
+
+
+# If-Match ヘッダーのいずれかが、データの現在の版と一致するか判定する（一致しない場合は更新しない）
+# 更新後の ETag（"版"）・参照系APIの ETag（"版.ハッシュ値"）のどちらも、版のみ比較する
+# （強い比較のため、W/ 付きの ETag は一致しない。指定がない場合と「*」は、版を確認せずに更新する）
+def is_if_match_satisfied(if_match: str | None, version: int) -> bool:
+    if if_match is None:
+        return True
+
+    def _version(tag: str) -> str | None:
+        tag = tag.strip()
+        if len(tag) < 2 or not tag.startswith('"') or not tag.endswith('"'):
+            return None
+        return tag[1:-1].split(".", 1)[0]
+
+    return any(
+        candidate.strip() == "*" or _version(candidate) == str(version)
+        for candidate in if_match.split(",")
+    )
@@ -0,0 +1,71 @@
+import csv
+import io
+import zlib
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+
+import orjson
+
+from sqlalchemy import Row
+
+from helpdesk_app_backend.models.enum.ticket import TicketExportFormat
+
+
+# CSV に書き出す値へ変換（Enum は値、日時は ISO 8601、None は空文字）
+def to_csv_value(value: object) -> object:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None:
+        return ""
+    return value
+
+
+# 1チャンク分の行（CSV の場合は列名の行も含む）を CSV に変換
+def encode_csv_rows(rows: Sequence[Sequence[object]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([to_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+# 1チャンク分の行を NDJSON（1行に1件のJSON）に変換
+# Enum・日時は orjson がそのまま変換する（Enum は値、日時は ISO 8601）
+def encode_ndjson_rows(columns: list[str], rows: list[Row]) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(columns, row, strict=True))) + b"\n" for row in rows)
+
+
+# チャンクごとの行を、指定した形式のバイト列に変換して順に返す
+# 一度に変換するのは1チャンク分のみのため、全体の件数によらず使用するメモリは一定
+# use_gzip=True の場合は gzip 形式に圧縮する（圧縮も1チャンクずつ行う）
+def encode_export_chunks(
+    columns: list[str],
+    row_chunks: Iterable[list[Row]],
+    export_format: TicketExportFormat,
+    use_gzip: bool,
+) -> Iterator[bytes]:
+    # wbits=31 → gzip 形式（ヘッダー・フッター付き）で圧縮する
+    compressor = zlib.compressobj(wbits=31) if use_gzip else None
+
+    def _encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor is not None else data
+
+    if export_format == TicketExportFormat.CSV:
+        header = _encode(encode_csv_rows([columns]))
+        if header:
+            yield header
+
+    for rows in row_chunks:
+        if export_format == TicketExportFormat.CSV:
+            data = _encode(encode_csv_rows(rows))
+        else:
+            data = _encode(encode_ndjson_rows(columns, rows))
+        # 圧縮した場合、圧縮前のデータがたまるまで空になることがある
+        if data:
+            yield data
+
+    if compressor is not None:
+        yield compressor.flush()
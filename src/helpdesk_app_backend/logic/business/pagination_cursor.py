@@ -0,0 +1,63 @@
+import base64
+import binascii
+import hashlib
+import json
+
+from datetime import datetime
+
+
+# カーソルを作成したときと異なる並び順・絞り込み条件で、カーソルが指定された場合のエラー
+# （不正な文字列の場合と区別するため、ValueError を継承した別のエラーにする）
+class CursorConditionMismatchError(ValueError):
+    pass
+
+
+# 絞り込み条件を、カーソルに含める短いハッシュにする（条件そのものはカーソルに含めない）
+def _hash_filters(filters: str) -> str:
+    return hashlib.blake2b(filters.encode(), digest_size=8).hexdigest()
+
+
+# 一覧のページ送り用カーソルを作成する
+# (created_at, id) の組に、並び順（sort）と絞り込み条件（filters のハッシュ）を加えて
+# JSONにしてbase64エンコードする（クライアントからは中身を意識させない不透明な文字列）
+def encode_cursor(created_at: datetime, id: int, sort: str, filters: str) -> str:
+    raw = json.dumps(
+        {
+            "created_at": created_at.isoformat(),
+            "id": id,
+            "sort": sort,
+            "filters": _hash_filters(filters),
+        },
+        separators=(",", ":"),
+    )
+    # URLのクエリに載せるため、URLセーフなbase64にし末尾の「=」は取り除く
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+# カーソルを (created_at, id) の組に戻す
+# 不正な文字列の場合は ValueError を返す
+# 作成したときと並び順・絞り込み条件が異なる場合は CursorConditionMismatchError を返す
+# （別の並び順・条件の位置から続きを取得してしまい、取りこぼし・重複が起きるのを防ぐ）
+def decode_cursor(cursor: str, sort: str, filters: str) -> tuple[datetime, int]:
+    try:
+        # 取り除いた「=」を補ってからデコード
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        created_at, id = datetime.fromisoformat(payload["created_at"]), int(payload["id"])
+        cursor_sort, cursor_filters = payload.get("sort"), payload.get("filters")
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        TypeError,
+        KeyError,
+        ValueError,
+        AttributeError,
+    ) as err:
+        raise ValueError("不正なカーソルです") from err
+
+    if cursor_sort != sort or cursor_filters != _hash_filters(filters):
+        raise CursorConditionMismatchError(
+            "カーソルを作成したときと、並び順・絞り込み条件が異なります"
+        )
+
+    return created_at, id
@@ -1,7 +1,8 @@
 from jose import jwt
 from passlib.context import CryptContext
 
-from helpdesk_app_backend.core.auth import ALGORITHM, SECRET_KEY
+from helpdesk_app_backend.core.auth import ALGORITHM, BCRYPT_ROUNDS, SECRET_KEY
+from helpdesk_app_backend.core.password_hash_executor import password_hash_executor
 
 
 # パスワード制約確認
@@ -19,7 +20,8 @@ def validate_password(password: str) -> None:
 # CryptContext(...) → パスワードハッシュの設定（どの方式を使うか等）
 # schemes=["bcrypt"] → 使うハッシュ方式は bcrypt だけにするという指定
 # deprecated="auto" → 将来ほかの方式を追加したとき、新規ハッシュは先頭の方式（bcrypt）だけを使い、他方式は非推奨扱いにする設定
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt__rounds → 新規ハッシュのコスト（既存のハッシュは作成時のコストのまま照合できる）
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 
 # パスワードを安全に変換して保存用にする（生パスワードを bcrypt でハッシュにする）
@@ -32,6 +34,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# trans_password_hash をハッシュ化専用のプロセスで実行する（async def のAPIで使用する）
+async def trans_password_hash_async(password: str) -> str:
+    return await password_hash_executor.run(trans_password_hash, password)
+
+
+# verify_password をハッシュ化専用のプロセスで実行する（async def のAPIで使用する）
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_executor.run(verify_password, plain_password, hashed_password)
+
+
 # トークン作成
 def create_access_token(payload: dict) -> str:
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
@@ -0,0 +1,71 @@
+import re
+
+from dataclasses import dataclass, field
+from datetime import date
+
+# 月ごとのパーティション名（p + 年月。例：p202610 → 2026年10月の対応履歴）
+PARTITION_NAME_PATTERN = re.compile(r"^p(\d{4})(\d{2})$")
+# 作成済みの月より後の対応履歴を受けるパーティション（通常は空）
+FUTURE_PARTITION_NAME = "p_future"
+
+
+# パーティションの作成・削除の計画
+# create_months → 作成する月（古い順）、expired_names → 保持期間を過ぎたパーティション名（古い順）
+@dataclass
+class TicketHistoryPartitionPlan:
+    create_months: list[date] = field(default_factory=list)
+    expired_names: list[str] = field(default_factory=list)
+
+
+# 月の初日に揃える
+def to_month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+# months か月後（負の場合は前）の月の初日
+def add_months(month: date, months: int) -> date:
+    month_index = month.year * 12 + month.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def to_partition_name(month: date) -> str:
+    return f"p{month.year:04d}{month.month:02d}"
+
+
+# パーティション名から月を取得する（月ごとのパーティションでない場合は None）
+def to_partition_month(partition_name: str) -> date | None:
+    matched = PARTITION_NAME_PATTERN.match(partition_name)
+    if matched is None:
+        return None
+    return date(int(matched.group(1)), int(matched.group(2)), 1)
+
+
+# 作成済みのパーティション名から、作成・削除するパーティションを決める
+# 作成 → 作成済みの最後の月の翌月から、today の months_ahead か月後の月まで
+# 削除 → 月末が today の月の retention_months か月前の初日以前の月（retention_months=0 の場合は削除しない）
+def plan_ticket_history_partitions(
+    partition_names: list[str], today: date, months_ahead: int, retention_months: int
+) -> TicketHistoryPartitionPlan:
+    current_month = to_month_start(today)
+    partition_months = sorted(
+        month
+        for month in (to_partition_month(partition_name) for partition_name in partition_names)
+        if month is not None
+    )
+
+    plan = TicketHistoryPartitionPlan()
+
+    month = add_months(partition_months[-1], 1) if partition_months else current_month
+    while month <= add_months(current_month, months_ahead):
+        plan.create_months.append(month)
+        month = add_months(month, 1)
+
+    if retention_months > 0:
+        retention_start = add_months(current_month, -retention_months)
+        plan.expired_names = [
+            to_partition_name(month)
+            for month in partition_months
+            if add_months(month, 1) <= retention_start
+        ]
+
+    return plan
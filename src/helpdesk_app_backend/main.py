@@ -2,12 +2,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from helpdesk_app_backend.api import router
+from helpdesk_app_backend.core.database import (
+    DB_REPLICA_HEALTH_CHECK_SECONDS,
+    DB_REPLICA_MAX_LAG_SECONDS,
+    DB_REPLICA_URLS,
+)
+from helpdesk_app_backend.core.json_response import FastJSONResponse
+from helpdesk_app_backend.core.primary_pinning import PrimaryPinningMiddleware
 from helpdesk_app_backend.handlers.server_exception_handler import handler
 
 # テストでエラー内容が不鮮明のとき、app = FastAPI(debug=True)にして、
 # テスト実行時にprint(response.text)で確認する
 # 通常はdebug=Trueを含めない
-app = FastAPI()
+# default_response_class → 全APIのレスポンスを orjson で高速にJSONへ変換する
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # CORS設定
 app.add_middleware(
@@ -21,8 +29,20 @@ app.add_middleware(
     allow_credentials=True,  # Cookieを使ったログイン情報のやり取りを許可する（JWTをCookieで使う場合は必須）
     allow_methods=["*"],  # どのHTTPメソッドを許すか。* は全部（GET/POST/PUT/DELETE…）
     allow_headers=["*"],  # どのHTTPヘッダを許すか。* は全部（Authorizationなども含む）
+    expose_headers=[
+        "ETag"
+    ],  # 画面から読み取れるレスポンスヘッダ（更新系APIの版を、次の更新の If-Match に指定するため）
 )
 
+# 読み取り専用のレプリカを使う場合、書き込みに成功した利用者の読み取りを一定時間プライマリへ固定する
+# 固定する秒数 → 許容する遅延（DB_REPLICA_MAX_LAG_SECONDS）＋レプリカの状態を確認し直す間隔
+# （確認と確認の間に遅延が許容秒数を超えても、自分の変更が反映前のデータを返さないようにする）
+if DB_REPLICA_URLS:
+    app.add_middleware(
+        PrimaryPinningMiddleware,
+        pin_seconds=DB_REPLICA_MAX_LAG_SECONDS + DB_REPLICA_HEALTH_CHECK_SECONDS,
+    )
+
 # FastAPI本体 (app) に、上で読み込んだ集約済みのルーター一式を登録
 app.include_router(router, prefix="/api")
 
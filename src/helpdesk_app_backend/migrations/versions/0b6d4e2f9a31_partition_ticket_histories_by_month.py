@@ -0,0 +1,65 @@
+"""partition ticket_histories by month
+
+Revision ID: 0b6d4e2f9a31
+Revises: f3a7c92d5e18
+Create Date: 2026-10-17 19:42:07.516248
+
+"""
+from collections.abc import Sequence
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6d4e2f9a31'
+down_revision: str | Sequence[str] | None = 'f3a7c92d5e18'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 当月から何か月先までパーティションを作成しておくか（以降は commands/maintain_ticket_history_partitions.py で作成する）
+PARTITION_MONTHS_AHEAD = 3
+
+
+def add_months(month: date, months: int) -> date:
+    month_index = month.year * 12 + month.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # パーティション分割したテーブルには外部キー制約・全文インデックスを付けられないため、先に外す
+    # （制約名は作成時に自動で付けられているため、DBから取得する）
+    for foreign_key in sa.inspect(bind).get_foreign_keys('ticket_histories'):
+        op.drop_constraint(foreign_key['name'], 'ticket_histories', type_='foreignkey')
+    op.drop_index('ft_ticket_histories_action_description', table_name='ticket_histories')
+
+    # 主キーにはパーティションの振り分けに使う列（created_at）を含める必要がある
+    op.execute('ALTER TABLE ticket_histories DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)')
+
+    # 最も古い対応履歴の月から、当月の PARTITION_MONTHS_AHEAD か月後の月まで、月ごとのパーティションを作成する
+    # 最初のパーティションはそれより前、p_future は作成済みの月より後の対応履歴をすべて受ける
+    current_month = datetime.now(ZoneInfo('Asia/Tokyo')).date().replace(day=1)
+    oldest_created_at = bind.execute(sa.text('SELECT MIN(created_at) FROM ticket_histories')).scalar()
+    month = min(oldest_created_at.date().replace(day=1), current_month) if oldest_created_at else current_month
+    definitions = []
+    while month <= add_months(current_month, PARTITION_MONTHS_AHEAD):
+        definitions.append(
+            f"PARTITION p{month.year:04d}{month.month:02d} VALUES LESS THAN ('{add_months(month, 1).isoformat()}')"
+        )
+        month = add_months(month, 1)
+    definitions.append('PARTITION p_future VALUES LESS THAN (MAXVALUE)')
+    op.execute(f"ALTER TABLE ticket_histories PARTITION BY RANGE COLUMNS(created_at) ({', '.join(definitions)})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE ticket_histories REMOVE PARTITIONING')
+    op.execute('ALTER TABLE ticket_histories DROP PRIMARY KEY, ADD PRIMARY KEY (id)')
+    op.create_index('ft_ticket_histories_action_description', 'ticket_histories', ['action_description'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+    op.create_foreign_key(None, 'ticket_histories', 'users', ['action_user_id'], ['id'])
+    op.create_foreign_key(None, 'ticket_histories', 'tickets', ['ticket_id'], ['id'])
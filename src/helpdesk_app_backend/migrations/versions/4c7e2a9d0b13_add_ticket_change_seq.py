@@ -0,0 +1,41 @@
+"""add ticket_changes.seq and ticket_change_counters table
+
+Revision ID: 4c7e2a9d0b13
+Revises: 6a3f0c8e2b57
+Create Date: 2026-10-17 23:48:21.337094
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4c7e2a9d0b13'
+down_revision: str | Sequence[str] | None = '6a3f0c8e2b57'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 変更履歴の seq はコミット時に採番する（主キーは追加した順のため、コミットした順と一致しない）
+    op.create_table('ticket_change_counters',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.add_column('ticket_changes', sa.Column('seq', sa.Integer(), nullable=True))
+
+    # 作成済みの変更履歴は、これまでの seq（主キー）をそのまま使い、採番はその続きから行う
+    op.execute('UPDATE ticket_changes SET seq = id')
+    op.execute('INSERT INTO ticket_change_counters (id, seq) SELECT 1, COALESCE(MAX(id), 0) FROM ticket_changes')
+    op.create_index('ux_ticket_changes_seq', 'ticket_changes', ['seq'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_ticket_changes_seq', table_name='ticket_changes')
+    op.drop_column('ticket_changes', 'seq')
+    op.drop_table('ticket_change_counters')
@@ -0,0 +1,31 @@
+"""add ticket version column
+
+Revision ID: 5c1e8a7d3b94
+Revises: 0b6d4e2f9a31
+Create Date: 2026-10-17 21:14:03.582190
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e8a7d3b94'
+down_revision: str | Sequence[str] | None = '0b6d4e2f9a31'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 既存のチケットは版 1 から始める（アーカイブ済みのチケットも、戻したときに同じ版を引き継ぐ）
+    op.add_column('tickets', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('archived_tickets', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('archived_tickets', 'version')
+    op.drop_column('tickets', 'version')
@@ -0,0 +1,51 @@
+"""create ticket_history_search table
+
+Revision ID: 6a3f0c8e2b57
+Revises: 9e4b2d7c1a68
+Create Date: 2026-10-17 23:12:48.603115
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6a3f0c8e2b57'
+down_revision: str | Sequence[str] | None = '9e4b2d7c1a68'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # パーティション分割した ticket_histories には全文インデックスを付けられないため、検索用のテーブルを別に作成する
+    op.create_table('ticket_history_search',
+    sa.Column('ticket_history_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('action_description', sa.Text(), nullable=False),
+    sa.Column('change_seq', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('ticket_history_id')
+    )
+    op.create_index('ix_ticket_history_search_ticket_id', 'ticket_history_search', ['ticket_id'], unique=False)
+    op.create_index('ix_ticket_history_search_change_seq', 'ticket_history_search', ['change_seq'], unique=False)
+
+    # 作成済みの対応履歴を、追加を記録した変更履歴の seq とともに写す（以降の追加は検索の前に差分のみ写す）
+    op.execute(
+        'INSERT INTO ticket_history_search (ticket_history_id, ticket_id, action_description, change_seq) '
+        'SELECT ticket_histories.id, ticket_histories.ticket_id, ticket_histories.action_description, '
+        'ticket_changes.id FROM ticket_changes '
+        'JOIN ticket_histories ON ticket_changes.ticket_history_id = ticket_histories.id'
+    )
+
+    # 全文インデックスは、写した後に作成する（1件ずつ索引を更新しないようにする）
+    op.create_index('ft_ticket_history_search_action_description', 'ticket_history_search', ['action_description'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ft_ticket_history_search_action_description', table_name='ticket_history_search')
+    op.drop_index('ix_ticket_history_search_change_seq', table_name='ticket_history_search')
+    op.drop_index('ix_ticket_history_search_ticket_id', table_name='ticket_history_search')
+    op.drop_table('ticket_history_search')
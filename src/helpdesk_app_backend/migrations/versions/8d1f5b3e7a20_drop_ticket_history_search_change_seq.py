@@ -0,0 +1,39 @@
+"""drop ticket_history_search.change_seq
+
+Revision ID: 8d1f5b3e7a20
+Revises: 4c7e2a9d0b13
+Create Date: 2026-10-18 00:21:09.481326
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1f5b3e7a20'
+down_revision: str | Sequence[str] | None = '4c7e2a9d0b13'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 以降は対応履歴の追加と同じトランザクションで写すため、検索の前の差分の追加で写していない対応履歴をここで写す
+    op.execute(
+        'INSERT INTO ticket_history_search (ticket_history_id, ticket_id, action_description, change_seq) '
+        'SELECT ticket_histories.id, ticket_histories.ticket_id, ticket_histories.action_description, 0 '
+        'FROM ticket_histories LEFT JOIN ticket_history_search '
+        'ON ticket_history_search.ticket_history_id = ticket_histories.id '
+        'WHERE ticket_history_search.ticket_history_id IS NULL'
+    )
+    op.drop_index('ix_ticket_history_search_change_seq', table_name='ticket_history_search')
+    op.drop_column('ticket_history_search', 'change_seq')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('ticket_history_search', sa.Column('change_seq', sa.Integer(), nullable=False, server_default='0'))
+    op.alter_column('ticket_history_search', 'change_seq', existing_type=sa.Integer(), server_default=None)
+    op.create_index('ix_ticket_history_search_change_seq', 'ticket_history_search', ['change_seq'], unique=False)
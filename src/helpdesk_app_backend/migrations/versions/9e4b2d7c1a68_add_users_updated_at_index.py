@@ -0,0 +1,26 @@
+"""add users updated_at index
+
+Revision ID: 9e4b2d7c1a68
+Revises: 5c1e8a7d3b94
+Create Date: 2026-10-17 22:03:41.275904
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b2d7c1a68'
+down_revision: str | Sequence[str] | None = '5c1e8a7d3b94'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_updated_at', 'users', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_updated_at', table_name='users')
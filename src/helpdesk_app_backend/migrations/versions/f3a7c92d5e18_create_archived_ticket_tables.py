@@ -0,0 +1,93 @@
+"""create archived ticket tables
+
+Revision ID: f3a7c92d5e18
+Revises: e8b3f1a94c2d
+Create Date: 2026-10-17 18:05:12.408317
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a7c92d5e18'
+down_revision: str | Sequence[str] | None = 'e8b3f1a94c2d'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TICKET_STATUS_TYPE = sa.Enum('START', 'ASSIGNED', 'IN_PROGRESS', 'RESOLVED', 'CLOSED', name='ticketstatustype')
+TICKET_EVENT_TYPE_VALUES = ('CREATED', 'COMMENTED', 'ASSIGNED', 'UNASSIGNED', 'STATUS_UPDATED', 'VISIBILITY_UPDATED')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('archived_tickets',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('is_public', sa.Boolean(), nullable=False),
+    sa.Column('status', TICKET_STATUS_TYPE, nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('staff_id', sa.Integer(), nullable=False),
+    sa.Column('supporter_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['staff_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['supporter_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('archived_ticket_histories',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('action_user_id', sa.Integer(), nullable=True),
+    sa.Column('action_description', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['action_user_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['ticket_id'], ['archived_tickets.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_ticket_histories_ticket_id_created_at', 'archived_ticket_histories', ['ticket_id', 'created_at'], unique=False)
+
+    # 変更履歴はアーカイブへ移したチケット・対応履歴の分も残すため、tickets / ticket_histories への外部キーを外す
+    # （制約名は作成時に自動で付けられているため、DBから取得する）
+    for foreign_key in sa.inspect(op.get_bind()).get_foreign_keys('ticket_changes'):
+        op.drop_constraint(foreign_key['name'], 'ticket_changes', type_='foreignkey')
+
+    op.alter_column('ticket_changes', 'change_type',
+               existing_type=sa.Enum(*TICKET_EVENT_TYPE_VALUES, name='ticketeventtype'),
+               type_=sa.Enum(*TICKET_EVENT_TYPE_VALUES, 'ARCHIVED', 'RESTORED', name='ticketeventtype'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # アーカイブ済みのチケット・対応履歴を tickets / ticket_histories へ戻してから削除する
+    op.execute(
+        'INSERT INTO tickets (id, title, is_public, status, description, staff_id, supporter_id, created_at, updated_at) '
+        'SELECT id, title, is_public, status, description, staff_id, supporter_id, created_at, updated_at FROM archived_tickets'
+    )
+    op.execute(
+        'INSERT INTO ticket_histories (id, ticket_id, action_user_id, action_description, created_at, updated_at) '
+        'SELECT id, ticket_id, action_user_id, action_description, created_at, updated_at FROM archived_ticket_histories'
+    )
+    op.execute(
+        'INSERT INTO ticket_counts (status, supporter_id, is_public, count) '
+        'SELECT status, COALESCE(supporter_id, 0), is_public, COUNT(*) FROM archived_tickets '
+        'GROUP BY status, COALESCE(supporter_id, 0), is_public '
+        'ON DUPLICATE KEY UPDATE count = count + VALUES(count)'
+    )
+    op.execute("DELETE FROM ticket_changes WHERE change_type IN ('ARCHIVED', 'RESTORED')")
+
+    op.alter_column('ticket_changes', 'change_type',
+               existing_type=sa.Enum(*TICKET_EVENT_TYPE_VALUES, 'ARCHIVED', 'RESTORED', name='ticketeventtype'),
+               type_=sa.Enum(*TICKET_EVENT_TYPE_VALUES, name='ticketeventtype'),
+               existing_nullable=False)
+    op.create_foreign_key(None, 'ticket_changes', 'tickets', ['ticket_id'], ['id'])
+    op.create_foreign_key(None, 'ticket_changes', 'ticket_histories', ['ticket_history_id'], ['id'])
+
+    op.drop_index('ix_archived_ticket_histories_ticket_id_created_at', table_name='archived_ticket_histories')
+    op.drop_table('archived_ticket_histories')
+    op.drop_table('archived_tickets')
@@ -1,9 +1,26 @@
 # SQLAlchemyのリレーションが正常に動作するように全てのモデルをインポート
 # 短い書き方で import できるようにする
+from .archived_ticket import ArchivedTicket
+from .archived_ticket_history import ArchivedTicketHistory
 from .base import Base
 from .ticket import Ticket
+from .ticket_change import TicketChange
+from .ticket_change_counter import TicketChangeCounter
+from .ticket_count import TicketCount
 from .ticket_history import TicketHistory
+from .ticket_history_search import TicketHistorySearch
 from .user import User
 
 # 外部からインポートできるようにエクスポート
-__all__ = ["User", "Ticket", "TicketHistory", "Base"]
+__all__ = [
+    "User",
+    "Ticket",
+    "TicketHistory",
+    "TicketHistorySearch",
+    "TicketChange",
+    "TicketChangeCounter",
+    "TicketCount",
+    "ArchivedTicket",
+    "ArchivedTicketHistory",
+    "Base",
+]
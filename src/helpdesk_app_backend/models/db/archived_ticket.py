@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from helpdesk_app_backend.models.db.base import Base
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+
+if TYPE_CHECKING:
+    from helpdesk_app_backend.models.db.archived_ticket_history import ArchivedTicketHistory
+    from helpdesk_app_backend.models.db.user import User
+
+
+# アーカイブ済みのチケット（クローズ後、一定期間更新のないチケット）
+# tickets から同じIDのまま移し、一覧・検索・集計の対象から外す（詳細は tickets にない場合にこちらから取得する）
+# 再オープン（「クローズ」→「対応中」）した場合は tickets へ戻す
+# 列は tickets と同じ（archived_at のみ追加）。詳細表示で Ticket と同じように扱えるよう、関連も同じ名前にする
+class ArchivedTicket(Base):
+    __tablename__ = "archived_tickets"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    is_public: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    status: Mapped[TicketStatusType] = mapped_column(Enum(TicketStatusType), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    staff_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    supporter_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    staff: Mapped[User] = relationship("User", foreign_keys=[staff_id])
+    supporter: Mapped[User] = relationship("User", foreign_keys=[supporter_id])
+
+    ticket_histories: Mapped[list[ArchivedTicketHistory]] = relationship(
+        "ArchivedTicketHistory", back_populates="ticket"
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from helpdesk_app_backend.models.db.base import Base
+
+if TYPE_CHECKING:
+    from helpdesk_app_backend.models.db.archived_ticket import ArchivedTicket
+    from helpdesk_app_backend.models.db.user import User
+
+
+# アーカイブ済みのチケットの対応履歴（チケットと同時に、同じIDのまま ticket_histories から移す）
+class ArchivedTicketHistory(Base):
+    __tablename__ = "archived_ticket_histories"
+    # チケット詳細で、チケットに紐づく履歴を作成日時順に取得するための複合インデックス
+    __table_args__ = (
+        Index("ix_archived_ticket_histories_ticket_id_created_at", "ticket_id", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    ticket_id: Mapped[int] = mapped_column(ForeignKey("archived_tickets.id"), nullable=False)
+    action_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=True)
+    action_description: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    ticket: Mapped[ArchivedTicket] = relationship(
+        "ArchivedTicket", foreign_keys=[ticket_id], back_populates="ticket_histories"
+    )
+    action_user: Mapped[User] = relationship("User", foreign_keys=[action_user_id])
@@ -1,17 +1,133 @@
 # SQLAlchemyのエンジン/セッションを初期化し、get_dbを提供するDB接続設定ファイル
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Annotated
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from fastapi import Cookie, Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
-from helpdesk_app_backend.core.database import DATABASE_URL
+from helpdesk_app_backend.core.database import (
+    ASYNC_DATABASE_URL,
+    ASYNC_DB_CONNECTION,
+    DATABASE_URL,
+    DB_ASYNC_ENABLED,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_REPLICA_CONNECT_TIMEOUT_SECONDS,
+    DB_REPLICA_HEALTH_CHECK_SECONDS,
+    DB_REPLICA_MAX_LAG_SECONDS,
+    DB_REPLICA_URLS,
+)
+from helpdesk_app_backend.core.database_pool import (
+    WaitTimeRecordingAsyncAdaptedQueuePool,
+    WaitTimeRecordingQueuePool,
+)
+from helpdesk_app_backend.core.database_replica import ReplicaRouter, retry_reads_on_primary
+from helpdesk_app_backend.core.primary_pinning import is_primary_pinned
 
-engine = create_engine(DATABASE_URL, echo=False)
+# コネクションプールの設定（core/database.py の環境変数で変更できる）
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+engine = create_engine(
+    DATABASE_URL, echo=False, poolclass=WaitTimeRecordingQueuePool, **POOL_OPTIONS
+)
 Base = declarative_base()
 
 session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 非同期用のエンジン/セッション
+# エンジンは DB_ASYNC_ENABLED の場合のみ作成する（非同期ドライバーを使わない環境でも起動できるようにするため）
+# expire_on_commit=False → commit 後に属性を参照しても、暗黙の再読み込み（非同期では不可）が発生しないようにする
+async_engine = (
+    create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=False,
+        poolclass=WaitTimeRecordingAsyncAdaptedQueuePool,
+        **POOL_OPTIONS,
+    )
+    if DB_ASYNC_ENABLED
+    else None
+)
+
+async_session = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# 読み取り専用のレプリカのエンジン/セッション（DB_REPLICA_URLS の順。未指定の場合は空）
+# 非同期用は、同じ接続先のドライバーを ASYNC_DB_CONNECTION に差し替えて作成する
+# connect_timeout → 応答しないレプリカへの接続を、DB_REPLICA_CONNECT_TIMEOUT_SECONDS 秒で諦める
+REPLICA_CONNECT_ARGS = {"connect_timeout": DB_REPLICA_CONNECT_TIMEOUT_SECONDS}
+
+replica_engines = [
+    create_engine(
+        url,
+        echo=False,
+        poolclass=WaitTimeRecordingQueuePool,
+        connect_args=REPLICA_CONNECT_ARGS,
+        **POOL_OPTIONS,
+    )
+    for url in DB_REPLICA_URLS
+]
+replica_sessions = [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    for replica_engine in replica_engines
+]
+async_replica_engines = (
+    [
+        create_async_engine(
+            make_url(url).set(drivername=ASYNC_DB_CONNECTION),
+            echo=False,
+            poolclass=WaitTimeRecordingAsyncAdaptedQueuePool,
+            connect_args=REPLICA_CONNECT_ARGS,
+            **POOL_OPTIONS,
+        )
+        for url in DB_REPLICA_URLS
+    ]
+    if DB_ASYNC_ENABLED
+    else []
+)
+
+
+# 非同期用のレプリカのセッションが内部で使うセッション（プライマリでの読み直しを、このクラスのセッションにのみ登録する）
+class AsyncReplicaSession(Session):
+    pass
+
+
+async_replica_sessions = [
+    async_sessionmaker(
+        bind=async_replica_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=AsyncReplicaSession,
+    )
+    for async_replica_engine in async_replica_engines
+]
+
+# レプリカとの接続が切れて失敗した読み取りは、1回だけプライマリで実行し直す
+for replica_session in replica_sessions:
+    retry_reads_on_primary(replica_session, engine)
+if async_engine is not None and async_replica_sessions:
+    retry_reads_on_primary(AsyncReplicaSession, async_engine.sync_engine)
+
+# レプリカの状態（接続可否・遅延）は同期用のエンジンで確認し、非同期用も同じ結果で振り分ける
+replica_router = ReplicaRouter(
+    replica_engines,
+    max_lag_seconds=DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=DB_REPLICA_HEALTH_CHECK_SECONDS,
+)
+for replica_index, async_replica_engine in enumerate(async_replica_engines):
+    replica_router.watch_disconnects(async_replica_engine.sync_engine, replica_index)
+
 
 # データベース接続を一時的に開いて、
 # 使い終わったらきちんと閉じるという処理を、
@@ -22,3 +138,52 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+# get_db の非同期版（async def のハンドラーで使用する）
+async def get_async_db() -> AsyncGenerator:
+    db = async_session()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+# 参照系API用のセッション（読み取り専用のレプリカへ振り分ける）
+# レプリカがない・使えるレプリカがない・書き込み直後（Cookie でプライマリへ固定中）の場合は、get_db のセッションを使う
+# get_db のセッションは使うまで接続しないため、レプリカで処理する場合もプライマリへは接続しない
+def get_read_db(
+    session: Annotated[Session, Depends(get_db)],
+    db_primary_until: Annotated[str | None, Cookie()] = None,
+) -> Generator:
+    replica_index = None if is_primary_pinned(db_primary_until) else replica_router.choose()
+    if replica_index is None:
+        yield session
+        return
+
+    db = replica_sessions[replica_index]()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# get_read_db の非同期版（レプリカの状態の確認は、イベントループを止めないようスレッドプールで行う）
+# 振り分けは確認済みの結果のみで行い、イベントループ上ではレプリカへ接続しない
+async def get_read_async_db(
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    db_primary_until: Annotated[str | None, Cookie()] = None,
+) -> AsyncGenerator:
+    replica_index = None
+    if async_replica_sessions and not is_primary_pinned(db_primary_until):
+        await run_in_threadpool(replica_router.refresh_if_stale)
+        replica_index = replica_router.choose(refresh=False)
+    if replica_index is None:
+        yield session
+        return
+
+    db = async_replica_sessions[replica_index]()
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now
@@ -17,6 +17,28 @@ if TYPE_CHECKING:
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    # 一覧取得時の絞り込み（公開チケット / 自分のチケット）と作成日時順の並び替えを索引で行うための複合インデックス
+    __table_args__ = (
+        Index("ix_tickets_is_public_created_at", "is_public", "created_at"),
+        Index("ix_tickets_staff_id_created_at", "staff_id", "created_at"),
+        # 一覧の絞り込み（ステータス / サポート担当者）と、更新日時順の並び替え用
+        Index("ix_tickets_status_created_at", "status", "created_at"),
+        Index("ix_tickets_supporter_id_created_at", "supporter_id", "created_at"),
+        Index("ix_tickets_updated_at", "updated_at"),
+        # 更新日時順（同時刻はID順）のキーセットページネーションを、絞り込み条件ごとに索引のみで行う
+        Index("ix_tickets_status_updated_at_id", "status", "updated_at", "id"),
+        Index("ix_tickets_staff_id_updated_at_id", "staff_id", "updated_at", "id"),
+        Index("ix_tickets_supporter_id_updated_at_id", "supporter_id", "updated_at", "id"),
+        Index("ix_tickets_is_public_updated_at_id", "is_public", "updated_at", "id"),
+        # キーワード検索用の全文インデックス（MySQL のみ作成する。ngram → 日本語を2文字ずつに区切って索引を作成する）
+        Index(
+            "ft_tickets_title_description",
+            "title",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -29,6 +51,12 @@ class Ticket(Base):
     supporter_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=get_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=get_now, onupdate=get_now)
+    # 版（更新のたびに1つ進める）。楽観的排他制御に使う
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+
+    # 更新時に「UPDATE ... WHERE id = ? AND version = ?」で版を確認し、版を1つ進める
+    # 読み込んだ後に他の操作で更新されていた場合（更新対象の行がない場合）は、コミット時に StaleDataError となる
+    __mapper_args__ = {"version_id_col": version}
 
     staff: Mapped[User] = relationship(
         "User", foreign_keys=[staff_id], back_populates="staff_tickets"
@@ -38,8 +66,11 @@ class Ticket(Base):
     )
 
     # チケットから見てアクションは「多」のためlist
+    # ticket_histories には外部キー制約がないため、結合条件を指定する
     ticket_histories: Mapped[list[TicketHistory]] = relationship(
-        "TicketHistory", foreign_keys="TicketHistory.ticket_id", back_populates="ticket"
+        "TicketHistory",
+        primaryjoin="foreign(TicketHistory.ticket_id) == Ticket.id",
+        back_populates="ticket",
     )
 
     # 日本語に変換（このモデルでのみ使用する関数であればここで記載してOK）
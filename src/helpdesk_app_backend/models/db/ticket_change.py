@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, Enum, Index, Integer, bindparam, event, insert, select, update
+from sqlalchemy.orm import Mapped, Session, mapped_column, object_session, relationship
+
+from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now
+from helpdesk_app_backend.models.db.base import Base
+from helpdesk_app_backend.models.db.ticket_change_counter import (
+    TICKET_CHANGE_COUNTER_ID,
+    TicketChangeCounter,
+)
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+
+if TYPE_CHECKING:
+    from helpdesk_app_backend.models.db.ticket import Ticket
+    from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+
+
+# チケットの変更履歴（差分同期用）
+# チケット・対応履歴を変更するたびに、同じトランザクションで1行追加する
+# seq はコミットした順に採番されるため、クライアントは前回取得した最後の seq 以降の変更のみ取得できる
+# （id は INSERT 時に採番され、小さい id の変更が後からコミットされる場合があるため、差分同期には使わない）
+# アーカイブへ移したチケット・対応履歴の変更も残すため、tickets / ticket_histories への外部キー制約は付けない
+class TicketChange(Base):
+    __tablename__ = "ticket_changes"
+    # seq の範囲で差分を取得する（コミット前の行は NULL）
+    __table_args__ = (Index("ux_ticket_changes_seq", "seq", unique=True),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # コミット時に採番する（assign_ticket_change_seqs）
+    seq: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    ticket_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # 対応履歴が追加された場合はそのID
+    ticket_history_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    change_type: Mapped[TicketEventType] = mapped_column(Enum(TicketEventType), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=get_now)
+
+    # チケット登録時はチケットIDが未採番のため、関連で紐づける（対応履歴も同様）
+    # 外部キー制約がないため、結合条件を指定する（foreign() → 参照する側の列）
+    ticket: Mapped[Ticket] = relationship(
+        "Ticket", primaryjoin="foreign(TicketChange.ticket_id) == Ticket.id"
+    )
+    ticket_history: Mapped[TicketHistory | None] = relationship(
+        "TicketHistory", primaryjoin="foreign(TicketChange.ticket_history_id) == TicketHistory.id"
+    )
+
+
+# このトランザクションで変更履歴を追加したか（コミット時に seq を付けるか）を保持する session.info のキー
+# モデルの追加は before_insert で、executemany での追加は insert_ticket_changes で記録する
+HAS_UNSEQUENCED_TICKET_CHANGES_KEY = "has_unsequenced_ticket_changes"
+
+
+# 変更履歴（モデル）の INSERT 時に、コミット時に seq を付けるよう記録する
+@event.listens_for(TicketChange, "before_insert")
+def record_inserted_ticket_change(
+    mapper: object, connection: object, ticket_change: TicketChange
+) -> None:
+    session = object_session(ticket_change)
+    if session is not None:
+        session.info[HAS_UNSEQUENCED_TICKET_CHANGES_KEY] = True
+
+
+# seq を count 件分採番し、最初の seq を返す
+# 採番した行のロックはコミットまで保持されるため、他のトランザクションの採番はこのコミットの後になる
+def allocate_ticket_change_seqs(session: Session, count: int) -> int:
+    result = session.execute(
+        update(TicketChangeCounter)
+        .where(TicketChangeCounter.id == TICKET_CHANGE_COUNTER_ID)
+        .values(seq=TicketChangeCounter.seq + count)
+        .execution_options(synchronize_session=False)
+    )
+    # マイグレーションを経ずに作成したDB（テスト等）では、最初の採番で行を追加する
+    if result.rowcount == 0:
+        session.execute(insert(TicketChangeCounter).values(id=TICKET_CHANGE_COUNTER_ID, seq=count))
+
+    last_seq = session.execute(
+        select(TicketChangeCounter.seq).where(TicketChangeCounter.id == TICKET_CHANGE_COUNTER_ID)
+    ).scalar_one()
+    return last_seq - count + 1
+
+
+# コミットの直前に、このトランザクションで追加した変更履歴へ、コミットした順の seq を付ける
+# seq が NULL の行は、コミット前の自分のトランザクションの行のみ見える（他のトランザクションの行はコミット時に seq が付く）
+# トランザクション内では追加した順（id の順）に採番する
+# 他の更新をすべて反映（flush）した後に採番するため、採番の行ロックを保持するのはコミットまでの短い間のみ
+# （行ロックを最後に取得するため、他の行ロックとの順序によるデッドロックも起きない）
+@event.listens_for(Session, "before_commit")
+def assign_ticket_change_seqs(session: Session) -> None:
+    session.flush()
+    if not session.info.pop(HAS_UNSEQUENCED_TICKET_CHANGES_KEY, False):
+        return
+
+    ticket_change_ids = list(
+        session.execute(
+            select(TicketChange.id).where(TicketChange.seq.is_(None)).order_by(TicketChange.id)
+        ).scalars()
+    )
+    if not ticket_change_ids:
+        return
+
+    first_seq = allocate_ticket_change_seqs(session, len(ticket_change_ids))
+    session.execute(
+        update(TicketChange.__table__)
+        .where(TicketChange.__table__.c.id == bindparam("change_id"))
+        .values(seq=bindparam("change_seq")),
+        [
+            {"change_id": ticket_change_id, "change_seq": first_seq + offset}
+            for offset, ticket_change_id in enumerate(ticket_change_ids)
+        ],
+    )
+
+
+# ロールバックした場合は、追加した変更履歴も破棄されるため記録を消す
+@event.listens_for(Session, "after_soft_rollback")
+def discard_unsequenced_ticket_changes(session: Session, previous_transaction: object) -> None:
+    session.info.pop(HAS_UNSEQUENCED_TICKET_CHANGES_KEY, None)
@@ -0,0 +1,18 @@
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from helpdesk_app_backend.models.db.base import Base
+
+# 採番に使う行の id（1行のみ）
+TICKET_CHANGE_COUNTER_ID = 1
+
+
+# 変更履歴（ticket_changes）の seq の採番（1行のみ）
+# コミットの直前に seq を加算し、行ロックをコミットまで保持するため、seq はコミットした順に採番される
+# （ticket_changes.id は INSERT 時に採番されるため、コミットの順と一致しない）
+class TicketChangeCounter(Base):
+    __tablename__ = "ticket_change_counters"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    # 採番済みの最後の seq
+    seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,22 @@
+from sqlalchemy import Boolean, Enum, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from helpdesk_app_backend.models.db.base import Base
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+
+# サポート担当者が未割り当てのチケットを集計する supporter_id（主キーに NULL は使えないため）
+UNASSIGNED_SUPPORTER_ID = 0
+
+
+# チケット件数の集計（ダッシュボード用）
+# ステータス・サポート担当者・公開設定の組み合わせごとに1行
+# チケットの登録・担当割り当て/解除・ステータス変更・公開設定変更のたびに、同じトランザクションで増減する
+# 集計結果がずれた場合は commands/reconcile_ticket_counts.py で作り直す
+class TicketCount(Base):
+    __tablename__ = "ticket_counts"
+
+    status: Mapped[TicketStatusType] = mapped_column(Enum(TicketStatusType), primary_key=True)
+    # 担当者のユーザーID（未割り当ての場合は UNASSIGNED_SUPPORTER_ID）
+    supporter_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    is_public: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text
+from sqlalchemy import DateTime, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from helpdesk_app_backend.logic.calculate.calculate_datetime import get_now
@@ -14,19 +14,31 @@ if TYPE_CHECKING:
     from helpdesk_app_backend.models.db.user import User
 
 
+# MySQL では作成日時（created_at）の月ごとにパーティション分割する（migrations の 0b6d4e2f9a31 で作成）
+# パーティション分割したテーブルの制約に合わせ、DB上の主キーは (id, created_at) とし、外部キー制約・全文インデックスは付けない
+# id は単独でも一意のため、モデルでは id のみを主キーとして扱う（SQLite では分割せず、id を主キーとして作成する）
+# 月ごとのパーティションは commands/maintain_ticket_history_partitions.py で作成・削除する
 class TicketHistory(Base):
     __tablename__ = "ticket_histories"
+    # チケット詳細で、チケットに紐づく履歴を作成日時順に取得するための複合インデックス
+    __table_args__ = (Index("ix_ticket_histories_ticket_id_created_at", "ticket_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    ticket_id: Mapped[int] = mapped_column(ForeignKey("tickets.id"), nullable=False)
-    action_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=True)
+    ticket_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    action_user_id: Mapped[int] = mapped_column(Integer, nullable=True)
     action_description: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=get_now)
+    # パーティションの振り分けに使うため、必須
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=get_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=get_now, onupdate=get_now)
 
+    # 外部キー制約がないため、結合条件を指定する（foreign() → 参照する側の列）
     ticket: Mapped[Ticket] = relationship(
-        "Ticket", foreign_keys=[ticket_id], back_populates="ticket_histories"
+        "Ticket",
+        primaryjoin="foreign(TicketHistory.ticket_id) == Ticket.id",
+        back_populates="ticket_histories",
     )
     action_user: Mapped[User] = relationship(
-        "User", foreign_keys=[action_user_id], back_populates="ticket_histories"
+        "User",
+        primaryjoin="foreign(TicketHistory.action_user_id) == User.id",
+        back_populates="ticket_histories",
     )
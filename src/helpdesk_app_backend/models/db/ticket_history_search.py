@@ -0,0 +1,45 @@
+from sqlalchemy import Index, Integer, Text, event, insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from helpdesk_app_backend.models.db.base import Base
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+
+
+# 対応履歴のキーワード検索用のテーブル（MySQL の全文インデックスで検索する）
+# ticket_histories は月ごとにパーティション分割しており、全文インデックスを作成できないため、
+# 内容のみをパーティション分割しないこのテーブルへ写す
+# 対応履歴の追加と同じトランザクションで1行追加する（下記のイベントで追加する）
+class TicketHistorySearch(Base):
+    __tablename__ = "ticket_history_search"
+    __table_args__ = (
+        Index("ix_ticket_history_search_ticket_id", "ticket_id"),
+        # キーワード検索用の全文インデックス（MySQL のみ作成する。ngram → 日本語を2文字ずつに区切って索引を作成する）
+        Index(
+            "ft_ticket_history_search_action_description",
+            "action_description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
+
+    # 対応履歴のID（ticket_histories.id と同じ値）
+    ticket_history_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    ticket_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    action_description: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+# 対応履歴（モデル）を追加した flush の直後に、同じトランザクションで検索用のテーブルへも追加する
+# （対応履歴のIDは INSERT 後に確定するため、flush の後に追加する。一括の追加も1回の executemany で追加する）
+@event.listens_for(Session, "after_flush")
+def insert_ticket_history_search_rows(session: Session, flush_context: object) -> None:
+    values = [
+        {
+            "ticket_history_id": ticket_history.id,
+            "ticket_id": ticket_history.ticket_id,
+            "action_description": ticket_history.action_description,
+        }
+        for ticket_history in session.new
+        if isinstance(ticket_history, TicketHistory)
+    ]
+    if values:
+        session.connection().execute(insert(TicketHistorySearch), values)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, Integer, String
+from sqlalchemy import Boolean, DateTime, Enum, Index, Integer, String
 
 # SQLAlchemy 2.0形式（最新）の書き方
 # Mapped：カラムになるものであることを示す。mapped_column：カラムの条件を指定するもの。
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 
 class User(Base):
     __tablename__ = "users"
+    # チケット一覧の版（アカウントの最終更新日時）を索引のみで取得するためのインデックス
+    __table_args__ = (Index("ix_users_updated_at", "updated_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(30), nullable=False)
@@ -48,6 +50,9 @@ class User(Base):
     supporter_tickets: Mapped[list[Ticket]] = relationship(
         "Ticket", foreign_keys="Ticket.supporter_id", back_populates="supporter"
     )
+    # ticket_histories には外部キー制約がないため、結合条件を指定する
     ticket_histories: Mapped[list[TicketHistory]] = relationship(
-        "TicketHistory", foreign_keys="TicketHistory.action_user_id", back_populates="action_user"
+        "TicketHistory",
+        primaryjoin="foreign(TicketHistory.action_user_id) == User.id",
+        back_populates="action_user",
     )
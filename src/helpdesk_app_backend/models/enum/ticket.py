@@ -18,3 +18,48 @@ class TicketStatusType(Enum):
             TicketStatusType.RESOLVED: "解決済み",
             TicketStatusType.CLOSED: "クローズ",
         }[self]
+
+
+# チケットの変更通知（SSE）のイベント種別
+class TicketEventType(Enum):
+    CREATED = "created"  # チケット登録
+    COMMENTED = "commented"  # コメント追加
+    ASSIGNED = "assigned"  # 担当者割り当て
+    UNASSIGNED = "unassigned"  # 担当解除
+    STATUS_UPDATED = "status_updated"  # ステータス変更
+    VISIBILITY_UPDATED = "visibility_updated"  # 公開設定変更
+    ARCHIVED = "archived"  # アーカイブへ移動（変更履歴にのみ記録し、SSE では通知しない）
+    RESTORED = "restored"  # アーカイブから戻した（再オープン時）
+
+
+# チケット一覧の並び順（クエリパラメータ sort に指定できる値）
+# 先頭が「-」の場合は降順。同じ日時のチケットはIDで並べる（キーセットページネーションのため）
+# 更新日時はチケットの更新で変わるため、ページ送りの途中で更新されたチケットは並び位置が移動する
+# （すでに取得したページへ移動すると取得されず、まだ取得していないページへ移動すると重複して取得される）
+class TicketListSortType(Enum):
+    CREATED_AT_DESC = "-created_at"  # 作成日時の新しい順（既定）
+    CREATED_AT_ASC = "created_at"  # 作成日時の古い順
+    UPDATED_AT_DESC = "-updated_at"  # 更新日時の新しい順
+    UPDATED_AT_ASC = "updated_at"  # 更新日時の古い順
+
+    # 並び替えに使う列名
+    @property
+    def column_name(self) -> str:
+        return self.value.removeprefix("-")
+
+    @property
+    def is_descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+# チケット・対応履歴のエクスポート形式（クエリパラメータ format に指定できる値）
+class TicketExportFormat(Enum):
+    CSV = "csv"  # 1行目は列名
+    NDJSON = "ndjson"  # 1行に1件のJSON
+
+    @property
+    def media_type(self) -> str:
+        return {
+            TicketExportFormat.CSV: "text/csv; charset=utf-8",
+            TicketExportFormat.NDJSON: "application/x-ndjson",
+        }[self]
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from helpdesk_app_backend.models.enum.user import AccountType
+
+
+# ログイン中のアカウント情報（リクエスト処理中に参照する項目のみ保持する）
+class CurrentAccount(BaseModel):
+    id: int
+    name: str
+    account_type: AccountType
+    is_suspended: bool
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+
+
+# チケットの変更通知（書き込み系APIが発行し、SSE で接続中のアカウントへ配信する）
+# staff_id・is_public → 配信先の絞り込み（一覧取得と同じ閲覧条件）に使用し、クライアントへは送らない
+class TicketEvent(BaseModel):
+    event_type: TicketEventType
+    # 変更履歴（ticket_changes）の seq。再接続時は GET /ticket/changes?since= で取りこぼしを取得できる
+    change_seq: int
+    ticket_id: int
+    staff_id: int
+    is_public: bool
+    # 対応履歴が追加された場合はそのID
+    history_id: int | None = None
@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+
+
+# チケット・対応履歴のエクスポートの絞り込み条件（未指定の項目では絞り込まない）
+class TicketExportFilter(BaseModel):
+    # いずれかのステータスに一致するチケット（対応履歴の場合は、チケットの現在のステータス）
+    statuses: list[TicketStatusType] = []
+    # 作成日時が created_from 以上、created_to 未満のチケット（対応履歴の場合は、対応履歴の作成日時）
+    created_from: datetime | None = None
+    created_to: datetime | None = None
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+
+
+# チケット一覧の絞り込み条件（未指定の項目では絞り込まない）
+# 閲覧可否（社員は自分のチケット または 公開チケットのみ）は、この条件とは別に必ず適用する
+class TicketListFilter(BaseModel):
+    # いずれかのステータスに一致するチケット
+    statuses: list[TicketStatusType] = []
+    staff_id: int | None = None
+    supporter_id: int | None = None
+    is_public: bool | None = None
+    # 作成日時が created_from 以上、created_to 未満のチケット
+    created_from: datetime | None = None
+    created_to: datetime | None = None
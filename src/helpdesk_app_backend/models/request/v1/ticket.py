@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from helpdesk_app_backend.models.enum.ticket import TicketStatusType
 
@@ -23,3 +23,25 @@ class UpdateTicketStatusRequest(BaseModel):
 # チケット公開設定変更（PUT）
 class UpdateTicketVisibilityRequest(BaseModel):
     is_public: bool
+
+
+# 一括操作で1回に指定できるチケット数
+BULK_TICKET_MAX_COUNT = 100
+
+
+# チケットの一括担当割り当て・一括担当解除（PUT）
+class BulkTicketRequest(BaseModel):
+    ticket_ids: list[int] = Field(min_length=1, max_length=BULK_TICKET_MAX_COUNT)
+    # チケットID → 画面に表示したときの版（チケットごとの If-Match。異なる場合はそのチケットのみ 412 とする）
+    # 指定がないチケットは版を確認しない
+    expected_versions: dict[int, int] = Field(default_factory=dict)
+
+
+# チケットステータス一括変更（PUT）
+class BulkUpdateTicketStatusRequest(BulkTicketRequest):
+    status: TicketStatusType
+
+
+# チケット公開設定一括変更（PUT）
+class BulkUpdateTicketVisibilityRequest(BulkTicketRequest):
+    is_public: bool
@@ -0,0 +1,62 @@
+from pydantic import BaseModel
+
+
+# コネクションプールの状態
+class PoolStatusItem(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    wait_count: int
+    wait_time_total_seconds: float
+    wait_time_max_seconds: float
+
+
+# コネクションプールの状態取得（GET）
+class GetPoolStatusResponse(BaseModel):
+    sync_pool: PoolStatusItem
+    # 非同期DB接続が無効の場合は None
+    async_pool: PoolStatusItem | None
+
+
+# 読み取り専用のレプリカ1台分の状態（最後に確認した時点）
+class ReplicaStatusItem(BaseModel):
+    url: str  # パスワードは伏せ字にする
+    available: bool
+    lag_seconds: float | None  # 接続できなかった場合・レプリケーションが停止している場合は None
+    pool: PoolStatusItem
+
+
+# 読み取り専用のレプリカの状態取得（GET）
+class GetReplicaStatusResponse(BaseModel):
+    max_lag_seconds: float
+    replicas: list[ReplicaStatusItem]
+
+
+# パスワードハッシュ化の実行器の状態取得（GET）
+class GetPasswordHashStatusResponse(BaseModel):
+    max_workers: int
+    max_pending: int
+    pending: int
+    queued: int
+    completed: int
+    rejected: int
+
+
+# アクセストークンのキャッシュの状態取得（GET）
+class GetAccessTokenCacheStatusResponse(BaseModel):
+    max_size: int
+    size: int
+    hits: int
+    misses: int
+
+
+# チケットの変更通知（SSE）の状態取得（GET）
+class GetTicketEventStatusResponse(BaseModel):
+    max_subscribers: int
+    subscribers: int
+    published: int
+    delivered: int
+    overflowed: int
+    failed: int
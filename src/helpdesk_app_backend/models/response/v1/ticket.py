@@ -16,6 +16,18 @@ class GetTicketResponseItem(BaseModel):
     created_at: datetime
 
 
+# チケット一覧取得（GET・ページネーションあり）
+class GetTicketListResponse(BaseModel):
+    items: list[GetTicketResponseItem]
+    next_cursor: str | None  # 次ページ取得用のカーソル（次ページが存在しない場合は null）
+
+
+# チケット検索（GET・関連度の高い順）
+class GetTicketSearchResponse(BaseModel):
+    items: list[GetTicketResponseItem]
+    next_offset: int | None  # 次ページ取得用の offset（次ページが存在しない場合は null）
+
+
 # 対応履歴取得（GET）
 class GetTicketHistoryResponseItem(BaseModel):
     id: int
@@ -25,6 +37,45 @@ class GetTicketHistoryResponseItem(BaseModel):
     created_at: datetime
 
 
+# 対応履歴の差分取得（GET）
+class GetTicketHistoriesResponse(BaseModel):
+    items: list[GetTicketHistoryResponseItem]
+    latest_id: int  # 取得済みの最新の履歴ID（次回取得時の since_id に指定する）
+    has_more: bool  # 取得しきれなかった履歴が残っているかどうか
+
+
+# チケットの変更の差分取得（GET）
+class GetTicketChangesResponse(BaseModel):
+    tickets: list[GetTicketResponseItem]  # 変更のあったチケットの現在の内容（IDの小さい順）
+    ticket_histories: list[GetTicketHistoryResponseItem]  # 追加された対応履歴（追加順）
+    removed_ticket_ids: list[int]  # 非公開になり閲覧できなくなったチケット
+    latest_seq: int  # 取得済みの最新の seq（次回取得時の since に指定する）
+    has_more: bool  # 取得しきれなかった変更が残っているかどうか
+
+
+# チケット件数取得（GET・ステータス別）
+class GetTicketStatusCountItem(BaseModel):
+    status: TicketStatusType
+    count: int
+
+
+# チケット件数取得（GET・サポート担当者別）
+class GetTicketSupporterCountItem(BaseModel):
+    supporter_id: int
+    supporter: str | None
+    count: int
+
+
+# チケット件数取得（GET・閲覧可能なチケットのみ）
+class GetTicketCountsResponse(BaseModel):
+    total: int
+    unassigned: int  # サポート担当者が未割り当てのチケット数
+    by_status: list[GetTicketStatusCountItem]  # 全ステータス（0件を含む。定義順）
+    by_supporter: list[
+        GetTicketSupporterCountItem
+    ]  # 担当チケットのあるサポート担当者のみ（IDの小さい順）
+
+
 # チケット詳細取得（GET）
 class GetTicketDetailResponse(BaseModel):
     id: int
@@ -37,7 +88,11 @@ class GetTicketDetailResponse(BaseModel):
     is_own_ticket: bool = Field(
         default=False
     )  # 担当が自分であるかどうかのフラグであるが、サポーターが存在しない場合も false となる（FE側で supporter が null の時点で、is_own_ticket の値は気にしないためOK）
-    ticket_histories: list[GetTicketHistoryResponseItem]
+    ticket_histories: list[GetTicketHistoryResponseItem]  # 直近の履歴のみ（古い順）
+    has_more_histories: bool = Field(
+        default=False
+    )  # ticket_histories より古い履歴が存在するかどうか（存在する場合は履歴取得APIで取得する）
+    version: int  # チケットの版（担当割り当て・ステータス変更などの If-Match に "版" の形式、または詳細取得の ETag をそのまま指定する）
 
 
 # チケット追加（POST）
@@ -70,3 +125,18 @@ class UpdateTicketVisibilityResponse(BaseModel):
     id: int
     action_user: str
     is_public: bool
+
+
+# チケット一括操作の結果（チケット1件分）
+class BulkTicketResultItem(BaseModel):
+    ticket_id: int
+    success: bool
+    status_code: int  # 単体の操作で返すステータスコード（200・422・412：指定された版と異なる・409：更新中に他の操作で更新された）
+    message: str | None  # 失敗した理由（成功した場合は null）
+
+
+# チケット一括操作（PUT）
+class BulkTicketResponse(BaseModel):
+    results: list[BulkTicketResultItem]  # 指定されたチケットIDの順（重複は除く）
+    succeeded: int
+    failed: int
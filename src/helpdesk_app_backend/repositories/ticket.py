@@ -1,12 +1,285 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+
+from sqlalchemy import Row, Select, and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketListSortType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.ticket_list_filter import TicketListFilter
+from helpdesk_app_backend.repositories.user import build_latest_user_updated_at_query
+
+# 一覧表示で参照する起票者・サポート担当者を、チケットと同じSELECT（JOIN）でまとめて読み込む指定
+# 指定しない場合、チケット1件ごとに staff / supporter のSELECTが追加で発行される（N+1問題）
+TICKET_USERS_EAGER_LOAD_OPTIONS = (joinedload(Ticket.staff), joinedload(Ticket.supporter))
 
 
 # 全チケットを取得する
 def get_tickets_all(session: Session) -> list[Ticket]:
-    return session.query(Ticket).all()
+    return session.query(Ticket).options(*TICKET_USERS_EAGER_LOAD_OPTIONS).all()
+
+
+# 起票者・サポート担当者は同じ users テーブルを2回JOINするため、別名を付けて区別する
+StaffUser = aliased(User, name="staff_user")
+SupporterUser = aliased(User, name="supporter_user")
+
+
+# 一覧表示に必要な列のみ取得するSELECT文（起票者・サポート担当者名をJOIN）を作成する
+# description（Text型）など一覧で使わない列は読み込まず、ORMオブジェクトも作成しない（1行=Row）
+def build_ticket_list_columns_query() -> Select:
+    return (
+        select(
+            Ticket.id,
+            Ticket.title,
+            Ticket.is_public,
+            Ticket.status,
+            Ticket.created_at,
+            Ticket.updated_at,
+            StaffUser.name.label("staff_name"),
+            SupporterUser.name.label("supporter_name"),
+        )
+        .join(StaffUser, Ticket.staff_id == StaffUser.id)
+        # サポート担当者は未割り当て（NULL）の場合があるため外部結合
+        .outerjoin(SupporterUser, Ticket.supporter_id == SupporterUser.id)
+    )
+
+
+# ログイン中のアカウントが閲覧可能なチケットのみに絞り込む
+# 社員：自分のチケット または 公開チケットのみ（絞り込みはDB側のWHERE句で行う）
+# 社員以外：全チケット
+def filter_visible_tickets(query: Select, user_id: int, account_type: AccountType) -> Select:
+    if account_type == AccountType.STAFF:
+        return query.where(or_(Ticket.staff_id == user_id, Ticket.is_public.is_(True)))
+    return query
+
+
+# 一覧の絞り込み条件を WHERE 句に追加する
+# 画面で使う組み合わせは、いずれも複合インデックスの範囲検索で絞り込める
+#   ステータス → ix_tickets_status_created_at
+#   サポート担当者（自分の担当） → ix_tickets_supporter_id_created_at
+#   起票者（自分のチケット） → ix_tickets_staff_id_created_at
+#   公開設定 → ix_tickets_is_public_created_at
+# 作成日時の範囲は、上記いずれのインデックスでも2列目の範囲として絞り込める
+def filter_ticket_list(query: Select, filters: TicketListFilter) -> Select:
+    if filters.statuses:
+        query = query.where(Ticket.status.in_(filters.statuses))
+    if filters.staff_id is not None:
+        query = query.where(Ticket.staff_id == filters.staff_id)
+    if filters.supporter_id is not None:
+        query = query.where(Ticket.supporter_id == filters.supporter_id)
+    if filters.is_public is not None:
+        query = query.where(Ticket.is_public.is_(filters.is_public))
+    if filters.created_from is not None:
+        query = query.where(Ticket.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        query = query.where(Ticket.created_at < filters.created_to)
+    return query
+
+
+# ログイン中のアカウントが閲覧可能なチケットを、一覧表示に必要な列のみ取得するSELECT文を作成する
+# 社員：自分のチケット または 公開チケットのみ（絞り込みはDB側のWHERE句で行う）
+# 社員以外：全チケット
+# filters を指定した場合、さらにその条件で絞り込む
+# 並び順は sort の日時順（同時刻の場合はIDで並べる。既定は作成日時の新しい順）
+# cursor を指定した場合、その (日時, id) より後ろのチケットのみ取得する（キーセットページネーション）
+# OFFSET と違い読み飛ばしが発生しないため、何ページ目でも取得コストは変わらない
+# 更新日時順の場合、ページ送りの途中で更新されたチケットは欠落・重複することがある（TicketListSortType を参照）
+# 同期版・非同期版の取得関数で共通して使用する
+def build_visible_ticket_list_query(
+    user_id: int,
+    account_type: AccountType,
+    limit: int | None = None,
+    cursor: tuple[datetime, int] | None = None,
+    filters: TicketListFilter | None = None,
+    sort: TicketListSortType = TicketListSortType.CREATED_AT_DESC,
+) -> Select:
+    # ix_tickets_staff_id_created_at / ix_tickets_is_public_created_at
+    # （更新日時順の場合は ix_tickets_staff_id_updated_at_id / ix_tickets_is_public_updated_at_id）を使って絞り込む
+    query = filter_visible_tickets(build_ticket_list_columns_query(), user_id, account_type)
+
+    if filters is not None:
+        query = filter_ticket_list(query, filters)
+
+    sort_column = getattr(Ticket, sort.column_name)
+
+    if cursor is not None:
+        cursor_sorted_at, cursor_id = cursor
+        if sort.is_descending:
+            query = query.where(
+                or_(
+                    sort_column < cursor_sorted_at,
+                    and_(sort_column == cursor_sorted_at, Ticket.id < cursor_id),
+                )
+            )
+        else:
+            query = query.where(
+                or_(
+                    sort_column > cursor_sorted_at,
+                    and_(sort_column == cursor_sorted_at, Ticket.id > cursor_id),
+                )
+            )
+
+    if sort.is_descending:
+        query = query.order_by(sort_column.desc(), Ticket.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Ticket.id.asc())
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
+# ログイン中のアカウントが閲覧可能なチケットを、一覧表示に必要な列のみ取得する
+def get_visible_ticket_list_rows(
+    session: Session,
+    user_id: int,
+    account_type: AccountType,
+    limit: int | None = None,
+    cursor: tuple[datetime, int] | None = None,
+    filters: TicketListFilter | None = None,
+    sort: TicketListSortType = TicketListSortType.CREATED_AT_DESC,
+) -> list[Row]:
+    query = build_visible_ticket_list_query(
+        user_id, account_type, limit=limit, cursor=cursor, filters=filters, sort=sort
+    )
+    return list(session.execute(query).all())
+
+
+# get_visible_ticket_list_rows の非同期版
+async def get_visible_ticket_list_rows_async(
+    session: AsyncSession,
+    user_id: int,
+    account_type: AccountType,
+    limit: int | None = None,
+    cursor: tuple[datetime, int] | None = None,
+    filters: TicketListFilter | None = None,
+    sort: TicketListSortType = TicketListSortType.CREATED_AT_DESC,
+) -> list[Row]:
+    query = build_visible_ticket_list_query(
+        user_id, account_type, limit=limit, cursor=cursor, filters=filters, sort=sort
+    )
+    return list((await session.execute(query)).all())
+
+
+# 指定したIDのチケットを、一覧表示に必要な列のみ取得する（IDの小さい順）
+# 閲覧可否の確認は呼び出し側で行う
+def build_ticket_list_rows_by_ids_query(ids: list[int]) -> Select:
+    return build_ticket_list_columns_query().where(Ticket.id.in_(ids)).order_by(Ticket.id)
+
+
+def get_ticket_list_rows_by_ids(session: Session, ids: list[int]) -> list[Row]:
+    return list(session.execute(build_ticket_list_rows_by_ids_query(ids)).all())
+
+
+# get_ticket_list_rows_by_ids の非同期版
+async def get_ticket_list_rows_by_ids_async(session: AsyncSession, ids: list[int]) -> list[Row]:
+    return list((await session.execute(build_ticket_list_rows_by_ids_query(ids))).all())
+
 
 # 指定したIDのチケット情報を取得
 def get_ticket_by_id(session: Session, id: int) -> Ticket:
     return session.query(Ticket).where(Ticket.id == id).first()
+
+
+# 指定したIDのチケット情報をまとめて取得（存在しないIDは含まない。一括操作で使用する）
+def get_tickets_by_ids(session: Session, ids: list[int]) -> list[Ticket]:
+    return list(session.execute(select(Ticket).where(Ticket.id.in_(ids))).scalars().all())
+
+
+# get_ticket_by_id の非同期版
+async def get_ticket_by_id_async(session: AsyncSession, id: int) -> Ticket:
+    return (await session.execute(select(Ticket).where(Ticket.id == id))).scalars().first()
+
+
+# 詳細表示用のSELECT文を作成する（同期版・非同期版で共通して使用する）
+def build_ticket_detail_query(id: int) -> Select:
+    return select(Ticket).options(*TICKET_USERS_EAGER_LOAD_OPTIONS).where(Ticket.id == id)
+
+
+# 指定したIDのチケット情報を、詳細表示で参照する起票者・サポート担当者と合わせて取得（1回のSELECTで取得）
+def get_ticket_detail_by_id(session: Session, id: int) -> Ticket:
+    return session.execute(build_ticket_detail_query(id)).scalars().first()
+
+
+# get_ticket_detail_by_id の非同期版
+# 非同期では関連の遅延読み込みができないため、起票者・サポート担当者は必ず同時に取得しておく
+async def get_ticket_detail_by_id_async(session: AsyncSession, id: int) -> Ticket:
+    return (await session.execute(build_ticket_detail_query(id))).scalars().first()
+
+
+# チケット一覧の版を取得するSELECT文を作成する（最新のチケットID・最新の対応履歴ID・最新の変更の seq・アカウントの最終更新日時）
+# チケットの追加でチケットIDが、チケットの更新・対応の追加では必ず対応履歴が追加されるため履歴IDが増える
+# アーカイブへの移動・アーカイブからの復元は対応履歴を追加しないため、変更履歴の seq で判定する
+# 一覧には起票者・サポート担当者の名前も含むため、アカウントの更新（名前の変更など）はアカウントの最終更新日時で判定する
+# いずれも索引（主キー・ux_ticket_changes_seq・ix_users_updated_at）の最大値のため、索引のみで取得できる
+def build_ticket_list_version_query() -> Select:
+    return select(
+        select(func.max(Ticket.id)).scalar_subquery().label("latest_ticket_id"),
+        select(func.max(TicketHistory.id)).scalar_subquery().label("latest_history_id"),
+        select(func.max(TicketChange.seq)).scalar_subquery().label("latest_change_seq"),
+        build_latest_user_updated_at_query().scalar_subquery().label("latest_user_updated_at"),
+    )
+
+
+# チケット一覧の版を取得する
+def get_ticket_list_version(session: Session) -> Row:
+    return session.execute(build_ticket_list_version_query()).one()
+
+
+# get_ticket_list_version の非同期版
+async def get_ticket_list_version_async(session: AsyncSession) -> Row:
+    return (await session.execute(build_ticket_list_version_query())).one()
+
+
+# チケット詳細の版を取得するSELECT文を作成する
+# 閲覧可否の判定に必要な列（staff_id / is_public）と、版（version）・最新の対応履歴ID・アカウントの最終更新日時のみ取得する
+# 詳細には起票者・サポート担当者・対応者の名前も含むため、アカウントの更新（名前の変更など）はアカウントの最終更新日時で判定する
+def build_ticket_version_query(id: int) -> Select:
+    latest_history_id = (
+        select(func.max(TicketHistory.id))
+        .where(TicketHistory.ticket_id == Ticket.id)
+        .scalar_subquery()
+    )
+    return select(
+        Ticket.id,
+        Ticket.staff_id,
+        Ticket.is_public,
+        Ticket.version,
+        latest_history_id.label("latest_history_id"),
+        build_latest_user_updated_at_query().scalar_subquery().label("latest_user_updated_at"),
+    ).where(Ticket.id == id)
+
+
+# チケット詳細の版を取得する（存在しない場合は None）
+def get_ticket_version(session: Session, id: int) -> Row | None:
+    return session.execute(build_ticket_version_query(id)).first()
+
+
+# get_ticket_version の非同期版
+async def get_ticket_version_async(session: AsyncSession, id: int) -> Row | None:
+    return (await session.execute(build_ticket_version_query(id))).first()
+
+
+# チケットの版（version）が読み込んだときと同じ場合のみ、1回の UPDATE で更新し、版を1つ進める（楽観的排他制御）
+# 「UPDATE ... WHERE id = ? AND version = ?」の対象の行があった場合（更新できた場合）は True
+# 読み込んだ後に他の操作で更新されていた場合は False（呼び出し側で、そのチケットのみ失敗として扱う）
+# 更新した値はセッション内のチケットにも反映する（コミット時に、同じ内容を再度 UPDATE しないよう変更済みとしては扱わない）
+def update_ticket_if_unchanged(session: Session, target_ticket: Ticket, **values: object) -> bool:
+    result = session.execute(
+        update(Ticket)
+        .where(Ticket.id == target_ticket.id, Ticket.version == target_ticket.version)
+        .values(**values, version=Ticket.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        return False
+
+    for key, value in {**values, "version": target_ticket.version + 1}.items():
+        set_committed_value(target_ticket, key, value)
+    return True
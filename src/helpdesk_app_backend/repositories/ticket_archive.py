@@ -0,0 +1,227 @@
+from datetime import datetime
+
+from sqlalchemy import Row, Select, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from helpdesk_app_backend.models.db.archived_ticket import ArchivedTicket
+from helpdesk_app_backend.models.db.archived_ticket_history import ArchivedTicketHistory
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.repositories.user import build_latest_user_updated_at_query
+
+# tickets / archived_tickets で共通の列（ticket_histories / archived_ticket_histories も同様）
+TICKET_COLUMN_NAMES = [
+    "id",
+    "title",
+    "is_public",
+    "status",
+    "description",
+    "staff_id",
+    "supporter_id",
+    "created_at",
+    "updated_at",
+    "version",
+]
+TICKET_HISTORY_COLUMN_NAMES = [
+    "id",
+    "ticket_id",
+    "action_user_id",
+    "action_description",
+    "created_at",
+    "updated_at",
+]
+
+
+# アーカイブの対象となるチケット（closed_before より前から「クローズ」のまま更新のないもの）を、
+# 更新日時の古い順に limit 件取得する（件数の集計に使う列のみ）
+# 取得したチケットは、アーカイブへ移し終わるまで行ロックを取得する
+# 更新中（他のトランザクションがロック中）のチケットは待たずに読み飛ばす（SKIP LOCKED）
+def get_archivable_ticket_rows(session: Session, closed_before: datetime, limit: int) -> list[Row]:
+    query = (
+        select(Ticket.id, Ticket.status, Ticket.supporter_id, Ticket.is_public)
+        .where(Ticket.status == TicketStatusType.CLOSED, Ticket.updated_at < closed_before)
+        .order_by(Ticket.updated_at, Ticket.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(session.execute(query).all())
+
+
+# 指定したチケットを、対応履歴とともにアーカイブへ移す（同じIDのまま。コミットは呼び出し側で行う）
+# INSERT ... SELECT で移すため、チケット・対応履歴をアプリ側に読み込まない
+def archive_tickets(session: Session, ticket_ids: list[int], archived_at: datetime) -> None:
+    session.execute(
+        insert(ArchivedTicket).from_select(
+            [*TICKET_COLUMN_NAMES, "archived_at"],
+            select(
+                *[getattr(Ticket, name) for name in TICKET_COLUMN_NAMES], literal(archived_at)
+            ).where(Ticket.id.in_(ticket_ids)),
+        )
+    )
+    session.execute(
+        insert(ArchivedTicketHistory).from_select(
+            TICKET_HISTORY_COLUMN_NAMES,
+            select(*[getattr(TicketHistory, name) for name in TICKET_HISTORY_COLUMN_NAMES]).where(
+                TicketHistory.ticket_id.in_(ticket_ids)
+            ),
+        )
+    )
+    session.execute(delete(TicketHistory).where(TicketHistory.ticket_id.in_(ticket_ids)))
+    session.execute(delete(Ticket).where(Ticket.id.in_(ticket_ids)))
+
+
+# 指定したアーカイブ済みのチケットを、対応履歴とともに tickets へ戻す（コミットは呼び出し側で行う）
+# 戻したチケットのIDを返す（同時に戻された などでアーカイブにないIDは含まない）
+# アーカイブの行ロックを取得してから戻すため、同じチケットを同時に戻しても二重には戻らない
+def restore_archived_tickets(session: Session, ticket_ids: list[int]) -> list[int]:
+    restored_ids = list(
+        session.execute(
+            select(ArchivedTicket.id)
+            .where(ArchivedTicket.id.in_(ticket_ids))
+            .order_by(ArchivedTicket.id)
+            .with_for_update()
+        ).scalars()
+    )
+    if not restored_ids:
+        return []
+
+    session.execute(
+        insert(Ticket).from_select(
+            TICKET_COLUMN_NAMES,
+            select(*[getattr(ArchivedTicket, name) for name in TICKET_COLUMN_NAMES]).where(
+                ArchivedTicket.id.in_(restored_ids)
+            ),
+        )
+    )
+    session.execute(
+        insert(TicketHistory).from_select(
+            TICKET_HISTORY_COLUMN_NAMES,
+            select(
+                *[getattr(ArchivedTicketHistory, name) for name in TICKET_HISTORY_COLUMN_NAMES]
+            ).where(ArchivedTicketHistory.ticket_id.in_(restored_ids)),
+        )
+    )
+    session.execute(
+        delete(ArchivedTicketHistory).where(ArchivedTicketHistory.ticket_id.in_(restored_ids))
+    )
+    session.execute(delete(ArchivedTicket).where(ArchivedTicket.id.in_(restored_ids)))
+    return restored_ids
+
+
+# 指定したIDのアーカイブ済みのチケットを取得
+def get_archived_ticket_by_id(session: Session, id: int) -> ArchivedTicket | None:
+    return session.get(ArchivedTicket, id)
+
+
+# 指定したIDのアーカイブ済みのチケットをまとめて取得（存在しないIDは含まない。一括操作で使用する）
+def get_archived_tickets_by_ids(session: Session, ids: list[int]) -> list[ArchivedTicket]:
+    query = select(ArchivedTicket).where(ArchivedTicket.id.in_(ids))
+    return list(session.execute(query).scalars().all())
+
+
+# get_archived_ticket_by_id の非同期版
+async def get_archived_ticket_by_id_async(session: AsyncSession, id: int) -> ArchivedTicket | None:
+    return await session.get(ArchivedTicket, id)
+
+
+# アーカイブ済みのチケットの詳細表示用のSELECT文を作成する（起票者・サポート担当者も同時に取得）
+def build_archived_ticket_detail_query(id: int) -> Select:
+    return (
+        select(ArchivedTicket)
+        .options(joinedload(ArchivedTicket.staff), joinedload(ArchivedTicket.supporter))
+        .where(ArchivedTicket.id == id)
+    )
+
+
+def get_archived_ticket_detail_by_id(session: Session, id: int) -> ArchivedTicket | None:
+    return session.execute(build_archived_ticket_detail_query(id)).scalars().first()
+
+
+# get_archived_ticket_detail_by_id の非同期版
+async def get_archived_ticket_detail_by_id_async(
+    session: AsyncSession, id: int
+) -> ArchivedTicket | None:
+    return (await session.execute(build_archived_ticket_detail_query(id))).scalars().first()
+
+
+# アーカイブ済みのチケット詳細の版を取得するSELECT文を作成する（tickets の場合と同じ列）
+def build_archived_ticket_version_query(id: int) -> Select:
+    latest_history_id = (
+        select(func.max(ArchivedTicketHistory.id))
+        .where(ArchivedTicketHistory.ticket_id == ArchivedTicket.id)
+        .scalar_subquery()
+    )
+    return select(
+        ArchivedTicket.id,
+        ArchivedTicket.staff_id,
+        ArchivedTicket.is_public,
+        ArchivedTicket.version,
+        latest_history_id.label("latest_history_id"),
+        build_latest_user_updated_at_query().scalar_subquery().label("latest_user_updated_at"),
+    ).where(ArchivedTicket.id == id)
+
+
+def get_archived_ticket_version(session: Session, id: int) -> Row | None:
+    return session.execute(build_archived_ticket_version_query(id)).first()
+
+
+# get_archived_ticket_version の非同期版
+async def get_archived_ticket_version_async(session: AsyncSession, id: int) -> Row | None:
+    return (await session.execute(build_archived_ticket_version_query(id))).first()
+
+
+# アーカイブ済みのチケットに紐づく直近の対応履歴を、新しい順に limit 件取得するSELECT文を作成する（対応者も同時に取得）
+def build_recent_archived_ticket_histories_query(ticket_id: int, limit: int) -> Select:
+    return (
+        select(ArchivedTicketHistory)
+        .options(joinedload(ArchivedTicketHistory.action_user))
+        .where(ArchivedTicketHistory.ticket_id == ticket_id)
+        .order_by(ArchivedTicketHistory.created_at.desc(), ArchivedTicketHistory.id.desc())
+        .limit(limit)
+    )
+
+
+# アーカイブ済みのチケットに紐づく直近の対応履歴を取得する（作成日時の古い順に並べ直して返す）
+def get_recent_archived_ticket_histories(
+    session: Session, ticket_id: int, limit: int
+) -> list[ArchivedTicketHistory]:
+    query = build_recent_archived_ticket_histories_query(ticket_id, limit)
+    return list(reversed(session.execute(query).scalars().all()))
+
+
+# get_recent_archived_ticket_histories の非同期版
+async def get_recent_archived_ticket_histories_async(
+    session: AsyncSession, ticket_id: int, limit: int
+) -> list[ArchivedTicketHistory]:
+    query = build_recent_archived_ticket_histories_query(ticket_id, limit)
+    return list(reversed((await session.execute(query)).scalars().all()))
+
+
+# アーカイブ済みのチケットに紐づく対応履歴のうち、指定したIDより後のものを古い順に limit 件取得するSELECT文を作成する
+def build_archived_ticket_histories_since_query(
+    ticket_id: int, since_id: int, limit: int
+) -> Select:
+    return (
+        select(ArchivedTicketHistory)
+        .options(joinedload(ArchivedTicketHistory.action_user))
+        .where(ArchivedTicketHistory.ticket_id == ticket_id, ArchivedTicketHistory.id > since_id)
+        .order_by(ArchivedTicketHistory.id)
+        .limit(limit)
+    )
+
+
+def get_archived_ticket_histories_since(
+    session: Session, ticket_id: int, since_id: int, limit: int
+) -> list[ArchivedTicketHistory]:
+    query = build_archived_ticket_histories_since_query(ticket_id, since_id, limit)
+    return list(session.execute(query).scalars().all())
+
+
+# get_archived_ticket_histories_since の非同期版
+async def get_archived_ticket_histories_since_async(
+    session: AsyncSession, ticket_id: int, since_id: int, limit: int
+) -> list[ArchivedTicketHistory]:
+    query = build_archived_ticket_histories_since_query(ticket_id, since_id, limit)
+    return list((await session.execute(query)).scalars().all())
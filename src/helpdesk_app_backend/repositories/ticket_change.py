@@ -0,0 +1,104 @@
+from sqlalchemy import Row, Select, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import (
+    HAS_UNSEQUENCED_TICKET_CHANGES_KEY,
+    TicketChange,
+)
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+from helpdesk_app_backend.models.enum.user import AccountType
+
+
+# 最新の変更の seq（変更がない場合は 0）を取得するSELECT文を作成する（seq の一意インデックスのみで取得できる）
+# seq はコミットした順に採番するため、この seq 以前の変更はすべてコミット済み（後から小さい seq の変更が増えない）
+def build_latest_ticket_change_seq_query() -> Select:
+    return select(func.coalesce(func.max(TicketChange.seq), 0))
+
+
+def get_latest_ticket_change_seq(session: Session) -> int:
+    return session.execute(build_latest_ticket_change_seq_query()).scalar_one()
+
+
+# get_latest_ticket_change_seq の非同期版
+async def get_latest_ticket_change_seq_async(session: AsyncSession) -> int:
+    return (await session.execute(build_latest_ticket_change_seq_query())).scalar_one()
+
+
+# 指定した seq より後（until_seq まで）の変更を、古い順に指定件数分取得するSELECT文を作成する
+# 閲覧可否の判定に使うため、チケットの現在の起票者・公開設定も同時に取得する
+# アーカイブへ移したチケット（tickets にない）の変更は、起票者・公開設定が NULL になる
+# 社員：自分のチケット または 公開チケットの変更のみ（一覧取得と同じ条件）
+#       ただし公開設定の変更・アーカイブへの移動は、一覧から外れたことを伝えるため含める
+# seq の一意インデックスの範囲で絞り込むため、変更履歴が増えても取得コストは取得件数分のみ
+def build_ticket_changes_since_query(
+    user_id: int, account_type: AccountType, since_seq: int, until_seq: int, limit: int
+) -> Select:
+    query = (
+        select(
+            TicketChange.seq,
+            TicketChange.ticket_id,
+            TicketChange.ticket_history_id,
+            TicketChange.change_type,
+            Ticket.staff_id,
+            Ticket.is_public,
+        )
+        .outerjoin(Ticket, TicketChange.ticket_id == Ticket.id)
+        .where(TicketChange.seq > since_seq, TicketChange.seq <= until_seq)
+    )
+
+    if account_type == AccountType.STAFF:
+        query = query.where(
+            or_(
+                Ticket.staff_id == user_id,
+                Ticket.is_public.is_(True),
+                TicketChange.change_type == TicketEventType.VISIBILITY_UPDATED,
+                Ticket.id.is_(None),
+            )
+        )
+
+    return query.order_by(TicketChange.seq).limit(limit)
+
+
+def get_ticket_changes_since(
+    session: Session,
+    user_id: int,
+    account_type: AccountType,
+    since_seq: int,
+    until_seq: int,
+    limit: int,
+) -> list[Row]:
+    query = build_ticket_changes_since_query(user_id, account_type, since_seq, until_seq, limit)
+    return list(session.execute(query).all())
+
+
+# get_ticket_changes_since の非同期版
+async def get_ticket_changes_since_async(
+    session: AsyncSession,
+    user_id: int,
+    account_type: AccountType,
+    since_seq: int,
+    until_seq: int,
+    limit: int,
+) -> list[Row]:
+    query = build_ticket_changes_since_query(user_id, account_type, since_seq, until_seq, limit)
+    return list((await session.execute(query)).all())
+
+
+# 変更履歴をまとめて追加する（1回の executemany で追加する。コミットは呼び出し側で行う）
+# seq はコミット時に付ける（assign_ticket_change_seqs）
+# values → 追加する変更（ticket_id・ticket_history_id・change_type）
+def insert_ticket_changes(session: Session, values: list[dict]) -> None:
+    session.execute(insert(TicketChange), values)
+    session.info[HAS_UNSEQUENCED_TICKET_CHANGES_KEY] = True
+
+
+# 指定した対応履歴の追加に対応する変更の seq を取得する（対応履歴ID → seq。コミット後に呼び出す）
+def get_ticket_change_seqs_by_history_ids(
+    session: Session, ticket_history_ids: list[int]
+) -> dict[int, int]:
+    query = select(TicketChange.ticket_history_id, TicketChange.seq).where(
+        TicketChange.ticket_history_id.in_(ticket_history_ids)
+    )
+    return {row[0]: row[1] for row in session.execute(query).all()}
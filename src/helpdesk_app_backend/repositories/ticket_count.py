@@ -0,0 +1,153 @@
+from typing import NamedTuple
+
+from sqlalchemy import Insert, Row, Select, delete, func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_count import UNASSIGNED_SUPPORTER_ID, TicketCount
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+
+
+# チケット件数の集計キー（ticket_counts の主キー）
+class TicketCountKey(NamedTuple):
+    status: TicketStatusType
+    supporter_id: int
+    is_public: bool
+
+
+# チケットの現在の状態から集計キーを作成する
+def to_ticket_count_key(
+    status: TicketStatusType, supporter_id: int | None, is_public: bool
+) -> TicketCountKey:
+    return TicketCountKey(
+        status=status,
+        supporter_id=supporter_id if supporter_id is not None else UNASSIGNED_SUPPORTER_ID,
+        is_public=is_public,
+    )
+
+
+# 集計キーの件数を delta 件増減するSQL文を作成する（行がない場合は delta 件として追加する）
+# 1文で「読み取り → 加算 → 書き込み」を行うため、同じキーを同時に更新しても増減を取りこぼさない
+def build_ticket_count_upsert(dialect_name: str, key: TicketCountKey, delta: int) -> Insert:
+    values = {**key._asdict(), "count": delta}
+    if dialect_name == "mysql":
+        return (
+            mysql_insert(TicketCount)
+            .values(values)
+            .on_duplicate_key_update(count=TicketCount.count + delta)
+        )
+    if dialect_name == "sqlite":
+        return (
+            sqlite_insert(TicketCount)
+            .values(values)
+            .on_conflict_do_update(
+                index_elements=[
+                    TicketCount.status,
+                    TicketCount.supporter_id,
+                    TicketCount.is_public,
+                ],
+                set_={"count": TicketCount.count + delta},
+            )
+        )
+    raise ValueError(f"チケット件数の集計に対応していないDBです: {dialect_name}")
+
+
+# 集計キーごとの件数を増減する（コミットは呼び出し側で行う）
+# 複数のキーを更新する場合は、常に同じ順番で行ロックを取得するよう並べ替えてから更新する
+# （逆向きの変更を同時に行った場合に、互いのロックを待ち合うデッドロックを防ぐ）
+def add_ticket_counts(session: Session, deltas: dict[TicketCountKey, int]) -> None:
+    dialect_name = session.get_bind().dialect.name
+    for key in sorted(deltas, key=lambda key: (key.status.value, key.supporter_id, key.is_public)):
+        if deltas[key] != 0:
+            session.execute(build_ticket_count_upsert(dialect_name, key, deltas[key]))
+
+
+# 集計済みの件数を、サポート担当者名とともに取得するSELECT文を作成する（件数が0の行は除く）
+# 件数の列名は ticket_count（Row の count メソッドと区別するため）
+# public_only=True の場合は公開チケットの件数のみ
+def build_ticket_count_rows_query(public_only: bool) -> Select:
+    query = (
+        select(
+            TicketCount.status,
+            TicketCount.supporter_id,
+            User.name.label("supporter_name"),
+            TicketCount.count.label("ticket_count"),
+        )
+        .outerjoin(User, TicketCount.supporter_id == User.id)
+        .where(TicketCount.count != 0)
+    )
+    if public_only:
+        query = query.where(TicketCount.is_public.is_(True))
+    return query
+
+
+def get_ticket_count_rows(session: Session, public_only: bool) -> list[Row]:
+    return list(session.execute(build_ticket_count_rows_query(public_only)).all())
+
+
+# 起票者の非公開チケットの件数を、チケットから直接集計するSELECT文を作成する（社員の場合の件数に加算する）
+# 起票者1人分のチケットのみのため、ix_tickets_staff_id_created_at で絞り込める
+def build_own_private_ticket_count_rows_query(staff_id: int) -> Select:
+    supporter_id = func.coalesce(Ticket.supporter_id, UNASSIGNED_SUPPORTER_ID)
+    return (
+        select(
+            Ticket.status,
+            supporter_id.label("supporter_id"),
+            User.name.label("supporter_name"),
+            func.count().label("ticket_count"),
+        )
+        .outerjoin(User, Ticket.supporter_id == User.id)
+        .where(Ticket.staff_id == staff_id, Ticket.is_public.is_(False))
+        .group_by(Ticket.status, supporter_id, User.name)
+    )
+
+
+def get_own_private_ticket_count_rows(session: Session, staff_id: int) -> list[Row]:
+    return list(session.execute(build_own_private_ticket_count_rows_query(staff_id)).all())
+
+
+# 集計済みの件数を、集計キーごとに取得する（作り直し時の比較用）
+# for_update=True の場合は行ロックを取得し、作り直しが終わるまで件数の増減を待たせる
+def get_stored_ticket_counts(
+    session: Session, for_update: bool = False
+) -> dict[TicketCountKey, int]:
+    query = select(
+        TicketCount.status,
+        TicketCount.supporter_id,
+        TicketCount.is_public,
+        TicketCount.count.label("ticket_count"),
+    )
+    if for_update:
+        query = query.with_for_update()
+    return {
+        TicketCountKey(row.status, row.supporter_id, row.is_public): row.ticket_count
+        for row in session.execute(query).all()
+    }
+
+
+# チケットから件数を集計し直す（集計キーごと）
+def get_actual_ticket_counts(session: Session) -> dict[TicketCountKey, int]:
+    supporter_id = func.coalesce(Ticket.supporter_id, UNASSIGNED_SUPPORTER_ID)
+    query = select(
+        Ticket.status,
+        supporter_id.label("supporter_id"),
+        Ticket.is_public,
+        func.count().label("ticket_count"),
+    ).group_by(Ticket.status, supporter_id, Ticket.is_public)
+    return {
+        TicketCountKey(row.status, row.supporter_id, row.is_public): row.ticket_count
+        for row in session.execute(query).all()
+    }
+
+
+# 集計済みの件数をすべて削除し、指定した件数で作り直す（コミットは呼び出し側で行う）
+def replace_ticket_counts(session: Session, counts: dict[TicketCountKey, int]) -> None:
+    session.execute(delete(TicketCount))
+    if counts:
+        session.execute(
+            insert(TicketCount),
+            [{**key._asdict(), "count": count} for key, count in counts.items()],
+        )
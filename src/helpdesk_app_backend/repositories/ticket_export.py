@@ -0,0 +1,99 @@
+from collections.abc import Iterator
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.archived_ticket import ArchivedTicket
+from helpdesk_app_backend.models.db.archived_ticket_history import ArchivedTicketHistory
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.internal.ticket_export_filter import TicketExportFilter
+
+# エクスポートする列（出力順）
+TICKET_EXPORT_COLUMN_NAMES = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "is_public",
+    "staff_id",
+    "supporter_id",
+    "created_at",
+    "updated_at",
+]
+TICKET_HISTORY_EXPORT_COLUMN_NAMES = [
+    "id",
+    "ticket_id",
+    "action_user_id",
+    "action_description",
+    "created_at",
+    "updated_at",
+]
+
+
+# エクスポートするチケットを取得するSELECT文を作成する（対応中のチケット → アーカイブ済みのチケットの順）
+# アーカイブ済みのチケット（archived_tickets）も合わせて出力する
+# UNION して全件を並び替えると、一時テーブルに全件を書き出してから並び替えるため、テーブルごとに主キーの順で読む
+# （1件目を読むまでに全件を読む必要がなく、テーブルごとに主キーの順で1チャンクずつ読み進められる）
+# 列には列名の別名を付ける（出力の列名に使うため）
+# ステータスを指定した場合は、ix_tickets_status_created_at で絞り込める
+def build_ticket_export_queries(filters: TicketExportFilter) -> list[Select]:
+    queries = []
+    for ticket_model in (Ticket, ArchivedTicket):
+        query = select(
+            *[getattr(ticket_model, name).label(name) for name in TICKET_EXPORT_COLUMN_NAMES]
+        )
+        if filters.statuses:
+            query = query.where(ticket_model.status.in_(filters.statuses))
+        if filters.created_from is not None:
+            query = query.where(ticket_model.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(ticket_model.created_at < filters.created_to)
+        queries.append(query.order_by(ticket_model.id))
+    return queries
+
+
+# エクスポートする対応履歴を取得するSELECT文を作成する（対応中のチケットの対応履歴 → アーカイブ済みのチケットの対応履歴の順）
+# アーカイブ済みのチケットの対応履歴（archived_ticket_histories）も合わせて出力する（チケットと同様に、テーブルごとに主キーの順で読む）
+# ステータスを指定した場合は、チケットの現在のステータスで絞り込む
+def build_ticket_history_export_queries(filters: TicketExportFilter) -> list[Select]:
+    queries = []
+    for history_model, ticket_model in (
+        (TicketHistory, Ticket),
+        (ArchivedTicketHistory, ArchivedTicket),
+    ):
+        query = select(
+            *[
+                getattr(history_model, name).label(name)
+                for name in TICKET_HISTORY_EXPORT_COLUMN_NAMES
+            ]
+        )
+        if filters.statuses:
+            query = query.join(ticket_model, history_model.ticket_id == ticket_model.id).where(
+                ticket_model.status.in_(filters.statuses)
+            )
+        if filters.created_from is not None:
+            query = query.where(history_model.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(history_model.created_at < filters.created_to)
+        queries.append(query.order_by(history_model.id))
+    return queries
+
+
+# SELECT文の結果を、SELECT文の順に chunk_size 件ずつ取得する
+# yield_per → サーバー側カーソル（stream_results）で読み進め、全件をメモリに載せない
+# 同じトランザクションで順に読むため、読み込み中にアーカイブへ移された・戻されたチケットも、
+# どちらか一方のテーブルから1回のみ出力される（MySQL の REPEATABLE READ では、最初の読み込み時点の内容を読む）
+# 読み終わるまで接続を使い続けるため、呼び出し側は最後まで読むか、途中でセッションを閉じる
+def stream_export_rows(
+    session: Session, queries: list[Select], chunk_size: int
+) -> Iterator[list[Row]]:
+    for query in queries:
+        result = session.execute(query.execution_options(yield_per=chunk_size))
+        for rows in result.partitions():
+            yield list(rows)
+
+
+# エクスポートする列名（SELECT文の列の別名）
+def get_export_column_names(queries: list[Select]) -> list[str]:
+    return list(queries[0].selected_columns.keys())
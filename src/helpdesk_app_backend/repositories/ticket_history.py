@@ -1,8 +1,113 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
 from helpdesk_app_backend.models.db.ticket_history import TicketHistory
 
 
 # チケットに紐づく対応履歴を取得する
+# 対応者（action_user）はJOINで同時に取得し、履歴ごとのユーザー取得SELECTを発生させない
+# 並び順は作成日時の古い順（同時刻の場合はIDの小さい順）で固定
+# ix_ticket_histories_ticket_id_created_at を使って絞り込み・並び替えを行う
 def get_ticket_histories_by_ticket_id(session: Session, id: int) -> list[TicketHistory]:
-    return session.query(TicketHistory).filter(TicketHistory.ticket_id == id).all()
+    return (
+        session.query(TicketHistory)
+        .options(joinedload(TicketHistory.action_user))
+        .filter(TicketHistory.ticket_id == id)
+        .order_by(TicketHistory.created_at, TicketHistory.id)
+        .all()
+    )
+
+
+# チケットに紐づく直近の対応履歴を指定件数分取得するSELECT文を作成する（対応者も同時に取得）
+# 新しい順に limit 件取得する（同期版・非同期版で共通して使用する）
+def build_recent_ticket_histories_query(ticket_id: int, limit: int) -> Select:
+    return (
+        select(TicketHistory)
+        .options(joinedload(TicketHistory.action_user))
+        .where(TicketHistory.ticket_id == ticket_id)
+        .order_by(TicketHistory.created_at.desc(), TicketHistory.id.desc())
+        .limit(limit)
+    )
+
+
+# チケットに紐づく直近の対応履歴を、指定件数分取得する（対応者も同時に取得）
+# 新しい順に limit 件取得した後、作成日時の古い順に並べ直して返す
+def get_recent_ticket_histories(
+    session: Session, ticket_id: int, limit: int
+) -> list[TicketHistory]:
+    query = build_recent_ticket_histories_query(ticket_id, limit)
+    recent_histories = session.execute(query).scalars().all()
+    return list(reversed(recent_histories))
+
+
+# get_recent_ticket_histories の非同期版
+async def get_recent_ticket_histories_async(
+    session: AsyncSession, ticket_id: int, limit: int
+) -> list[TicketHistory]:
+    query = build_recent_ticket_histories_query(ticket_id, limit)
+    recent_histories = (await session.execute(query)).scalars().all()
+    return list(reversed(recent_histories))
+
+
+# チケットに紐づく対応履歴のうち、指定したIDより後に追加されたものを古い順に指定件数分取得するSELECT文を作成する
+# （対応者も同時に取得）。IDは追加順に採番されるため、前回取得した最後のIDを渡すと差分のみ取得できる
+def build_ticket_histories_since_query(ticket_id: int, since_id: int, limit: int) -> Select:
+    return (
+        select(TicketHistory)
+        .options(joinedload(TicketHistory.action_user))
+        .where(TicketHistory.ticket_id == ticket_id, TicketHistory.id > since_id)
+        .order_by(TicketHistory.id)
+        .limit(limit)
+    )
+
+
+# チケットに紐づく対応履歴のうち、指定したIDより後に追加されたものを取得する
+def get_ticket_histories_since(
+    session: Session, ticket_id: int, since_id: int, limit: int
+) -> list[TicketHistory]:
+    query = build_ticket_histories_since_query(ticket_id, since_id, limit)
+    return list(session.execute(query).scalars().all())
+
+
+# get_ticket_histories_since の非同期版
+async def get_ticket_histories_since_async(
+    session: AsyncSession, ticket_id: int, since_id: int, limit: int
+) -> list[TicketHistory]:
+    query = build_ticket_histories_since_query(ticket_id, since_id, limit)
+    return list((await session.execute(query)).scalars().all())
+
+
+# 指定したIDの対応履歴を、IDの小さい順（追加順）に取得するSELECT文を作成する（対応者も同時に取得）
+def build_ticket_histories_by_ids_query(ids: list[int]) -> Select:
+    return (
+        select(TicketHistory)
+        .options(joinedload(TicketHistory.action_user))
+        .where(TicketHistory.id.in_(ids))
+        .order_by(TicketHistory.id)
+    )
+
+
+# 指定したIDの対応履歴を取得する
+def get_ticket_histories_by_ids(session: Session, ids: list[int]) -> list[TicketHistory]:
+    return list(session.execute(build_ticket_histories_by_ids_query(ids)).scalars().all())
+
+
+# get_ticket_histories_by_ids の非同期版
+async def get_ticket_histories_by_ids_async(
+    session: AsyncSession, ids: list[int]
+) -> list[TicketHistory]:
+    return list((await session.execute(build_ticket_histories_by_ids_query(ids))).scalars().all())
+
+
+# 対応履歴をまとめて追加し、採番された対応履歴IDを返す（チケットID → 対応履歴ID。コミットは呼び出し側で行う）
+# まとめて flush し、採番されたIDは追加したオブジェクトから取得する（他の更新で追加された対応履歴と取り違えない）
+# values → 追加する対応履歴（ticket_id・action_user_id・action_description。チケットごとに1件）
+def add_ticket_histories(session: Session, values: list[dict]) -> dict[int, int]:
+    new_ticket_histories = [TicketHistory(**value) for value in values]
+    session.add_all(new_ticket_histories)
+    session.flush()
+    return {
+        new_ticket_history.ticket_id: new_ticket_history.id
+        for new_ticket_history in new_ticket_histories
+    }
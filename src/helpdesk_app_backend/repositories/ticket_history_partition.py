@@ -0,0 +1,108 @@
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.logic.business.ticket_history_partition import (
+    FUTURE_PARTITION_NAME,
+    add_months,
+    to_partition_name,
+)
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.ticket_history_search import TicketHistorySearch
+
+TICKET_HISTORY_TABLE_NAME = TicketHistory.__tablename__
+
+
+# 月ごとのパーティションの定義（month の対応履歴 → 翌月の初日より前）
+def to_partition_definition(month: date) -> str:
+    return (
+        f"PARTITION {to_partition_name(month)} "
+        f"VALUES LESS THAN ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+# 作成済みの月より後の月のパーティションを追加するDDLを作成する
+# 最後のパーティション（p_future）を分割するため、p_future が空であればデータの移動は発生しない
+def build_add_partitions_ddl(months: list[date]) -> str:
+    definitions = [to_partition_definition(month) for month in months]
+    definitions.append(f"PARTITION {FUTURE_PARTITION_NAME} VALUES LESS THAN (MAXVALUE)")
+    return (
+        f"ALTER TABLE {TICKET_HISTORY_TABLE_NAME} "
+        f"REORGANIZE PARTITION {FUTURE_PARTITION_NAME} INTO ({', '.join(definitions)})"
+    )
+
+
+# パーティションを削除するDDLを作成する（行単位の DELETE ではなく、パーティションのファイルごと削除する）
+def build_drop_partitions_ddl(partition_names: list[str]) -> str:
+    return f"ALTER TABLE {TICKET_HISTORY_TABLE_NAME} DROP PARTITION {', '.join(partition_names)}"
+
+
+# パーティションと入れ替えるテーブルの名前（例：ticket_histories_p202401）
+def to_exchange_table_name(partition_name: str) -> str:
+    return f"{TICKET_HISTORY_TABLE_NAME}_{partition_name}"
+
+
+# パーティションのデータを別のテーブルへ移すDDLを作成する（移した後、空になったパーティションを削除する）
+# EXCHANGE PARTITION はデータをコピーせず、パーティションとテーブルを入れ替える
+def build_exchange_partition_ddls(partition_name: str) -> list[str]:
+    table_name = to_exchange_table_name(partition_name)
+    return [
+        f"CREATE TABLE {table_name} LIKE {TICKET_HISTORY_TABLE_NAME}",
+        f"ALTER TABLE {table_name} REMOVE PARTITIONING",
+        f"ALTER TABLE {TICKET_HISTORY_TABLE_NAME} "
+        f"EXCHANGE PARTITION {partition_name} WITH TABLE {table_name}",
+        build_drop_partitions_ddl([partition_name]),
+    ]
+
+
+# パーティションの対応履歴を参照している行から、参照を外すSQL文を作成する（パーティションを削除・移動する前に実行する）
+# ticket_changes → 対応履歴のIDを NULL にする（削除した対応履歴を、差分同期・検索用の索引で参照しないようにする）
+# ticket_history_search → 行を削除する（削除した対応履歴が、キーワード検索で見つからないようにする）
+def build_detach_partition_references_sqls(partition_name: str) -> list[str]:
+    history_ids = f"SELECT id FROM {TICKET_HISTORY_TABLE_NAME} PARTITION ({partition_name})"
+    return [
+        f"UPDATE {TicketChange.__tablename__} SET ticket_history_id = NULL "
+        f"WHERE ticket_history_id IN ({history_ids})",
+        f"DELETE FROM {TicketHistorySearch.__tablename__} WHERE ticket_history_id IN ({history_ids})",
+    ]
+
+
+# ticket_histories のパーティション名を、範囲の古い順に取得する
+def get_ticket_history_partition_names(session: Session) -> list[str]:
+    query = text(
+        "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+        "AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    )
+    return list(session.execute(query, {"table_name": TICKET_HISTORY_TABLE_NAME}).scalars())
+
+
+# 月ごとのパーティションを追加する（MySQL の DDL は自動でコミットされる）
+def add_ticket_history_partitions(session: Session, months: list[date]) -> None:
+    session.execute(text(build_add_partitions_ddl(months)))
+
+
+# パーティションを削除する（削除したパーティションの対応履歴は復元できない）
+def drop_ticket_history_partitions(session: Session, partition_names: list[str]) -> None:
+    session.execute(text(build_drop_partitions_ddl(partition_names)))
+
+
+# パーティションの対応履歴を、別のテーブル（ticket_histories_p + 年月）へ移してから削除する
+# 移したテーブルはバックアップの取得後などに、個別に削除する
+def exchange_ticket_history_partition(session: Session, partition_name: str) -> str:
+    for ddl in build_exchange_partition_ddls(partition_name):
+        session.execute(text(ddl))
+    return to_exchange_table_name(partition_name)
+
+
+# パーティションの対応履歴を参照している行から、参照を外してコミットする
+def detach_ticket_history_partition_references(
+    session: Session, partition_names: list[str]
+) -> None:
+    for partition_name in partition_names:
+        for sql in build_detach_partition_references_sqls(partition_name):
+            session.execute(text(sql))
+    session.commit()
@@ -0,0 +1,98 @@
+from sqlalchemy import Row, Select, func, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.ticket_history_search import TicketHistorySearch
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.repositories.ticket import (
+    build_ticket_list_columns_query,
+    filter_visible_tickets,
+)
+
+
+# キーワードに一致するチケットを、関連度の高い順に一覧表示に必要な列のみ取得するSELECT文を作成する（MySQL のみ）
+# タイトル・詳細の全文インデックス（ft_tickets_title_description）と、
+# 対応履歴の検索用テーブルの全文インデックス（ft_ticket_history_search_action_description）で検索する
+# 関連度 → タイトル・詳細の関連度 ＋ チケットの対応履歴のうち最も関連度の高いものの関連度
+# 閲覧可否は一覧取得と同じ条件でDB側で絞り込む
+def build_fulltext_ticket_search_query(
+    keyword: str, user_id: int, account_type: AccountType, limit: int, offset: int
+) -> Select:
+    history_score = match(TicketHistorySearch.action_description, against=keyword)
+    history_scores = (
+        select(
+            TicketHistorySearch.ticket_id,
+            func.max(history_score).label("score"),
+        )
+        .where(history_score > 0)
+        .group_by(TicketHistorySearch.ticket_id)
+        .subquery("history_scores")
+    )
+    score = match(Ticket.title, Ticket.description, against=keyword) + func.coalesce(
+        history_scores.c.score, 0
+    )
+
+    query = (
+        build_ticket_list_columns_query()
+        .outerjoin(history_scores, history_scores.c.ticket_id == Ticket.id)
+        .where(score > 0)
+    )
+    query = filter_visible_tickets(query, user_id, account_type)
+
+    return query.order_by(score.desc(), Ticket.id.desc()).limit(limit).offset(offset)
+
+
+def search_tickets_fulltext(
+    session: Session,
+    keyword: str,
+    user_id: int,
+    account_type: AccountType,
+    limit: int,
+    offset: int,
+) -> list[Row]:
+    query = build_fulltext_ticket_search_query(keyword, user_id, account_type, limit, offset)
+    return list(session.execute(query).all())
+
+
+# 指定したIDのチケットのうち、閲覧可能なものを一覧表示に必要な列のみ取得する（並び順は呼び出し側で決める）
+def get_visible_ticket_list_rows_by_ids(
+    session: Session, ids: list[int], user_id: int, account_type: AccountType
+) -> list[Row]:
+    query = filter_visible_tickets(
+        build_ticket_list_columns_query().where(Ticket.id.in_(ids)), user_id, account_type
+    )
+    return list(session.execute(query).all())
+
+
+# 検索用の索引（全文インデックスを使えない環境向け）の作成に使う、全チケットのタイトル・詳細
+def get_ticket_search_documents(session: Session, ids: list[int] | None = None) -> list[Row]:
+    query = select(Ticket.id, Ticket.title, Ticket.description)
+    if ids is not None:
+        query = query.where(Ticket.id.in_(ids))
+    return list(session.execute(query).all())
+
+
+# 検索用の索引の作成に使う、対応履歴の内容
+# ids → 指定したIDの対応履歴のみ、ticket_ids → 指定したチケットの対応履歴のみ
+def get_ticket_history_search_documents(
+    session: Session, ids: list[int] | None = None, ticket_ids: list[int] | None = None
+) -> list[Row]:
+    query = select(TicketHistory.id, TicketHistory.ticket_id, TicketHistory.action_description)
+    if ids is not None:
+        query = query.where(TicketHistory.id.in_(ids))
+    if ticket_ids is not None:
+        query = query.where(TicketHistory.ticket_id.in_(ticket_ids))
+    return list(session.execute(query).all())
+
+
+# 検索用の索引の更新に使う、指定した seq より後（until_seq まで）の変更
+def get_ticket_changes_for_search(session: Session, since_seq: int, until_seq: int) -> list[Row]:
+    query = (
+        select(TicketChange.ticket_id, TicketChange.ticket_history_id, TicketChange.change_type)
+        .where(TicketChange.seq > since_seq, TicketChange.seq <= until_seq)
+        .order_by(TicketChange.seq)
+    )
+    return list(session.execute(query).all())
@@ -1,3 +1,7 @@
+from datetime import datetime
+
+from sqlalchemy import Row, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from helpdesk_app_backend.models.db.user import User
@@ -13,6 +17,32 @@ def get_users_all(session: Session) -> list[User]:
     return session.query(User).all()
 
 
+# アカウント一覧の表示に必要な列のみ取得する（password など一覧で使わない列は読み込まず、ORMオブジェクトも作成しない）
+def get_account_list_rows(session: Session) -> list[Row]:
+    query = select(User.id, User.name, User.email, User.account_type, User.is_suspended)
+    return list(session.execute(query).all())
+
+
 # 指定したIDのユーザーアカウント情報を取得
 def get_user_by_id(session: Session, id: int) -> User:
     return session.query(User).where(User.id == id).first()
+
+
+# get_user_by_id の非同期版
+async def get_user_by_id_async(session: AsyncSession, id: int) -> User:
+    return (await session.execute(select(User).where(User.id == id))).scalars().first()
+
+
+# アカウントの最終更新日時の最大値を取得するSELECT文を作成する（名前の変更などを、一覧・詳細の ETag に反映するために使用する）
+# ix_users_updated_at の最大値のため、索引のみで取得できる
+def build_latest_user_updated_at_query() -> Select:
+    return select(func.max(User.updated_at))
+
+
+def get_latest_user_updated_at(session: Session) -> datetime | None:
+    return session.execute(build_latest_user_updated_at_query()).scalar_one()
+
+
+# get_latest_user_updated_at の非同期版
+async def get_latest_user_updated_at_async(session: AsyncSession) -> datetime | None:
+    return (await session.execute(build_latest_user_updated_at_query())).scalar_one()
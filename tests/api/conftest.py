@@ -1,13 +1,19 @@
 from collections.abc import Callable, Iterator
 from datetime import datetime
+from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import ColumnProperty, Session
 
 from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.core.current_account import (
+    get_current_account,
+    get_current_account_for_read,
+)
 from helpdesk_app_backend.main import app
 from helpdesk_app_backend.models.db.base import get_db
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
@@ -43,6 +49,25 @@ def override_validate_access_token() -> (
     app.dependency_overrides.pop(validate_access_token, None)
 
 
+# 【Fixture】get_current_account を差し替え（任意のアカウント情報を返す）
+# 引数に None を渡すと「アカウントが存在しない」状態になる
+# 参照系API用（get_current_account_for_read）も同じアカウント情報を返す
+@pytest.fixture
+def override_get_current_account() -> Iterator[Callable[[object], None]]:
+    def _fake_get_current_account(account: object) -> None:
+        app.dependency_overrides[get_current_account] = lambda: account
+        app.dependency_overrides[get_current_account_for_read] = lambda: account
+
+    yield _fake_get_current_account
+
+    app.dependency_overrides.pop(get_current_account, None)
+    app.dependency_overrides.pop(get_current_account_for_read, None)
+
+
+# 擬似セッションの接続先（MySQL として扱う。SQL文の作成にのみ使用し、接続はしない）
+FAKE_BIND = SimpleNamespace(dialect=mysql.dialect())
+
+
 # 【FakeSession】commit が成功する擬似セッション
 # そのテストで必要なメソッドが入っていれば十分なため、使わないメソッドがあっても、問題はない。
 class FakeSessionCommitSuccess:
@@ -50,6 +75,7 @@ class FakeSessionCommitSuccess:
         self,
     ) -> None:
         self.commit_called = False
+        self.executed_statements: list = []
 
     # 追加されたレコードへID、defaultが設定されているカラムにその値を付けるフリをするメソッド
     # 本来DBに保存するときに呼ぶsession.add(...)の代役
@@ -71,6 +97,9 @@ class FakeSessionCommitSuccess:
                         # 第一引数のクラスに対して、第二引数の文字列をキーにして第三引数の値を返却するようにプロパティを作成
                         # 例：model.id とした場合 1 が返ってくる
                         setattr(model, col.name, value)
+                    # 変更履歴の seq（本来はコミット時に設定される）
+                    if col.name == "seq":
+                        setattr(model, col.name, 1)
                     # addメソッドが呼ばれた際に、default設定されているが値が未入力の場合
                     if col.default is not None and getattr(model, col.name) is None:
                         # col.default.arg → default値 をそのまま取得してくる
@@ -78,6 +107,13 @@ class FakeSessionCommitSuccess:
                         value = col.default.arg() if callable(col.default.arg) else col.default.arg
                         setattr(model, col.name, value)
 
+    # SQL文を直接実行する処理（件数の集計の増減など）の代役。実行したSQL文を記録するのみ
+    def execute(self, statement) -> None:  # noqa: ANN001
+        self.executed_statements.append(statement)
+
+    def get_bind(self) -> SimpleNamespace:
+        return FAKE_BIND
+
     def commit(self) -> None:
         self.commit_called = True
 
@@ -121,6 +157,12 @@ class FakeSessionCommitError:
     def add(self, _) -> None:  # noqa: ANN001
         return
 
+    def execute(self, _) -> None:  # noqa: ANN001
+        return
+
+    def get_bind(self) -> SimpleNamespace:
+        return FAKE_BIND
+
     def commit(self) -> None:
         self.commit_called = True  # commitが呼ばれたことを記録
         # わざと例外を発生させる。これによりrollbackが呼ばれるようになる
@@ -153,3 +195,17 @@ def override_get_db_error(
 
     # 元の状態に戻す（差し替え解除）
     app.dependency_overrides.pop(get_db, None)
+
+
+# 【Fixture】get_db を差し替え（SQLiteのインメモリDBを使用）
+# 実際にSQLを発行して確認したいテストで使用する
+@pytest.fixture
+def override_get_db_sqlite(sqlite_session: Session) -> Iterator[Session]:
+    def _sqlite_db() -> Iterator[Session]:
+        yield sqlite_session
+
+    app.dependency_overrides[get_db] = _sqlite_db
+
+    yield sqlite_session
+
+    app.dependency_overrides.pop(get_db, None)
@@ -4,11 +4,17 @@ from dataclasses import dataclass
 import pytest
 
 from conftest import FakeSessionCommitError, FakeSessionCommitSuccess
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from helpdesk_app_backend.api.v1.admin import account as api_account
+from helpdesk_app_backend.models.db.user import User
 from helpdesk_app_backend.models.enum.user import AccountType
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.models.response.v1.admin.account import GetAccountResponseItem
+from helpdesk_app_backend.repositories.user import get_users_all
 
 
 @dataclass
@@ -50,7 +56,7 @@ def test_get_accounts_success(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(api_account, "get_users_all", lambda _session: registered_data)
+    monkeypatch.setattr(api_account, "get_account_list_rows", lambda _session: registered_data)
 
     # 実行
     response = test_client.get("/api/v1/admin/account")
@@ -68,6 +74,61 @@ def test_get_accounts_success(
     ]
 
 
+# GETテスト（レスポンスのJSONが、レスポンスモデルを1件ずつ作成していた従来の出力とバイト単位で同一）
+def test_get_accounts_response_bytes_unchanged(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="admin@example.com",
+        user_id=1,
+        account_type=AccountType.ADMIN,
+        exp=1761905996,
+    )
+
+    # テスト用登録済データ（全アカウントタイプ・利用状態を網羅）
+    override_get_db_sqlite.add_all(
+        [
+            User(
+                id=index,
+                name=f'テストユーザー{index} "引用符" 😀',
+                email=f"tester{index}@example.com",
+                password="hashedpass",
+                account_type=account_type,
+                is_suspended=index % 2 == 0,
+            )
+            for index, account_type in enumerate(AccountType, start=1)
+        ]
+    )
+    override_get_db_sqlite.commit()
+
+    override_validate_access_token(access_token)
+
+    # 従来の出力（1件ずつ GetAccountResponseItem を作成し、標準の JSONResponse で出力）
+    expected_body = JSONResponse(
+        jsonable_encoder(
+            [
+                GetAccountResponseItem(
+                    id=account.id,
+                    name=account.name,
+                    email=account.email,
+                    account_type=account.account_type,
+                    is_suspended=account.is_suspended,
+                )
+                for account in get_users_all(override_get_db_sqlite)
+            ]
+        )
+    ).body
+
+    # 実行
+    response = test_client.get("/api/v1/admin/account")
+
+    # 検証
+    assert response.status_code == 200
+    assert response.content == expected_body
+
+
 # GETテスト（失敗：管理者以外がアカウント登録しようとした場合）
 # @pytest.mark.parametrize → 同じテスト関数を、入力だけ変えて何回も実行するための仕組み
 @pytest.mark.parametrize("account_type", [AccountType.STAFF, AccountType.SUPPORTER])
@@ -321,6 +382,12 @@ def test_update_account_success(
 
     monkeypatch.setattr(api_account, "get_user_by_id", lambda _session, id: registered_data)
 
+    # キャッシュ破棄の呼び出しを記録
+    invalidated_user_ids: list[int] = []
+    monkeypatch.setattr(
+        api_account, "invalidate_current_account_cache", invalidated_user_ids.append
+    )
+
     # テスト用更新予定データ
     body = {
         "id": "2",
@@ -332,6 +399,7 @@ def test_update_account_success(
 
     # 検証
     assert response.status_code == 200
+    assert invalidated_user_ids == [2]  # 変更したアカウントのキャッシュが破棄される
 
 
 # PUTテスト（失敗）
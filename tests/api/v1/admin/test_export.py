@@ -0,0 +1,268 @@
+import gzip
+
+from collections.abc import Callable, Iterator
+from datetime import datetime
+
+import orjson
+import pytest
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from helpdesk_app_backend.api.v1.admin import export as api_export
+from helpdesk_app_backend.models.db import base
+from helpdesk_app_backend.models.db.archived_ticket import ArchivedTicket
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketExportFormat, TicketStatusType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.ticket_export_filter import TicketExportFilter
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.repositories.ticket_export import (
+    build_ticket_export_queries,
+    get_export_column_names,
+    stream_export_rows,
+)
+
+ADMIN_ACCESS_TOKEN = AccessTokenPayload(
+    sub="admin@example.com",
+    user_id=9,
+    account_type=AccountType.ADMIN,
+    exp=1761905996,
+)
+
+
+# 【Fixture】エクスポートで作成するセッションの接続先を SQLite（インメモリ）に差し替え、テストデータを登録
+# （チケット3件・対応履歴3件）
+@pytest.fixture
+def export_session(sqlite_session: Session, monkeypatch: pytest.MonkeyPatch) -> Iterator[Session]:
+    monkeypatch.setattr(
+        base,
+        "session",
+        sessionmaker(autocommit=False, autoflush=False, bind=sqlite_session.get_bind()),
+    )
+
+    sqlite_session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            Ticket(
+                id=1,
+                title="テスト, 1",
+                is_public=True,
+                description="テスト詳細",
+                staff_id=1,
+                created_at=datetime(2026, 8, 31, 10, 0, 0),
+                updated_at=datetime(2026, 8, 31, 10, 0, 0),
+            ),
+            Ticket(
+                id=2,
+                title="テスト2",
+                is_public=False,
+                status=TicketStatusType.CLOSED,
+                description="テスト詳細",
+                staff_id=1,
+                created_at=datetime(2026, 9, 1, 10, 0, 0),
+                updated_at=datetime(2026, 9, 2, 10, 0, 0),
+            ),
+            Ticket(
+                id=3,
+                title="テスト3",
+                is_public=True,
+                status=TicketStatusType.RESOLVED,
+                description="テスト詳細",
+                staff_id=1,
+                created_at=datetime(2026, 9, 15, 10, 0, 0),
+                updated_at=datetime(2026, 9, 15, 10, 0, 0),
+            ),
+            TicketHistory(
+                id=1,
+                ticket_id=2,
+                action_user_id=1,
+                action_description="8月の履歴",
+                created_at=datetime(2026, 8, 31, 12, 0, 0),
+                updated_at=datetime(2026, 8, 31, 12, 0, 0),
+            ),
+            TicketHistory(
+                id=2,
+                ticket_id=2,
+                action_user_id=None,
+                action_description="9月の履歴",
+                created_at=datetime(2026, 9, 2, 10, 0, 0),
+                updated_at=datetime(2026, 9, 2, 10, 0, 0),
+            ),
+            TicketHistory(
+                id=3,
+                ticket_id=1,
+                action_user_id=1,
+                action_description="新規質問の履歴",
+                created_at=datetime(2026, 9, 3, 10, 0, 0),
+                updated_at=datetime(2026, 9, 3, 10, 0, 0),
+            ),
+        ]
+    )
+    sqlite_session.commit()
+
+    yield sqlite_session
+
+
+# GETテスト（成功：チケットを CSV でエクスポート。作成日時・ステータスで絞り込み）
+def test_export_tickets_csv(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    export_session: Session,
+) -> None:
+    override_validate_access_token(ADMIN_ACCESS_TOKEN)
+
+    # 実行
+    response = test_client.get(
+        "/api/v1/admin/export/tickets",
+        params={
+            "created_from": "2026-08-01T00:00:00",
+            "created_to": "2026-10-01T00:00:00",
+            "status": ["start", "closed"],
+        },
+    )
+
+    # 検証
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert response.headers["content-disposition"] == 'attachment; filename="tickets.csv"'
+    assert response.text == (
+        "id,title,description,status,is_public,staff_id,supporter_id,created_at,updated_at\n"
+        '1,"テスト, 1",テスト詳細,start,True,1,,2026-08-31T10:00:00,2026-08-31T10:00:00\n'
+        "2,テスト2,テスト詳細,closed,False,1,,2026-09-01T10:00:00,2026-09-02T10:00:00\n"
+    )
+
+
+# GETテスト（成功：対応履歴を NDJSON・gzip 圧縮でエクスポート。対応履歴の作成日時・チケットのステータスで絞り込み）
+def test_export_ticket_histories_ndjson_gzip(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    export_session: Session,
+) -> None:
+    override_validate_access_token(ADMIN_ACCESS_TOKEN)
+
+    # 実行
+    response = test_client.get(
+        "/api/v1/admin/export/ticket-histories",
+        params={
+            "format": "ndjson",
+            "gzip": "true",
+            "created_from": "2026-09-01T00:00:00",
+            "status": "closed",
+        },
+    )
+
+    # 検証
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="ticket_histories.ndjson.gz"'
+    )
+    assert [orjson.loads(line) for line in gzip.decompress(response.content).splitlines()] == [
+        {
+            "id": 2,
+            "ticket_id": 2,
+            "action_user_id": None,
+            "action_description": "9月の履歴",
+            "created_at": "2026-09-02T10:00:00",
+            "updated_at": "2026-09-02T10:00:00",
+        }
+    ]
+
+
+# 1チャンクずつ読み込み・変換して返す（全件をまとめて変換しない）
+def test_stream_export_by_chunk(
+    export_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(api_export, "EXPORT_CHUNK_SIZE", 2)
+
+    # 実行
+    chunks = list(
+        api_export.stream_export(
+            build_ticket_export_queries(TicketExportFilter()), TicketExportFormat.NDJSON, False
+        )
+    )
+
+    # 検証（3件を2件ずつ読み込むため、2回に分けて返される）
+    assert [len(chunk.splitlines()) for chunk in chunks] == [2, 1]
+
+
+# 対応中のチケット → アーカイブ済みのチケットの順に、テーブルごとに主キーの順で読む（UNION で全件を並び替えない）
+def test_stream_export_live_then_archived(export_session: Session) -> None:
+    export_session.add(
+        ArchivedTicket(
+            id=4,
+            title="アーカイブ済み",
+            is_public=True,
+            status=TicketStatusType.CLOSED,
+            description="テスト詳細",
+            staff_id=1,
+            created_at=datetime(2026, 7, 1, 10, 0, 0),
+            updated_at=datetime(2026, 7, 2, 10, 0, 0),
+            archived_at=datetime(2026, 10, 1, 0, 0, 0),
+        )
+    )
+    export_session.commit()
+    queries = build_ticket_export_queries(TicketExportFilter())
+
+    # 実行
+    chunks = list(stream_export_rows(export_session, queries, chunk_size=2))
+
+    # 検証（テーブルごとにチャンクを分けて返す）
+    assert [[row.id for row in rows] for rows in chunks] == [[1, 2], [3], [4]]
+    assert get_export_column_names(queries)[0] == "id"
+    assert all("UNION" not in str(query) for query in queries)
+
+
+# GETテスト（失敗：作成日時の範囲が不正）
+def test_export_tickets_invalid_created_range(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+) -> None:
+    override_validate_access_token(ADMIN_ACCESS_TOKEN)
+
+    # 実行
+    response = test_client.get(
+        "/api/v1/admin/export/tickets",
+        params={"created_from": "2026-10-01T00:00:00", "created_to": "2026-09-01T00:00:00"},
+    )
+
+    # 検証
+    assert response.status_code == 422
+    assert response.json() == {"detail": "作成日時の範囲が不正です"}
+
+
+# GETテスト（失敗：管理者以外のアカウントタイプ）
+@pytest.mark.parametrize("path", ["tickets", "ticket-histories"])
+@pytest.mark.parametrize("account_type", [AccountType.STAFF, AccountType.SUPPORTER])
+def test_export_forbidden(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    path: str,
+    account_type: AccountType,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=1,
+        account_type=account_type,
+        exp=1761905996,
+    )
+
+    override_validate_access_token(access_token)
+
+    # 実行
+    response = test_client.get(f"/api/v1/admin/export/{path}")
+
+    # 検証
+    assert response.status_code == 403
+    assert response.json() == {"detail": "アクセス権限がありません"}
@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass  # テスト用の「ダミーのデータ型」を簡単に作るためのライブラリ
 from datetime import datetime, timedelta
 from unittest.mock import Mock
@@ -26,6 +27,14 @@ class DummyUser:
 BASE_URL = "/api/v1/auth"
 
 
+# verify_password_async の代わりに使う偽の関数を作成（照合結果を固定する）
+def fake_verify_password_async(result: bool) -> Callable[[str, str], Awaitable[bool]]:
+    async def _fake(plain_password: str, hashed_password: str) -> bool:
+        return result
+
+    return _fake
+
+
 # 本物の代わりに使う偽の fake_get_user_by_email 関数（fixture 化したどのテストでも使えるグローバル関数）
 @pytest.fixture
 def fake_get_user_by_email(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -60,7 +69,7 @@ def test_login_success(test_client: TestClient, monkeypatch: pytest.MonkeyPatch)
     mock_create_access_token = Mock(return_value="dummy.jwt.token")
     monkeypatch.setattr(api_auth, "create_access_token", mock_create_access_token)
     monkeypatch.setattr(api_auth, "get_now_UTC", lambda: current_time)
-    monkeypatch.setattr(api_auth, "verify_password", lambda plain_password, hashed_password: True)
+    monkeypatch.setattr(api_auth, "verify_password_async", fake_verify_password_async(True))
 
     # 実行
     response = test_client.post(f"{BASE_URL}/login", json=body)
@@ -105,7 +114,7 @@ def test_is_suspended_account(test_client: TestClient, monkeypatch: pytest.Monke
             is_suspended=True,
         ),
     )
-    monkeypatch.setattr(api_auth, "verify_password", lambda plain_password, hashed_password: True)
+    monkeypatch.setattr(api_auth, "verify_password_async", fake_verify_password_async(True))
 
     body = {"email": "notfoundtest@example.com", "password": "testP@ssw0rd"}
 
@@ -120,7 +129,7 @@ def test_is_suspended_account(test_client: TestClient, monkeypatch: pytest.Monke
 # ログインテスト（失敗：パスワード不一致）
 @pytest.mark.usefixtures("override_get_db_error", "fake_get_user_by_email")
 def test_login_wrong_password(test_client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(api_auth, "verify_password", lambda plain_password, hashed_password: False)
+    monkeypatch.setattr(api_auth, "verify_password_async", fake_verify_password_async(False))
 
     body = {"email": "test@example.com", "password": "wrongtestP@ssw0rd"}
 
@@ -5,7 +5,6 @@ import pytest
 
 from fastapi.testclient import TestClient
 
-from helpdesk_app_backend.api.v1 import healthcheck as api_healthcheck
 from helpdesk_app_backend.models.enum.user import AccountType
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
 
@@ -33,8 +32,8 @@ def test_healthcheck(test_client: TestClient) -> None:
 def test_auth_healthcheck_return_account_type(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
         sub="test@example.com",
@@ -45,11 +44,7 @@ def test_auth_healthcheck_return_account_type(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(
-        api_healthcheck,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
 
     # 実行
     response = test_client.get(f"{BASE_URL}/auth")
@@ -64,8 +59,8 @@ def test_auth_healthcheck_return_account_type(
 def test_auth_healthcheck_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
         sub="test@example.com",
@@ -76,11 +71,7 @@ def test_auth_healthcheck_is_suspended_account(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(
-        api_healthcheck,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=True))
 
     # 実行
     response = test_client.get(f"{BASE_URL}/auth")
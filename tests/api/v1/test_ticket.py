@@ -1,16 +1,47 @@
+import threading
+
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 
 import pytest
 
 from conftest import FakeSessionCommitError, FakeSessionCommitSuccess
+from fastapi import HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session, sessionmaker
 
 from helpdesk_app_backend.api.v1 import ticket as api_ticket
-from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.commands.archive_closed_tickets import archive_closed_tickets
+from helpdesk_app_backend.commands.reconcile_ticket_counts import reconcile_ticket_counts
+from helpdesk_app_backend.core import ticket_search_backend
+from helpdesk_app_backend.logic.business.pagination_cursor import encode_cursor
+from helpdesk_app_backend.models.db.archived_ticket import ArchivedTicket
+from helpdesk_app_backend.models.db.base import Base
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.ticket_history_search import TicketHistorySearch
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import (
+    TicketEventType,
+    TicketListSortType,
+    TicketStatusType,
+)
 from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+from helpdesk_app_backend.models.internal.ticket_list_filter import TicketListFilter
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+from helpdesk_app_backend.models.response.v1.ticket import (
+    GetTicketListResponse,
+    GetTicketResponseItem,
+)
+from helpdesk_app_backend.repositories.ticket import get_visible_ticket_list_rows
 
 
 @dataclass
@@ -32,11 +63,34 @@ class DummyTicket:
     supporter_id: int | None
     supporter: DummyUser | None
     created_at: datetime
+    updated_at: datetime = datetime(2020, 7, 21, 6, 12, 30)
+    version: int = 1
 
     def translate_is_public_to_ja(self) -> str:
         return "公開" if self.is_public else "非公開"
 
 
+# 一覧用に列を絞って取得した行（Row）の代役
+@dataclass
+class DummyTicketListRow:
+    id: int
+    title: str
+    is_public: bool
+    status: TicketStatusType
+    staff_name: str
+    supporter_name: str | None
+    created_at: datetime
+
+
+# 一覧の版（get_ticket_list_version の結果）の代役
+@dataclass
+class DummyTicketListVersion:
+    latest_ticket_id: int | None
+    latest_history_id: int | None
+    latest_change_seq: int | None = None
+    latest_user_updated_at: datetime | None = None
+
+
 @dataclass
 class DummyTicketHistory:
     id: int
@@ -49,11 +103,52 @@ class DummyTicketHistory:
 TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE = "指定したチケットは存在しない、もしくは操作権限がありません"
 
 
-# GETテスト：一覧取得（成功：アカウントタイプが社員の場合）
+# get_visible_ticket_list_rows の代役（DB側のWHERE句・ORDER BY・LIMITと同じ条件で絞り込んだ行を返す）
+def fake_get_visible_ticket_list_rows(
+    registered_data: list[DummyTicket],
+) -> Callable[..., list[DummyTicketListRow]]:
+    def _fake_get_visible_ticket_list_rows(
+        _session: object,
+        user_id: int,
+        account_type: AccountType,
+        limit: int | None = None,
+        cursor: tuple[datetime, int] | None = None,
+        filters: TicketListFilter | None = None,
+        sort: TicketListSortType = TicketListSortType.CREATED_AT_DESC,
+    ) -> list[DummyTicketListRow]:
+        tickets = [
+            ticket
+            for ticket in registered_data
+            if account_type != AccountType.STAFF or ticket.staff_id == user_id or ticket.is_public
+        ]
+        # 作成日時の新しい順（同時刻の場合はIDの大きい順）
+        tickets.sort(key=lambda ticket: (ticket.created_at, ticket.id), reverse=True)
+        if cursor is not None:
+            tickets = [ticket for ticket in tickets if (ticket.created_at, ticket.id) < cursor]
+        if limit is not None:
+            tickets = tickets[:limit]
+        return [
+            DummyTicketListRow(
+                id=ticket.id,
+                title=ticket.title,
+                is_public=ticket.is_public,
+                status=ticket.status,
+                staff_name=ticket.staff.name,
+                supporter_name=ticket.supporter.name if ticket.supporter else None,
+                created_at=ticket.created_at,
+            )
+            for ticket in tickets
+        ]
+
+    return _fake_get_visible_ticket_list_rows
+
+
+# GETテスト：一覧取得（成功：アカウントタイプが社員の場合・互換モード）
 @pytest.mark.parametrize("account_type", [AccountType.STAFF])
 def test_get_tickets_success_for_staff(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -118,25 +213,30 @@ def test_get_tickets_success_for_staff(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+    monkeypatch.setattr(
+        api_ticket,
+        "get_visible_ticket_list_rows",
+        fake_get_visible_ticket_list_rows(registered_data),
+    )
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
+        "get_ticket_list_version",
+        lambda _session: DummyTicketListVersion(latest_ticket_id=3, latest_history_id=None),
     )
-    monkeypatch.setattr(api_ticket, "get_tickets_all", lambda _session: registered_data)
 
     # 実行
-    response = test_client.get("api/v1/ticket")
+    response = test_client.get("api/v1/ticket", params={"legacy": True})
 
     # 検証
     assert response.status_code == 200
     assert response.json() == [
         {
-            "id": 1,
-            "title": "テストチケット1",
+            "id": 3,
+            "title": "テストチケット3",
             "is_public": True,
             "status": TicketStatusType.START.value,
-            "staff": "テスト社員1",
+            "staff": "テスト社員2",
             "supporter": "テストサポート担当者1",
             "created_at": "2020-07-21T06:12:30.000551",
         },
@@ -150,22 +250,23 @@ def test_get_tickets_success_for_staff(
             "created_at": "2020-07-21T06:12:30.000551",
         },
         {
-            "id": 3,
-            "title": "テストチケット3",
+            "id": 1,
+            "title": "テストチケット1",
             "is_public": True,
             "status": TicketStatusType.START.value,
-            "staff": "テスト社員2",
+            "staff": "テスト社員1",
             "supporter": "テストサポート担当者1",
             "created_at": "2020-07-21T06:12:30.000551",
         },
     ]
 
 
-# GETテスト：一覧取得（成功：アカウントタイプが社員以外の場合）
+# GETテスト：一覧取得（成功：アカウントタイプが社員以外の場合・互換モード）
 @pytest.mark.parametrize("account_type", [AccountType.ADMIN, AccountType.SUPPORTER])
 def test_get_tickets_success_for_other(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -230,34 +331,30 @@ def test_get_tickets_success_for_other(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+    monkeypatch.setattr(
+        api_ticket,
+        "get_visible_ticket_list_rows",
+        fake_get_visible_ticket_list_rows(registered_data),
+    )
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
+        "get_ticket_list_version",
+        lambda _session: DummyTicketListVersion(latest_ticket_id=3, latest_history_id=None),
     )
-    monkeypatch.setattr(api_ticket, "get_tickets_all", lambda _session: registered_data)
 
     # 実行
-    response = test_client.get("api/v1/ticket")
+    response = test_client.get("api/v1/ticket", params={"legacy": True})
 
     # 検証
     assert response.status_code == 200
     assert response.json() == [
         {
-            "id": 1,
-            "title": "テストチケット1",
-            "is_public": True,
-            "status": TicketStatusType.START.value,
-            "staff": "テスト社員1",
-            "supporter": "テストサポート担当者1",
-            "created_at": "2020-07-21T06:12:30.000551",
-        },
-        {
-            "id": 2,
-            "title": "テストチケット2",
+            "id": 4,
+            "title": "テストチケット4",
             "is_public": False,
             "status": TicketStatusType.START.value,
-            "staff": "テスト社員1",
+            "staff": "テスト社員2",
             "supporter": "テストサポート担当者1",
             "created_at": "2020-07-21T06:12:30.000551",
         },
@@ -271,22 +368,349 @@ def test_get_tickets_success_for_other(
             "created_at": "2020-07-21T06:12:30.000551",
         },
         {
-            "id": 4,
-            "title": "テストチケット4",
+            "id": 2,
+            "title": "テストチケット2",
             "is_public": False,
             "status": TicketStatusType.START.value,
-            "staff": "テスト社員2",
+            "staff": "テスト社員1",
+            "supporter": "テストサポート担当者1",
+            "created_at": "2020-07-21T06:12:30.000551",
+        },
+        {
+            "id": 1,
+            "title": "テストチケット1",
+            "is_public": True,
+            "status": TicketStatusType.START.value,
+            "staff": "テスト社員1",
             "supporter": "テストサポート担当者1",
             "created_at": "2020-07-21T06:12:30.000551",
         },
     ]
 
 
+# GETテスト：一覧取得（成功：カーソルでページ送りできる場合）
+@pytest.mark.parametrize("account_type", [AccountType.ADMIN])
+def test_get_tickets_paginated_by_cursor(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    account_type: AccountType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=1,
+        account_type=account_type,
+        exp=1761905996,
+    )
+
+    # テスト用登録済データ（作成日時が異なる3件）
+    registered_data = [
+        DummyTicket(
+            id=ticket_id,
+            title=f"テストチケット{ticket_id}",
+            is_public=True,
+            status=TicketStatusType.START,
+            description=f"テスト詳細{ticket_id}",
+            staff_id=1,
+            staff=DummyUser(id=1, name="テスト社員1", is_suspended=False),
+            supporter_id=None,
+            supporter=None,
+            created_at=datetime(2020, 7, 20 + ticket_id, 6, 12, 30, 551),
+        )
+        for ticket_id in [1, 2, 3]
+    ]
+
+    override_validate_access_token(access_token)
+
+    override_get_current_account(DummyUser(id=1, name="テスト管理者1", is_suspended=False))
+    monkeypatch.setattr(
+        api_ticket,
+        "get_visible_ticket_list_rows",
+        fake_get_visible_ticket_list_rows(registered_data),
+    )
+    monkeypatch.setattr(
+        api_ticket,
+        "get_ticket_list_version",
+        lambda _session: DummyTicketListVersion(latest_ticket_id=3, latest_history_id=None),
+    )
+
+    # 実行（1ページ目）
+    first_response = test_client.get("api/v1/ticket", params={"limit": 2})
+
+    # 検証（新しい順に2件と、次ページのカーソルが返る）
+    assert first_response.status_code == 200
+    first_page = first_response.json()
+    assert [item["id"] for item in first_page["items"]] == [3, 2]
+    assert first_page["items"][0] == {
+        "id": 3,
+        "title": "テストチケット3",
+        "is_public": True,
+        "status": TicketStatusType.START.value,
+        "staff": "テスト社員1",
+        "supporter": None,
+        "created_at": "2020-07-23T06:12:30.000551",
+    }
+    assert first_page["next_cursor"] is not None
+
+    # 実行（2ページ目）
+    second_response = test_client.get(
+        "api/v1/ticket", params={"limit": 2, "cursor": first_page["next_cursor"]}
+    )
+
+    # 検証（残りの1件が返り、次ページは存在しない）
+    assert second_response.status_code == 200
+    second_page = second_response.json()
+    assert [item["id"] for item in second_page["items"]] == [1]
+    assert second_page["next_cursor"] is None
+
+
+# GETテスト：一覧取得（失敗：不正なカーソルを指定した場合）
+@pytest.mark.parametrize("account_type", [AccountType.ADMIN])
+def test_get_tickets_invalid_cursor(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    account_type: AccountType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=1,
+        account_type=account_type,
+        exp=1761905996,
+    )
+
+    override_validate_access_token(access_token)
+
+    override_get_current_account(DummyUser(id=1, name="テスト管理者1", is_suspended=False))
+    monkeypatch.setattr(
+        api_ticket, "get_visible_ticket_list_rows", fake_get_visible_ticket_list_rows([])
+    )
+
+    # 実行
+    response = test_client.get("api/v1/ticket", params={"cursor": "wrong_cursor"})
+
+    # 検証
+    assert response.status_code == 422
+    assert response.json() == {"detail": "不正なカーソルです"}
+
+
+# GETテスト：一覧取得（失敗：カーソルを作成したときと異なる並び順・絞り込み条件を指定した場合は 400）
+@pytest.mark.usefixtures("override_get_db_success")
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": TicketListSortType.UPDATED_AT_DESC.value},
+        {"status": TicketStatusType.START.value},
+    ],
+)
+def test_get_tickets_cursor_condition_mismatch(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    monkeypatch: pytest.MonkeyPatch,
+    params: dict[str, str],
+) -> None:
+    override_validate_access_token(
+        AccessTokenPayload(
+            sub="test@example.com", user_id=1, account_type=AccountType.ADMIN, exp=1761905996
+        )
+    )
+    override_get_current_account(DummyUser(id=1, name="テスト管理者1", is_suspended=False))
+    monkeypatch.setattr(
+        api_ticket, "get_visible_ticket_list_rows", fake_get_visible_ticket_list_rows([])
+    )
+    monkeypatch.setattr(
+        api_ticket,
+        "get_ticket_list_version",
+        lambda _session: DummyTicketListVersion(latest_ticket_id=3, latest_history_id=None),
+    )
+    # 作成日時の新しい順・絞り込みなしで作成したカーソル
+    cursor = encode_cursor(
+        datetime(2020, 7, 21, 6, 12, 30),
+        3,
+        TicketListSortType.CREATED_AT_DESC.value,
+        TicketListFilter().model_dump_json(),
+    )
+
+    # 実行
+    matched_response = test_client.get("api/v1/ticket", params={"cursor": cursor})
+    response = test_client.get("api/v1/ticket", params={"cursor": cursor, **params})
+
+    # 検証
+    assert matched_response.status_code == 200
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "カーソルを作成したときと、並び順・絞り込み条件が異なります"
+    }
+
+
+# GETテスト：一覧取得（チケット件数に関わらず、1リクエストあたりのSQL発行回数が一定）
+# 起票者・サポート担当者をチケットごとに追加取得（N+1問題）していないことを確認
+@pytest.mark.parametrize("ticket_count", [1, 20])
+def test_get_tickets_sql_statement_count(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    executed_statements: list[str],
+    ticket_count: int,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=5,
+        account_type=AccountType.SUPPORTER,
+        exp=1761905996,
+    )
+
+    # テスト用登録済データ（チケットごとに別の社員が起票し、半数にサポート担当者を割り当て）
+    override_get_db_sqlite.add(
+        User(
+            id=5,
+            name="テストサポート担当者1",
+            email="supporter1@example.com",
+            password="hashed",
+            account_type=AccountType.SUPPORTER,
+        )
+    )
+    for ticket_id in range(1, ticket_count + 1):
+        override_get_db_sqlite.add(
+            User(
+                id=100 + ticket_id,
+                name=f"テスト社員{ticket_id}",
+                email=f"staff{ticket_id}@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            )
+        )
+        override_get_db_sqlite.add(
+            Ticket(
+                id=ticket_id,
+                title=f"テストチケット{ticket_id}",
+                is_public=True,
+                description=f"テスト詳細{ticket_id}",
+                staff_id=100 + ticket_id,
+                supporter_id=5 if ticket_id % 2 == 0 else None,
+            )
+        )
+    override_get_db_sqlite.commit()
+    # 登録時に読み込まれたオブジェクトを破棄し、リクエスト内で改めてDBから取得させる
+    override_get_db_sqlite.expunge_all()
+    executed_statements.clear()
+
+    override_validate_access_token(access_token)
+
+    # 実行
+    response = test_client.get("api/v1/ticket", params={"limit": 100})
+
+    # 検証
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == ticket_count
+    # アカウント情報取得 1回 + 一覧の版の取得（ETag 用）1回 + チケット一覧取得（起票者・サポート担当者をJOIN）1回
+    assert len(executed_statements) == 3
+
+
+# GETテスト：一覧取得（レスポンスのJSONが、レスポンスモデルを1件ずつ作成していた従来の出力とバイト単位で同一）
+@pytest.mark.parametrize("legacy", [False, True])
+def test_get_tickets_response_bytes_unchanged(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    legacy: bool,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=5,
+        account_type=AccountType.SUPPORTER,
+        exp=1761905996,
+    )
+
+    # テスト用登録済データ（ステータス・公開設定・サポート担当者の有無・日時の書式を網羅）
+    override_get_db_sqlite.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=5,
+                name="テストサポート担当者1",
+                email="supporter1@example.com",
+                password="hashed",
+                account_type=AccountType.SUPPORTER,
+            ),
+        ]
+    )
+    for ticket_id, status in enumerate(TicketStatusType, start=1):
+        override_get_db_sqlite.add(
+            Ticket(
+                id=ticket_id,
+                title=f'テストチケット{ticket_id} "引用符" 😀',
+                is_public=ticket_id % 2 == 0,
+                status=status,
+                description=f"テスト詳細{ticket_id}",
+                staff_id=1,
+                supporter_id=5 if ticket_id % 2 == 0 else None,
+                created_at=datetime(
+                    2020, 7, 21, 6, 12, 30, ticket_id * 100 if ticket_id > 2 else 0
+                ),
+            )
+        )
+    override_get_db_sqlite.commit()
+
+    override_validate_access_token(access_token)
+
+    # 従来の出力（1件ずつ GetTicketResponseItem を作成し、標準の JSONResponse で出力）
+    ticket_rows = get_visible_ticket_list_rows(
+        override_get_db_sqlite,
+        user_id=5,
+        account_type=AccountType.SUPPORTER,
+        limit=None if legacy else 3,
+    )
+    items = [
+        GetTicketResponseItem(
+            id=ticket_row.id,
+            title=ticket_row.title,
+            is_public=ticket_row.is_public,
+            status=ticket_row.status,
+            staff=ticket_row.staff_name,
+            supporter=ticket_row.supporter_name,
+            created_at=ticket_row.created_at,
+        )
+        for ticket_row in ticket_rows
+    ]
+    expected_content = (
+        items
+        if legacy
+        else GetTicketListResponse(
+            items=items[:2],
+            next_cursor=encode_cursor(
+                ticket_rows[1].created_at,
+                ticket_rows[1].id,
+                TicketListSortType.CREATED_AT_DESC.value,
+                TicketListFilter().model_dump_json(),
+            ),
+        )
+    )
+    expected_body = JSONResponse(jsonable_encoder(expected_content)).body
+
+    # 実行
+    response = test_client.get("api/v1/ticket", params={"legacy": True} if legacy else {"limit": 2})
+
+    # 検証
+    assert response.status_code == 200
+    assert response.content == expected_body
+
+
 # GETテスト：一覧取得（失敗：アカウントが存在しない場合）
 @pytest.mark.parametrize("account_type", [AccountType.STAFF])
 def test_get_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -315,12 +739,12 @@ def test_get_account_not_found(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
+        "get_visible_ticket_list_rows",
+        fake_get_visible_ticket_list_rows(registered_data),
     )
-    monkeypatch.setattr(api_ticket, "get_tickets_all", lambda _session: registered_data)
 
     # 実行
     response = test_client.get("api/v1/ticket")
@@ -335,6 +759,7 @@ def test_get_account_not_found(
 def test_get_tickets_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -363,12 +788,12 @@ def test_get_tickets_is_suspended_account(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=True))
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=True),
+        "get_visible_ticket_list_rows",
+        fake_get_visible_ticket_list_rows(registered_data),
     )
-    monkeypatch.setattr(api_ticket, "get_tickets_all", lambda _session: registered_data)
 
     # 実行
     response = test_client.get("api/v1/ticket")
@@ -383,6 +808,7 @@ def test_get_tickets_is_suspended_account(
 def test_get_ticket_detail_success_for_staff(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -440,25 +866,22 @@ def test_get_ticket_detail_success_for_staff(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
-    )
-    monkeypatch.setattr(
-        api_ticket,
-        "get_ticket_by_id",
+        "get_ticket_detail_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
 
     monkeypatch.setattr(
         api_ticket,
-        "get_ticket_histories_by_ticket_id",
-        lambda _session, id: [
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: [
             ticket_history
             for ticket_history in registered_ticket_histories_data
-            if ticket_history.ticket_id == id
-        ],
+            if ticket_history.ticket_id == ticket_id
+        ][-limit:],
     )
 
     # 実行
@@ -491,6 +914,8 @@ def test_get_ticket_detail_success_for_staff(
                 "created_at": "2020-07-21T06:12:30.000551",
             },
         ],
+        "has_more_histories": False,
+        "version": 1,
     }
 
 
@@ -499,6 +924,7 @@ def test_get_ticket_detail_success_for_staff(
 def test_get_ticket_detail_success_for_other(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -556,25 +982,22 @@ def test_get_ticket_detail_success_for_other(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
-    monkeypatch.setattr(
-        api_ticket,
-        "get_ticket_by_id",
+        "get_ticket_detail_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
 
     monkeypatch.setattr(
         api_ticket,
-        "get_ticket_histories_by_ticket_id",
-        lambda _session, id: [
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: [
             ticket_history
             for ticket_history in registered_ticket_histories_data
-            if ticket_history.ticket_id == id
-        ],
+            if ticket_history.ticket_id == ticket_id
+        ][-limit:],
     )
 
     # 実行
@@ -607,6 +1030,8 @@ def test_get_ticket_detail_success_for_other(
                 "created_at": "2020-07-21T06:12:30.000551",
             },
         ],
+        "has_more_histories": False,
+        "version": 1,
     }
 
 
@@ -615,6 +1040,7 @@ def test_get_ticket_detail_success_for_other(
 def test_get_ticket_detail_not_found_for_unknown_id(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -665,25 +1091,24 @@ def test_get_ticket_detail_not_found_for_unknown_id(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
-    )
-    monkeypatch.setattr(
-        api_ticket,
-        "get_ticket_by_id",
+        "get_ticket_detail_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
+    # アーカイブ済みのチケットにも存在しない
+    monkeypatch.setattr(api_ticket, "get_archived_ticket_detail_by_id", lambda _session, id: None)
 
     monkeypatch.setattr(
         api_ticket,
-        "get_ticket_histories_by_ticket_id",
-        lambda _session, id: [
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: [
             ticket_history
             for ticket_history in registered_ticket_histories_data
-            if ticket_history.ticket_id == id
-        ],
+            if ticket_history.ticket_id == ticket_id
+        ][-limit:],
     )
 
     # 実行
@@ -699,6 +1124,7 @@ def test_get_ticket_detail_not_found_for_unknown_id(
 def test_get_ticket_detail_forbidden_when_staff_accesses_others_private(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -749,25 +1175,22 @@ def test_get_ticket_detail_forbidden_when_staff_accesses_others_private(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=2, name="テスト社員2", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員2", is_suspended=False),
-    )
-    monkeypatch.setattr(
-        api_ticket,
-        "get_ticket_by_id",
+        "get_ticket_detail_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
 
     monkeypatch.setattr(
         api_ticket,
-        "get_ticket_histories_by_ticket_id",
-        lambda _session, id: [
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: [
             ticket_history
             for ticket_history in registered_ticket_histories_data
-            if ticket_history.ticket_id == id
-        ],
+            if ticket_history.ticket_id == ticket_id
+        ][-limit:],
     )
 
     # 実行
@@ -783,6 +1206,7 @@ def test_get_ticket_detail_forbidden_when_staff_accesses_others_private(
 def test_get_ticket_detail_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -833,25 +1257,22 @@ def test_get_ticket_detail_account_not_found(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(None)
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
-    monkeypatch.setattr(
-        api_ticket,
-        "get_ticket_by_id",
+        "get_ticket_detail_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
 
     monkeypatch.setattr(
         api_ticket,
-        "get_ticket_histories_by_ticket_id",
-        lambda _session, id: [
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: [
             ticket_history
             for ticket_history in registered_ticket_histories_data
-            if ticket_history.ticket_id == id
-        ],
+            if ticket_history.ticket_id == ticket_id
+        ][-limit:],
     )
 
     # 実行
@@ -867,6 +1288,7 @@ def test_get_ticket_detail_account_not_found(
 def test_get_ticket_detail_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -917,25 +1339,22 @@ def test_get_ticket_detail_is_suspended_account(
 
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=True))
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=True),
-    )
-    monkeypatch.setattr(
-        api_ticket,
-        "get_ticket_by_id",
+        "get_ticket_detail_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
 
     monkeypatch.setattr(
         api_ticket,
-        "get_ticket_histories_by_ticket_id",
-        lambda _session, id: [
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: [
             ticket_history
             for ticket_history in registered_ticket_histories_data
-            if ticket_history.ticket_id == id
-        ],
+            if ticket_history.ticket_id == ticket_id
+        ][-limit:],
     )
 
     # 実行
@@ -946,14 +1365,162 @@ def test_get_ticket_detail_is_suspended_account(
     assert response.json() == {"detail": "このアカウント情報は不正です"}
 
 
-# POSTテスト：チケット登録（成功）
-@pytest.mark.usefixtures("override_get_db_success")
+# GETテスト：詳細取得（履歴・対応者の件数に関わらず、1リクエストあたりのSQL発行回数が一定）
+# 対応者を履歴ごとに追加取得（N+1問題）していないこと、履歴が作成日時順で返ることを確認
+@pytest.mark.parametrize("history_count", [1, 20])
+def test_get_ticket_detail_sql_statement_count(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    executed_statements: list[str],
+    history_count: int,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=5,
+        account_type=AccountType.SUPPORTER,
+        exp=1761905996,
+    )
+
+    # テスト用登録済データ（履歴ごとに別のアカウントが対応し、登録順と作成日時順を逆にする）
+    override_get_db_sqlite.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=5,
+                name="テストサポート担当者1",
+                email="supporter1@example.com",
+                password="hashed",
+                account_type=AccountType.SUPPORTER,
+            ),
+            Ticket(
+                id=1,
+                title="テストチケット1",
+                is_public=True,
+                description="テスト詳細1",
+                staff_id=1,
+                supporter_id=5,
+            ),
+        ]
+    )
+    for history_id in range(1, history_count + 1):
+        override_get_db_sqlite.add(
+            User(
+                id=100 + history_id,
+                name=f"テスト対応者{history_id}",
+                email=f"user{history_id}@example.com",
+                password="hashed",
+                account_type=AccountType.SUPPORTER,
+            )
+        )
+        override_get_db_sqlite.add(
+            TicketHistory(
+                id=history_id,
+                ticket_id=1,
+                action_user_id=100 + history_id,
+                action_description=f"テスト対応内容{history_id}",
+                created_at=datetime(2020, 7, 21, 6, 12, 30) - timedelta(minutes=history_id),
+            )
+        )
+    override_get_db_sqlite.commit()
+    # 登録時に読み込まれたオブジェクトを破棄し、リクエスト内で改めてDBから取得させる
+    override_get_db_sqlite.expunge_all()
+    executed_statements.clear()
+
+    override_validate_access_token(access_token)
+
+    # 実行
+    response = test_client.get("api/v1/ticket/1")
+
+    # 検証
+    assert response.status_code == 200
+    ticket_histories = response.json()["ticket_histories"]
+    assert ticket_histories[0]["action_user"] == f"テスト対応者{history_count}"
+    assert [history["id"] for history in ticket_histories] == list(range(history_count, 0, -1))
+    # アカウント情報取得 1回 + アカウントの最終更新日時の取得（ETag 用）1回
+    # + チケット取得（サポート担当者をJOIN）1回 + 履歴取得（対応者をJOIN）1回
+    assert len(executed_statements) == 4
+
+
+# GETテスト：詳細取得（直近の履歴のみ含め、古い履歴が残っていることを返す）
+@pytest.mark.parametrize("account_type", [AccountType.ADMIN])
+def test_get_ticket_detail_with_recent_histories_only(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    account_type: AccountType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=1,
+        account_type=account_type,
+        exp=1761905996,
+    )
+
+    registered_ticket = DummyTicket(
+        id=1,
+        title="テストチケット1",
+        is_public=True,
+        status=TicketStatusType.START,
+        description="テスト詳細1",
+        staff_id=1,
+        staff=DummyUser(id=1, name="テスト社員1", is_suspended=False),
+        supporter_id=None,
+        supporter=None,
+        created_at=datetime(2020, 7, 21, 6, 12, 30, 551),
+    )
+
+    # 詳細に含める件数より多い履歴
+    registered_ticket_histories_data = [
+        DummyTicketHistory(
+            id=history_id,
+            ticket_id=1,
+            action_user=DummyUser(id=1, name="テスト社員1", is_suspended=False),
+            action_description=f"テスト対応内容{history_id}",
+            created_at=datetime(2020, 7, 21, 6, 12, 30, 551),
+        )
+        for history_id in range(1, api_ticket.TICKET_DETAIL_HISTORY_LIMIT + 11)
+    ]
+
+    override_validate_access_token(access_token)
+
+    override_get_current_account(DummyUser(id=1, name="テスト管理者1", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_latest_user_updated_at", lambda _session: None)
+    monkeypatch.setattr(
+        api_ticket, "get_ticket_detail_by_id", lambda _session, id: registered_ticket
+    )
+    monkeypatch.setattr(
+        api_ticket,
+        "get_recent_ticket_histories",
+        lambda _session, ticket_id, limit: registered_ticket_histories_data[-limit:],
+    )
+
+    # 実行
+    response = test_client.get("api/v1/ticket/1")
+
+    # 検証（直近の履歴のみ古い順に含まれる）
+    assert response.status_code == 200
+    ticket_histories = response.json()["ticket_histories"]
+    assert len(ticket_histories) == api_ticket.TICKET_DETAIL_HISTORY_LIMIT
+    assert ticket_histories[0]["id"] == 11
+    assert ticket_histories[-1]["id"] == api_ticket.TICKET_DETAIL_HISTORY_LIMIT + 10
+    assert response.json()["has_more_histories"] is True
+
+
+# GETテスト：履歴の差分取得（成功：since_id より後の履歴のみ取得できる）
 @pytest.mark.parametrize("account_type", [AccountType.STAFF])
-def test_create_ticket_success(
+def test_get_ticket_histories_since(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
-    success_session: "FakeSessionCommitSuccess",
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
@@ -963,14 +1530,567 @@ def test_create_ticket_success(
         exp=1761905996,
     )
 
+    registered_ticket = DummyTicket(
+        id=1,
+        title="テストチケット1",
+        is_public=False,
+        status=TicketStatusType.ASSIGNED,
+        description="テスト詳細1",
+        staff_id=1,
+        staff=DummyUser(id=1, name="テスト社員1", is_suspended=False),
+        supporter_id=5,
+        supporter=DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
+        created_at=datetime(2020, 7, 21, 6, 12, 30, 551),
+    )
+
+    registered_ticket_histories_data = [
+        DummyTicketHistory(
+            id=history_id,
+            ticket_id=1,
+            action_user=DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
+            action_description=f"テスト対応内容{history_id}",
+            created_at=datetime(2020, 7, 21, 6, 12, 30, 551),
+        )
+        for history_id in range(1, 6)
+    ]
+
     override_validate_access_token(access_token)
 
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_ticket_by_id", lambda _session, id: registered_ticket)
     monkeypatch.setattr(
         api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
+        "get_ticket_histories_since",
+        lambda _session, ticket_id, since_id, limit: [
+            ticket_history
+            for ticket_history in registered_ticket_histories_data
+            if ticket_history.ticket_id == ticket_id and ticket_history.id > since_id
+        ][:limit],
     )
 
+    # 実行（ID=2 より後の履歴を2件取得）
+    response = test_client.get("api/v1/ticket/1/histories", params={"since_id": 2, "limit": 2})
+
+    # 検証
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [
+            {
+                "id": 3,
+                "ticket": 1,
+                "action_user": "テストサポート担当者1",
+                "action_description": "テスト対応内容3",
+                "created_at": "2020-07-21T06:12:30.000551",
+            },
+            {
+                "id": 4,
+                "ticket": 1,
+                "action_user": "テストサポート担当者1",
+                "action_description": "テスト対応内容4",
+                "created_at": "2020-07-21T06:12:30.000551",
+            },
+        ],
+        "latest_id": 4,
+        "has_more": True,
+    }
+
+    # 実行（新しい履歴がない場合）
+    response = test_client.get("api/v1/ticket/1/histories", params={"since_id": 5})
+
+    # 検証
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "latest_id": 5, "has_more": False}
+
+
+# GETテスト：履歴の差分取得（失敗：社員が他人の非公開チケットを取得しようとした場合）
+@pytest.mark.parametrize("account_type", [AccountType.STAFF])
+def test_get_ticket_histories_forbidden_when_staff_accesses_others_private(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    account_type: AccountType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=1,
+        account_type=account_type,
+        exp=1761905996,
+    )
+
+    registered_ticket = DummyTicket(
+        id=1,
+        title="テストチケット1",
+        is_public=False,
+        status=TicketStatusType.START,
+        description="テスト詳細1",
+        staff_id=2,
+        staff=DummyUser(id=2, name="テスト社員2", is_suspended=False),
+        supporter_id=None,
+        supporter=None,
+        created_at=datetime(2020, 7, 21, 6, 12, 30, 551),
+    )
+
+    override_validate_access_token(access_token)
+
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+    monkeypatch.setattr(api_ticket, "get_ticket_by_id", lambda _session, id: registered_ticket)
+
+    # 実行
+    response = test_client.get("api/v1/ticket/1/histories")
+
+    # 検証
+    assert response.status_code == 422
+    assert response.json() == {"detail": TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE}
+
+
+# ETag テスト用のデータを登録（社員2名・チケット2件（2件目は社員2の非公開チケット）・対応履歴1件）
+def register_etag_test_data(session: Session) -> None:
+    session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=2,
+                name="テスト社員2",
+                email="staff2@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            Ticket(
+                id=1, title="テストチケット1", is_public=True, description="テスト詳細1", staff_id=1
+            ),
+            Ticket(
+                id=2,
+                title="テストチケット2",
+                is_public=False,
+                description="テスト詳細2",
+                staff_id=2,
+            ),
+            TicketHistory(
+                id=1, ticket_id=1, action_user_id=1, action_description="テスト対応内容1"
+            ),
+        ]
+    )
+    session.commit()
+
+
+STAFF_ACCESS_TOKEN = AccessTokenPayload(
+    sub="staff1@example.com",
+    user_id=1,
+    account_type=AccountType.STAFF,
+    exp=1761905996,
+)
+
+
+# GETテスト：詳細取得（ETag が一致する場合は 304 を返し、版の確認のみ行う。対応履歴の追加後は 200 を返す）
+def test_get_ticket_detail_not_modified(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    executed_statements: list[str],
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+
+    # 実行（初回）
+    first_response = test_client.get("api/v1/ticket/1")
+    etag = first_response.headers["ETag"]
+
+    # 検証（初回）
+    assert first_response.status_code == 200
+    assert etag.startswith('"1.')
+    assert first_response.headers["Cache-Control"] == "private, no-cache"
+
+    # 実行（ETag を指定）
+    executed_statements.clear()
+    not_modified_response = test_client.get("api/v1/ticket/1", headers={"If-None-Match": etag})
+
+    # 検証（本文なしの 304。アカウント情報取得 1回 + 版の取得 1回のみ）
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+    assert not_modified_response.headers["ETag"] == etag
+    assert len(executed_statements) == 2
+
+    # 実行（対応履歴を追加した後に ETag を指定）
+    override_get_db_sqlite.add(
+        TicketHistory(id=2, ticket_id=1, action_user_id=1, action_description="テスト対応内容2")
+    )
+    override_get_db_sqlite.commit()
+    modified_response = test_client.get("api/v1/ticket/1", headers={"If-None-Match": etag})
+
+    # 検証（新しい ETag と本文を返す）
+    assert modified_response.status_code == 200
+    assert modified_response.headers["ETag"] != etag
+    assert [history["id"] for history in modified_response.json()["ticket_histories"]] == [1, 2]
+
+
+# GETテスト：詳細取得（対応者の名前を変更した後は、ETag を指定しても 200 と新しい名前を返す）
+def test_get_ticket_detail_modified_by_account_update(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    etag = test_client.get("api/v1/ticket/1").headers["ETag"]
+
+    # 実行（対応者の名前を変更した後に ETag を指定）
+    action_user = override_get_db_sqlite.get(User, 1)
+    action_user.name = "テスト社員1（改名）"
+    action_user.updated_at = datetime(2099, 1, 1, 9, 0, 0)
+    override_get_db_sqlite.commit()
+    response = test_client.get("api/v1/ticket/1", headers={"If-None-Match": etag})
+    not_modified_response = test_client.get(
+        "api/v1/ticket/1", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    # 検証
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["ticket_histories"][0]["action_user"] == "テスト社員1（改名）"
+    assert not_modified_response.status_code == 304
+
+
+# GETテスト：詳細取得（閲覧できないチケットの場合、ETag を指定しても 304 を返さない）
+def test_get_ticket_detail_not_modified_forbidden(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+
+    # 実行
+    response = test_client.get("api/v1/ticket/2", headers={"If-None-Match": "*"})
+
+    # 検証
+    assert response.status_code == 422
+    assert response.json() == {"detail": TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE}
+
+
+# GETテスト：一覧取得（ETag が一致する場合は 304 を返す。チケットの追加後・パラメータが異なる場合は 200 を返す）
+def test_get_tickets_not_modified(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+
+    # 実行（初回）
+    first_response = test_client.get("api/v1/ticket")
+    etag = first_response.headers["ETag"]
+
+    # 実行（ETag を指定）
+    not_modified_response = test_client.get("api/v1/ticket", headers={"If-None-Match": etag})
+    other_limit_response = test_client.get(
+        "api/v1/ticket", params={"limit": 1}, headers={"If-None-Match": etag}
+    )
+
+    # 検証
+    assert first_response.status_code == 200
+    assert [item["id"] for item in first_response.json()["items"]] == [1]
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+    assert other_limit_response.status_code == 200
+
+    # 実行（チケットを追加した後に ETag を指定）
+    override_get_db_sqlite.add(
+        Ticket(id=3, title="テストチケット3", is_public=True, description="テスト詳細3", staff_id=2)
+    )
+    override_get_db_sqlite.commit()
+    modified_response = test_client.get("api/v1/ticket", headers={"If-None-Match": etag})
+
+    # 検証
+    assert modified_response.status_code == 200
+    assert modified_response.headers["ETag"] != etag
+    assert {item["id"] for item in modified_response.json()["items"]} == {1, 3}
+
+
+# GETテスト：一覧取得（アカウント名を変更した後は、ETag を指定しても 200 で変更後の名前を返す）
+def test_get_tickets_modified_by_account_update(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    etag = test_client.get("api/v1/ticket").headers["ETag"]
+
+    # 実行（起票者の名前を変更した後に ETag を指定）
+    staff = override_get_db_sqlite.get(User, 1)
+    staff.name = "テスト社員1（改名）"
+    staff.updated_at = datetime(2099, 1, 1, 9, 0, 0)
+    override_get_db_sqlite.commit()
+    response = test_client.get("api/v1/ticket", headers={"If-None-Match": etag})
+
+    # 検証
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["items"][0]["staff"] == "テスト社員1（改名）"
+
+
+# GETテスト：変更の差分取得（書き込み系APIと同じトランザクションで記録した変更のうち、閲覧可能なもののみ返す）
+def test_get_ticket_changes(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    other_staff_access_token = STAFF_ACCESS_TOKEN.model_copy(
+        update={"sub": "staff2@example.com", "user_id": 2}
+    )
+
+    # 実行（社員1が自分のチケットにコメント、社員2が自分の非公開チケットにコメント → 公開 → 非公開）
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    test_client.post("/api/v1/ticket/1/comments", json={"comment": "質問です"})
+    override_validate_access_token(other_staff_access_token)
+    test_client.post("/api/v1/ticket/2/comments", json={"comment": "補足です"})
+    for is_public in [True, False]:
+        test_client.put("/api/v1/ticket/2/visibility", json={"is_public": is_public})
+
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    all_changes = test_client.get("/api/v1/ticket/changes").json()
+    latest_changes = test_client.get("/api/v1/ticket/changes", params={"since": 4}).json()
+    override_validate_access_token(other_staff_access_token)
+    first_page = test_client.get("/api/v1/ticket/changes", params={"limit": 1}).json()
+
+    # 検証（社員1：他人の非公開チケットの内容は含めず、非公開になったことのみ返す）
+    assert [ticket["id"] for ticket in all_changes["tickets"]] == [1]
+    assert [
+        (history["ticket"], history["action_description"])
+        for history in all_changes["ticket_histories"]
+    ] == [(1, "質問です")]
+    assert all_changes["removed_ticket_ids"] == [2]
+    assert all_changes["latest_seq"] == 4
+    assert all_changes["has_more"] is False
+    assert latest_changes == {
+        "tickets": [],
+        "ticket_histories": [],
+        "removed_ticket_ids": [],
+        "latest_seq": 4,
+        "has_more": False,
+    }
+
+    # 検証（社員2：件数を指定した場合は、続きがあることと次回の seq を返す）
+    assert [ticket["id"] for ticket in first_page["tickets"]] == [1]
+    assert first_page["latest_seq"] == 1
+    assert first_page["has_more"] is True
+
+
+# GETテスト：変更の差分取得（先に INSERT した変更が後からコミットされても、取りこぼさない）
+def test_get_ticket_changes_committed_out_of_order(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+
+    # 実行（id=3 を INSERT した書き込みより先に、id=5 を INSERT した書き込みがコミットされた場合）
+    override_get_db_sqlite.add(
+        TicketChange(id=5, ticket_id=1, change_type=TicketEventType.STATUS_UPDATED)
+    )
+    override_get_db_sqlite.commit()
+    first_changes = test_client.get("/api/v1/ticket/changes").json()
+
+    override_get_db_sqlite.add(
+        TicketChange(id=3, ticket_id=1, change_type=TicketEventType.VISIBILITY_UPDATED)
+    )
+    override_get_db_sqlite.commit()
+    next_changes = test_client.get(
+        "/api/v1/ticket/changes", params={"since": first_changes["latest_seq"]}
+    ).json()
+
+    # 検証（seq はコミットした順に付くため、後からコミットされた id=3 の変更も次回の差分に含まれる）
+    assert first_changes["latest_seq"] == 1
+    assert [ticket["id"] for ticket in first_changes["tickets"]] == [1]
+    assert next_changes["latest_seq"] == 2
+    assert [ticket["id"] for ticket in next_changes["tickets"]] == [1]
+    assert [
+        (change.id, change.seq)
+        for change in override_get_db_sqlite.query(TicketChange).order_by(TicketChange.seq)
+    ] == [(5, 1), (3, 2)]
+
+
+# GETテスト：一覧取得（絞り込み・並び順を指定した場合。条件ごとに ETag が異なる）
+def test_get_tickets_with_filters(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_validate_access_token(
+        STAFF_ACCESS_TOKEN.model_copy(update={"sub": "staff2@example.com", "user_id": 2})
+    )
+
+    # 実行
+    private_tickets = test_client.get("/api/v1/ticket", params={"is_public": False})
+    started_tickets = test_client.get(
+        "/api/v1/ticket", params={"status": ["start", "assigned"], "sort": "created_at"}
+    )
+    closed_tickets = test_client.get("/api/v1/ticket", params={"status": "closed"})
+    invalid_sort = test_client.get("/api/v1/ticket", params={"sort": "title"})
+    invalid_range = test_client.get(
+        "/api/v1/ticket",
+        params={"created_from": "2020-07-22T00:00:00", "created_to": "2020-07-21T00:00:00"},
+    )
+
+    # 検証
+    assert [ticket["id"] for ticket in private_tickets.json()["items"]] == [2]
+    assert [ticket["id"] for ticket in started_tickets.json()["items"]] == [1, 2]
+    assert closed_tickets.json() == {"items": [], "next_cursor": None}
+    assert len({private_tickets.headers["ETag"], closed_tickets.headers["ETag"]}) == 2
+    assert invalid_sort.status_code == 422
+    assert invalid_range.status_code == 422
+    assert invalid_range.json() == {"detail": "作成日時の範囲が不正です"}
+
+
+# GETテスト：チケット件数（登録・担当割り当て・ステータス変更・公開設定変更のたびに集計が増減する）
+def test_get_ticket_counts(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    override_get_db_sqlite.add_all(
+        [
+            User(
+                id=account_id,
+                name=name,
+                email=f"user{account_id}@example.com",
+                password="hashed",
+                account_type=account_type,
+            )
+            for account_id, name, account_type in [
+                (1, "テスト社員1", AccountType.STAFF),
+                (2, "テスト社員2", AccountType.STAFF),
+                (5, "テストサポート担当者1", AccountType.SUPPORTER),
+            ]
+        ]
+    )
+    override_get_db_sqlite.commit()
+    other_staff_access_token = STAFF_ACCESS_TOKEN.model_copy(
+        update={"sub": "user2@example.com", "user_id": 2}
+    )
+    supporter_access_token = STAFF_ACCESS_TOKEN.model_copy(
+        update={"sub": "user5@example.com", "user_id": 5, "account_type": AccountType.SUPPORTER}
+    )
+
+    # 実行（チケット1：社員1の公開、チケット2：社員2の非公開、チケット3：社員2の公開 → 非公開）
+    body = {"title": "テストタイトル", "description": "テスト詳細", "staff_id": 1}
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    test_client.post("/api/v1/ticket", json={**body, "is_public": True})
+    override_validate_access_token(other_staff_access_token)
+    test_client.post("/api/v1/ticket", json={**body, "is_public": False})
+    test_client.post("/api/v1/ticket", json={**body, "is_public": True})
+    test_client.put("/api/v1/ticket/3/visibility", json={"is_public": False})
+    override_validate_access_token(supporter_access_token)
+    for ticket_id in [1, 2]:
+        test_client.put(f"/api/v1/ticket/{ticket_id}/assign")
+    test_client.put("/api/v1/ticket/1/status", json={"status": "in_progress"})
+
+    supporter_counts = test_client.get("/api/v1/ticket/counts").json()
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    own_counts = test_client.get("/api/v1/ticket/counts").json()
+    override_validate_access_token(other_staff_access_token)
+    other_counts = test_client.get("/api/v1/ticket/counts").json()
+
+    # 検証（サポート担当者：全チケット）
+    assert supporter_counts == {
+        "total": 3,
+        "unassigned": 1,
+        "by_status": [
+            {"status": "start", "count": 1},
+            {"status": "assigned", "count": 1},
+            {"status": "in_progress", "count": 1},
+            {"status": "resolved", "count": 0},
+            {"status": "closed", "count": 0},
+        ],
+        "by_supporter": [{"supporter_id": 5, "supporter": "テストサポート担当者1", "count": 2}],
+    }
+
+    # 検証（社員：公開チケット ＋ 自分の非公開チケット）
+    assert (own_counts["total"], own_counts["unassigned"]) == (1, 0)
+    assert (other_counts["total"], other_counts["unassigned"]) == (3, 1)
+    assert reconcile_ticket_counts(override_get_db_sqlite, dry_run=True) == []
+
+
+# GETテスト：キーワード検索（関連度順。社員は閲覧可能なチケットのみ。コメントの追加後は対応履歴からも検索できる）
+def test_search_tickets(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register_etag_test_data(override_get_db_sqlite)
+    override_get_db_sqlite.add(
+        Ticket(id=3, title="VPNに接続できない", is_public=True, description="自宅から", staff_id=2)
+    )
+    override_get_db_sqlite.commit()
+    # 他のテストの索引を引き継がないよう、空の索引から作成する
+    monkeypatch.setitem(
+        ticket_search_backend.TICKET_SEARCH_BACKENDS,
+        "inverted_index",
+        ticket_search_backend.InvertedIndexTicketSearchBackend(),
+    )
+    other_staff_access_token = STAFF_ACCESS_TOKEN.model_copy(
+        update={"sub": "staff2@example.com", "user_id": 2}
+    )
+
+    # 実行
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    own_results = test_client.get("/api/v1/ticket/search", params={"q": "テスト"}).json()
+    before_comment = test_client.get("/api/v1/ticket/search", params={"q": "プリンター"}).json()
+    test_client.post("/api/v1/ticket/3/comments", json={"comment": "プリンターも使えません"})
+    after_comment = test_client.get("/api/v1/ticket/search", params={"q": "プリンター"}).json()
+    override_validate_access_token(other_staff_access_token)
+    first_page = test_client.get("/api/v1/ticket/search", params={"q": "テスト", "limit": 1}).json()
+    second_page = test_client.get(
+        "/api/v1/ticket/search", params={"q": "テスト", "limit": 1, "offset": 1}
+    ).json()
+    empty_keyword = test_client.get("/api/v1/ticket/search", params={"q": ""})
+
+    # 検証（社員1：他人の非公開チケット2は返さない）
+    assert [ticket["id"] for ticket in own_results["items"]] == [1]
+    assert own_results["next_offset"] is None
+    assert before_comment == {"items": [], "next_offset": None}
+    assert [ticket["id"] for ticket in after_comment["items"]] == [3]
+
+    # 検証（社員2：対応履歴にも一致するチケット1が先）
+    assert [ticket["id"] for ticket in first_page["items"]] == [1]
+    assert first_page["next_offset"] == 1
+    assert [ticket["id"] for ticket in second_page["items"]] == [2]
+    assert second_page["next_offset"] is None
+    assert empty_keyword.status_code == 422
+
+
+# POSTテスト：チケット登録（成功）
+@pytest.mark.usefixtures("override_get_db_success")
+@pytest.mark.parametrize("account_type", [AccountType.STAFF])
+def test_create_ticket_success(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    account_type: AccountType,
+    success_session: "FakeSessionCommitSuccess",
+) -> None:
+    access_token = AccessTokenPayload(
+        sub="test@example.com",
+        user_id=1,
+        account_type=account_type,
+        exp=1761905996,
+    )
+
+    override_validate_access_token(access_token)
+
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
+
     # テスト用登録予定データ
     body = {
         "title": "テストタイトル",
@@ -993,9 +2113,9 @@ def test_create_ticket_success(
 def test_create_account_error(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     error_session: "FakeSessionCommitError",
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
         sub="test@example.com",
@@ -1006,11 +2126,7 @@ def test_create_account_error(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
 
     # テスト用登録予定データ
     body = {
@@ -1033,8 +2149,8 @@ def test_create_account_error(
 def test_create_accounts_forbidden(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
         sub="test@example.com",
@@ -1045,11 +2161,7 @@ def test_create_accounts_forbidden(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
 
     # テスト用登録予定データ
     body = {
@@ -1073,9 +2185,9 @@ def test_create_accounts_forbidden(
 def test_create_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
         sub="test@example.com",
@@ -1086,11 +2198,7 @@ def test_create_account_not_found(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
+    override_get_current_account(None)
 
     # テスト用登録予定データ
     body = {
@@ -1114,9 +2222,9 @@ def test_create_account_not_found(
 def test_create_ticket_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     access_token = AccessTokenPayload(
         sub="test@example.com",
@@ -1127,11 +2235,7 @@ def test_create_ticket_is_suspended_account(
 
     override_validate_access_token(access_token)
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=True))
 
     # テスト用登録予定データ
     body = {
@@ -1155,6 +2259,7 @@ def test_create_ticket_is_suspended_account(
 def test_create_ticket_comment_success(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
     monkeypatch: pytest.MonkeyPatch,
@@ -1184,17 +2289,15 @@ def test_create_ticket_comment_success(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
         "get_ticket_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
+    published_events: list[TicketEvent] = []
+    monkeypatch.setattr(api_ticket.ticket_event_broker, "publish", published_events.append)
 
     # テスト用登録予定データ
     body = {
@@ -1212,6 +2315,17 @@ def test_create_ticket_comment_success(
         "action_user": "テスト社員1",
         "comment": "質問です",
     }
+    # コミット後に、追加した対応履歴の変更通知が発行される
+    assert published_events == [
+        TicketEvent(
+            event_type=TicketEventType.COMMENTED,
+            change_seq=1,
+            ticket_id=1,
+            staff_id=2,
+            is_public=True,
+            history_id=1,
+        )
+    ]
 
 
 # POSTテスト：チケットに対する質疑応答登録（失敗）
@@ -1220,6 +2334,7 @@ def test_create_ticket_comment_success(
 def test_create_ticket_comment_error(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     error_session: "FakeSessionCommitError",
     monkeypatch: pytest.MonkeyPatch,
@@ -1249,11 +2364,7 @@ def test_create_ticket_comment_error(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1279,6 +2390,7 @@ def test_create_ticket_comment_error(
 def test_create_ticket_comment_ticket_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1307,11 +2419,7 @@ def test_create_ticket_comment_ticket_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1337,6 +2445,7 @@ def test_create_ticket_comment_ticket_not_found(
 def test_create_ticket_comment_when_staff_accesses_other_private_ticket(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1365,11 +2474,7 @@ def test_create_ticket_comment_when_staff_accesses_other_private_ticket(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1395,6 +2500,7 @@ def test_create_ticket_comment_when_staff_accesses_other_private_ticket(
 def test_create_ticket_comment_when_ticket_is_closed(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1423,11 +2529,7 @@ def test_create_ticket_comment_when_ticket_is_closed(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1455,6 +2557,7 @@ def test_create_ticket_comment_when_ticket_is_closed(
 def test_create_ticket_comment_when_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1483,11 +2586,7 @@ def test_create_ticket_comment_when_account_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
+    override_get_current_account(None)
 
     monkeypatch.setattr(
         api_ticket,
@@ -1513,6 +2612,7 @@ def test_create_ticket_comment_when_account_not_found(
 def test_create_ticket_comment_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1541,11 +2641,7 @@ def test_create_ticket_comment_is_suspended_account(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=True))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1566,12 +2662,471 @@ def test_create_ticket_comment_is_suspended_account(
     assert response.json() == {"detail": "このアカウント情報は不正です"}
 
 
+# テスト用データ登録（一括操作用。社員2名・サポート担当者2名、チケット3件）
+def register_bulk_test_data(session: Session) -> None:
+    session.add_all(
+        [
+            User(
+                id=account_id,
+                name=name,
+                email=f"user{account_id}@example.com",
+                password="hashed",
+                account_type=account_type,
+            )
+            for account_id, name, account_type in [
+                (1, "テスト社員1", AccountType.STAFF),
+                (2, "テスト社員2", AccountType.STAFF),
+                (5, "テストサポート担当者1", AccountType.SUPPORTER),
+                (6, "テストサポート担当者2", AccountType.SUPPORTER),
+            ]
+        ]
+    )
+    session.add_all(
+        [
+            Ticket(id=1, title="テスト1", is_public=True, description="詳細", staff_id=1),
+            Ticket(id=2, title="テスト2", is_public=False, description="詳細", staff_id=2),
+            Ticket(
+                id=3,
+                title="テスト3",
+                is_public=True,
+                status=TicketStatusType.ASSIGNED,
+                description="詳細",
+                staff_id=1,
+                supporter_id=6,
+            ),
+        ]
+    )
+    session.commit()
+    # 件数の集計を、登録したチケットから作成する
+    reconcile_ticket_counts(session, dry_run=False)
+
+
+SUPPORTER_ACCESS_TOKEN = AccessTokenPayload(
+    sub="user5@example.com",
+    user_id=5,
+    account_type=AccountType.SUPPORTER,
+    exp=1761905996,
+)
+
+
+# PUTテスト：一括担当割り当て（対象にできないチケットは理由を返し、それ以外は1回のコミットで変更する）
+def test_bulk_assign_supporter(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    executed_statements: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    published_events: list[TicketEvent] = []
+    monkeypatch.setattr(api_ticket.ticket_event_broker, "publish", published_events.append)
+    override_validate_access_token(SUPPORTER_ACCESS_TOKEN)
+    executed_statements.clear()
+
+    # 実行
+    response = test_client.put("/api/v1/ticket/bulk/assign", json={"ticket_ids": [1, 3, 99, 2, 1]})
+
+    # 検証
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {"ticket_id": 1, "success": True, "status_code": 200, "message": None},
+            {
+                "ticket_id": 3,
+                "success": False,
+                "status_code": 422,
+                "message": "すでにサポート担当者が存在します",
+            },
+            {
+                "ticket_id": 99,
+                "success": False,
+                "status_code": 422,
+                "message": TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE,
+            },
+            {"ticket_id": 2, "success": True, "status_code": 200, "message": None},
+        ],
+        "succeeded": 2,
+        "failed": 2,
+    }
+    # 対応履歴は採番されたIDを受け取るため1件ずつ（1回の flush で）、検索用の対応履歴・変更履歴は1回のINSERTで追加する
+    insert_counts = {
+        table_name: sum(
+            statement.startswith(f"INSERT INTO {table_name} ") for statement in executed_statements
+        )
+        for table_name in ["ticket_histories", "ticket_history_search", "ticket_changes"]
+    }
+    assert insert_counts == {"ticket_histories": 2, "ticket_history_search": 1, "ticket_changes": 1}
+
+    histories = override_get_db_sqlite.query(TicketHistory).order_by(TicketHistory.id).all()
+    assert [(history.ticket_id, history.action_description) for history in histories] == [
+        (1, "担当者 テストサポート担当者1 を担当に割り当てました"),
+        (2, "担当者 テストサポート担当者1 を担当に割り当てました"),
+    ]
+    assert [
+        (search_row.ticket_history_id, search_row.ticket_id)
+        for search_row in override_get_db_sqlite.query(TicketHistorySearch).order_by(
+            TicketHistorySearch.ticket_history_id
+        )
+    ] == [(1, 1), (2, 2)]
+    assert [
+        (event.event_type, event.ticket_id, event.history_id, event.change_seq)
+        for event in published_events
+    ] == [(TicketEventType.ASSIGNED, 1, 1, 1), (TicketEventType.ASSIGNED, 2, 2, 2)]
+    assert reconcile_ticket_counts(override_get_db_sqlite, dry_run=True) == []
+
+
+# PUTテスト：一括ステータス変更・一括担当解除・一括公開設定変更
+def test_bulk_update_tickets(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    override_validate_access_token(SUPPORTER_ACCESS_TOKEN)
+    test_client.put("/api/v1/ticket/bulk/assign", json={"ticket_ids": [1, 2]})
+
+    # 実行
+    status_response = test_client.put(
+        "/api/v1/ticket/bulk/status", json={"ticket_ids": [1, 2, 3], "status": "in_progress"}
+    )
+    unassign_response = test_client.put("/api/v1/ticket/bulk/unassign", json={"ticket_ids": [2, 3]})
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    visibility_response = test_client.put(
+        "/api/v1/ticket/bulk/visibility", json={"ticket_ids": [1, 2, 3], "is_public": False}
+    )
+    forbidden_response = test_client.put(
+        "/api/v1/ticket/bulk/status", json={"ticket_ids": [1], "status": "closed"}
+    )
+    empty_response = test_client.put("/api/v1/ticket/bulk/visibility", json={"ticket_ids": []})
+
+    # 検証
+    assert [result["message"] for result in status_response.json()["results"]] == [
+        None,
+        None,
+        "ステータスを変更する権限がありません",
+    ]
+    assert [result["message"] for result in unassign_response.json()["results"]] == [
+        None,
+        "このチケットの担当解除を行う権限がありません",
+    ]
+    assert [result["message"] for result in visibility_response.json()["results"]] == [
+        None,
+        TICKET_NOT_FOUND_OR_FORBIDDEN_MESSAGE,
+        None,
+    ]
+    assert forbidden_response.status_code == 403
+    assert empty_response.status_code == 422
+
+    tickets = override_get_db_sqlite.query(Ticket).order_by(Ticket.id).all()
+    assert [(ticket.status, ticket.supporter_id, ticket.is_public) for ticket in tickets] == [
+        (TicketStatusType.IN_PROGRESS, 5, False),
+        (TicketStatusType.START, None, False),
+        (TicketStatusType.ASSIGNED, 6, False),
+    ]
+    assert reconcile_ticket_counts(override_get_db_sqlite, dry_run=True) == []
+
+
+# PUTテスト：一括担当割り当て（読み込んだ後に他の操作で更新されたチケットのみ失敗とし、それ以外は変更する）
+def test_bulk_assign_supporter_conflict(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    override_validate_access_token(SUPPORTER_ACCESS_TOKEN)
+    get_bulk_target_tickets = api_ticket.get_bulk_target_tickets
+
+    # 対象のチケットを読み込んだ直後に、他の操作でチケット2が担当割り当てされた状態にする
+    def get_bulk_target_tickets_and_update(
+        session: Session, ticket_ids: list[int]
+    ) -> dict[int, Ticket]:
+        target_tickets = get_bulk_target_tickets(session, ticket_ids)
+        session.execute(
+            update(Ticket)
+            .where(Ticket.id == 2)
+            .values(supporter_id=6, status=TicketStatusType.ASSIGNED, version=Ticket.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return target_tickets
+
+    monkeypatch.setattr(api_ticket, "get_bulk_target_tickets", get_bulk_target_tickets_and_update)
+
+    # 実行
+    response = test_client.put("/api/v1/ticket/bulk/assign", json={"ticket_ids": [1, 2]})
+
+    # 検証
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {"ticket_id": 1, "success": True, "status_code": 200, "message": None},
+            {
+                "ticket_id": 2,
+                "success": False,
+                "status_code": 409,
+                "message": api_ticket.TICKET_UPDATED_BY_OTHERS_MESSAGE,
+            },
+        ],
+        "succeeded": 1,
+        "failed": 1,
+    }
+    override_get_db_sqlite.expire_all()
+    tickets = (
+        override_get_db_sqlite.query(Ticket).filter(Ticket.id.in_([1, 2])).order_by(Ticket.id).all()
+    )
+    assert [(ticket.supporter_id, ticket.version) for ticket in tickets] == [(5, 2), (6, 2)]
+    assert [
+        history.ticket_id
+        for history in override_get_db_sqlite.query(TicketHistory).order_by(TicketHistory.id)
+    ] == [1]
+
+
+# PUTテスト：一括公開設定変更（チケットごとに版を指定した場合、画面に表示したときの版と異なるチケットのみ 412 とする）
+def test_bulk_update_ticket_visibility_with_expected_versions(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+
+    # 実行
+    response = test_client.put(
+        "/api/v1/ticket/bulk/visibility",
+        json={"ticket_ids": [1, 3], "is_public": False, "expected_versions": {"1": 1, "3": 2}},
+    )
+
+    # 検証
+    assert response.status_code == 200
+    assert [
+        (result["ticket_id"], result["status_code"], result["message"])
+        for result in response.json()["results"]
+    ] == [(1, 200, None), (3, 412, api_ticket.TICKET_UPDATED_BY_OTHERS_MESSAGE)]
+    override_get_db_sqlite.expire_all()
+    tickets = override_get_db_sqlite.query(Ticket).filter(Ticket.id.in_([1, 3])).order_by(Ticket.id)
+    assert [(ticket.is_public, ticket.version) for ticket in tickets] == [(False, 2), (True, 1)]
+
+
+# GET・PUTテスト：アーカイブ済みのチケット（詳細はアーカイブから返し、再オープンすると tickets へ戻す）
+def test_archived_ticket_detail_and_reopen(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    closed_ticket = override_get_db_sqlite.get(Ticket, 3)
+    closed_ticket.status = TicketStatusType.CLOSED
+    closed_ticket.supporter_id = 5
+    closed_ticket.updated_at = datetime(2026, 1, 10, 10, 0, 0)
+    override_get_db_sqlite.add(
+        TicketHistory(ticket_id=3, action_user_id=5, action_description="対応しました")
+    )
+    override_get_db_sqlite.commit()
+    reconcile_ticket_counts(override_get_db_sqlite, dry_run=False)
+    archive_closed_tickets(override_get_db_sqlite, datetime(2026, 4, 1), batch_size=10)
+    published_events: list[TicketEvent] = []
+    monkeypatch.setattr(api_ticket.ticket_event_broker, "publish", published_events.append)
+
+    # 実行
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    changes_response = test_client.get("/api/v1/ticket/changes")
+    override_validate_access_token(SUPPORTER_ACCESS_TOKEN)
+    detail_response = test_client.get("/api/v1/ticket/3")
+    histories_response = test_client.get("/api/v1/ticket/3/histories")
+    reopen_response = test_client.put("/api/v1/ticket/3/status", json={"status": "in_progress"})
+
+    # 検証（アーカイブ済みの間は、一覧の変更としては削除扱い・詳細と対応履歴はアーカイブから返す）
+    assert changes_response.json()["removed_ticket_ids"] == [3]
+    assert detail_response.status_code == 200
+    assert detail_response.json()["title"] == "テスト3"
+    assert [history["action_description"] for history in histories_response.json()["items"]] == [
+        "対応しました"
+    ]
+
+    # 検証（再オープンすると同じIDのまま tickets へ戻り、件数の集計にも戻る）
+    assert reopen_response.status_code == 200
+    reopened_ticket = override_get_db_sqlite.get(Ticket, 3)
+    assert reopened_ticket.status == TicketStatusType.IN_PROGRESS
+    assert override_get_db_sqlite.get(ArchivedTicket, 3) is None
+    assert [
+        history.action_description
+        for history in override_get_db_sqlite.query(TicketHistory)
+        .filter(TicketHistory.ticket_id == 3)
+        .order_by(TicketHistory.id)
+    ] == ["対応しました", "ステータスを「対応中」に変更しました"]
+    assert [
+        change.change_type
+        for change in override_get_db_sqlite.query(TicketChange).order_by(TicketChange.id)
+    ] == [TicketEventType.ARCHIVED, TicketEventType.RESTORED, TicketEventType.STATUS_UPDATED]
+    assert reconcile_ticket_counts(override_get_db_sqlite, dry_run=True) == []
+    assert [event.event_type for event in published_events] == [TicketEventType.STATUS_UPDATED]
+
+
+# PUTテスト：If-Match で版を指定した更新（一致する場合のみ更新し、更新後の版を ETag で返す。古い版の場合は 412）
+def test_update_ticket_with_if_match(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    override_validate_access_token(SUPPORTER_ACCESS_TOKEN)
+
+    # 実行
+    detail_response = test_client.get("/api/v1/ticket/1")
+    assign_response = test_client.put("/api/v1/ticket/1/assign", headers={"If-Match": '"1"'})
+    stale_response = test_client.put(
+        "/api/v1/ticket/1/status", json={"status": "in_progress"}, headers={"If-Match": '"1"'}
+    )
+    status_response = test_client.put(
+        "/api/v1/ticket/1/status",
+        json={"status": "in_progress"},
+        headers={"If-Match": assign_response.headers["ETag"]},
+    )
+
+    # 検証
+    assert detail_response.json()["version"] == 1
+    assert assign_response.status_code == 200
+    assert assign_response.headers["ETag"] == '"2"'
+    assert stale_response.status_code == 412
+    assert stale_response.json() == {
+        "detail": "他の操作でチケットが更新されました。最新の内容を取得してから、再度操作してください"
+    }
+    assert status_response.status_code == 200
+    assert status_response.headers["ETag"] == '"3"'
+    assert test_client.get("/api/v1/ticket/1").json()["version"] == 3
+    assert [
+        history.action_description
+        for history in override_get_db_sqlite.query(TicketHistory).order_by(TicketHistory.id)
+    ] == [
+        "担当者 テストサポート担当者1 を担当に割り当てました",
+        "ステータスを「対応中」に変更しました",
+    ]
+
+
+# PUTテスト：詳細取得で受け取った ETag を、そのまま If-Match に指定して更新する
+# （版が同じ間は更新でき、他の操作で更新された後は 412）
+def test_update_ticket_with_detail_etag(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_db_sqlite: Session,
+) -> None:
+    register_bulk_test_data(override_get_db_sqlite)
+    override_validate_access_token(SUPPORTER_ACCESS_TOKEN)
+
+    # 実行
+    detail_etag = test_client.get("/api/v1/ticket/1").headers["ETag"]
+    assign_response = test_client.put("/api/v1/ticket/1/assign", headers={"If-Match": detail_etag})
+    stale_response = test_client.put(
+        "/api/v1/ticket/1/status",
+        json={"status": "in_progress"},
+        headers={"If-Match": detail_etag},
+    )
+    latest_etag = test_client.get("/api/v1/ticket/1").headers["ETag"]
+    status_response = test_client.put(
+        "/api/v1/ticket/1/status",
+        json={"status": "in_progress"},
+        headers={"If-Match": latest_etag},
+    )
+
+    # 検証
+    assert assign_response.status_code == 200
+    assert stale_response.status_code == 412
+    assert status_response.status_code == 200
+    assert status_response.headers["ETag"] == '"3"'
+
+
+# 同時実行テスト：2名のサポート担当者が、同じチケットを同時に担当割り当てする
+# 両方が同じ版を読み込んだ後に更新するため、先に更新した1名のみ成功し、もう1名は 409 となる（後の更新で上書きしない）
+def test_assign_supporter_race(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # スレッドごとに別の接続を使うため、ファイルの SQLite を使用する
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'race.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    create_session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with create_session() as session:
+        register_bulk_test_data(session)
+
+    published_events: list[TicketEvent] = []
+    monkeypatch.setattr(api_ticket.ticket_event_broker, "publish", published_events.append)
+
+    # 両方のスレッドがチケットを読み込むまで待ち合わせてから、1スレッドずつ更新させる
+    # （SQLite はDB全体をロックするため、更新のみ順番に行う。MySQL では行ロックで同じように順番に更新される）
+    read_barrier = threading.Barrier(2)
+    write_lock = threading.Lock()
+    original_get_ticket_by_id = api_ticket.get_ticket_by_id
+
+    def get_ticket_by_id_and_wait(session: Session, id: int) -> Ticket | None:
+        target_ticket = original_get_ticket_by_id(session, id=id)
+        read_barrier.wait(timeout=5)
+        write_lock.acquire()
+        return target_ticket
+
+    monkeypatch.setattr(api_ticket, "get_ticket_by_id", get_ticket_by_id_and_wait)
+
+    status_codes: dict[int, int] = {}
+
+    def assign(user_id: int, name: str) -> None:
+        with create_session() as session:
+            try:
+                api_ticket.assign_supporter(
+                    ticket_id=1,
+                    session=session,
+                    access_token=AccessTokenPayload(
+                        sub=f"user{user_id}@example.com",
+                        user_id=user_id,
+                        account_type=AccountType.SUPPORTER,
+                        exp=1761905996,
+                    ),
+                    target_account=CurrentAccount(
+                        id=user_id,
+                        name=name,
+                        account_type=AccountType.SUPPORTER,
+                        is_suspended=False,
+                    ),
+                    response=Response(),
+                )
+                status_codes[user_id] = 200
+            except HTTPException as error:
+                status_codes[user_id] = error.status_code
+            finally:
+                write_lock.release()
+
+    # 実行
+    threads = [
+        threading.Thread(target=assign, args=(5, "テストサポート担当者1")),
+        threading.Thread(target=assign, args=(6, "テストサポート担当者2")),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # 検証
+    assert sorted(status_codes.values()) == [200, 409]
+    winner_id = next(user_id for user_id, status_code in status_codes.items() if status_code == 200)
+    with create_session() as session:
+        target_ticket = session.get(Ticket, 1)
+        assert (target_ticket.supporter_id, target_ticket.status, target_ticket.version) == (
+            winner_id,
+            TicketStatusType.ASSIGNED,
+            2,
+        )
+        assert session.query(TicketHistory).count() == 1
+        assert session.query(TicketChange).count() == 1
+        assert reconcile_ticket_counts(session, dry_run=True) == []
+    assert len(published_events) == 1
+    engine.dispose()
+
+
 # PUTテスト：サポート担当者登録設定（成功）
 @pytest.mark.usefixtures("override_get_db_success")
 @pytest.mark.parametrize("account_type", [AccountType.SUPPORTER])
 def test_assign_supporter_success(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
     monkeypatch: pytest.MonkeyPatch,
@@ -1601,11 +3156,7 @@ def test_assign_supporter_success(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1627,6 +3178,7 @@ def test_assign_supporter_success(
 def test_assign_supporter_error(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     error_session: "FakeSessionCommitError",
     monkeypatch: pytest.MonkeyPatch,
@@ -1656,11 +3208,7 @@ def test_assign_supporter_error(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1681,6 +3229,7 @@ def test_assign_supporter_error(
 def test_assign_supporter_account_type_is_not_supporter(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1709,11 +3258,7 @@ def test_assign_supporter_account_type_is_not_supporter(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=1, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=1, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1734,6 +3279,7 @@ def test_assign_supporter_account_type_is_not_supporter(
 def test_assign_supporter_ticket_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1762,11 +3308,7 @@ def test_assign_supporter_ticket_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1787,6 +3329,7 @@ def test_assign_supporter_ticket_not_found(
 def test_assign_supporter_already_exist(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1815,11 +3358,7 @@ def test_assign_supporter_already_exist(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1835,11 +3374,12 @@ def test_assign_supporter_already_exist(
     assert response.json() == {"detail": "すでにサポート担当者が存在します"}
 
 
-# PUTテスト：サポート担当者登録設定（失敗：ステータスが「新規質問」でない場合）
+# PUTテスト：サポート担当者登録設定（失敗：ステータスが「新規質問」でない場合は、チケットを変更する前に 422）
 @pytest.mark.parametrize("account_type", [AccountType.SUPPORTER])
 def test_assign_supporter_status_is_not_start(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1868,11 +3408,7 @@ def test_assign_supporter_status_is_not_start(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1883,9 +3419,10 @@ def test_assign_supporter_status_is_not_start(
     # 実行
     response = test_client.put("/api/v1/ticket/1/assign")
 
-    # 検証
-    assert response.status_code == 500
-    assert response.json() == {"detail": "システムエラーが発生しました"}
+    # 検証（チケットは変更しない）
+    assert response.status_code == 422
+    assert response.json() == {"detail": "選択したステータスには変更できません"}
+    assert registered_data[0].supporter_id is None
 
 
 # PUTテスト：サポート担当者登録設定（失敗：遷移不可のステータスに変更しようとした場合）
@@ -1893,6 +3430,7 @@ def test_assign_supporter_status_is_not_start(
 def test_assign_supporter_when_transition_forbidden(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1921,11 +3459,7 @@ def test_assign_supporter_when_transition_forbidden(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -1952,6 +3486,7 @@ def test_assign_supporter_when_transition_forbidden(
 def test_assign_supporter_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1980,11 +3515,7 @@ def test_assign_supporter_account_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
+    override_get_current_account(None)
 
     monkeypatch.setattr(
         api_ticket,
@@ -2005,6 +3536,7 @@ def test_assign_supporter_account_not_found(
 def test_assign_supporter_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2033,11 +3565,7 @@ def test_assign_supporter_is_suspended_account(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テストサポート担当者1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=2, name="テストサポート担当者1", is_suspended=True))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2059,6 +3587,7 @@ def test_assign_supporter_is_suspended_account(
 def test_unassign_supporter_success(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
     monkeypatch: pytest.MonkeyPatch,
@@ -2088,11 +3617,7 @@ def test_unassign_supporter_success(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2119,6 +3644,7 @@ def test_unassign_supporter_success(
 def test_unassign_supporter_error(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     error_session: "FakeSessionCommitError",
     monkeypatch: pytest.MonkeyPatch,
@@ -2148,11 +3674,7 @@ def test_unassign_supporter_error(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2173,6 +3695,7 @@ def test_unassign_supporter_error(
 def test_unassign_supporter_account_type_is_not_supporter(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2201,11 +3724,7 @@ def test_unassign_supporter_account_type_is_not_supporter(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2226,6 +3745,7 @@ def test_unassign_supporter_account_type_is_not_supporter(
 def test_unassign_supporter_ticket_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2254,11 +3774,7 @@ def test_unassign_supporter_ticket_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2279,6 +3795,7 @@ def test_unassign_supporter_ticket_not_found(
 def test_unassign_supporter_other_user_is_supporter(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2307,11 +3824,7 @@ def test_unassign_supporter_other_user_is_supporter(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2332,6 +3845,7 @@ def test_unassign_supporter_other_user_is_supporter(
 def test_unassign_supporter_when_transition_forbidden(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2360,11 +3874,7 @@ def test_unassign_supporter_when_transition_forbidden(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2391,6 +3901,7 @@ def test_unassign_supporter_when_transition_forbidden(
 def test_unassign_supporter_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2419,11 +3930,7 @@ def test_unassign_supporter_account_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
+    override_get_current_account(None)
 
     monkeypatch.setattr(
         api_ticket,
@@ -2444,6 +3951,7 @@ def test_unassign_supporter_account_not_found(
 def test_unassign_supporter_is_suspended_account(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2472,11 +3980,7 @@ def test_unassign_supporter_is_suspended_account(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=True))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2498,6 +4002,7 @@ def test_unassign_supporter_is_suspended_account(
 def test_update_ticket_status_success(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
     monkeypatch: pytest.MonkeyPatch,
@@ -2527,11 +4032,7 @@ def test_update_ticket_status_success(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2563,6 +4064,7 @@ def test_update_ticket_status_success(
 def test_update_ticket_status_error(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     error_session: "FakeSessionCommitError",
     monkeypatch: pytest.MonkeyPatch,
@@ -2592,11 +4094,7 @@ def test_update_ticket_status_error(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2622,6 +4120,7 @@ def test_update_ticket_status_error(
 def test_update_ticket_status_when_new_status_is_start(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2650,11 +4149,7 @@ def test_update_ticket_status_when_new_status_is_start(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2680,6 +4175,7 @@ def test_update_ticket_status_when_new_status_is_start(
 def test_update_ticket_status_account_type_is_staff(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2708,11 +4204,7 @@ def test_update_ticket_status_account_type_is_staff(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2738,6 +4230,7 @@ def test_update_ticket_status_account_type_is_staff(
 def test_update_ticket_status_ticket_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2766,17 +4259,15 @@ def test_update_ticket_status_ticket_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
         "get_ticket_by_id",
         lambda _session, id: next((ticket for ticket in registered_data if ticket.id == id), None),
     )  # next() → 条件に合う最初のチケットを返す、なければ None
+    # アーカイブ済みのチケットにも存在しない
+    monkeypatch.setattr(api_ticket, "get_archived_ticket_by_id", lambda _session, id: None)
 
     # テスト用変更予定データ
     body = {
@@ -2796,6 +4287,7 @@ def test_update_ticket_status_ticket_not_found(
 def test_update_ticket_status_when_current_status_is_start(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2824,11 +4316,7 @@ def test_update_ticket_status_when_current_status_is_start(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2854,6 +4342,7 @@ def test_update_ticket_status_when_current_status_is_start(
 def test_update_ticket_status_supporter_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2882,11 +4371,7 @@ def test_update_ticket_status_supporter_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2912,6 +4397,7 @@ def test_update_ticket_status_supporter_not_found(
 def test_update_ticket_status_forbidden_for_unauthorized_supporter(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2940,11 +4426,7 @@ def test_update_ticket_status_forbidden_for_unauthorized_supporter(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -2970,6 +4452,7 @@ def test_update_ticket_status_forbidden_for_unauthorized_supporter(
 def test_update_ticket_status_when_transition_forbidden(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2998,11 +4481,7 @@ def test_update_ticket_status_when_transition_forbidden(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3034,6 +4513,7 @@ def test_update_ticket_status_when_transition_forbidden(
 def test_update_ticket_status_when_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3062,11 +4542,7 @@ def test_update_ticket_status_when_account_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
+    override_get_current_account(None)
 
     monkeypatch.setattr(
         api_ticket,
@@ -3092,6 +4568,7 @@ def test_update_ticket_status_when_account_not_found(
 def test_update_ticket_status_when_account_is_suspended(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3120,11 +4597,7 @@ def test_update_ticket_status_when_account_is_suspended(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=5, name="テストサポート担当者1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=5, name="テストサポート担当者1", is_suspended=True))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3151,6 +4624,7 @@ def test_update_ticket_status_when_account_is_suspended(
 def test_update_ticket_visibility_success(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     success_session: "FakeSessionCommitSuccess",
     monkeypatch: pytest.MonkeyPatch,
@@ -3180,11 +4654,7 @@ def test_update_ticket_visibility_success(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3216,6 +4686,7 @@ def test_update_ticket_visibility_success(
 def test_update_ticket_visibility_error(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     error_session: "FakeSessionCommitError",
     monkeypatch: pytest.MonkeyPatch,
@@ -3245,11 +4716,7 @@ def test_update_ticket_visibility_error(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3275,6 +4742,7 @@ def test_update_ticket_visibility_error(
 def test_update_ticket_visibility_ticket_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3303,11 +4771,7 @@ def test_update_ticket_visibility_ticket_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3333,6 +4797,7 @@ def test_update_ticket_visibility_ticket_not_found(
 def test_update_ticket_visibility_when_staff_accesses_other_ticket(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3361,11 +4826,7 @@ def test_update_ticket_visibility_when_staff_accesses_other_ticket(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3391,6 +4852,7 @@ def test_update_ticket_visibility_when_staff_accesses_other_ticket(
 def test_update_ticket_visibility_when_same_setting(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3419,11 +4881,7 @@ def test_update_ticket_visibility_when_same_setting(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=False),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=False))
 
     monkeypatch.setattr(
         api_ticket,
@@ -3449,6 +4907,7 @@ def test_update_ticket_visibility_when_same_setting(
 def test_update_ticket_visibility_when_account_not_found(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3477,11 +4936,7 @@ def test_update_ticket_visibility_when_account_not_found(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: None,
-    )
+    override_get_current_account(None)
 
     monkeypatch.setattr(
         api_ticket,
@@ -3507,6 +4962,7 @@ def test_update_ticket_visibility_when_account_not_found(
 def test_update_ticket_visibility_when_account_is_suspended(
     test_client: TestClient,
     override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
     account_type: AccountType,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -3535,11 +4991,7 @@ def test_update_ticket_visibility_when_account_is_suspended(
         ),
     ]
 
-    monkeypatch.setattr(
-        api_ticket,
-        "get_user_by_id",
-        lambda _session, id: DummyUser(id=2, name="テスト社員1", is_suspended=True),
-    )
+    override_get_current_account(DummyUser(id=2, name="テスト社員1", is_suspended=True))
 
     monkeypatch.setattr(
         api_ticket,
@@ -0,0 +1,216 @@
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta
+
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.api.v1.ticket_async import router as ticket_async_router
+from helpdesk_app_backend.core.check_token import validate_access_token
+from helpdesk_app_backend.handlers.server_exception_handler import handler
+from helpdesk_app_backend.models.db.base import get_async_db
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+
+STAFF_ACCESS_TOKEN = AccessTokenPayload(
+    sub="staff1@example.com",
+    user_id=1,
+    account_type=AccountType.STAFF,
+    exp=1761905996,
+)
+
+
+# 【Fixture】非同期ハンドラーのみを登録したアプリの TestClient を提供
+# （DB_ASYNC_ENABLED=true の場合と同じく、非同期版のチケット参照系APIを呼び出す）
+# DBは SQLite（一時ファイル）を aiosqlite で参照する。テストデータは同期セッションで登録する
+@pytest.fixture
+def async_test_client(
+    sqlite_async_sessionmaker: tuple[Session, async_sessionmaker[AsyncSession]],
+) -> Iterator[tuple[TestClient, Session]]:
+    sync_session, async_session_factory = sqlite_async_sessionmaker
+
+    async def _sqlite_async_db() -> AsyncIterator[AsyncSession]:
+        async with async_session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(ticket_async_router, prefix="/api/v1/ticket")
+    app.add_exception_handler(Exception, handler)
+    app.dependency_overrides[get_async_db] = _sqlite_async_db
+    app.dependency_overrides[validate_access_token] = lambda: STAFF_ACCESS_TOKEN
+
+    sync_session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=2,
+                name="テスト社員2",
+                email="staff2@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+        ]
+    )
+    sync_session.add_all(
+        [
+            Ticket(
+                id=ticket_id,
+                title=f"テストチケット{ticket_id}",
+                is_public=ticket_id != 3,
+                description=f"テスト詳細{ticket_id}",
+                staff_id=1 if ticket_id != 3 else 2,
+                created_at=datetime(2020, 7, 21, 6, 12, 30) + timedelta(days=ticket_id),
+            )
+            for ticket_id in range(1, 4)
+        ]
+    )
+    sync_session.add_all(
+        [
+            TicketHistory(
+                id=history_id,
+                ticket_id=1,
+                action_user_id=1,
+                action_description=f"テスト対応内容{history_id}",
+                created_at=datetime(2020, 7, 22, 6, 12, 30) + timedelta(minutes=history_id),
+            )
+            for history_id in range(1, 4)
+        ]
+    )
+    sync_session.commit()
+
+    yield TestClient(app, raise_server_exceptions=False), sync_session
+
+
+# チケット一覧を取得できる（社員は自分のチケット または 公開チケットのみ）
+def test_get_tickets_async(async_test_client: tuple[TestClient, Session]) -> None:
+    test_client, _ = async_test_client
+
+    # 実行
+    first_page = test_client.get("/api/v1/ticket", params={"limit": 1})
+    second_page = test_client.get(
+        "/api/v1/ticket", params={"limit": 1, "cursor": first_page.json()["next_cursor"]}
+    )
+
+    # 検証
+    assert first_page.status_code == 200
+    assert [item["id"] for item in first_page.json()["items"]] == [2]
+    assert [item["id"] for item in second_page.json()["items"]] == [1]
+    assert second_page.json()["next_cursor"] is None
+    assert second_page.json()["items"][0]["staff"] == "テスト社員1"
+
+
+# チケット詳細を、直近の対応履歴と合わせて取得できる
+def test_get_ticket_detail_async(async_test_client: tuple[TestClient, Session]) -> None:
+    test_client, _ = async_test_client
+
+    # 実行
+    response = test_client.get("/api/v1/ticket/1")
+
+    # 検証
+    assert response.status_code == 200
+    assert response.json()["description"] == "テスト詳細1"
+    assert [history["id"] for history in response.json()["ticket_histories"]] == [1, 2, 3]
+    assert response.json()["ticket_histories"][0]["action_user"] == "テスト社員1"
+    assert response.json()["has_more_histories"] is False
+
+
+# 社員が他人の非公開チケットを取得しようとした場合、422 を返す
+def test_get_ticket_detail_async_forbidden(
+    async_test_client: tuple[TestClient, Session],
+) -> None:
+    test_client, _ = async_test_client
+
+    # 実行
+    response = test_client.get("/api/v1/ticket/3")
+
+    # 検証
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": "指定したチケットは存在しない、もしくは操作権限がありません"
+    }
+
+
+# 指定したIDより後の対応履歴のみ取得できる
+def test_get_ticket_histories_async(async_test_client: tuple[TestClient, Session]) -> None:
+    test_client, _ = async_test_client
+
+    # 実行
+    response = test_client.get("/api/v1/ticket/1/histories", params={"since_id": 1, "limit": 1})
+
+    # 検証
+    assert response.status_code == 200
+    assert [history["id"] for history in response.json()["items"]] == [2]
+    assert response.json()["latest_id"] == 2
+    assert response.json()["has_more"] is True
+
+
+# 停止中のアカウントの場合、401 を返す（アカウント情報も非同期で取得する）
+def test_get_tickets_async_suspended_account(
+    async_test_client: tuple[TestClient, Session],
+) -> None:
+    test_client, sync_session = async_test_client
+    sync_session.get(User, 1).is_suspended = True
+    sync_session.commit()
+
+    # 実行
+    response = test_client.get("/api/v1/ticket")
+
+    # 検証
+    assert response.status_code == 401
+    assert response.json() == {"detail": "このアカウント情報は不正です"}
+
+
+# ETag が一致する場合、チケット詳細・一覧とも 304 を返す
+def test_get_ticket_async_not_modified(async_test_client: tuple[TestClient, Session]) -> None:
+    test_client, _ = async_test_client
+    detail_etag = test_client.get("/api/v1/ticket/1").headers["ETag"]
+    list_etag = test_client.get("/api/v1/ticket").headers["ETag"]
+
+    # 実行
+    detail_response = test_client.get("/api/v1/ticket/1", headers={"If-None-Match": detail_etag})
+    list_response = test_client.get("/api/v1/ticket", headers={"If-None-Match": list_etag})
+
+    # 検証
+    assert detail_response.status_code == 304
+    assert detail_response.headers["ETag"] == detail_etag
+    assert list_response.status_code == 304
+    assert list_response.headers["ETag"] == list_etag
+
+
+# 指定した seq より後の変更のうち、閲覧可能なチケット・対応履歴のみ取得できる
+def test_get_ticket_changes_async(async_test_client: tuple[TestClient, Session]) -> None:
+    test_client, sync_session = async_test_client
+    sync_session.add_all(
+        [
+            TicketChange(id=1, ticket_id=1, change_type=TicketEventType.CREATED),
+            TicketChange(
+                id=2, ticket_id=1, ticket_history_id=3, change_type=TicketEventType.COMMENTED
+            ),
+            TicketChange(id=3, ticket_id=3, change_type=TicketEventType.CREATED),
+        ]
+    )
+    sync_session.commit()
+
+    # 実行
+    response = test_client.get("/api/v1/ticket/changes", params={"since": 1})
+
+    # 検証
+    assert response.status_code == 200
+    assert [ticket["id"] for ticket in response.json()["tickets"]] == [1]
+    assert [history["id"] for history in response.json()["ticket_histories"]] == [3]
+    assert response.json()["removed_ticket_ids"] == []
+    assert response.json()["latest_seq"] == 3
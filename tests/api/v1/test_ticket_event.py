@@ -0,0 +1,94 @@
+from collections.abc import Callable
+
+import pytest
+
+from fastapi.testclient import TestClient
+
+from helpdesk_app_backend.api.v1 import ticket_event as api_ticket_event
+from helpdesk_app_backend.api.v1.ticket_event import stream_ticket_events
+from helpdesk_app_backend.core.ticket_event_broker import ticket_event_broker
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+
+STAFF_ACCESS_TOKEN = AccessTokenPayload(
+    sub="staff1@example.com",
+    user_id=1,
+    account_type=AccountType.STAFF,
+    exp=1761905996,
+)
+
+
+# 接続時に再接続の待ち時間を送り、閲覧可能なチケットの通知のみ送る
+# 通知がない間はコメント行を送り、終了時に購読を終了する
+@pytest.mark.asyncio
+async def test_stream_ticket_events() -> None:
+    stream = stream_ticket_events(AccountType.STAFF, 1, heartbeat_seconds=0.01)
+    first_message = await anext(stream)
+    subscribers = ticket_event_broker.stats().subscribers
+
+    # 実行
+    for ticket_id, staff_id in [(1, 2), (2, 1)]:
+        ticket_event_broker.publish(
+            TicketEvent(
+                event_type=TicketEventType.COMMENTED,
+                change_seq=ticket_id,
+                ticket_id=ticket_id,
+                staff_id=staff_id,
+                is_public=False,
+                history_id=3,
+            )
+        )
+    event_message = await anext(stream)
+    heartbeat_message = await anext(stream)
+    await stream.aclose()
+
+    # 検証
+    assert first_message == b"retry: 3000\n\n"
+    assert event_message == (
+        b'id: 2\nevent: ticket\ndata: {"type":"commented","ticket_id":2,"history_id":3}\n\n'
+    )
+    assert heartbeat_message == b": ping\n\n"
+    assert ticket_event_broker.stats().subscribers == subscribers - 1
+
+
+# 停止中のアカウントの場合、401 を返す
+def test_get_ticket_events_is_suspended_account(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+) -> None:
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    override_get_current_account(
+        CurrentAccount(id=1, name="テスト社員1", account_type=AccountType.STAFF, is_suspended=True)
+    )
+
+    # 実行
+    response = test_client.get("/api/v1/ticket/events")
+
+    # 検証
+    assert response.status_code == 401
+    assert response.json() == {"detail": "このアカウント情報は不正です"}
+
+
+# 同時接続数の上限に達している場合、503 を返す
+def test_get_ticket_events_when_full(
+    test_client: TestClient,
+    override_validate_access_token: Callable[[AccessTokenPayload], None],
+    override_get_current_account: Callable[[object], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    override_validate_access_token(STAFF_ACCESS_TOKEN)
+    override_get_current_account(
+        CurrentAccount(id=1, name="テスト社員1", account_type=AccountType.STAFF, is_suspended=False)
+    )
+    monkeypatch.setattr(api_ticket_event.ticket_event_broker, "max_subscribers", 0)
+
+    # 実行
+    response = test_client.get("/api/v1/ticket/events")
+
+    # 検証
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
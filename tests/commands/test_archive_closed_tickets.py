@@ -0,0 +1,147 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.commands.archive_closed_tickets import archive_closed_tickets
+from helpdesk_app_backend.commands.reconcile_ticket_counts import reconcile_ticket_counts
+from helpdesk_app_backend.models.db.archived_ticket import ArchivedTicket
+from helpdesk_app_backend.models.db.archived_ticket_history import ArchivedTicketHistory
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_change import TicketChange
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketEventType, TicketStatusType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.repositories.ticket import get_ticket_list_version
+from helpdesk_app_backend.repositories.ticket_archive import restore_archived_tickets
+from helpdesk_app_backend.repositories.ticket_count import TicketCountKey, get_stored_ticket_counts
+
+CLOSED_BEFORE = datetime(2026, 4, 1, 0, 0, 0)
+
+
+# テスト用データ登録
+# チケット1・2 → 「クローズ」のまま CLOSED_BEFORE より前から更新なし（アーカイブの対象）
+# チケット3 → 「クローズ」だが CLOSED_BEFORE 以降に更新あり、チケット4 → 「対応中」（どちらも対象外）
+def register_test_data(session: Session) -> None:
+    session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=5,
+                name="テストサポート担当者1",
+                email="supporter1@example.com",
+                password="hashed",
+                account_type=AccountType.SUPPORTER,
+            ),
+        ]
+    )
+    for ticket_id, status, updated_at in [
+        (1, TicketStatusType.CLOSED, datetime(2026, 1, 10, 10, 0, 0)),
+        (2, TicketStatusType.CLOSED, datetime(2026, 2, 10, 10, 0, 0)),
+        (3, TicketStatusType.CLOSED, datetime(2026, 5, 10, 10, 0, 0)),
+        (4, TicketStatusType.IN_PROGRESS, datetime(2026, 1, 10, 10, 0, 0)),
+    ]:
+        session.add(
+            Ticket(
+                id=ticket_id,
+                title=f"テスト{ticket_id}",
+                is_public=ticket_id % 2 == 1,
+                status=status,
+                description="テスト詳細",
+                staff_id=1,
+                supporter_id=5,
+                created_at=datetime(2025, 12, 1, 10, 0, 0),
+                updated_at=updated_at,
+            )
+        )
+        session.add(
+            TicketHistory(
+                id=ticket_id,
+                ticket_id=ticket_id,
+                action_user_id=5,
+                action_description=f"チケット{ticket_id}の対応",
+                created_at=datetime(2025, 12, 2, 10, 0, 0),
+                updated_at=datetime(2025, 12, 2, 10, 0, 0),
+            )
+        )
+    session.commit()
+    reconcile_ticket_counts(session, dry_run=False)
+
+
+# 対象のチケットのみ、対応履歴とともにバッチごとにアーカイブへ移し、集計・変更履歴・一覧の版に反映する
+def test_archive_closed_tickets(sqlite_session: Session) -> None:
+    register_test_data(sqlite_session)
+    before_list_version = get_ticket_list_version(sqlite_session)
+
+    # 実行（1件ずつ移す）
+    archived_count = archive_closed_tickets(sqlite_session, CLOSED_BEFORE, batch_size=1)
+
+    # 検証
+    assert archived_count == 2
+    assert sqlite_session.scalars(select(Ticket.id).order_by(Ticket.id)).all() == [3, 4]
+    assert sqlite_session.scalars(select(TicketHistory.id).order_by(TicketHistory.id)).all() == [
+        3,
+        4,
+    ]
+    archived_ticket = sqlite_session.get(ArchivedTicket, 1)
+    assert archived_ticket.title == "テスト1"
+    assert archived_ticket.updated_at == datetime(2026, 1, 10, 10, 0, 0)
+    assert archived_ticket.archived_at is not None
+    assert sqlite_session.scalars(
+        select(ArchivedTicketHistory.ticket_id).order_by(ArchivedTicketHistory.id)
+    ).all() == [1, 2]
+
+    # 件数の集計からは除かれ、チケットから集計し直した件数と一致する
+    assert (
+        get_stored_ticket_counts(sqlite_session)[TicketCountKey(TicketStatusType.CLOSED, 5, True)]
+        == 1
+    )
+    assert reconcile_ticket_counts(sqlite_session, dry_run=True) == []
+
+    # 変更履歴に記録され、一覧の版が変わる
+    assert sqlite_session.execute(
+        select(TicketChange.ticket_id, TicketChange.change_type).order_by(TicketChange.id)
+    ).all() == [(1, TicketEventType.ARCHIVED), (2, TicketEventType.ARCHIVED)]
+    assert get_ticket_list_version(sqlite_session) != before_list_version
+
+
+# max_batches を指定した場合は、その回数分のみ移す
+def test_archive_closed_tickets_max_batches(sqlite_session: Session) -> None:
+    register_test_data(sqlite_session)
+
+    # 実行
+    archived_count = archive_closed_tickets(
+        sqlite_session, CLOSED_BEFORE, batch_size=1, max_batches=1
+    )
+
+    # 検証（更新日時の古いチケットから移す）
+    assert archived_count == 1
+    assert sqlite_session.scalars(select(ArchivedTicket.id)).all() == [1]
+
+
+# アーカイブから戻したチケットは、同じIDのまま対応履歴とともに tickets へ戻る
+def test_restore_archived_tickets(sqlite_session: Session) -> None:
+    register_test_data(sqlite_session)
+    archive_closed_tickets(sqlite_session, CLOSED_BEFORE, batch_size=10)
+
+    # 実行
+    restored_ids = restore_archived_tickets(sqlite_session, [2, 99])
+    sqlite_session.commit()
+
+    # 検証
+    assert restored_ids == [2]
+    assert sqlite_session.get(Ticket, 2).updated_at == datetime(2026, 2, 10, 10, 0, 0)
+    assert sqlite_session.scalars(
+        select(TicketHistory.id).where(TicketHistory.ticket_id == 2)
+    ).all() == [2]
+    assert sqlite_session.scalars(select(ArchivedTicket.id)).all() == [1]
+    assert sqlite_session.scalars(select(ArchivedTicketHistory.id)).all() == [1]
+    # 同じチケットを再度戻そうとした場合は、戻さない
+    assert restore_archived_tickets(sqlite_session, [2]) == []
@@ -0,0 +1,74 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.commands import maintain_ticket_history_partitions as command
+from helpdesk_app_backend.commands.maintain_ticket_history_partitions import (
+    maintain_ticket_history_partitions,
+)
+
+
+# MySQL に接続したセッションの代役（実行したSQL文を記録する）
+class FakeMySQLSession:
+    def __init__(self) -> None:
+        self.executed_statements: list[str] = []
+
+    def get_bind(self) -> SimpleNamespace:
+        return SimpleNamespace(dialect=SimpleNamespace(name="mysql"))
+
+    def execute(self, statement) -> None:  # noqa: ANN001
+        self.executed_statements.append(str(statement))
+
+    def commit(self) -> None:
+        self.executed_statements.append("COMMIT")
+
+
+# 先の月のパーティションを追加し、保持期間を過ぎた月のパーティションを入れ替えてから削除する
+# 削除する前に、変更履歴・対応履歴の検索用テーブルから、削除する対応履歴への参照を外す
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_maintain_ticket_history_partitions(monkeypatch: pytest.MonkeyPatch, dry_run: bool) -> None:
+    session = FakeMySQLSession()
+    monkeypatch.setattr(
+        command,
+        "get_ticket_history_partition_names",
+        lambda _: ["p202409", "p202410", "p202612", "p_future"],
+    )
+
+    # 実行
+    plan = maintain_ticket_history_partitions(
+        session,
+        today=date(2026, 10, 17),
+        months_ahead=3,
+        retention_months=24,
+        exchange=True,
+        dry_run=dry_run,
+    )
+
+    # 検証（dry_run=True の場合は変更しない）
+    assert plan.create_months == [date(2027, 1, 1)]
+    assert plan.expired_names == ["p202409"]
+    if dry_run:
+        assert session.executed_statements == []
+    else:
+        assert [statement.split(" (")[0] for statement in session.executed_statements] == [
+            "ALTER TABLE ticket_histories REORGANIZE PARTITION p_future INTO",
+            "UPDATE ticket_changes SET ticket_history_id = NULL WHERE ticket_history_id IN",
+            "DELETE FROM ticket_history_search WHERE ticket_history_id IN",
+            "COMMIT",
+            "CREATE TABLE ticket_histories_p202409 LIKE ticket_histories",
+            "ALTER TABLE ticket_histories_p202409 REMOVE PARTITIONING",
+            "ALTER TABLE ticket_histories EXCHANGE PARTITION p202409 WITH TABLE ticket_histories_p202409",
+            "ALTER TABLE ticket_histories DROP PARTITION p202409",
+        ]
+
+
+# パーティション分割に対応していないDB（SQLite 等）の場合はエラー
+def test_maintain_ticket_history_partitions_not_mysql(sqlite_session: Session) -> None:
+    # 検証
+    with pytest.raises(ValueError, match="対応していないDBです: sqlite"):
+        maintain_ticket_history_partitions(
+            sqlite_session, today=date(2026, 10, 17), months_ahead=3, retention_months=0
+        )
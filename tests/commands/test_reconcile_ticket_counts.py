@@ -0,0 +1,87 @@
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.commands.reconcile_ticket_counts import (
+    TicketCountDrift,
+    reconcile_ticket_counts,
+)
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.repositories.ticket_count import (
+    TicketCountKey,
+    add_ticket_counts,
+    get_stored_ticket_counts,
+)
+
+START_PUBLIC = TicketCountKey(TicketStatusType.START, 0, True)
+ASSIGNED_PRIVATE = TicketCountKey(TicketStatusType.ASSIGNED, 5, False)
+CLOSED_PUBLIC = TicketCountKey(TicketStatusType.CLOSED, 5, True)
+
+
+# テスト用データ登録（チケット3件。集計は「新規質問・公開」が1件多く、「担当者割り当て済み・非公開」がない状態）
+def register_test_data(session: Session) -> None:
+    session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            Ticket(id=1, title="テスト1", is_public=True, description="テスト詳細", staff_id=1),
+            Ticket(
+                id=2,
+                title="テスト2",
+                is_public=False,
+                status=TicketStatusType.ASSIGNED,
+                description="テスト詳細",
+                staff_id=1,
+                supporter_id=5,
+            ),
+            Ticket(
+                id=3,
+                title="テスト3",
+                is_public=True,
+                status=TicketStatusType.CLOSED,
+                description="テスト詳細",
+                staff_id=1,
+                supporter_id=5,
+            ),
+        ]
+    )
+    add_ticket_counts(session, {START_PUBLIC: 2, CLOSED_PUBLIC: 1})
+    session.commit()
+
+
+# dry_run=True の場合、ずれを返すのみで集計は変更しない
+def test_reconcile_ticket_counts_dry_run(sqlite_session: Session) -> None:
+    register_test_data(sqlite_session)
+
+    # 実行
+    drifts = reconcile_ticket_counts(sqlite_session, dry_run=True)
+
+    # 検証
+    assert drifts == [
+        TicketCountDrift(key=ASSIGNED_PRIVATE, stored=0, actual=1),
+        TicketCountDrift(key=START_PUBLIC, stored=2, actual=1),
+    ]
+    assert get_stored_ticket_counts(sqlite_session) == {START_PUBLIC: 2, CLOSED_PUBLIC: 1}
+
+
+# ずれがある場合はチケットから集計し直した件数で作り直し、作り直し後はずれがない
+def test_reconcile_ticket_counts(sqlite_session: Session) -> None:
+    register_test_data(sqlite_session)
+
+    # 実行
+    drifts = reconcile_ticket_counts(sqlite_session, dry_run=False)
+
+    # 検証
+    assert len(drifts) == 2
+    assert get_stored_ticket_counts(sqlite_session) == {
+        START_PUBLIC: 1,
+        ASSIGNED_PRIVATE: 1,
+        CLOSED_PUBLIC: 1,
+    }
+    assert reconcile_ticket_counts(sqlite_session, dry_run=False) == []
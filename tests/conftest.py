@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+# 全モデルを読み込み、Base.metadata にテーブル定義を登録する
+from helpdesk_app_backend.models.db import Base
+
+
+# 【Fixture】SQLite（インメモリ）のセッションを提供
+# 本番DB（MySQL）の代わりに、発行されるSQLを実際に実行して確認したいテストで使用する
+@pytest.fixture
+def sqlite_session() -> Iterator[Session]:
+    # StaticPool → 全接続で同じインメモリDBを共有する（接続ごとにDBが作り直されないようにする）
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+# 【Fixture】sqlite_session で発行されたSQL文を記録する
+# リクエスト1回あたりのSQL発行回数を検証し、N+1問題の再発を防ぐために使用する
+@pytest.fixture
+def executed_statements(sqlite_session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+    engine = sqlite_session.get_bind()
+
+    def _record_statement(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record_statement)
+
+    yield statements
+
+    event.remove(engine, "before_cursor_execute", _record_statement)
+
+
+# 【Fixture】SQLite（一時ファイル）の同期セッションと、同じDBを参照する非同期セッションの作成元を提供
+# 非同期版の処理を確認するテストで使用する（テストデータは同期セッションで登録する）
+# インメモリDBは接続ごとに別のDBになるため、aiosqlite と共有できるよう一時ファイルを使用する
+@pytest.fixture
+def sqlite_async_sessionmaker(
+    tmp_path: Path,
+) -> Iterator[tuple[Session, async_sessionmaker[AsyncSession]]]:
+    database_path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{database_path}")
+    Base.metadata.create_all(engine)
+
+    # NullPool → 接続を使い回さない（テストごとに異なるイベントループから接続されるため）
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield db, async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,81 @@
+import pytest
+
+import helpdesk_app_backend.core.access_token_cache as access_token_cache_module
+
+from helpdesk_app_backend.core.access_token_cache import AccessTokenCache
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+
+
+def create_payload(user_id: int, exp: int = 2000) -> AccessTokenPayload:
+    return AccessTokenPayload(
+        sub=f"user{user_id}@example.com",
+        user_id=user_id,
+        account_type=AccountType.STAFF,
+        exp=exp,
+    )
+
+
+# 【Fixture】現在時刻（UNIX時間）を 1000 に固定する
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(access_token_cache_module.time, "time", lambda: now[0])
+    return now
+
+
+# 登録したペイロードを取得でき、ヒット数・ミス数が記録される
+def test_access_token_cache_hit_and_miss() -> None:
+    cache = AccessTokenCache(max_size=2)
+
+    # 実行
+    missed = cache.get("token1")
+    cache.set("token1", create_payload(1))
+    hit = cache.get("token1")
+
+    # 検証
+    assert missed is None
+    assert hit == create_payload(1)
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+# 有効期限を過ぎたペイロードは破棄される（期限切れのものは登録もしない）
+def test_access_token_cache_expired(fixed_now: list[float]) -> None:
+    cache = AccessTokenCache(max_size=2)
+    cache.set("token1", create_payload(1, exp=1500))
+    cache.set("token2", create_payload(2, exp=900))
+
+    # 実行
+    fixed_now[0] = 1500.0
+
+    # 検証
+    assert cache.get("token1") is None
+    assert cache.get("token2") is None
+    assert cache.stats().size == 0
+
+
+# 上限を超えた場合、最も長く使われていないものから破棄される
+def test_access_token_cache_evicts_least_recently_used() -> None:
+    cache = AccessTokenCache(max_size=2)
+    cache.set("token1", create_payload(1))
+    cache.set("token2", create_payload(2))
+
+    # 実行（token1 を使用した後に token3 を登録する）
+    cache.get("token1")
+    cache.set("token3", create_payload(3))
+
+    # 検証
+    assert cache.get("token2") is None
+    assert cache.get("token1") == create_payload(1)
+    assert cache.get("token3") == create_payload(3)
+    assert cache.stats().size == 2
+
+
+# 上限が 0 の場合はキャッシュしない
+def test_access_token_cache_disabled() -> None:
+    cache = AccessTokenCache(max_size=0)
+    cache.set("token1", create_payload(1))
+
+    # 検証
+    assert cache.get("token1") is None
@@ -10,6 +10,12 @@ from helpdesk_app_backend.models.enum.user import AccountType
 from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
 
 
+# 【Fixture】テストごとに検証済みアクセストークンのキャッシュを空にする
+@pytest.fixture(autouse=True)
+def clear_access_token_cache() -> None:
+    check_token.access_token_cache.clear()
+
+
 # アクセストークンが有効
 def test_validate_access_token_success(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
@@ -65,3 +71,28 @@ def test_validate_access_token_invalid() -> None:
     # 検証
     with pytest.raises(UnauthorizedException, match="不正なアクセストークンです"):
         check_token.validate_access_token("wrong_token")
+
+
+# 検証済みのアクセストークンは、2回目以降はキャッシュから返す（署名検証・デコードを行わない）
+def test_validate_access_token_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded_tokens: list[str] = []
+
+    def _fake_verify_access_token(token: str) -> dict:
+        decoded_tokens.append(token)
+        return {
+            "sub": "test@example.com",
+            "account_type": AccountType.ADMIN,
+            "user_id": 1,
+            "exp": 4102444800,  # 2100/1/1
+        }
+
+    monkeypatch.setattr(check_token, "verify_access_token", _fake_verify_access_token)
+
+    # 実行
+    first = check_token.validate_access_token("dummy.jwt")
+    second = check_token.validate_access_token("dummy.jwt")
+
+    # 検証
+    assert first == second
+    assert decoded_tokens == ["dummy.jwt"]
+    assert check_token.access_token_cache.stats().hits == 1
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+
+import pytest
+
+import helpdesk_app_backend.core.current_account as current_account
+
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.current_account import CurrentAccount
+from helpdesk_app_backend.models.internal.token_payload import AccessTokenPayload
+
+
+@dataclass
+class DummyUser:
+    id: int
+    name: str
+    account_type: AccountType
+    is_suspended: bool
+
+
+ACCESS_TOKEN = AccessTokenPayload(
+    sub="test@example.com",
+    user_id=1,
+    account_type=AccountType.STAFF,
+    exp=1761905996,
+)
+
+
+# 【Fixture】get_user_by_id を差し替え、呼び出し回数を記録する
+@pytest.fixture
+def user_lookups(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    lookups: list[int] = []
+
+    def _fake_get_user_by_id(_session: object, id: int) -> DummyUser:
+        lookups.append(id)
+        return DummyUser(
+            id=id, name="テスト社員1", account_type=AccountType.STAFF, is_suspended=False
+        )
+
+    monkeypatch.setattr(current_account, "get_user_by_id", _fake_get_user_by_id)
+    # テストごとにキャッシュを空にする
+    monkeypatch.setattr(current_account, "_account_cache", {})
+    return lookups
+
+
+# アカウント情報を取得できる（キャッシュ無効の場合は毎回DBを参照する）
+def test_get_current_account_without_cache(
+    monkeypatch: pytest.MonkeyPatch, user_lookups: list[int]
+) -> None:
+    monkeypatch.setattr(current_account, "ACCOUNT_CACHE_TTL_SECONDS", 0)
+
+    # 実行
+    first = current_account.get_current_account(None, ACCESS_TOKEN)
+    second = current_account.get_current_account(None, ACCESS_TOKEN)
+
+    # 検証
+    assert (
+        first
+        == second
+        == CurrentAccount(
+            id=1, name="テスト社員1", account_type=AccountType.STAFF, is_suspended=False
+        )
+    )
+    assert user_lookups == [1, 1]
+
+
+# アカウントが存在しない場合は None を返す
+def test_get_current_account_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(current_account, "get_user_by_id", lambda _session, id: None)
+
+    # 検証
+    assert current_account.get_current_account(None, ACCESS_TOKEN) is None
+
+
+# キャッシュ有効の場合、有効期限内はDBを参照せずキャッシュから返す
+def test_get_current_account_with_cache(
+    monkeypatch: pytest.MonkeyPatch, user_lookups: list[int]
+) -> None:
+    monkeypatch.setattr(current_account, "ACCOUNT_CACHE_TTL_SECONDS", 30)
+    now = [1000.0]
+    monkeypatch.setattr(current_account.time, "monotonic", lambda: now[0])
+
+    # 実行・検証（2回目はキャッシュから返す）
+    current_account.get_current_account(None, ACCESS_TOKEN)
+    current_account.get_current_account(None, ACCESS_TOKEN)
+    assert user_lookups == [1]
+
+    # 実行・検証（有効期限切れの場合はDBを参照する）
+    now[0] += 30
+    current_account.get_current_account(None, ACCESS_TOKEN)
+    assert user_lookups == [1, 1]
+
+
+# キャッシュを破棄すると、次回はDBを参照する
+def test_invalidate_current_account_cache(
+    monkeypatch: pytest.MonkeyPatch, user_lookups: list[int]
+) -> None:
+    monkeypatch.setattr(current_account, "ACCOUNT_CACHE_TTL_SECONDS", 30)
+
+    # 実行
+    current_account.get_current_account(None, ACCESS_TOKEN)
+    current_account.invalidate_current_account_cache(1)
+    current_account.get_current_account(None, ACCESS_TOKEN)
+
+    # 検証
+    assert user_lookups == [1, 1]
@@ -0,0 +1,39 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import Engine, create_engine, text
+
+from helpdesk_app_backend.core.database_pool import WaitTimeRecordingQueuePool
+
+
+# 【Fixture】WaitTimeRecordingQueuePool を使用する SQLite（一時ファイル）のエンジン
+@pytest.fixture
+def recording_engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=WaitTimeRecordingQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    yield engine
+    engine.dispose()
+
+
+# 接続を取り出すたびに待ち時間が記録され、使用中・超過分の接続数を確認できる
+def test_wait_time_recording_queue_pool(recording_engine: Engine) -> None:
+    pool = recording_engine.pool
+
+    # 実行（pool_size=1 を超えて2つ目の接続を取り出す）
+    with recording_engine.connect() as first, recording_engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+
+        # 検証
+        assert pool.checkedout() == 2
+        assert pool.overflow() == 1
+
+    assert pool.checkedout() == 0
+    assert pool.wait_stats.count == 2
+    assert pool.wait_stats.total_seconds >= pool.wait_stats.max_seconds >= 0
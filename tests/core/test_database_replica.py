@@ -0,0 +1,140 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from helpdesk_app_backend.core import database_replica
+from helpdesk_app_backend.core.database_replica import ReplicaRouter, retry_reads_on_primary
+from helpdesk_app_backend.models.db import base
+
+
+# 【Fixture】レプリカの代わりの SQLite（一時ファイル）のエンジン2台と、接続できないエンジン1台
+@pytest.fixture
+def replica_engines(tmp_path: Path) -> Iterator[list[Engine]]:
+    engines = [
+        create_engine(f"sqlite:///{tmp_path / 'replica1.db'}"),
+        create_engine(f"sqlite:///{tmp_path / 'replica2.db'}"),
+        create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica3.db'}"),
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+# 接続できるレプリカへ順番に振り分け、接続できないレプリカには振り分けない
+def test_replica_router_choose(replica_engines: list[Engine]) -> None:
+    replica_router = ReplicaRouter(replica_engines, max_lag_seconds=5, check_interval_seconds=60)
+
+    # 実行
+    chosen_indexes = [replica_router.choose() for _ in range(4)]
+
+    # 検証
+    assert chosen_indexes == [0, 1, 0, 1]
+    assert [replica.available for replica in replica_router.replicas] == [True, True, False]
+    assert replica_router.replicas[2].lag_seconds is None
+
+
+# 遅延が許容秒数を超えたレプリカには振り分けず、使えるレプリカがない場合は None（プライマリで処理する）
+# 状態は check_interval_seconds ごとに確認し直す
+def test_replica_router_choose_lagging(
+    replica_engines: list[Engine], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replica_router = ReplicaRouter(
+        replica_engines[:1], max_lag_seconds=5, check_interval_seconds=60
+    )
+    monkeypatch.setattr(database_replica, "get_replica_lag_seconds", lambda _: 6.0)
+
+    # 実行・検証
+    assert replica_router.choose() is None
+    assert replica_router.replicas[0].lag_seconds == 6.0
+
+    # 確認の間隔内は、遅延が解消しても前回の確認結果で振り分ける
+    monkeypatch.setattr(database_replica, "get_replica_lag_seconds", lambda _: 1.0)
+    assert replica_router.choose() is None
+
+    replica_router.check_interval_seconds = 0
+    assert replica_router.choose() == 0
+
+
+# refresh=False の場合は状態を確認せず（接続せず）、前回の確認結果で振り分ける
+def test_replica_router_choose_without_refresh(replica_engines: list[Engine]) -> None:
+    replica_router = ReplicaRouter(replica_engines, max_lag_seconds=5, check_interval_seconds=60)
+
+    # 実行・検証（未確認のため、使えるレプリカはない）
+    assert replica_router.choose(refresh=False) is None
+
+    replica_router.refresh_if_stale()
+    assert replica_router.choose(refresh=False) == 0
+
+
+# レプリカとの接続が切れて失敗した読み取りは、プライマリで実行し直し、以降の読み取りもプライマリで行う
+# 接続が切れた以外のエラーは、実行し直さない
+def test_retry_reads_on_primary(replica_engines: list[Engine]) -> None:
+    primary_engine, replica_engine = replica_engines[:2]
+    with primary_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (name TEXT)"))
+        connection.execute(text("INSERT INTO items VALUES ('プライマリ')"))
+    disconnected = [True]
+
+    # レプリカでのエラーを、接続が切れたエラーとして扱わせる
+    @event.listens_for(replica_engine, "handle_error")
+    def handle_error(context: ExceptionContext) -> None:
+        context.is_disconnect = disconnected[0]
+
+    replica_session = sessionmaker(bind=replica_engine)
+    retry_reads_on_primary(replica_session, primary_engine)
+
+    # 実行・検証
+    with replica_session() as session:
+        assert session.execute(text("SELECT name FROM items")).scalar_one() == "プライマリ"
+        assert session.info["use_primary"] is True
+        assert session.execute(text("SELECT count(*) FROM items")).scalar_one() == 1
+
+    disconnected[0] = False
+    with replica_session() as session, pytest.raises(OperationalError):
+        session.execute(text("SELECT name FROM items"))
+
+
+# レプリカを使える場合はレプリカのセッション、書き込み直後（Cookie の期限内）・使えるレプリカがない場合はプライマリのセッション
+@pytest.mark.parametrize(
+    ("db_primary_until", "replica_available", "expected"),
+    [
+        (None, True, "replica"),
+        ("9999999999", True, "primary"),
+        ("1", True, "replica"),
+        (None, False, "primary"),
+    ],
+)
+def test_get_read_db(
+    replica_engines: list[Engine],
+    monkeypatch: pytest.MonkeyPatch,
+    db_primary_until: str | None,
+    replica_available: bool,
+    expected: str,
+) -> None:
+    replica_router = ReplicaRouter(
+        replica_engines[:1] if replica_available else replica_engines[2:],
+        max_lag_seconds=5,
+        check_interval_seconds=60,
+    )
+    replica_session = sessionmaker(bind=replica_engines[0])
+    monkeypatch.setattr(base, "replica_router", replica_router)
+    monkeypatch.setattr(base, "replica_sessions", [replica_session])
+    primary_session = Session()
+
+    # 実行
+    read_db = base.get_read_db(primary_session, db_primary_until)
+    session = next(read_db)
+
+    # 検証
+    if expected == "primary":
+        assert session is primary_session
+    else:
+        assert session is not primary_session
+        assert session.get_bind() is replica_engines[0]
+    read_db.close()
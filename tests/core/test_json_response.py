@@ -0,0 +1,49 @@
+import json
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from pydantic_core import to_jsonable_python
+
+from helpdesk_app_backend.core.json_response import FastJSONResponse
+from helpdesk_app_backend.main import app
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.models.response.v1.ticket import GetTicketResponseItem
+
+
+# 標準ライブラリの json（FastAPI 標準の JSONResponse と同じ設定）で変換した結果
+def dumps_with_standard_json(content: object) -> bytes:
+    return json.dumps(
+        to_jsonable_python(content), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+# 全APIのデフォルトのレスポンスクラスとして設定されている
+def test_default_response_class() -> None:
+    # 検証
+    assert app.router.default_response_class is FastJSONResponse
+
+
+# 日時・TicketStatusType・レスポンスモデル・日本語を、標準の json と同じ内容に変換できる
+def test_fast_json_response_render() -> None:
+    content = {
+        "naive": datetime(2020, 7, 21, 6, 12, 30),
+        "microsecond": datetime(2020, 7, 21, 6, 12, 30, 123456),
+        "utc": datetime(2020, 7, 21, 6, 12, 30, tzinfo=UTC),
+        "jst": datetime(2020, 7, 21, 6, 12, 30, tzinfo=timezone(timedelta(hours=9))),
+        "status": TicketStatusType.IN_PROGRESS,
+        "item": GetTicketResponseItem(
+            id=1,
+            title="テストチケット1",
+            is_public=True,
+            status=TicketStatusType.START,
+            staff="テスト社員1",
+            supporter=None,
+            created_at=datetime(2020, 7, 21, 6, 12, 30),
+        ),
+    }
+
+    # 実行
+    rendered = FastJSONResponse(content).body
+
+    # 検証
+    assert rendered == dumps_with_standard_json(content)
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+import pytest
+
+from helpdesk_app_backend.core.password_hash_executor import PasswordHashExecutor
+from helpdesk_app_backend.exceptions.service_unavailable_exception import (
+    ServiceUnavailableException,
+)
+from helpdesk_app_backend.logic.business.security import trans_password_hash, verify_password
+
+
+# 別プロセスでハッシュ化・照合を実行できる
+@pytest.mark.asyncio
+async def test_password_hash_executor_run() -> None:
+    executor = PasswordHashExecutor(max_workers=1, max_pending=2)
+    try:
+        hashed_password = await executor.run(trans_password_hash, "testP@ssw0rd")
+        is_valid = await executor.run(verify_password, "testP@ssw0rd", hashed_password)
+    finally:
+        executor.shutdown()
+
+    # 検証
+    assert is_valid is True
+    assert executor.stats().completed == 2
+    assert executor.stats().pending == 0
+
+
+# 受付上限を超えた場合は待たずに 503 を返し、断った件数を記録する
+@pytest.mark.asyncio
+async def test_password_hash_executor_back_pressure() -> None:
+    executor = PasswordHashExecutor(max_workers=1, max_pending=1)
+    try:
+        running = asyncio.ensure_future(executor.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+
+        # 検証（処理中の1件で受付上限に達している）
+        assert executor.stats().pending == 1
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await executor.run(time.sleep, 0)
+
+        await running
+    finally:
+        executor.shutdown()
+
+    # 検証
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+    assert executor.stats().rejected == 1
+    assert executor.stats().completed == 1
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from helpdesk_app_backend.core.primary_pinning import (
+    PRIMARY_PINNED_COOKIE_NAME,
+    PrimaryPinningMiddleware,
+    is_primary_pinned,
+)
+
+
+# Cookie の期限内の場合のみ、プライマリへ固定する（値が不正な場合は固定しない）
+@pytest.mark.parametrize(
+    ("pinned_until", "expected"),
+    [
+        (None, False),
+        (str(time.time() + 60), True),
+        (str(time.time() - 1), False),
+        ("invalid", False),
+    ],
+)
+def test_is_primary_pinned(pinned_until: str | None, expected: bool) -> None:
+    # 検証
+    assert is_primary_pinned(pinned_until) is expected
+
+
+# 書き込みに成功したレスポンスにのみ、プライマリへ固定する期限の Cookie を付与する
+def test_primary_pinning_middleware() -> None:
+    app = FastAPI()
+    app.add_middleware(PrimaryPinningMiddleware, pin_seconds=15)
+
+    @app.get("/items")
+    def get_items() -> list[int]:
+        return []
+
+    @app.post("/items")
+    def create_item() -> int:
+        return 1
+
+    @app.put("/items")
+    def update_item() -> int:
+        raise HTTPException(status_code=422)
+
+    test_client = TestClient(app)
+
+    # 実行
+    get_response = test_client.get("/items")
+    post_response = test_client.post("/items")
+    failed_response = test_client.put("/items")
+
+    # 検証
+    assert PRIMARY_PINNED_COOKIE_NAME not in get_response.cookies
+    assert PRIMARY_PINNED_COOKIE_NAME not in failed_response.cookies
+    pinned_until = post_response.cookies[PRIMARY_PINNED_COOKIE_NAME]
+    assert is_primary_pinned(pinned_until)
+    assert float(pinned_until) <= time.time() + 15
+    assert "Max-Age=16" in post_response.headers["set-cookie"]
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+
+import pytest
+
+from helpdesk_app_backend.core.ticket_event_backend import (
+    LocalTicketEventBackend,
+    create_ticket_event_backend,
+)
+from helpdesk_app_backend.core.ticket_event_broker import TicketEventBroker
+from helpdesk_app_backend.models.enum.ticket import TicketEventType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.ticket_event import TicketEvent
+
+
+def make_event(ticket_id: int, staff_id: int, is_public: bool) -> TicketEvent:
+    return TicketEvent(
+        event_type=TicketEventType.COMMENTED,
+        change_seq=ticket_id,
+        ticket_id=ticket_id,
+        staff_id=staff_id,
+        is_public=is_public,
+        history_id=ticket_id * 10,
+    )
+
+
+# 失敗する配信経路（送信失敗時の動作確認用）
+class FailingTicketEventBackend(LocalTicketEventBackend):
+    def publish(self, event: TicketEvent) -> None:
+        raise ConnectionError
+
+
+# 社員には自分のチケット または 公開チケットの通知のみ、それ以外のアカウントには全ての通知を配信する
+# 書き込み系APIと同じく、イベントループ外のスレッドから発行しても配信される
+@pytest.mark.asyncio
+async def test_ticket_event_broker_delivers_visible_events() -> None:
+    broker = TicketEventBroker(LocalTicketEventBackend(), queue_size=10, max_subscribers=10)
+    staff_subscription = broker.subscribe(AccountType.STAFF, 1)
+    supporter_subscription = broker.subscribe(AccountType.SUPPORTER, 5)
+    events = [make_event(1, 1, False), make_event(2, 2, False), make_event(3, 2, True)]
+
+    # 実行
+    publisher = threading.Thread(target=lambda: [broker.publish(event) for event in events])
+    publisher.start()
+    publisher.join()
+    await asyncio.sleep(0)
+
+    # 検証
+    staff_events = [staff_subscription.queue.get_nowait() for _ in range(2)]
+    supporter_events = [supporter_subscription.queue.get_nowait() for _ in range(3)]
+    assert [event.ticket_id for event in staff_events] == [1, 3]
+    assert staff_subscription.queue.empty()
+    assert [event.ticket_id for event in supporter_events] == [1, 2, 3]
+    assert broker.stats().published == 3
+    assert broker.stats().delivered == 5
+
+
+# 配信待ちが上限を超えた接続には再取得の印（None）を送り、以降は配信しない
+@pytest.mark.asyncio
+async def test_ticket_event_broker_overflow() -> None:
+    broker = TicketEventBroker(LocalTicketEventBackend(), queue_size=2, max_subscribers=10)
+    subscription = broker.subscribe(AccountType.ADMIN, 3)
+
+    # 実行
+    for ticket_id in range(1, 5):
+        broker.publish(make_event(ticket_id, 1, True))
+    await asyncio.sleep(0)
+
+    # 検証
+    queued = [subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())]
+    assert [event.ticket_id if event else None for event in queued] == [1, 2, None]
+    assert broker.stats().subscribers == 0
+    assert broker.stats().overflowed == 1
+
+
+# 接続数の上限と、購読の終了
+@pytest.mark.asyncio
+async def test_ticket_event_broker_subscribers() -> None:
+    broker = TicketEventBroker(LocalTicketEventBackend(), queue_size=2, max_subscribers=1)
+
+    # 実行
+    subscription = broker.subscribe(AccountType.ADMIN, 3)
+    is_full = broker.is_full()
+    broker.unsubscribe(subscription)
+
+    # 検証
+    assert is_full is True
+    assert broker.is_full() is False
+
+
+# 配信経路への送信に失敗しても例外を投げず、失敗件数を記録する
+def test_ticket_event_broker_publish_failed() -> None:
+    broker = TicketEventBroker(FailingTicketEventBackend(), queue_size=2, max_subscribers=1)
+
+    # 実行
+    broker.publish(make_event(1, 1, True))
+
+    # 検証
+    assert broker.stats().failed == 1
+
+
+# 不明な配信経路を指定した場合
+def test_create_ticket_event_backend_unknown() -> None:
+    with pytest.raises(ValueError):
+        create_ticket_event_backend("unknown")
@@ -0,0 +1,62 @@
+import pytest
+
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.core import ticket_search_backend
+from helpdesk_app_backend.core.ticket_search_backend import InvertedIndexTicketSearchBackend
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.user import AccountType
+
+
+# プロセス内の索引で検索する場合、関連度の高い順に一定件数ずつ閲覧可否を確認し、1ページ分そろった時点で終える
+# （閲覧できないチケットが続く場合は、確認する件数を倍に増やして続きを確認する）
+def test_inverted_index_search_pages_visibility_checks(
+    sqlite_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sqlite_session.add_all(
+        [
+            User(
+                id=account_id,
+                name=f"テスト社員{account_id}",
+                email=f"staff{account_id}@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            )
+            for account_id in [1, 2]
+        ]
+    )
+    # チケットIDの大きい順に並ぶ（関連度が同じ場合）。社員1が閲覧できるのは 10・5・4・3・2・1 のみ
+    sqlite_session.add_all(
+        [
+            Ticket(
+                id=ticket_id,
+                title="VPNに接続できない",
+                is_public=ticket_id <= 5 or ticket_id == 10,
+                description="テスト詳細",
+                staff_id=2,
+            )
+            for ticket_id in range(1, 11)
+        ]
+    )
+    sqlite_session.commit()
+    monkeypatch.setattr(ticket_search_backend, "TICKET_SEARCH_VISIBILITY_BATCH_SIZE", 2)
+    checked_batches: list[list[int]] = []
+    get_visible_rows = ticket_search_backend.get_visible_ticket_list_rows_by_ids
+
+    def record_visible_rows(session: Session, ids: list[int], **kwargs: object) -> list:
+        checked_batches.append(ids)
+        return get_visible_rows(session, ids=ids, **kwargs)
+
+    monkeypatch.setattr(
+        ticket_search_backend, "get_visible_ticket_list_rows_by_ids", record_visible_rows
+    )
+
+    # 実行
+    ticket_rows = InvertedIndexTicketSearchBackend().search(
+        sqlite_session, "VPN", user_id=1, account_type=AccountType.STAFF, limit=2, offset=1
+    )
+
+    # 検証（2件目・3件目の閲覧可能なチケット。offset + limit の3件 → 6件の順に確認し、残りのIDは確認しない）
+    assert [ticket_row.id for ticket_row in ticket_rows] == [5, 4]
+    assert checked_batches == [[10, 9, 8], [7, 6, 5, 4, 3, 2]]
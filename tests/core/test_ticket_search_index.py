@@ -0,0 +1,38 @@
+from helpdesk_app_backend.core.ticket_search_index import TicketSearchIndex, to_ngrams
+
+
+# 2文字ずつの語に分割する（空白・記号をまたがない。全角/半角・大文字/小文字を区別しない）
+def test_to_ngrams() -> None:
+    assert to_ngrams("ログイン不可") == ["ログ", "グイ", "イン", "ン不", "不可"]
+    assert to_ngrams("ＶＰＮ 接続、A") == ["vp", "pn", "接続", "a"]
+    assert to_ngrams("") == []
+
+
+# キーワードの語を多く・繰り返し含むチケットほど上位に返す
+def test_ticket_search_index_ranking() -> None:
+    index = TicketSearchIndex()
+    index.set_ticket(1, "プリンターの不具合", "印刷できない")
+    index.set_ticket(2, "VPNに接続できない", "自宅からVPNに接続できない")
+    index.set_ticket(3, "パスワード変更", "手順を知りたい")
+    index.add_history(1, 3, "VPN接続後に変更できました")
+
+    # 実行・検証
+    assert index.search("VPN 接続") == [2, 3]
+    assert index.search("メール") == []
+
+
+# タイトル・詳細の差し替えと、同じ対応履歴の二重登録
+def test_ticket_search_index_update() -> None:
+    index = TicketSearchIndex()
+    index.set_ticket(1, "プリンターの不具合", "印刷できない")
+    index.add_history(1, 1, "ドライバーを再インストール")
+    index.add_history(1, 1, "ドライバーを再インストール")
+
+    # 実行
+    index.set_ticket(1, "スキャナーの不具合", "読み取れない")
+
+    # 検証
+    assert index.search("プリンター") == []
+    assert index.search("スキャナー") == [1]
+    assert index.search("ドライバー") == [1]
+    assert index._postings["ドラ"] == {1: 1}
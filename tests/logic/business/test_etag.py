@@ -0,0 +1,68 @@
+import pytest
+
+from helpdesk_app_backend.logic.business.etag import (
+    is_etag_matched,
+    is_if_match_satisfied,
+    make_etag,
+    make_version_etag,
+    make_versioned_etag,
+)
+
+
+# 同じ値からは同じ ETag、異なる値からは異なる ETag が作成される
+def test_make_etag() -> None:
+    etag = make_etag("ticket", 1, "2020-07-21T06:12:30", 5)
+
+    # 検証
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert etag == make_etag("ticket", 1, "2020-07-21T06:12:30", 5)
+    assert etag != make_etag("ticket", 1, "2020-07-21T06:12:30", 6)
+    assert make_etag(None, 1) != make_etag(1, None)
+
+
+# If-None-Match との比較（複数指定・W/ の有無・「*」）
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('W/"xyz", W/"abc"', True),
+        ("*", True),
+        ('W/"xyz"', False),
+    ],
+)
+def test_is_etag_matched(if_none_match: str | None, expected: bool) -> None:
+    # 検証
+    assert is_etag_matched(if_none_match, 'W/"abc"') is expected
+
+
+# 版とハッシュ値から作成した ETag は、強い ETag で、先頭が版になる
+def test_make_versioned_etag() -> None:
+    etag = make_versioned_etag(3, "ticket", 1, None)
+
+    # 検証
+    assert etag.startswith('"3.') and etag.endswith('"')
+    assert etag == make_versioned_etag(3, "ticket", 1, None)
+    assert etag != make_versioned_etag(3, "ticket", 1, 5)
+
+
+# If-Match との比較（更新後・参照時の ETag のどちらも版のみ比較する。強い比較のため W/ 付きは一致しない。
+# 指定なし・「*」は版を確認しない）
+@pytest.mark.parametrize(
+    ("if_match", "expected"),
+    [
+        (None, True),
+        (make_version_etag(3), True),
+        ('"2", "3"', True),
+        (make_versioned_etag(3, "ticket", 1), True),
+        ("*", True),
+        ('"2"', False),
+        (make_versioned_etag(2, "ticket", 1), False),
+        ('W/"3"', False),
+        ("3", False),
+    ],
+)
+def test_is_if_match_satisfied(if_match: str | None, expected: bool) -> None:
+    # 検証
+    assert is_if_match_satisfied(if_match, 3) is expected
@@ -0,0 +1,62 @@
+import gzip
+
+from datetime import datetime
+
+import orjson
+
+from helpdesk_app_backend.logic.business.export_encoder import encode_export_chunks
+from helpdesk_app_backend.models.enum.ticket import TicketExportFormat, TicketStatusType
+
+COLUMNS = ["id", "title", "status", "supporter_id", "created_at"]
+ROW_CHUNKS = [
+    [(1, "テスト, 1", TicketStatusType.START, None, datetime(2026, 9, 1, 10, 0, 0))],
+    [(2, 'テスト"2"', TicketStatusType.CLOSED, 5, datetime(2026, 9, 2, 10, 0, 0))],
+]
+
+
+# CSV：1行目は列名、Enum は値・日時は ISO 8601・None は空文字で出力される（区切り文字・引用符はエスケープされる）
+def test_encode_export_chunks_csv() -> None:
+    chunks = list(encode_export_chunks(COLUMNS, ROW_CHUNKS, TicketExportFormat.CSV, False))
+
+    # 検証（列名 + チャンクごとに1つずつ返される）
+    assert len(chunks) == 3
+    assert b"".join(chunks).decode() == (
+        "id,title,status,supporter_id,created_at\n"
+        '1,"テスト, 1",start,,2026-09-01T10:00:00\n'
+        '2,"テスト""2""",closed,5,2026-09-02T10:00:00\n'
+    )
+
+
+# NDJSON：1行に1件のJSON
+def test_encode_export_chunks_ndjson() -> None:
+    chunks = list(encode_export_chunks(COLUMNS, ROW_CHUNKS, TicketExportFormat.NDJSON, False))
+
+    # 検証
+    assert len(chunks) == 2
+    assert [orjson.loads(line) for line in b"".join(chunks).splitlines()] == [
+        {
+            "id": 1,
+            "title": "テスト, 1",
+            "status": "start",
+            "supporter_id": None,
+            "created_at": "2026-09-01T10:00:00",
+        },
+        {
+            "id": 2,
+            "title": 'テスト"2"',
+            "status": "closed",
+            "supporter_id": 5,
+            "created_at": "2026-09-02T10:00:00",
+        },
+    ]
+
+
+# gzip 圧縮：展開すると圧縮しない場合と同じ内容になる（行がない場合も、展開できる形式で返す）
+def test_encode_export_chunks_gzip() -> None:
+    plain = b"".join(encode_export_chunks(COLUMNS, ROW_CHUNKS, TicketExportFormat.CSV, False))
+    compressed = b"".join(encode_export_chunks(COLUMNS, ROW_CHUNKS, TicketExportFormat.CSV, True))
+    empty = b"".join(encode_export_chunks(COLUMNS, [], TicketExportFormat.NDJSON, True))
+
+    # 検証
+    assert gzip.decompress(compressed) == plain
+    assert gzip.decompress(empty) == b""
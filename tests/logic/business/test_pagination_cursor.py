@@ -0,0 +1,43 @@
+from datetime import datetime
+
+import pytest
+
+from helpdesk_app_backend.logic.business.pagination_cursor import (
+    CursorConditionMismatchError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+# エンコードしたカーソルをデコードすると元の (created_at, id) に戻る
+def test_encode_and_decode_cursor() -> None:
+    created_at = datetime(2020, 7, 21, 6, 12, 30, 551)
+
+    cursor = encode_cursor(created_at, 10, "-created_at", '{"is_public":true}')
+
+    # 検証
+    assert "=" not in cursor  # URLのクエリにそのまま載せられる
+    assert decode_cursor(cursor, "-created_at", '{"is_public":true}') == (created_at, 10)
+
+
+# 不正なカーソルの場合 ValueError を返す
+@pytest.mark.parametrize("cursor", ["wrong_cursor", "", "e30", "W10"])  # e30 → 「{}」、W10 → 「[]」
+def test_decode_cursor_invalid(cursor: str) -> None:
+    # 検証
+    with pytest.raises(ValueError, match="不正なカーソルです"):
+        decode_cursor(cursor, "-created_at", "{}")
+
+
+# 作成したときと並び順・絞り込み条件が異なる場合 CursorConditionMismatchError を返す
+@pytest.mark.parametrize(
+    ("sort", "filters"),
+    [("-updated_at", '{"is_public":true}'), ("-created_at", '{"is_public":false}')],
+)
+def test_decode_cursor_condition_mismatch(sort: str, filters: str) -> None:
+    cursor = encode_cursor(
+        datetime(2020, 7, 21, 6, 12, 30), 10, "-created_at", '{"is_public":true}'
+    )
+
+    # 検証
+    with pytest.raises(CursorConditionMismatchError):
+        decode_cursor(cursor, sort, filters)
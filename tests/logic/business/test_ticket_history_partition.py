@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+from helpdesk_app_backend.logic.business.ticket_history_partition import (
+    add_months,
+    plan_ticket_history_partitions,
+    to_partition_month,
+    to_partition_name,
+)
+
+
+# 年をまたぐ場合も、月の初日を返す
+@pytest.mark.parametrize(
+    ("month", "months", "expected"),
+    [
+        (date(2026, 10, 1), 3, date(2027, 1, 1)),
+        (date(2026, 1, 1), -1, date(2025, 12, 1)),
+        (date(2026, 10, 1), -24, date(2024, 10, 1)),
+    ],
+)
+def test_add_months(month: date, months: int, expected: date) -> None:
+    # 検証
+    assert add_months(month, months) == expected
+
+
+# パーティション名と月の変換（月ごとのパーティションでない場合は None）
+def test_to_partition_name_and_month() -> None:
+    # 検証
+    assert to_partition_name(date(2026, 1, 1)) == "p202601"
+    assert to_partition_month("p202601") == date(2026, 1, 1)
+    assert to_partition_month("p_future") is None
+
+
+# 作成済みの最後の月の翌月から months_ahead か月後まで作成し、保持期間を過ぎた月を削除する
+def test_plan_ticket_history_partitions() -> None:
+    partition_names = ["p202409", "p202410", "p202411", "p202610", "p202611", "p_future"]
+
+    # 実行
+    plan = plan_ticket_history_partitions(
+        partition_names, today=date(2026, 10, 17), months_ahead=3, retention_months=24
+    )
+
+    # 検証（2024年10月の月末 → 2024年11月1日のため、保持期間の開始日（2024年10月1日）より後となり残す）
+    assert plan.create_months == [date(2026, 12, 1), date(2027, 1, 1)]
+    assert plan.expired_names == ["p202409"]
+
+
+# 作成済みの月が先まである場合は作成しない、retention_months=0 の場合は削除しない
+def test_plan_ticket_history_partitions_nothing_to_do() -> None:
+    partition_names = ["p202001", "p202701", "p_future"]
+
+    # 実行
+    plan = plan_ticket_history_partitions(
+        partition_names, today=date(2026, 10, 17), months_ahead=3, retention_months=0
+    )
+
+    # 検証
+    assert plan.create_months == []
+    assert plan.expired_names == []
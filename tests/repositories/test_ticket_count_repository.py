@@ -0,0 +1,38 @@
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.enum.ticket import TicketStatusType
+from helpdesk_app_backend.repositories.ticket_count import (
+    TicketCountKey,
+    add_ticket_counts,
+    build_ticket_count_upsert,
+    get_stored_ticket_counts,
+    to_ticket_count_key,
+)
+
+START_PUBLIC = to_ticket_count_key(TicketStatusType.START, None, True)
+ASSIGNED_PUBLIC = TicketCountKey(TicketStatusType.ASSIGNED, 5, True)
+
+
+# 行がない集計キーは追加し、ある集計キーは件数を増減する
+def test_add_ticket_counts(sqlite_session: Session) -> None:
+    add_ticket_counts(sqlite_session, {START_PUBLIC: 1})
+    add_ticket_counts(sqlite_session, {START_PUBLIC: 1})
+    add_ticket_counts(sqlite_session, {START_PUBLIC: -1, ASSIGNED_PUBLIC: 1})
+    sqlite_session.commit()
+
+    # 検証
+    assert START_PUBLIC.supporter_id == 0
+    assert get_stored_ticket_counts(sqlite_session) == {START_PUBLIC: 1, ASSIGNED_PUBLIC: 1}
+
+
+# MySQL では、1文で件数を加算する（同時に更新しても増減を取りこぼさない）
+def test_build_ticket_count_upsert_mysql() -> None:
+    query = build_ticket_count_upsert("mysql", ASSIGNED_PUBLIC, -1)
+
+    # 実行
+    sql = str(query.compile(dialect=mysql.dialect()))
+
+    # 検証
+    assert sql.startswith("INSERT INTO ticket_counts (status, supporter_id, is_public, count)")
+    assert sql.endswith("ON DUPLICATE KEY UPDATE count = (ticket_counts.count + %s)")
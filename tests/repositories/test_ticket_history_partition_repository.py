@@ -0,0 +1,48 @@
+from datetime import date
+
+from helpdesk_app_backend.repositories.ticket_history_partition import (
+    build_add_partitions_ddl,
+    build_detach_partition_references_sqls,
+    build_drop_partitions_ddl,
+    build_exchange_partition_ddls,
+)
+
+
+# p_future を分割して月ごとのパーティションを追加し、p_future は最後に残す
+def test_build_add_partitions_ddl() -> None:
+    # 実行
+    ddl = build_add_partitions_ddl([date(2026, 12, 1), date(2027, 1, 1)])
+
+    # 検証
+    assert ddl == (
+        "ALTER TABLE ticket_histories REORGANIZE PARTITION p_future INTO ("
+        "PARTITION p202612 VALUES LESS THAN ('2027-01-01'), "
+        "PARTITION p202701 VALUES LESS THAN ('2027-02-01'), "
+        "PARTITION p_future VALUES LESS THAN (MAXVALUE))"
+    )
+
+
+# 期限切れのパーティションは、削除 または 別のテーブルへ入れ替えてから削除する
+def test_build_drop_and_exchange_partition_ddls() -> None:
+    # 検証
+    assert (
+        build_drop_partitions_ddl(["p202409", "p202410"])
+        == "ALTER TABLE ticket_histories DROP PARTITION p202409, p202410"
+    )
+    assert build_exchange_partition_ddls("p202409") == [
+        "CREATE TABLE ticket_histories_p202409 LIKE ticket_histories",
+        "ALTER TABLE ticket_histories_p202409 REMOVE PARTITIONING",
+        "ALTER TABLE ticket_histories EXCHANGE PARTITION p202409 WITH TABLE ticket_histories_p202409",
+        "ALTER TABLE ticket_histories DROP PARTITION p202409",
+    ]
+
+
+# 削除するパーティションの対応履歴を参照している変更履歴は NULL にし、検索用テーブルからは削除する
+def test_build_detach_partition_references_sqls() -> None:
+    # 検証
+    assert build_detach_partition_references_sqls("p202409") == [
+        "UPDATE ticket_changes SET ticket_history_id = NULL "
+        "WHERE ticket_history_id IN (SELECT id FROM ticket_histories PARTITION (p202409))",
+        "DELETE FROM ticket_history_search "
+        "WHERE ticket_history_id IN (SELECT id FROM ticket_histories PARTITION (p202409))",
+    ]
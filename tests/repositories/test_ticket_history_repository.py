@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.repositories.ticket_history import (
+    add_ticket_histories,
+    get_recent_ticket_histories,
+    get_recent_ticket_histories_async,
+    get_ticket_histories_since,
+    get_ticket_histories_since_async,
+)
+
+
+# テスト用データ登録（チケット1件に対して履歴5件、別チケットに履歴1件）
+def register_test_data(session: Session) -> None:
+    session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            Ticket(id=1, title="テストチケット1", is_public=True, description="詳細1", staff_id=1),
+            Ticket(id=2, title="テストチケット2", is_public=True, description="詳細2", staff_id=1),
+        ]
+    )
+    session.add_all(
+        [
+            TicketHistory(
+                id=history_id,
+                ticket_id=1,
+                action_user_id=1,
+                action_description=f"テスト対応内容{history_id}",
+                created_at=datetime(2020, 7, 21, 6, 12, 30) + timedelta(minutes=history_id),
+            )
+            for history_id in range(1, 6)
+        ]
+    )
+    session.add(
+        TicketHistory(id=6, ticket_id=2, action_user_id=1, action_description="別チケットの履歴")
+    )
+    session.commit()
+
+
+@pytest.fixture
+def registered_session(sqlite_session: Session) -> Session:
+    register_test_data(sqlite_session)
+    return sqlite_session
+
+
+# 【Fixture】テスト用データを登録したDBを参照する、非同期セッションの作成元
+@pytest.fixture
+def registered_async_sessionmaker(
+    sqlite_async_sessionmaker: tuple[Session, async_sessionmaker[AsyncSession]],
+) -> async_sessionmaker[AsyncSession]:
+    sync_session, async_session_factory = sqlite_async_sessionmaker
+    register_test_data(sync_session)
+    return async_session_factory
+
+
+# 直近の履歴を指定件数分、古い順で取得できる
+def test_get_recent_ticket_histories(registered_session: Session) -> None:
+    ticket_histories = get_recent_ticket_histories(registered_session, ticket_id=1, limit=3)
+
+    # 検証
+    assert [ticket_history.id for ticket_history in ticket_histories] == [3, 4, 5]
+
+
+# 指定したIDより後の履歴のみ、古い順で指定件数分取得できる
+def test_get_ticket_histories_since(registered_session: Session) -> None:
+    ticket_histories = get_ticket_histories_since(
+        registered_session, ticket_id=1, since_id=1, limit=2
+    )
+
+    # 検証
+    assert [ticket_history.id for ticket_history in ticket_histories] == [2, 3]
+    assert ticket_histories[0].action_user.name == "テスト社員1"
+
+
+# まとめて追加した対応履歴のIDを、チケットごとに返す
+# （同じチケットに他の対応履歴が続けて追加されても、追加した対応履歴のIDを返す）
+def test_add_ticket_histories(registered_session: Session) -> None:
+    history_ids = add_ticket_histories(
+        registered_session,
+        [
+            {"ticket_id": 2, "action_user_id": 1, "action_description": "一括の対応2"},
+            {"ticket_id": 1, "action_user_id": 1, "action_description": "一括の対応1"},
+        ],
+    )
+    registered_session.add(
+        TicketHistory(ticket_id=1, action_user_id=1, action_description="同時に追加されたコメント")
+    )
+    registered_session.commit()
+
+    # 検証
+    assert history_ids == {2: 7, 1: 8}
+    assert {
+        ticket_id: registered_session.get(TicketHistory, history_id).action_description
+        for ticket_id, history_id in history_ids.items()
+    } == {2: "一括の対応2", 1: "一括の対応1"}
+
+
+# 非同期版：直近の履歴・指定したIDより後の履歴を、対応者と合わせて古い順で取得できる
+@pytest.mark.asyncio
+async def test_get_ticket_histories_async(
+    registered_async_sessionmaker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with registered_async_sessionmaker() as session:
+        recent_histories = await get_recent_ticket_histories_async(session, ticket_id=1, limit=3)
+        since_histories = await get_ticket_histories_since_async(
+            session, ticket_id=1, since_id=1, limit=2
+        )
+
+    # 検証
+    assert [ticket_history.id for ticket_history in recent_histories] == [3, 4, 5]
+    assert [ticket_history.id for ticket_history in since_histories] == [2, 3]
+    assert since_histories[0].action_user.name == "テスト社員1"
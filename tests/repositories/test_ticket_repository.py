@@ -0,0 +1,285 @@
+from datetime import datetime
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.ticket import Ticket
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.user import User
+from helpdesk_app_backend.models.enum.ticket import TicketListSortType, TicketStatusType
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.models.internal.ticket_list_filter import TicketListFilter
+from helpdesk_app_backend.repositories.ticket import (
+    get_ticket_by_id_async,
+    get_ticket_detail_by_id_async,
+    get_ticket_list_version,
+    get_ticket_version,
+    get_visible_ticket_list_rows,
+    get_visible_ticket_list_rows_async,
+)
+
+
+# テスト用データ登録（社員2名・サポート担当者1名、公開/非公開チケットをそれぞれ作成）
+def register_test_data(session: Session) -> None:
+    session.add_all(
+        [
+            User(
+                id=1,
+                name="テスト社員1",
+                email="staff1@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=2,
+                name="テスト社員2",
+                email="staff2@example.com",
+                password="hashed",
+                account_type=AccountType.STAFF,
+            ),
+            User(
+                id=5,
+                name="テストサポート担当者1",
+                email="supporter1@example.com",
+                password="hashed",
+                account_type=AccountType.SUPPORTER,
+            ),
+        ]
+    )
+    session.add_all(
+        [
+            Ticket(
+                id=1,
+                title="テストチケット1",
+                is_public=True,
+                description="テスト詳細1",
+                staff_id=1,
+                created_at=datetime(2020, 7, 21, 6, 12, 30),
+                updated_at=datetime(2020, 8, 4, 6, 12, 30),
+            ),
+            Ticket(
+                id=2,
+                title="テストチケット2",
+                is_public=False,
+                description="テスト詳細2",
+                staff_id=1,
+                created_at=datetime(2020, 7, 22, 6, 12, 30),
+                updated_at=datetime(2020, 8, 2, 6, 12, 30),
+            ),
+            Ticket(
+                id=3,
+                title="テストチケット3",
+                is_public=True,
+                description="テスト詳細3",
+                staff_id=2,
+                created_at=datetime(2020, 7, 23, 6, 12, 30),
+                updated_at=datetime(2020, 8, 3, 6, 12, 30),
+            ),
+            Ticket(
+                id=4,
+                title="テストチケット4",
+                is_public=False,
+                description="テスト詳細4",
+                staff_id=2,
+                supporter_id=5,
+                created_at=datetime(2020, 7, 24, 6, 12, 30),
+                updated_at=datetime(2020, 7, 24, 6, 12, 30),
+            ),
+        ]
+    )
+    session.commit()
+
+
+@pytest.fixture
+def registered_session(sqlite_session: Session) -> Session:
+    register_test_data(sqlite_session)
+    return sqlite_session
+
+
+# 【Fixture】テスト用データを登録したDBを参照する、非同期セッションの作成元
+@pytest.fixture
+def registered_async_sessionmaker(
+    sqlite_async_sessionmaker: tuple[Session, async_sessionmaker[AsyncSession]],
+) -> async_sessionmaker[AsyncSession]:
+    sync_session, async_session_factory = sqlite_async_sessionmaker
+    register_test_data(sync_session)
+    return async_session_factory
+
+
+# 社員：自分のチケット または 公開チケットのみ取得できる
+def test_get_visible_ticket_list_rows_for_staff(registered_session: Session) -> None:
+    tickets = get_visible_ticket_list_rows(
+        registered_session, user_id=1, account_type=AccountType.STAFF
+    )
+
+    # 検証
+    assert sorted(ticket.id for ticket in tickets) == [1, 2, 3]
+
+
+# 社員以外：全チケットを取得できる
+@pytest.mark.parametrize("account_type", [AccountType.ADMIN, AccountType.SUPPORTER])
+def test_get_visible_ticket_list_rows_for_other(
+    registered_session: Session, account_type: AccountType
+) -> None:
+    tickets = get_visible_ticket_list_rows(registered_session, user_id=5, account_type=account_type)
+
+    # 検証
+    assert sorted(ticket.id for ticket in tickets) == [1, 2, 3, 4]
+
+
+# 作成日時の新しい順に、カーソルより後ろのチケットを件数指定で取得できる
+def test_get_visible_ticket_list_rows_with_cursor(registered_session: Session) -> None:
+    first_page = get_visible_ticket_list_rows(
+        registered_session, user_id=5, account_type=AccountType.ADMIN, limit=2
+    )
+    last_ticket = first_page[-1]
+    second_page = get_visible_ticket_list_rows(
+        registered_session,
+        user_id=5,
+        account_type=AccountType.ADMIN,
+        limit=2,
+        cursor=(last_ticket.created_at, last_ticket.id),
+    )
+
+    # 検証
+    assert [ticket.id for ticket in first_page] == [4, 3]
+    assert [ticket.id for ticket in second_page] == [2, 1]
+
+
+# 絞り込み条件を指定した場合、閲覧可能なチケットのうち条件に一致するもののみ取得する
+@pytest.mark.parametrize(
+    ("filters", "expected_ids"),
+    [
+        (TicketListFilter(statuses=[TicketStatusType.ASSIGNED, TicketStatusType.CLOSED]), [2]),
+        (TicketListFilter(supporter_id=5), [2]),
+        (TicketListFilter(staff_id=1, is_public=True), [1]),
+        (
+            TicketListFilter(
+                created_from=datetime(2020, 7, 22, 6, 12, 30),
+                created_to=datetime(2020, 7, 24, 6, 12, 30),
+            ),
+            [3, 2],
+        ),
+    ],
+)
+def test_get_visible_ticket_list_rows_with_filters(
+    registered_session: Session, filters: TicketListFilter, expected_ids: list[int]
+) -> None:
+    # 社員1が閲覧できないチケット4と同じ条件のチケット2を用意する
+    ticket = registered_session.get(Ticket, 2)
+    ticket.status = TicketStatusType.ASSIGNED
+    ticket.supporter_id = 5
+    registered_session.commit()
+
+    # 実行
+    tickets = get_visible_ticket_list_rows(
+        registered_session, user_id=1, account_type=AccountType.STAFF, filters=filters
+    )
+
+    # 検証
+    assert [ticket.id for ticket in tickets] == expected_ids
+
+
+# 並び順を指定した場合、その日時順（同時刻の場合はID順）に、カーソルより後ろのチケットを取得できる
+@pytest.mark.parametrize(
+    ("sort", "expected_ids"),
+    [
+        (TicketListSortType.CREATED_AT_ASC, [1, 2, 3, 4]),
+        (TicketListSortType.UPDATED_AT_DESC, [1, 3, 2, 4]),
+        (TicketListSortType.UPDATED_AT_ASC, [4, 2, 3, 1]),
+    ],
+)
+def test_get_visible_ticket_list_rows_with_sort(
+    registered_session: Session, sort: TicketListSortType, expected_ids: list[int]
+) -> None:
+    first_page = get_visible_ticket_list_rows(
+        registered_session, user_id=5, account_type=AccountType.ADMIN, limit=2, sort=sort
+    )
+    last_ticket = first_page[-1]
+    second_page = get_visible_ticket_list_rows(
+        registered_session,
+        user_id=5,
+        account_type=AccountType.ADMIN,
+        limit=2,
+        cursor=(getattr(last_ticket, sort.column_name), last_ticket.id),
+        sort=sort,
+    )
+
+    # 検証
+    assert [ticket.id for ticket in first_page + second_page] == expected_ids
+
+
+# 一覧に必要な列と、起票者・サポート担当者の名前のみ取得する（description は取得しない）
+def test_get_visible_ticket_list_rows_columns(registered_session: Session) -> None:
+    rows = get_visible_ticket_list_rows(
+        registered_session, user_id=5, account_type=AccountType.ADMIN, limit=1
+    )
+
+    # 検証
+    assert rows[0]._asdict() == {
+        "id": 4,
+        "title": "テストチケット4",
+        "is_public": False,
+        "status": TicketStatusType.START,
+        "created_at": datetime(2020, 7, 24, 6, 12, 30),
+        "updated_at": datetime(2020, 7, 24, 6, 12, 30),
+        "staff_name": "テスト社員2",
+        "supporter_name": "テストサポート担当者1",
+    }
+
+
+# 一覧・詳細の版（最新のチケットID・最新の対応履歴ID）が、対応履歴の追加で変わる
+def test_get_ticket_versions(registered_session: Session) -> None:
+    before_list_version = get_ticket_list_version(registered_session)
+    before_ticket_version = get_ticket_version(registered_session, id=4)
+
+    registered_session.add(
+        TicketHistory(id=1, ticket_id=4, action_user_id=5, action_description="テスト対応内容1")
+    )
+    registered_session.commit()
+
+    # 検証
+    assert before_list_version._asdict() == {
+        "latest_ticket_id": 4,
+        "latest_history_id": None,
+        "latest_change_seq": None,
+        "latest_user_updated_at": before_list_version.latest_user_updated_at,
+    }
+    assert before_list_version.latest_user_updated_at is not None
+    assert get_ticket_list_version(registered_session).latest_history_id == 1
+    assert before_ticket_version.staff_id == 2
+    assert before_ticket_version.is_public is False
+    assert before_ticket_version.latest_history_id is None
+    assert get_ticket_version(registered_session, id=4).latest_history_id == 1
+    assert get_ticket_version(registered_session, id=99) is None
+
+
+# 非同期版：社員は自分のチケット または 公開チケットのみ、作成日時の新しい順に取得できる
+@pytest.mark.asyncio
+async def test_get_visible_ticket_list_rows_async(
+    registered_async_sessionmaker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with registered_async_sessionmaker() as session:
+        tickets = await get_visible_ticket_list_rows_async(
+            session, user_id=1, account_type=AccountType.STAFF
+        )
+
+    # 検証
+    assert [ticket.id for ticket in tickets] == [3, 2, 1]
+
+
+# 非同期版：チケット詳細を起票者・サポート担当者と合わせて取得できる
+@pytest.mark.asyncio
+async def test_get_ticket_detail_by_id_async(
+    registered_async_sessionmaker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with registered_async_sessionmaker() as session:
+        ticket = await get_ticket_detail_by_id_async(session, id=4)
+        not_found_ticket = await get_ticket_by_id_async(session, id=99)
+
+    # 検証（セッション終了後でも起票者・サポート担当者を参照できる）
+    assert ticket.staff.name == "テスト社員2"
+    assert ticket.supporter.name == "テストサポート担当者1"
+    assert not_found_ticket is None
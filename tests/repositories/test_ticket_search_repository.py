@@ -0,0 +1,70 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from helpdesk_app_backend.models.db.ticket_history import TicketHistory
+from helpdesk_app_backend.models.db.ticket_history_search import TicketHistorySearch
+from helpdesk_app_backend.models.enum.user import AccountType
+from helpdesk_app_backend.repositories.ticket_history import add_ticket_histories
+from helpdesk_app_backend.repositories.ticket_search import build_fulltext_ticket_search_query
+
+
+# MySQL では、タイトル・詳細の全文インデックスと、対応履歴の検索用テーブルの全文インデックスで検索し、
+# 関連度（タイトル・詳細 ＋ 最も関連度の高い対応履歴）の高い順に並べる
+# 社員の場合は、自分のチケット または 公開チケットのみに絞り込む
+def test_build_fulltext_ticket_search_query() -> None:
+    query = build_fulltext_ticket_search_query(
+        "VPN", user_id=1, account_type=AccountType.STAFF, limit=21, offset=20
+    )
+
+    # 実行
+    sql = str(query.compile(dialect=mysql.dialect()))
+
+    # 検証
+    assert "MATCH (tickets.title, tickets.description) AGAINST (%s)" in sql
+    assert "max(MATCH (ticket_history_search.action_description) AGAINST (%s))" in sql
+    assert "LEFT OUTER JOIN (SELECT ticket_history_search.ticket_id" in sql
+    assert "ticket_histories" not in sql
+    assert "tickets.staff_id = %s OR tickets.is_public IS true" in sql
+    assert (
+        "ORDER BY (MATCH (tickets.title, tickets.description) AGAINST (%s)) "
+        "+ coalesce(history_scores.score, %s) DESC, tickets.id DESC"
+    ) in sql
+    assert "LIMIT %s, %s" in sql
+
+
+# 対応履歴の追加と同じトランザクションで、検索用テーブルへも追加する（まとめて追加した場合も含む）
+# ロールバックした場合は、検索用テーブルにも残らない
+def test_insert_ticket_history_search_rows(sqlite_session: Session) -> None:
+    # 実行
+    sqlite_session.add(
+        TicketHistory(id=1, ticket_id=1, action_user_id=1, action_description="VPNに接続できない")
+    )
+    sqlite_session.commit()
+    add_ticket_histories(
+        sqlite_session,
+        [
+            {"ticket_id": 2, "action_user_id": 1, "action_description": "再起動しました"},
+            {"ticket_id": 3, "action_user_id": 1, "action_description": "交換しました"},
+        ],
+    )
+    sqlite_session.commit()
+    sqlite_session.add(
+        TicketHistory(id=4, ticket_id=1, action_user_id=1, action_description="取り消します")
+    )
+    sqlite_session.flush()
+    sqlite_session.rollback()
+
+    # 検証
+    rows = sqlite_session.execute(
+        select(
+            TicketHistorySearch.ticket_history_id,
+            TicketHistorySearch.ticket_id,
+            TicketHistorySearch.action_description,
+        ).order_by(TicketHistorySearch.ticket_history_id)
+    ).all()
+    assert [tuple(row) for row in rows] == [
+        (1, 1, "VPNに接続できない"),
+        (2, 2, "再起動しました"),
+        (3, 3, "交換しました"),
+    ]